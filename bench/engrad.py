@@ -0,0 +1,132 @@
+#-------------------------------------------------------------------------------
+# Name:        bench.engrad
+# Purpose:     Timing benchmark for loading ORCA .engrad files
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+""" Time repeated :class:`opan.grad.OrcaEngrad` loads of a synthetic file.
+
+Each load is timed as shipped; with
+:meth:`~opan.grad.OrcaEngrad._parse_bulk` disabled, so that every file
+goes through :meth:`~opan.grad.OrcaEngrad._parse_regex`; and, as the
+baseline, with the :meth:`~opan.grad.OrcaEngrad._load` of the git
+revision given by ``--baseline``. By default this is the revision before
+:meth:`~opan.grad.OrcaEngrad._parse_bulk` was introduced. The parse cache
+is bypassed throughout. Run from the repository root of a git checkout,
+e.g.::
+
+    python bench/engrad.py --atoms 100 --reps 200
+
+"""
+
+
+def engrad_text(num_ats, seed=0):
+    """ Synthetic .engrad file contents with `num_ats` atoms. """
+
+    # Imports
+    import numpy as np
+
+    rng = np.random.RandomState(seed)
+    ats = rng.choice([1, 6, 7, 8, 16], num_ats)
+    lines = ["#", "# Number of atoms", "#", " {0}".format(num_ats), "#",
+             "# The current total energy in Eh", "#",
+             "  -1715.759691151236", "#",
+             "# The current gradient in Eh/bohr", "#"]
+    lines.extend("{0:21.12f}".format(v)
+                        for v in rng.uniform(-1e-3, 1e-3, 3 * num_ats))
+    lines.extend(["#", "# The atomic numbers and current coordinates in Bohr",
+                  "#"])
+    lines.extend("  {0:2d} {1:12.7f} {2:12.7f} {3:12.7f}".format(a, *xyz)
+                        for a, xyz in zip(ats,
+                                    rng.uniform(-20, 20, (num_ats, 3))))
+    return "\n".join(lines) + "\n"
+
+## end def engrad_text
+
+
+def baseline_class(rev):
+    """ :class:`~opan.grad.OrcaEngrad` with the `_load` of git `rev`. """
+
+    # Imports
+    import os, subprocess, types
+    from opan.grad import OrcaEngrad
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                            os.pardir))
+    git = lambda *args: subprocess.check_output(('git', '-C', root) + args,
+                                                    universal_newlines=True)
+    if rev is None:
+        rev = git('log', '-S', 'def _parse_bulk', '--reverse',
+                    '--format=%H', '--', 'opan/grad.py').split()[0] + '^'
+    ## end if
+
+    # Execute the old module as a sibling of opan.grad, for its
+    #  relative imports
+    mod = types.ModuleType('opan._grad_baseline')
+    mod.__package__ = 'opan'
+    exec(git('show', rev + ':opan/grad.py'), mod.__dict__)
+
+    return type('BaselineEngrad', (OrcaEngrad,),
+                                    {'_load': mod.OrcaEngrad._load})
+
+## end def baseline_class
+
+
+def main():
+
+    # Imports
+    import argparse, os, sys, tempfile, timeit
+
+    sys.path.insert(0, os.path.abspath(os.path.join(
+                                    os.path.dirname(__file__), os.pardir)))
+    from opan.grad import OrcaEngrad
+
+    class RegexEngrad(OrcaEngrad):
+        def _parse_bulk(self):
+            return False
+        ## end def _parse_bulk
+    ## end class RegexEngrad
+
+    prs = argparse.ArgumentParser(description="OrcaEngrad load benchmark")
+    prs.add_argument('--atoms', type=int, default=100)
+    prs.add_argument('--reps', type=int, default=200)
+    prs.add_argument('--baseline', default=None,
+                     help="git revision of the baseline loader")
+    args = prs.parse_args()
+    BaselineEngrad = baseline_class(args.baseline)
+
+    with tempfile.TemporaryDirectory() as td:
+        path = os.path.join(td, 'bench.engrad')
+        with open(path, 'w') as f:
+            f.write(engrad_text(args.atoms))
+        ## end with
+
+        t_base, t_re, t = (min(timeit.repeat(
+                                    lambda: cls(path=path, cache=False),
+                                    number=args.reps, repeat=3)) / args.reps
+                        for cls in (BaselineEngrad, RegexEngrad, OrcaEngrad))
+    ## end with
+
+    print("{0} atoms: {1:.1f} us per load ({2:.1f} us baseline, {3:.1f}x; "
+          "{4:.1f} us regex only, {5:.1f}x)".format(args.atoms, t * 1e6,
+                        t_base * 1e6, t_base / t, t_re * 1e6, t_base / t_re))
+
+## end def main
+
+
+if __name__ == '__main__':
+    main()
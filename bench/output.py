@@ -0,0 +1,171 @@
+#-------------------------------------------------------------------------------
+# Name:        bench.output
+# Purpose:     Timing benchmark for parsing ORCA output files
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+""" Time :class:`opan.output.OrcaOutput` parses of a synthetic output.
+
+The synthetic output mimics an unrestricted, D3/gCP-corrected geometry
+optimization followed by a frequency calculation.  Run from the
+repository root, e.g.::
+
+    python bench/output.py --cycles 200 --reps 3
+
+"""
+
+
+def output_text(cycles, seed=0):
+    """ Synthetic |orca| output contents with `cycles` optimization steps. """
+
+    # Imports
+    import numpy as np
+
+    rng = np.random.RandomState(seed)
+    lines = ["", "                                 * O   R   C   A *", ""]
+
+    for c in range(cycles):
+        en = -1715.75 + rng.uniform(-1e-3, 1e-3)
+        lines.extend(["", "--------------", "SCF ITERATIONS",
+                      "--------------",
+                      "ITER       Energy         Delta-E        Max-DP"
+                      "      RMS-DP      [F,P]     Damp"])
+        lines.extend("  {0:2d}  {1:16.10f}  {2:12.9f}  {3:10.8f}  "
+                     "{4:10.8f}  {5:10.8f}  0.7000".format(i, en, *dv)
+                     for i, dv in enumerate(rng.uniform(0, 1e-3, (15, 4))))
+        lines.extend(["", "    " + "*" * 53,
+                      "    *" + "SUCCESS".center(51) + "*",
+                      "    *" + "SCF CONVERGED AFTER  15 CYCLES".center(51)
+                                                                    + "*",
+                      "    " + "*" * 53,
+                      "", "----------------", "TOTAL SCF ENERGY",
+                      "----------------", "",
+                      "Total Energy       :   {0:18.8f} Eh".format(en), "",
+                      "----------------", "ORBITAL ENERGIES",
+                      "----------------", "",
+                      "  NO   OCC          E(Eh)            E(eV) "])
+        lines.extend("  {0:3d}   {1:6.4f}    {2:14.6f}    {3:14.4f} ".format(
+                            i, 1.0, e, e * 27.2114)
+                     for i, e in enumerate(sorted(rng.uniform(-20, 2, 80))))
+        lines.extend(["", "----------------------", "UHF SPIN CONTAMINATION",
+                      "----------------------", "",
+                      "Expectation value of <S**2>     :     {0:.6f}".format(
+                                        0.75 + rng.uniform(0, 1e-2)),
+                      "Ideal value S*(S+1) for S=0.5   :     0.750000",
+                      "Deviation                       :     {0:.6f}".format(
+                                        rng.uniform(0, 1e-2)),
+                      "", "-----------------------", "MULLIKEN ATOMIC CHARGES",
+                      "-----------------------"])
+        lines.extend("   {0:2d} C :   {1:10.6f}".format(i, q)
+                     for i, q in enumerate(rng.uniform(-1, 1, 30)))
+        lines.extend(["", "-------------------------   ----------------",
+                      "Dispersion correction           {0:.9f}".format(
+                                        rng.uniform(-1e-2, 0)),
+                      "-------------------------   ----------------",
+                      "", "-------------------------   ----------------",
+                      "gCP correction                   {0:.9f}".format(
+                                        rng.uniform(0, 1e-2)),
+                      "-------------------------   ----------------",
+                      "", "-------------------------   --------------------",
+                      "FINAL SINGLE POINT ENERGY     {0:.12f}".format(en),
+                      "-------------------------   --------------------",
+                      "", "-------------", "DIPOLE MOMENT", "-------------",
+                      "                                X             Y"
+                      "             Z",
+                      "Total Dipole Moment    :      0.02345      -0.03456"
+                      "       0.00000",
+                      "Magnitude (a.u.)       :      {0:.5f}".format(
+                                        rng.uniform(0, 1)),
+                      "Magnitude (Debye)      :      {0:.5f}".format(
+                                        rng.uniform(0, 2)),
+                      ""])
+    ## next c
+
+    lines.extend(["", "                    ***********************HURRAY"
+                  "********************",
+                  "                    ***        THE OPTIMIZATION HAS "
+                  "CONVERGED     ***",
+                  "", "--------------------------",
+                  "THERMOCHEMISTRY AT 298.15K", "--------------------------",
+                  "", "Temperature         ... 298.15 K",
+                  "Pressure            ... 1.00 atm", "",
+                  "Electronic energy                ...  -1715.75969115 Eh",
+                  "Zero point energy                ...      0.02123456 Eh"
+                  "      13.32 kcal/mol",
+                  "Thermal vibrational correction   ...      0.00012345 Eh"
+                  "       0.08 kcal/mol",
+                  "Thermal rotational correction    ...      0.00141628 Eh"
+                  "       0.89 kcal/mol",
+                  "Thermal translational correction ...      0.00141628 Eh"
+                  "       0.89 kcal/mol",
+                  "Thermal Enthalpy correction       ...      0.00094421 Eh"
+                  "       0.59 kcal/mol",
+                  "Electronic entropy               ...      0.00000000 Eh"
+                  "       0.00 kcal/mol",
+                  "Vibrational entropy              ...      0.00003456 Eh"
+                  "       0.02 kcal/mol",
+                  "Rotational entropy               ...      0.00823456 Eh"
+                  "       5.17 kcal/mol",
+                  "Translational entropy            ...      0.01634532 Eh"
+                  "      10.26 kcal/mol",
+                  "", " qrot = 43.10 ", "",
+                  "Timings for individual modules:", "",
+                  "Sum of individual times         ...      123.456 sec",
+                  "", "                             ****ORCA TERMINATED "
+                  "NORMALLY****", ""])
+
+    return "\n".join(lines)
+
+## end def output_text
+
+
+def main():
+
+    # Imports
+    import argparse, os, sys, tempfile, timeit
+
+    sys.path.insert(0, os.path.abspath(os.path.join(
+                                    os.path.dirname(__file__), os.pardir)))
+    from opan.output import OrcaOutput
+
+    prs = argparse.ArgumentParser(description="OrcaOutput parse benchmark")
+    prs.add_argument('--cycles', type=int, default=200)
+    prs.add_argument('--reps', type=int, default=3)
+    prs.add_argument('--quantities', nargs='+', default=None,
+                help="OrcaOutput.QTY / OrcaOutput.EN members to parse")
+    args = prs.parse_args()
+
+    with tempfile.TemporaryDirectory() as td:
+        path = os.path.join(td, 'bench.out')
+        with open(path, 'w') as f:
+            f.write(output_text(args.cycles))
+        ## end with
+        size = os.path.getsize(path)
+
+        t = min(timeit.repeat(lambda: OrcaOutput(path,
+                                        quantities=args.quantities),
+                                        number=1, repeat=args.reps))
+    ## end with
+
+    print("{0} cycles ({1:.1f} MB): {2:.1f} ms per parse".format(
+                                    args.cycles, size / 2**20, t * 1e3))
+
+## end def main
+
+
+if __name__ == '__main__':
+    main()
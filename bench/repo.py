@@ -0,0 +1,187 @@
+#-------------------------------------------------------------------------------
+# Name:        bench.repo
+# Purpose:     Size and throughput benchmark for OpanAnharmRepo storage
+#                layouts
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+""" Compare :class:`opan.vpt2.repo.OpanAnharmRepo` storage layouts.
+
+Stores and then reads back a Hessian, gradient, geometry and energy for
+each of a number of displacements of a synthetic molecule, reporting the
+file size and the write and read throughput of each layout, and then
+the time to read all the values of each type at once with
+:meth:`~opan.vpt2.repo.OpanAnharmRepo.get_all`, grouped and stacked.
+Run from the repository root, e.g.::
+
+    python bench/repo.py --atoms 60 --disps 40
+
+"""
+
+
+#: Layouts compared, by label
+LAYOUTS = [('contiguous', None),
+           ('chunked', {'chunks': 'full'}),
+           ('gzip-4+shuffle', {'compression': 'gzip', 'compression_opts': 4,
+                               'shuffle': True}),
+           ('gzip-4', {'compression': 'gzip', 'compression_opts': 4}),
+           ('lzf', {'compression': 'lzf'}),
+           ('lzf+shuffle', {'compression': 'lzf', 'shuffle': True})]
+
+
+def disp_data(num_ats, num_disps, seed=0):
+    """ Synthetic (hess, grad, geom, energy) for each displacement.
+
+    Hessian blocks decay with interatomic distance, and all values are
+    rounded to the decimal places of the |orca| .hess and .engrad files.
+
+    """
+
+    # Imports
+    import numpy as np
+
+    rng = np.random.RandomState(seed)
+    geom = rng.uniform(-8, 8, (num_ats, 3))
+    dist = np.sqrt(((geom[:, None, :] - geom[None, :, :])**2).sum(axis=2))
+    decay = np.kron(np.exp(-dist / 1.5), np.ones((3, 3)))
+    base = rng.uniform(-0.5, 0.5, decay.shape) * decay
+    base = base + base.T
+
+    data = []
+    for d in range(num_disps):
+        pert = rng.uniform(-1e-3, 1e-3, base.shape) * decay
+        data.append((np.round(base + pert + pert.T, 6),
+                     np.round(rng.uniform(-1e-2, 1e-2, 3 * num_ats), 12),
+                     np.round(geom.ravel() + rng.uniform(-0.1, 0.1,
+                                                        3 * num_ats), 7),
+                     -1715.75 + rng.uniform(-1e-3, 1e-3)))
+    ## next d
+
+    return data
+
+## end def disp_data
+
+
+def run_layout(path, storage, data):
+    """ (file size, write seconds, read seconds) for one layout. """
+
+    # Imports
+    import os, time
+    import numpy as np
+    from opan.const import EnumAnharmRepoData as E_ARD
+    from opan.const import EnumDispDirection as E_DD
+    from opan.vpt2.repo import OpanAnharmRepo
+
+    types = [E_ARD.HESS, E_ARD.GRAD, E_ARD.GEOM, E_ARD.ENERGY]
+
+    repo = OpanAnharmRepo(path, storage=storage)
+    t0 = time.perf_counter()
+    for (m, vals) in enumerate(data):
+        for (dt, v) in zip(types, vals):
+            repo.store_data(v, dt, m, E_DD.POSITIVE)
+        ## next (dt, v)
+    ## next (m, vals)
+    t_write = time.perf_counter() - t0
+    repo.close()
+
+    repo = OpanAnharmRepo(path)
+    t0 = time.perf_counter()
+    for (m, vals) in enumerate(data):
+        for (dt, v) in zip(types, vals):
+            assert np.array_equal(repo.get_data(dt, m, E_DD.POSITIVE), v)
+        ## next (dt, v)
+    ## next (m, vals)
+    t_read = time.perf_counter() - t0
+    repo.close()
+
+    return os.path.getsize(path), t_write, t_read
+
+## end def run_layout
+
+
+def run_bulk(path, data):
+    """ Seconds to read all values of every type, grouped and stacked. """
+
+    # Imports
+    import time
+    from opan.const import EnumAnharmRepoData as E_ARD
+    from opan.const import EnumAnharmRepoLayout as E_ARL
+    from opan.vpt2.repo import OpanAnharmRepo
+
+    types = [E_ARD.HESS, E_ARD.GRAD, E_ARD.GEOM, E_ARD.ENERGY]
+
+    repo = OpanAnharmRepo(path)
+    for (i, dt) in enumerate(types):
+        repo.store_many([[vals[i], vals[i]] for vals in data], dt)
+    ## next (i, dt)
+
+    times = {}
+    for layout in [E_ARL.GROUPED, E_ARL.STACKED]:
+        repo.migrate(layout)
+        t0 = time.perf_counter()
+        for dt in types:
+            repo.get_all(dt)
+        ## next dt
+        times.update({ layout : time.perf_counter() - t0 })
+    ## next layout
+    repo.close()
+
+    return times
+
+## end def run_bulk
+
+
+def main():
+
+    # Imports
+    import argparse, os, sys, tempfile
+
+    sys.path.insert(0, os.path.abspath(os.path.join(
+                                    os.path.dirname(__file__), os.pardir)))
+
+    prs = argparse.ArgumentParser(description="OpanAnharmRepo layout "
+                                                            "benchmark")
+    prs.add_argument('--atoms', type=int, default=60)
+    prs.add_argument('--disps', type=int, default=40)
+    args = prs.parse_args()
+
+    data = disp_data(args.atoms, args.disps)
+    raw = sum(sum(getattr(v, 'nbytes', 8) for v in vals) for vals in data)
+
+    print("{0} atoms, {1} displacements, {2:.1f} MB of data".format(
+                                    args.atoms, args.disps, raw / 2**20))
+    print("{0:16s} {1:>9s} {2:>6s} {3:>11s} {4:>11s}".format("layout",
+                            "size (MB)", "ratio", "write MB/s", "read MB/s"))
+    with tempfile.TemporaryDirectory() as td:
+        for (label, storage) in LAYOUTS:
+            (size, t_w, t_r) = run_layout(os.path.join(td, label + '.h5'),
+                                                            storage, data)
+            print("{0:16s} {1:9.2f} {2:6.2f} {3:11.1f} {4:11.1f}".format(
+                        label, size / 2**20, raw / size,
+                        raw / 2**20 / t_w, raw / 2**20 / t_r))
+        ## next (label, storage)
+
+        times = run_bulk(os.path.join(td, 'bulk.h5'), data)
+        print("get_all, all types: " + ", ".join("{0} {1:.3f} s"
+                        .format(k.lower(), v) for (k, v) in times.items()))
+    ## end with
+
+## end def main
+
+
+if __name__ == '__main__':
+    main()
@@ -158,6 +158,10 @@ rst_epilog = """
 
 .. |dict| replace:: :obj:`dict`
 
+.. |frozenset| replace:: :obj:`frozenset`
+
+.. |bytes| replace:: :obj:`bytes`
+
 .. |callable| replace:: :func:`callable`
 
 .. |re.compile| replace:: :func:`re.compile`
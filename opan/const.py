@@ -84,6 +84,9 @@ supporting membership testing with `in`
     :class:`~opan.const.EnumFileType` -- Various file types relevant to
     the software packages
 
+    :class:`~opan.const.EnumJobStatus` -- State of a job in the
+    :mod:`opan.utils.schedule` job queue
+
     :class:`~opan.const.EnumMassPertType`  -- Type of atomic mass
     perturbation being applied
 
@@ -96,6 +99,11 @@ supporting membership testing with `in`
 
     :class:`~opan.const.EnumAnharmRepoData` -- Displacement-specific values
 
+    :class:`~opan.const.EnumAnharmRepoLayout` -- Arrangement of the
+    displacement-specific values in the file
+
+    :class:`~opan.const.EnumAnharmRepoMode` -- Access mode of the file
+
     :class:`~opan.const.EnumAnharmRepoParam` -- Displacement-nonspecific values
 
     **Units Enumerations**
@@ -301,6 +309,30 @@ class EnumFileType(OpanEnum):
 ## end class EnumFileType
 
 
+class EnumJobStatus(OpanEnum):
+    """ Enumeration class for the state of a queued computation.
+
+    Used by :class:`~opan.utils.schedule.OrcaScheduler`.
+
+    **Enum Values**
+
+    """
+
+    #: Waiting to be run, or to be re-run after a failure
+    PENDING = 'PENDING'
+
+    #: Currently running
+    RUNNING = 'RUNNING'
+
+    #: Completed successfully
+    DONE = 'DONE'
+
+    #: Failed on every permitted attempt
+    FAILED = 'FAILED'
+
+## end class EnumJobStatus
+
+
 class EnumAnharmRepoData(OpanEnum):
     """ Enumeration class for datatypes in VPT2 HDF5 repository.
 
@@ -359,9 +391,69 @@ class EnumAnharmRepoParam(OpanEnum):
     #: Length-`3*N` vector of perturbation factors (all should be ~1)
     PERT_VEC = 'PERT_VEC'
 
+    #: JSON text of the dataset storage layout (chunking and filters) for
+    #: each :class:`~opan.const.EnumAnharmRepoData` type; see
+    #: :class:`~opan.vpt2.repo.OpanAnharmRepo`
+    STORAGE = 'STORAGE'
+
+    #: :class:`~opan.const.EnumAnharmRepoLayout` arrangement of the
+    #: displacement-specific data
+    LAYOUT = 'LAYOUT'
+
 ## end class EnumAnharmRepoParam
 
 
+class EnumAnharmRepoLayout(OpanEnum):
+    """ Enumeration class for data arrangements in VPT2 HDF5 repository.
+
+    Indicates how the :class:`~opan.const.EnumAnharmRepoData` values of
+    the displaced geometries are arranged in the on-disk HDF5 repository
+    of :class:`~opan.vpt2.repo.OpanAnharmRepo`. Values at the reference
+    geometry are stored the same way in either.
+
+    **Enum Values**
+
+    """
+
+    #: One group per mode and displacement direction, holding one dataset
+    #: per data type
+    GROUPED = 'GROUPED'
+
+    #: One dataset per data type, stacked over modes and displacement
+    #: directions
+    STACKED = 'STACKED'
+
+## end class EnumAnharmRepoLayout
+
+
+class EnumAnharmRepoMode(OpanEnum):
+    """ Enumeration class for access modes of VPT2 HDF5 repository.
+
+    Indicates how :class:`~opan.vpt2.repo.OpanAnharmRepo` opens its
+    on-disk HDF5 file. The SWMR (single-writer/multiple-reader) modes
+    require HDF5 1.10 or later.
+
+    **Enum Values**
+
+    """
+
+    #: Read and write, creating the file if absent; no concurrent access
+    READWRITE = 'READWRITE'
+
+    #: Read only; no concurrent writer
+    READONLY = 'READONLY'
+
+    #: Read and write, creating the file if absent, in the latest HDF5
+    #: file format, for SWMR writing once
+    #: :meth:`~opan.vpt2.repo.OpanAnharmRepo.start_swmr` is called
+    SWMR_WRITE = 'SWMR_WRITE'
+
+    #: Read only, concurrently with a SWMR writer
+    SWMR_READ = 'SWMR_READ'
+
+## end class EnumAnharmRepoMode
+
+
 class EnumUnitsRotConst(OpanEnum):
     """ Units Enumeration class for rotational constants.
 
@@ -560,6 +652,22 @@ class DEF(object):
     # rotational symmetry
     SYMM_AVG_MAX = 2
 
+    #: |int| --
+    #: Limit in bytes on the total size of the on-disk parse cache
+    #: (see :mod:`opan.utils.cache`)
+    CACHE_MAX_SIZE = 2**28
+
+    #: |int| --
+    #: Size in bytes below which source files are not held in the on-disk
+    #: parse cache, since reading an entry back is slower than parsing
+    #: such a file
+    CACHE_MIN_SIZE = 2**17
+
+    #: |int| --
+    #: Default limit in bytes on the size of the in-memory read cache of
+    #: each :class:`~opan.vpt2.repo.OpanAnharmRepo`
+    REPO_CACHE_MAX_SIZE = 2**26
+
     #: |dict| of |dict| --
     #: Dictionary of dictionaries of file extensions for geometry, gradient,
     #: hessian, etc. files from the various software suites.
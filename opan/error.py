@@ -260,10 +260,11 @@ class OutputError(OpanError):
 
     **Typecodes**
 
-    *(none yet)*
-
     """
 
+    #: Incremental parsing requested of a non-incremental instance
+    NOT_INCREMENTAL = 'NOT_INCREMENTAL'
+
 ## end class OutputError
 
 
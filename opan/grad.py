@@ -203,7 +203,7 @@ class SuperOpanGrad(object):
         if 3*len(self.atom_syms) != self.gradient.shape[0]: # pragma: no cover
             raise GErr(GErr.BADATOM, "Atoms list is not length-N", srcstr)
         ## end if
-        if not all(map(lambda v: v in atom_num, self.atom_syms)):
+        if not all(map(atom_num.__contains__, self.atom_syms)):
             raise GErr(GErr.BADATOM,    # pragma: no cover
                     "Invalid atoms in list: {0}".format(self.atom_syms),
                     srcstr)
@@ -265,7 +265,8 @@ class OrcaEngrad(SuperOpanGrad):
     """ Container for gradient data generated by |orca|.
 
     Initialize by passing the path to the file to be loaded as the
-    `path` keyword argument.
+    `path` keyword argument. The complete text of the file is retained in
+    :attr:`in_str` unless ``keep_str=False`` is also passed.
 
     Key information contained includes the gradient, the energy, the number
     of atoms, the geometry, and the atom IDs.  For |orca|, the precision of the
@@ -278,6 +279,10 @@ class OrcaEngrad(SuperOpanGrad):
 
     .. automethod:: _load
 
+    .. automethod:: _parse_bulk
+
+    .. automethod:: _parse_regex
+
     |
 
     **Class Variables**
@@ -292,6 +297,15 @@ class OrcaEngrad(SuperOpanGrad):
 
             Captures the entire block of atom ID & geometry data.
 
+        .. attribute:: athead
+
+            Matches the header of the atom ID & geometry block only.
+
+        .. attribute:: atlead
+
+            Matches the leading portion of any line that would extend
+            the atom ID & geometry block.
+
         .. attribute:: atline
 
             Extracts single lines from the atom ID / geometry block.
@@ -304,6 +318,10 @@ class OrcaEngrad(SuperOpanGrad):
 
             Captures the gradient data block.
 
+        .. attribute:: gradhead
+
+            Matches the header of the gradient data block only.
+
         .. attribute:: numats
 
             Retrieves the stand-along 'number of atoms' field.
@@ -334,7 +352,8 @@ class OrcaEngrad(SuperOpanGrad):
     .. attribute:: OrcaEngrad.in_str
 
         |str| -- Complete text of the ENGRAD file read in
-        to generate the :class:`OrcaEngrad` instance.
+        to generate the :class:`OrcaEngrad` instance, unless loaded with
+        ``keep_str=False``, in which case |None|.
 
     .. attribute:: OrcaEngrad.num_ats
 
@@ -435,8 +454,37 @@ class OrcaEngrad(SuperOpanGrad):
         (?P<c3>[0-9.-]+)                    # Third coordinate
         """, _re.I | _re.X)
 
+        # Headers of the gradient and geometry blocks, as matched at the
+        #  start of 'gradblock' and 'atblock', but without the block
+        #  contents. Used by the bulk parse to locate the blocks cheaply.
+        gradhead = _re.compile("""
+        \\#.*                           # Key text is in a comment block
+        in\\ Eh/bohr                    # Key text
+        .*\\n                           # Clear to newline
+        \\#.*\\n                        # Blank comment line
+        """, _re.I | _re.X)
+
+        athead = _re.compile("""
+        \\#.*                           # Key text is in a comment block
+        coordinates\\ in\\ Bohr         # Key text
+        .*\\n                           # Clear to newline
+        \\#.*                           # Blank comment line
+        """, _re.M | _re.I | _re.X)
+
+        # Leading portion of a line that 'atblock' would accept as part
+        #  of the geometry block
+        atlead = _re.compile("""
+        [ \\t]*                         # Leading whitespace
+        ([a-z]+|\\d+)+                  # Atomic symbol or number
+        ([ \\t]+[0-9.-]+){3}            # Three coordinates
+        """, _re.I | _re.X)
+
     ## end class Pat
 
+    # Version of the parse, as recorded in the parse cache; increment
+    #  whenever the parsed data could change
+    _cache_version = 1
+
     def _load(self, **kwargs):
         """ Initialize :class:`OrcaEngrad` object from .engrad file
 
@@ -449,6 +497,18 @@ class OrcaEngrad(SuperOpanGrad):
         path
             |str| -- Complete path to the .engrad file to be read.
 
+        keep_str
+            |bool|, optional -- If |True| (the default), retain the
+            complete text of the file in :attr:`in_str`. If |False|, the
+            text is discarded once parsed and :attr:`in_str` is |None|.
+
+        cache
+            |bool| or :class:`~opan.utils.cache.ParseCache`, optional --
+            Parse cache to use, as for
+            :func:`~opan.utils.cache.get_cache`. Default is |None|, the
+            default cache if one is configured. Used only if `keep_str`
+            is |False|.
+
         Raises
         ------
         ~opan.error.GradError
@@ -466,13 +526,11 @@ class OrcaEngrad(SuperOpanGrad):
         """
 
         # Imports
-        from .const import CIC, atom_sym, atom_num
         from .error import GradError
-        from .utils import safe_cast as scast
-        import numpy as np
+        from .utils.cache import get_cache
 
         # Check if instantiated; complain if so
-        if 'engrad_path' in dir(self):
+        if hasattr(self, 'engrad_path'):
             raise GradError(GradError.OVERWRITE,
                     "Cannot overwrite contents of existing OrcaEngrad", "")
         ## end if
@@ -480,6 +538,20 @@ class OrcaEngrad(SuperOpanGrad):
         # Retrieve the file target
         engrad_path = kwargs['path']
 
+        # Serve from the parse cache if possible
+        keep_str = kwargs.get('keep_str', True)
+        cache = None if keep_str else get_cache(kwargs.get('cache'))
+        if cache is not None:
+            data, stamp = cache.load(engrad_path, 'engrad',
+                                        version=self._cache_version)
+            if data is not None:
+                self.engrad_path = engrad_path
+                self.in_str = None
+                self.__dict__.update(data)
+                return
+            ## end if
+        ## end if
+
         # Open file, read contents, close stream
         with open(engrad_path,'rU') as in_fl:
             self.engrad_path = engrad_path
@@ -489,34 +561,214 @@ class OrcaEngrad(SuperOpanGrad):
         # Store source string
         srcstr = "ENGRAD File: {0}".format(engrad_path)
 
+        # Well-formed files are handled by the bulk parse. Anything it
+        #  cannot vouch for is passed to the full regex parse, which raises
+        #  the appropriate error if the file is in fact malformed.
+        if not self._parse_bulk():
+            self._parse_regex(srcstr)
+        ## end if
+
+        # Discard the file contents unless asked to keep them
+        if not keep_str:
+            self.in_str = None
+        ## end if
+
+        # Cache the results
+        if cache is not None:
+            cache.store(engrad_path, 'engrad',
+                        dict((k, getattr(self, k)) for k in ('num_ats',
+                            'energy', 'gradient', 'geom', 'atom_syms')),
+                        stamp, version=self._cache_version)
+        ## end if
+
+    ## end def _load
+
+    def _parse_bulk(self):
+        """ Parse well-formed .engrad contents in a single vectorized pass.
+
+        The gradient and geometry blocks are located by their headers and
+        converted wholesale, with cheap checks confirming that
+        :attr:`Pat.gradblock`, :attr:`Pat.atblock` and :attr:`Pat.atline`
+        would capture exactly the same data. If any check fails, nothing
+        is stored and |False| is returned, so that :meth:`_parse_regex`
+        can reproduce the exact error behavior. The block patterns
+        themselves are not used to delimit the blocks, since matching
+        them accounts for most of the time taken by :meth:`_parse_regex`.
+
+        Returns
+        -------
+        success
+            |bool| -- |True| if the energy, number of atoms, gradient,
+            geometry and atom symbols were stored
+
+        """
+
+        # Imports
+        from itertools import chain
+        import string
+        from .const import CIC, atom_sym, atom_num
+        import numpy as np
+
+        # The checks work on the ASCII bytes of the file, so that the
+        #  case-folded key text search is consistent with re.I and the
+        #  character set checks are cheap. Anything else is left to the
+        #  regex parse.
+        num_chars = b'0123456789.-'
+        geom_chars = num_chars + b' \t\n' + string.ascii_letters.encode()
+
+        text = self.in_str
+        try:
+            btext = text.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+        ## end try
+        low = btext.lower()
+
+        # Locate the single-value fields and the block headers. A header
+        #  search starts at the line of the first occurrence of its key
+        #  text, since re.I searches are slow to skip over the data.
+        def head(pat, key):
+            idx = low.find(key)
+            return None if idx < 0 else \
+                        pat.search(text, low.rfind(b'\n', 0, idx) + 1)
+        ## end def head
+
+        m_numats = self.Pat.numats.search(text)
+        m_energy = self.Pat.energy.search(text)
+        m_gh = head(self.Pat.gradhead, b'in eh/bohr')
+        m_ah = head(self.Pat.athead, b'coordinates in bohr')
+        if not (m_numats and m_energy and m_gh and m_ah):
+            return False
+        ## end if
+        num_ats = np.int_(m_numats.group("num"))
+
+        # Gradient block: one number per line, with only spaces around
+        #  it, through to the next line starting with a pound, and one
+        #  line per coordinate. float() alone would also accept exponents,
+        #  'nan', tabs and the like; blank and multi-number lines fail the
+        #  conversion below.
+        g_st = m_gh.end()
+        g_end = text.find('\n#', g_st - 1) + 1
+        grad_lines = text[g_st:g_end].split('\n')[:-1]
+        if g_end <= g_st or len(grad_lines) != 3 * num_ats or \
+                    btext[g_st:g_end].translate(None, num_chars + b' \n'):
+            return False
+        ## end if
+
+        # Geometry block: exactly num_ats lines of four tokens separated
+        #  by spaces or tabs, with the following line (if any) not
+        #  continuing the block, and coordinates free of exponents and the
+        #  like. The element IDs are checked against the tables below.
+        a_st = m_ah.end() + 1
+        at_lines = text[a_st:].split('\n', num_ats)
+        if not text.startswith('\n', a_st - 1) or len(at_lines) < num_ats \
+                or (len(at_lines) > num_ats and
+                    self.Pat.atlead.match(at_lines.pop())):
+            return False
+        ## end if
+        at_toks = list(map(str.split, at_lines))
+        geom_toks = list(chain.from_iterable(at_toks))
+        ats = geom_toks[0::4]
+        del geom_toks[0::4]
+        a_end = a_st + sum(map(len, at_lines)) + num_ats - 1
+        if set(map(len, at_toks)) != {4} or \
+                btext[a_st:a_end].translate(None, geom_chars) or \
+                ''.join(geom_toks).encode('ascii').translate(None, num_chars):
+            return False
+        ## end if
+
+        # Numeric conversions; malformed numbers go to the regex parse
+        try:
+            gradient = np.array(grad_lines, dtype=np.float_)
+            geom = np.array(geom_toks, dtype=np.float_)
+        except ValueError:
+            return False
+        ## end try
+
+        # Element IDs, checked once per distinct entry
+        syms = {}
+        for at in set(ats):
+            if str.isdigit(at):
+                if not (CIC.MIN_ATOMIC_NUM <= int(at) <= CIC.MAX_ATOMIC_NUM):
+                    return False
+                ## end if
+                syms[at] = atom_sym[int(at)]
+            elif at.upper() in atom_num:
+                syms[at] = at.upper()
+            else:
+                return False
+            ## end if
+        ## next at
+
+        # All good; store everything
+        self.num_ats = num_ats
+        self.energy = np.float_(m_energy.group("en"))
+        self.gradient = gradient
+        self.geom = geom
+        self.atom_syms = [syms[at] for at in ats]
+        return True
+
+    ## end def _parse_bulk
+
+    def _parse_regex(self, srcstr):
+        """ Parse .engrad contents by full regex matching.
+
+        Reference parse, used for any file not accepted by
+        :meth:`_parse_bulk`.
+
+        Parameters
+        ----------
+        srcstr
+            |str| -- Error source string
+
+        Raises
+        ------
+        ~opan.error.GradError
+            Various typecodes --
+            If the gradient file is malformed in some fashion
+
+        """
+
+        # Imports
+        from .const import CIC, atom_sym, atom_num
+        from .error import GradError
+        from .utils import safe_cast as scast
+        import numpy as np
+
+        # Search for all relevant data blocks once
+        m_numats = self.Pat.numats.search(self.in_str)
+        m_energy = self.Pat.energy.search(self.in_str)
+        m_grad = self.Pat.gradblock.search(self.in_str)
+        m_geom = self.Pat.atblock.search(self.in_str)
+
         # Check to ensure all relevant data blocks are found
-        if not self.Pat.numats.search(self.in_str):
+        if not m_numats:
             raise GradError(GradError.NUMATS,
                     "Number of atoms specification not found", srcstr)
         ## end if
-        if not self.Pat.energy.search(self.in_str):
+        if not m_energy:
             raise GradError(GradError.ENERGY,
                     "Energy specification not found", srcstr)
         ## end if
-        if not self.Pat.gradblock.search(self.in_str):
+        if not m_grad:
             raise GradError(GradError.GRADBLOCK,
                     "Gradient data block not found", srcstr)
         ## end if
-        if not self.Pat.atblock.search(self.in_str):
+        if not m_geom:
             raise GradError(GradError.GEOMBLOCK,
                     "Geometry data block not found", srcstr)
         ## end if
 
         # Retrieve the number of atoms
-        self.num_ats = np.int_(self.Pat.numats.search(self.in_str).group("num"))
+        self.num_ats = np.int_(m_numats.group("num"))
 
         # Retrieve the energy
-        self.energy = np.float_(self.Pat.energy.search(self.in_str).group("en"))
+        self.energy = np.float_(m_energy.group("en"))
 
         # Retrieve the gradient and store numerically. Raise an error if
         #  the number of gradient elements is not equal to three times the
         #  number of atoms.
-        grad_str = self.Pat.gradblock.search(self.in_str).group("block")
+        grad_str = m_grad.group("block")
         if not len(grad_str.splitlines()) == 3 * self.num_ats:
             raise GradError(GradError.GRADBLOCK,
                     "Gradient block size mismatch with number of atoms",
@@ -524,27 +776,22 @@ class OrcaEngrad(SuperOpanGrad):
         ## end if
         self.gradient = np.array(grad_str.splitlines(), dtype=np.float_)
 
-        # Pull and store the geometry block
-        geom_str = self.Pat.atblock.search(self.in_str).group("block")
+        # Pull the geometry block lines
+        at_mchs = list(self.Pat.atline.finditer(m_geom.group("block")))
 
         # Confirm the correct number of atoms
-        if not len(self.Pat.atline.findall(geom_str)) ==  self.num_ats:
+        if not len(at_mchs) ==  self.num_ats:
             raise GradError(GradError.GEOMBLOCK,
                     "Inconsistent number of atom coordinates in \
                     geometry block", srcstr)
         ## end if
 
-        # Initialize the atom symbols list
+        # Initialize the atom symbols list and the coordinates vector
         self.atom_syms = []
-
-        # Assemble the coordinates vector and assemble/check the element
-        #  ID vector.
-        # Init the atom counter and the coordinates vector
-        atom_count = 0
-        self.geom = np.zeros((0,), dtype=np.float_)
+        self.geom = np.empty((3 * self.num_ats,), dtype=np.float_)
 
         # Iterate over the atom spec lines and store element and coordinates
-        for line_mch in self.Pat.atline.finditer(geom_str):
+        for atom_count, line_mch in enumerate(at_mchs):
             # Populate the atom symbols list; have to check for
             #  whether it's an atomic number or an element symbol
             if str.isdigit(line_mch.group("at")):
@@ -576,18 +823,15 @@ class OrcaEngrad(SuperOpanGrad):
                 self.atom_syms.append(line_mch.group("at").upper())
             ## end if
 
-            # Append the three coordinates of the current atom to the
-            #  temp coordinates vector. Unit conversion not needed since
-            #  ENGRAD files report coordinates in Bohrs.
-            self.geom = np.concatenate(
-                    (
-                        self.geom,
-                        [scast(line_mch.group("c{0}".format(i)), np.float_)
+            # Store the three coordinates of the current atom. Unit
+            #  conversion not needed since ENGRAD files report
+            #  coordinates in Bohrs.
+            self.geom[3 * atom_count:3 * atom_count + 3] = \
+                    [scast(line_mch.group("c{0}".format(i)), np.float_)
                                                         for i in range(1,4)]
-                     ))
         ## next line_mch
 
-    ## end def __init__
+    ## end def _parse_regex
 
 ## end def OrcaEngrad
 
@@ -152,7 +152,7 @@ Hessian data from external computational packages.
 
 **Subclasses**
 
-.. autoclass:: OrcaHess(path='...')
+.. autoclass:: OrcaHess(path='...'[, lazy=False[, keep_str=True]])
 
 
 """
@@ -311,6 +311,15 @@ class OrcaHess(SuperOpanHess):
     Initialize by passing the path to the file to be loaded as the
     `path` keyword argument.
 
+    To defer parsing of everything but the geometry and Hessian, pass
+    ``lazy=True`` as well. Each remaining instance variable is then parsed
+    from the file on first access and retained, which substantially
+    reduces load time and memory use when only the Hessian is of interest.
+    See :meth:`_load` for details.
+
+    The complete text of the file is retained in :attr:`in_str` unless
+    ``keep_str=False`` is passed.
+
     Information contained includes the Hessian matrix, the number of atoms,
     the atomic symbols, the atomic weights, and the geometry, as reported in
     the .hess file.  See 'Instance Variables' below for a full list.
@@ -366,124 +375,11 @@ class OrcaHess(SuperOpanHess):
 
         |
 
-        .. attribute:: at_block
-
-            Captures the entire block of atom IDs & weights, as
-            well as the geometry data.
-
-        .. attribute:: at_line
-
-            Retrieves individual lines within the atom / geometry
-            specification block.
-
-        .. attribute:: dipder_block
-
-            Captures the entire dipole derivatives block.
-
-        .. attribute:: dipder_line
-
-            Retrieves individual lines in the dipole derivatives block.
-
-        .. attribute:: eigvals_block
-
-            Captures the entire mass-weighted Hessian eigenvalues block.
-
-        .. attribute:: eigvals_line
-
-            Retrieves individual lines of the mass-weighted
-            hessian eigenvalues block.
-
-        .. attribute:: eigvecs_block
-
-            Captures the entire set of mass-weighted Hessian
-            eigenvectors blocks.
-
-        .. attribute:: eigvecs_sec
-
-            Extracts sections (individual blocks) of the mass-weighted
-            Hessian eigenvectors blocks.
-
-        .. attribute:: eigvecs_line
-
-            Retrieves individual lines of a mass-weighted
-            Hessian eigenvectors block.
-
-        .. attribute:: energy
-
-            Retrieves the energy reported in the .hess file.
-
-        .. attribute:: freq_block
-
-            Captures the entire vibrational frequencies block.
-
-        .. attribute:: freq_line
-
-            Retrieves individual lines of the frequencies block.
-
-        .. attribute:: hess_block
-
-            Captures the entire set of Hessian blocks.
-
-        .. attribute:: hess_sec
-
-            Extracts full-height, 3- or 6-column sections (individual
-            blocks) of the set of Hessian blocks.
-
-        .. attribute:: hess_line
-
-            Retrieves individual lines within a Hessian block.
-
-        .. attribute:: jobs_block
-
-            Captures the entire job list block.
-
-        .. attribute:: jobs_line
-
-            Retrieves individual lines of the job list block.
-
-        .. attribute:: ir_block
-
-            Captures the entire IR spectrum block
-
-        .. attribute:: ir_line
-
-            Retrieves individual lines of the IR spectrum block
-
-        .. attribute:: modes_block
-
-            Captures the entire set of (weighted, column-normalized)
-            normal modes blocks
-
-        .. attribute:: modes_sec
+        .. attribute:: block_head
 
-            Extracts full-height, 3- or 6-column sections (individual
-            blocks) of the set of normal modes blocks
-
-        .. attribute:: modes_line
-
-            Retrieves individual lines within a normal modes block
-
-        .. attribute:: polder_block
-
-            Captures the polarizability derivatives block
-
-        .. attribute:: polder_line
-
-            Retrieves individual lines in the polarizability
-            derivatives block
-
-        .. attribute:: raman_block
-
-            Captures the Raman spectrum block
-
-        .. attribute:: raman_line
-
-            Retrieves individual lines in the Raman spectrum block
-
-        .. attribute:: temp
-
-            Retrieves the 'actual temperature' field (sometimes
-            is spuriously zero)
+            Locates the '$' header line of each data block in the
+            .hess file, capturing the block name. A single forward scan
+            with this pattern splits the file into its constituent blocks.
 
     |
 
@@ -532,7 +428,9 @@ class OrcaHess(SuperOpanHess):
 
     .. attribute:: OrcaHess.in_str
 
-        |str| -- Complete contents of the imported .hess file
+        |str| -- Complete contents of the imported .hess file, unless
+        loaded with ``keep_str=False``, in which case |None|. If loaded
+        with ``lazy=True``, the file is re-read on first access.
 
     .. attribute:: OrcaHess.ir_comps
 
@@ -900,8 +798,76 @@ class OrcaHess(SuperOpanHess):
         .*$                             # Whatever to end of line
         """, _re.I | _re.M | _re.X)
 
+        # Header line of each data block. All data in the .hess file lives
+        #  in blocks introduced by a '$name' line, so one forward scan with
+        #  this pattern is sufficient to locate every block in the file.
+        #  The contents of each block are then parsed in bulk, rather than
+        #  by separate Regex searches through the entire file.
+        block_head = _re.compile("""
+        ^\\$(?P<name>[a-z0-9_]+)        # '$' and block name, at line start
+        .*$\\n?                         # Whatever to end of line
+        """, _re.I | _re.M | _re.X)
+
+        # Identical pattern, for indexing the raw bytes of the file
+        #  when loading lazily
+        block_head_bytes = _re.compile(b"""
+        ^\\$(?P<name>[a-z0-9_]+)        # '$' and block name, at line start
+        .*$\\n?                         # Whatever to end of line
+        """, _re.I | _re.M | _re.X)
+
     ## end class Pat
 
+    # Instance variables whose parsing is deferred to first access when
+    #  loaded with `lazy`, mapped to the method that parses them
+    _lazy_attrs = {'in_str': '_load_in_str',
+                    'freqs': '_load_freqs',
+                    'modes': '_load_modes',
+                    'energy': '_load_energy',
+                    'temp': '_load_temp',
+                    'dipders': '_load_dipders',
+                    'ir_comps': '_load_ir',
+                    'ir_mags': '_load_ir',
+                    'polders': '_load_polders',
+                    'raman_acts': '_load_raman',
+                    'raman_depols': '_load_raman',
+                    'joblist': '_load_joblist',
+                    'mwh_eigvals': '_load_eigvals',
+                    'mwh_eigvecs': '_load_eigvecs'}
+
+    # Instance variables held in the parse cache
+    _cache_attrs = ('num_ats', 'atom_syms', 'atom_masses', 'geom', 'hess',
+                    'freqs', 'modes', 'energy', 'temp', 'dipders',
+                    'ir_comps', 'ir_mags', 'polders', 'raman_acts',
+                    'raman_depols', 'joblist', 'mwh_eigvals', 'mwh_eigvecs')
+
+    # Version of the parse, as recorded in the parse cache; increment
+    #  whenever the parsed data could change
+    _cache_version = 1
+
+
+    def __getattr__(self, name):
+        """ Parse lazily-loaded data on first access.
+
+        Only invoked when normal attribute lookup fails. The parsed data
+        are stored as ordinary instance variables, so subsequent
+        accesses do not pass through here.
+
+        """
+
+        # Only deferred instance variables are handled, and only
+        #  for an instance loaded with `lazy`
+        if not (name in OrcaHess._lazy_attrs and
+                                    self.__dict__.get('_lazy', False)):
+            raise AttributeError("'{0}' object has no attribute '{1}'"
+                                    .format(type(self).__name__, name))
+        ## end if
+
+        # Parse and return
+        getattr(self, OrcaHess._lazy_attrs[name])()
+        return self.__dict__[name]
+
+    ## end def __getattr__
+
 
     def _load(self, **kwargs):
         """ Initialize OrcaHess Hessian object from .hess file
@@ -914,6 +880,20 @@ class OrcaHess(SuperOpanHess):
         block that is present, some flavor of :exc:`~opan.error.HessError`
         will be raised.
 
+        The file is split into its '$'-delimited blocks in a single pass,
+        and the numerical contents of each block are then converted
+        to |nparray| form in bulk.
+
+        If `lazy` is |True|, only the locations of the blocks within the
+        file are indexed at load time, and only the geometry and Hessian
+        are parsed. Each remaining instance variable is parsed from the
+        file on its first access, and stored. The presence of all required
+        blocks is still confirmed at load time, but any
+        :exc:`~opan.error.HessError` arising from malformed contents of
+        a deferred block is raised on first access instead. The file
+        must remain in place, unmodified, for the lifetime of a lazily
+        loaded instance.
+
         Parameters
         ----------
         path
@@ -921,6 +901,25 @@ class OrcaHess(SuperOpanHess):
             `kwargs` parameter specifying complete path to the
             .hess file to be read.
 
+        lazy
+            |bool|, optional --
+            `kwargs` parameter; if |True|, defer parsing of all blocks
+            other than the geometry and Hessian until first access.
+            Default is |False|.
+
+        keep_str
+            |bool|, optional --
+            `kwargs` parameter; if |True| (the default), retain the
+            complete text of the file in :attr:`in_str`. If |False|, the
+            text is discarded once parsed and :attr:`in_str` is |None|.
+
+        cache
+            |bool| or :class:`~opan.utils.cache.ParseCache`, optional --
+            `kwargs` parameter specifying the parse cache to use, as for
+            :func:`~opan.utils.cache.get_cache`. Default is |None|, the
+            default cache if one is configured. Used only if `lazy` is
+            |False| and `keep_str` is |False|.
+
         Raises
         ------
         ~opan.error.HessError
@@ -936,143 +935,10 @@ class OrcaHess(SuperOpanHess):
 
         """
 
-        # Local method(s)
-        def parse_multiblock(hesstext, p_block, p_sec, p_line, num_ats,
-                                                            blockname, tc):
-            """ Helper function for importing blocks with multiple sections.
-
-            Parsing of data spanning multiple sections of columns is somewhat
-            involved. This function encapsulates the process for cleaner
-            code.  The structure depends critically on several formatting
-            features of |orca| .hess files.
-
-            Note the search groups that must be present in the `p_block` and
-            `p_line` Regex patterns.
-
-            Parameters
-            ----------
-            hesstest
-                |str| --
-                Complete text of the .hess file
-
-            p_block
-                |re.compile| pattern --
-                Retrieves the **entirety** of the relevant block
-                Required groups:
-                    dim     : overall dimension of the data block
-                    block   : contents of the block, including column headers
-
-            p_sec
-                |re.compile| pattern --
-                Retrieves each section of data columns
-
-            p_line
-                |re.compile| pattern --
-                Retrieves individual lines of a section
-                Required groups:
-                    row     : Row index into the final data block
-                    e#      : Column index into the data section (# in range(6))
-
-            num_ats
-                |int| --
-                Number of atoms in the geometry
-
-            blockname
-                |str| --
-                Brief text description of the block being imported, if needed
-                for error reporting purposes
-
-            tc
-                :class:`~opan.error.HessError` typecode --
-                Type of error to be thrown, if required
-
-            Returns
-            -------
-            workmtx
-                3N x 3N |npfloat_| --
-                Assembled array for storage
-
-            """
-
-            # Pull the block
-            m_block = p_block.search(hesstext)
-
-            # Confirm the anticipated matrix size matches 3*num_ats
-            if not int(m_block.group("dim")) == 3*num_ats:
-                raise HessError(tc, blockname + " dimension " +
-                        "specification mismatched with geometry",
-                        "HESS File: " + hess_path)
-            ## end if
-
-            # Initialize the working matrix
-            workmtx = np.zeros((3*num_ats, 3*num_ats), dtype=np.float_)
-
-            # Initialize the column offset for populating the matrix
-            col_offset = 0
-
-            # Initialize the counter for the number of row sections imported
-            rows_counter = 0
-
-            # Loop through the subsections of the matrix
-            for m_sec in p_sec.finditer(m_block.group("block")):
-                # Loop through each entry
-                for m_line in p_line.finditer(m_sec.group(0)):
-                    # Store the row; expect base zero so no adjustment needed.
-                    rowval = scast(m_line.group("row"), np.int_)
-
-                    # Loop to fill the row
-                    for i in range(6):
-                        # Store the element
-                        val = scast(m_line.group('e{0}'.format(i)), np.float_)
-
-                        # Only store to matrix if a value actually retrieved.
-                        #  This protects against the final three-column section
-                        #  in blocks for systems with an odd number of atoms.
-                        if not np.isnan(val):
-                            workmtx[rowval, col_offset + i] = val
-                        ## end if
-                    ## next i
-
-                    # Increment the row-read counter
-                    rows_counter += 1
-
-                ## next m_hess_line
-
-                # Last thing is to increment the offset by six. Don't have to
-                #  worry about offsetting for a section only three columns wide
-                #  because that SHOULD only ever occur at the last section
-                col_offset += 6
-
-            ## next m_hess_sec
-
-            # Check to ensure that the column offset is high enough to have
-            #  fully populated the matrix based on the number of atoms. This is
-            #  a check against malformation of the HESS file, resulting in a
-            #  reduced number of sections being retrieved.
-            if not col_offset >= (3 * num_ats):
-                raise HessError(tc, "Insufficient number of " + blockname +
-                        " sections found",
-                        "HESS File: " + hess_path)
-            ## end if
-
-            # Additional cross-check on number of rows imported
-            if (rows_counter % (3*num_ats)) != 0:
-                # Not the right number of rows; complain
-                raise HessError(tc,
-                            blockname + " row count mismatch",
-                            "HESS File: " + hess_path)
-            ## end if
-
-            # Return the working matrix
-            return workmtx
-
-        ## end def parse_multiblock
-
         # Imports
-        import re, numpy as np
+        import numpy as np
         from .error import HessError
-        from .utils import safe_cast as scast
-        from .const import atom_num, atom_sym, PRM, DEF
+        from .utils.cache import get_cache
 
         # Check if instantiated; complain if so
         if 'hess_path' in dir(self):
@@ -1083,65 +949,480 @@ class OrcaHess(SuperOpanHess):
         # Retrieve the file target and store
         hess_path = kwargs['path']
         self.hess_path = hess_path
+        self._lazy = kwargs.get('lazy', False)
+        keep_str = kwargs.get('keep_str', True)
+
+        # Serve from the parse cache if possible
+        cache = None if self._lazy or keep_str else \
+                                    get_cache(kwargs.get('cache'))
+        if cache is not None:
+            data, stamp = cache.load(hess_path, 'hess',
+                                        version=self._cache_version)
+            if data is not None:
+                data.update(atom_masses=list(data['atom_masses']))
+                self.__dict__.update(data)
+                self.in_str = None
+                self._blocks = {}
+                return
+            ## end if
+        ## end if
 
-        # Open file, read contents, close stream
-        with open(hess_path,'rU') as in_fl:
-            self.in_str = in_fl.read()
-        ## end with
-
-        # Store the source string
-        srcstr = "HESS File: {0}".format(hess_path)
+        # Index the file into its blocks in a single pass, keyed by the
+        #  lowercased block name and storing the bounds of the contents of
+        #  each. Only the first instance of any repeated block is retained.
+        if self._lazy:
+            # Positions are byte offsets into the file; the raw contents
+            #  are discarded once indexed
+            with open(hess_path, 'rb') as in_fl:
+                text = in_fl.read()
+            ## end with
+            heads = list(self.Pat.block_head_bytes.finditer(text))
+        else:
+            # Open file, read contents, close stream
+            with open(hess_path,'rU') as in_fl:
+                self.in_str = in_fl.read()
+            ## end with
+            text = self.in_str
+            heads = list(self.Pat.block_head.finditer(text))
+        ## end if
+        self._blocks = {}
+        for i, m in enumerate(heads):
+            end = heads[i + 1].start() if i + 1 < len(heads) else len(text)
+            self._blocks.setdefault(m.group("name").decode().lower()
+                                    if self._lazy else
+                                    m.group("name").lower(), (m.end(), end))
+        ## next i, m
+        del text
 
         # Check to ensure all required data blocks are found
-        if not OrcaHess.Pat.at_block.search(self.in_str):
+        if 'atoms' not in self._blocks:
             raise HessError(HessError.AT_BLOCK,
-                    "Atom specification block not found", srcstr)
+                    "Atom specification block not found", self._srcstr)
         ## end if
-        if not OrcaHess.Pat.hess_block.search(self.in_str):
+        if 'hessian' not in self._blocks:
             raise HessError(HessError.HESS_BLOCK,
-                    "Hessian block not found", srcstr)
+                    "Hessian block not found", self._srcstr)
         ## end if
-        if not OrcaHess.Pat.freq_block.search(self.in_str):
+        if 'vibrational_frequencies' not in self._blocks:
             raise HessError(HessError.FREQ_BLOCK,
-                    "Frequencies block (cm**-1 units) not found", srcstr)
+                    "Frequencies block (cm**-1 units) not found", self._srcstr)
         ## end if
-        if not OrcaHess.Pat.modes_block.search(self.in_str):
+        if 'normal_modes' not in self._blocks:
             raise HessError(HessError.MODES_BLOCK,
-                    "Normal modes block not found", srcstr)
+                    "Normal modes block not found", self._srcstr)
         ## end if
-        if not OrcaHess.Pat.energy.search(self.in_str):
+        if 'act_energy' not in self._blocks:
             raise HessError(HessError.ENERGY,
-                    "Energy value not found", srcstr)
+                    "Energy value not found", self._srcstr)
         ## end if
-        if not OrcaHess.Pat.temp.search(self.in_str):
+        if 'actual_temperature' not in self._blocks:
             raise HessError(HessError.TEMP,
-                    "'Actual temperature' value not found", srcstr)
+                    "'Actual temperature' value not found", self._srcstr)
+        ## end if
+
+        # Geometry and Hessian are always needed
+        self._load_atoms()
+        self._load_hess()
+
+        # Everything else, if not deferred. Order matters here only for the
+        #  sequence in which errors are raised for a file with multiple
+        #  problems; dependencies among the blocks are handled regardless.
+        if not self._lazy:
+            self._load_modes()
+            self._load_freqs()
+            self._load_energy()
+            self._load_temp()
+            self._load_dipders()
+            self._load_ir()
+            self._load_polders()
+            self._load_raman()
+            self._load_joblist()
+            self._load_eigvals()
+            self._load_eigvecs()
+        ## end if
+
+        # Discard the file contents unless asked to keep them. If lazy and
+        #  keeping, they are read on demand.
+        if not keep_str:
+            self.in_str = None
+        ## end if
+
+        # Cache the results
+        if cache is not None:
+            data = dict((k, getattr(self, k)) for k in self._cache_attrs)
+            data.update(atom_masses=np.array(self.atom_masses))
+            cache.store(hess_path, 'hess', data, stamp,
+                                        version=self._cache_version)
+        ## end if
+
+    ## end def _load
+
+
+    @property
+    def _srcstr(self):
+        """ Source string for :exc:`~opan.error.HessError` reporting """
+        return "HESS File: {0}".format(self.hess_path)
+
+    ## end def _srcstr
+
+
+    def _block_lines(self, name):
+        """ Retrieve the contents of a block, split into lines.
+
+        Parameters
+        ----------
+        name
+            |str| -- Lowercase name of the block, without the leading '$'
+
+        Returns
+        -------
+        lines
+            |list| of |str| --
+            Lines of the block following its header line, or |None| if the
+            block is absent from the file
+
+        """
+
+        # Absent block
+        if name not in self._blocks:
+            return None
         ## end if
 
+        start, end = self._blocks[name]
+
+        # Read from the file if lazy; slice the stored contents if not
+        if self._lazy:
+            with open(self.hess_path, 'rb') as in_fl:
+                in_fl.seek(start)
+                text = in_fl.read(end - start).decode()
+            ## end with
+        else:
+            text = self.in_str[start:end]
+        ## end if
+
+        return text.splitlines()
+
+    ## end def _block_lines
+
+
+    def _lines_to_array(self, lines, dtype, blockname, tc):
+        """ Bulk conversion of whitespace-delimited lines to an array.
+
+        Parameters
+        ----------
+        lines
+            |list| of |str| -- Lines of the block to be converted
+
+        dtype
+            |type| -- `dtype` of the resulting array
+
+        blockname
+            |str| --
+            Brief text description of the block being imported, if needed
+            for error reporting purposes
+
+        tc
+            :class:`~opan.error.HessError` typecode --
+            Type of error to be thrown, if required
+
+        Returns
+        -------
+        arr
+            two-dimensional |nparray| --
+            One row per line of `lines`
+
+        """
+
+        # Imports
+        import numpy as np
+        from .error import HessError
+
+        # Ragged rows and non-numeric entries both raise ValueError
+        #  on conversion
+        try:
+            return np.array([l.split() for l in lines], dtype=dtype)
+        except ValueError:
+            raise HessError(tc, "Malformed data in " + blockname +
+                    " block", self._srcstr)
+        ## end try
+
+    ## end def _lines_to_array
+
+
+    def _block_dims(self, lines, num, blockname, tc):
+        """ Retrieve the leading dimension value(s) of a block.
+
+        Parameters
+        ----------
+        lines
+            |list| of |str| -- All lines of the block
+
+        num
+            |int| -- Number of dimension values expected
+
+        blockname
+            |str| --
+            Brief text description of the block being imported, if needed
+            for error reporting purposes
+
+        tc
+            :class:`~opan.error.HessError` typecode --
+            Type of error to be thrown, if required
+
+        Returns
+        -------
+        dims
+            |list| of |int| -- Dimension value(s) of the block
+
+        """
+
+        # Imports
+        from .error import HessError
+
+        try:
+            dims = [int(v) for v in lines[0].split()[:num]]
+        except (IndexError, ValueError):
+            dims = []
+        ## end try
+
+        if len(dims) != num:
+            raise HessError(tc, blockname + " dimension " +
+                    "specification not found", self._srcstr)
+        ## end if
+
+        return dims
+
+    ## end def _block_dims
+
+
+    def _parse_rowblock(self, lines, nrows, ncols, blockname, tc):
+        """ Helper function for importing single-section blocks.
+
+        Parameters
+        ----------
+        lines
+            |list| of |str| --
+            Lines of the block, following the dimension specification
+
+        nrows
+            |int| -- Number of data rows expected in the block
+
+        ncols
+            |int| -- Number of data columns expected in each row
+
+        blockname
+            |str| --
+            Brief text description of the block being imported, if needed
+            for error reporting purposes
+
+        tc
+            :class:`~opan.error.HessError` typecode --
+            Type of error to be thrown, if required
+
+        Returns
+        -------
+        workmtx
+            `nrows` x `ncols` |npfloat_| --
+            Block contents
+
+        """
+
+        # Imports
+        import numpy as np
+        from .error import HessError
+
+        workmtx = self._lines_to_array(lines[:nrows], np.float_,
+                                                        blockname, tc)
+
+        # Proofread for proper size. Truncation of the block, or any
+        #  row not containing the right number of values, will result
+        #  in a mismatch here.
+        if workmtx.shape != (nrows, ncols):
+            raise HessError(tc, "Number of " + blockname + " rows != " +
+                    "{0}".format(nrows), self._srcstr)
+        ## end if
+
+        return workmtx
+
+    ## end def _parse_rowblock
+
+
+    def _parse_multiblock(self, lines, blockname, tc):
+        """ Helper function for importing blocks with multiple sections.
+
+        Parsing of data spanning multiple sections of columns is somewhat
+        involved. This function encapsulates the process for cleaner
+        code.  The structure depends critically on several formatting
+        features of |orca| .hess files: each section is a line of
+        integer column headers, followed by exactly 3N lines each
+        holding a row index and the data values for those columns.
+
+        Parameters
+        ----------
+        lines
+            |list| of |str| --
+            Lines of the block, following the dimension specification
+
+        blockname
+            |str| --
+            Brief text description of the block being imported, if needed
+            for error reporting purposes
+
+        tc
+            :class:`~opan.error.HessError` typecode --
+            Type of error to be thrown, if required
+
+        Returns
+        -------
+        workmtx
+            3N x 3N |npfloat_| --
+            Assembled array for storage
+
+        """
+
+        # Imports
+        import numpy as np
+        from .error import HessError
+
+        # Convenience dimension
+        dim = 3 * self.num_ats
+
+        # Initialize the working matrix
+        workmtx = np.zeros((dim, dim), dtype=np.float_)
+
+        # Row indices expected at the head of each section row
+        rowvals = np.arange(dim, dtype=np.float_)
+
+        # Initialize the column offset for populating the matrix, and the
+        #  position of the current section header within the lines
+        col_offset = 0
+        pos = 0
+
+        # Loop through the sections until the matrix is fully populated
+        while col_offset < dim:
+            # Column headers of the section; their absence indicates
+            #  that the file is truncated or otherwise malformed.
+            try:
+                cols = [int(v) for v in lines[pos].split()]
+            except (IndexError, ValueError):
+                cols = []
+            ## end try
+            if (len(cols) == 0 or cols != list(range(col_offset,
+                                            col_offset + len(cols))) or
+                                            col_offset + len(cols) > dim):
+                raise HessError(tc, "Insufficient number of " +
+                        blockname + " sections found", self._srcstr)
+            ## end if
+
+            # Bulk import of the section, including the row indices
+            sec = self._lines_to_array(lines[pos + 1:pos + 1 + dim],
+                                                np.float_, blockname, tc)
+
+            # Cross-check on number and labeling of rows imported
+            if (sec.shape != (dim, len(cols) + 1) or
+                            not np.array_equal(sec[:, 0], rowvals)):
+                raise HessError(tc, blockname + " row count mismatch",
+                        self._srcstr)
+            ## end if
+
+            # Store and advance to the next section
+            workmtx[:, col_offset:col_offset + len(cols)] = sec[:, 1:]
+            col_offset += len(cols)
+            pos += dim + 1
+
+        ## loop
+
+        # Return the working matrix
+        return workmtx
+
+    ## end def _parse_multiblock
+
+
+    def _parse_value(self, name, blockname, tc):
+        """ Retrieve the single value stored in a block.
+
+        Parameters
+        ----------
+        name
+            |str| -- Lowercase name of the block
+
+        blockname
+            |str| --
+            Brief text description of the value being imported, if needed
+            for error reporting purposes
+
+        tc
+            :class:`~opan.error.HessError` typecode --
+            Type of error to be thrown, if required
+
+        Returns
+        -------
+        val
+            |npfloat_| -- Value stored in the block
+
+        """
+
+        # Imports
+        import numpy as np
+        from .error import HessError
+
+        try:
+            return np.float_(self._block_lines(name)[0].split()[0])
+        except (IndexError, ValueError):
+            raise HessError(tc, blockname + " not found", self._srcstr)
+        ## end try
+
+    ## end def _parse_value
+
+
+    def _load_in_str(self):
+        """ Read the complete contents of the .hess file. """
+
+        with open(self.hess_path,'rU') as in_fl:
+            self.in_str = in_fl.read()
+        ## end with
+
+    ## end def _load_in_str
+
+
+    def _load_atoms(self):
+        """ Parse the geometry specification block. """
+
+        # Imports
+        import numpy as np
+        from .error import HessError
+        from .const import atom_num, atom_sym
 
-        #=== Geometry spec block ===#
         # Store the block
-        m_work = self.Pat.at_block.search(self.in_str)
+        lines = self._block_lines('atoms')
 
         # Bring in the number of atoms
-        self.num_ats = np.int_(m_work.group("num"))
+        self.num_ats = np.int_(self._block_dims(lines, 1,
+                            "Atom specification", HessError.AT_BLOCK)[0])
 
-        # Initialize the vectors of atomic symbols, masses, and the
-        #  geometry
-        self.atom_syms = []
-        self.atom_masses = []
-        self.geom = []
+        # Split the atom lines; each must hold the atomic number/element,
+        #  the atomic mass, and three coordinates
+        at_toks = [l.split() for l in lines[1:1 + self.num_ats]]
+
+        # Double-check that the number of atoms retrieved matches the
+        #  number indicated in the HESS file.
+        if not (len(at_toks) == self.num_ats and
+                                    all(len(t) == 5 for t in at_toks)):
+            raise HessError(HessError.AT_BLOCK, "Atomic symbol dimension " +
+                    "mismatch with HESS atom specification", self._srcstr)
+        ## end if
 
         # Parse the list of atoms
-        for m in OrcaHess.Pat.at_line.finditer(m_work.group("block")):
+        self.atom_syms = []
+        for t in at_toks:
             # Parse the element symbol or atomic number
             try:
                 # See if it casts as an int
-                num = scast(m.group('el'), np.int_)
-            except (ValueError, TypeError):
+                num = int(t[0])
+            except ValueError:
                 # Nope, must be letters. Check if valid by poking it into the
                 #  dict. If not valid, should raise another error.
-                num = atom_num[m.group('el').upper()]
+                num = atom_num[t[0].upper()]
             ## end try
 
             # If this point is reached, either it's cast ok to an int,
@@ -1149,108 +1430,135 @@ class OrcaHess(SuperOpanHess):
             #  is a valid element symbol. SO, convert back to atom_sym and
             #  store - this will also check for an invalid int entry
             self.atom_syms.append(atom_sym[num])
+        ## next t
 
-            # Parse the atomic weight; should be a simple append?
-            self.atom_masses.append(scast(m.group("mass"), np.float_))
+        # Bulk import of the atomic weights and the geometry
+        work = self._lines_to_array([" ".join(t[1:]) for t in at_toks],
+                        np.float_, "Atom specification", HessError.AT_BLOCK)
+        self.atom_masses = list(work[:, 0])
+        self.geom = work[:, 1:].flatten()
 
-            # Build geometry as a 1-D list
-            self.geom.extend([scast(m.group(gp), np.float_) for
-                                                gp in ['c1', 'c2', 'c3']])
-        ## next m
+    ## end def _load_atoms
 
-        # Double-check that the number of atoms retrieved matches the
-        #  number indicated in the HESS file. Checks of atomic masses
-        #  and geometry length are presumably redundant.
-        if not len(self.atom_syms) == self.num_ats:
-            raise HessError(HessError.AT_BLOCK, "Atomic symbol dimension " +
-                    "mismatch with HESS atom specification", srcstr)
+
+    def _load_hess(self):
+        """ Parse the Hessian block. """
+
+        # Imports
+        from .error import HessError
+
+        lines = self._block_lines('hessian')
+        if self._block_dims(lines, 1, "Hessian",
+                            HessError.HESS_BLOCK)[0] != 3*self.num_ats:
+            raise HessError(HessError.HESS_BLOCK, "Hessian dimension " +
+                    "specification mismatched with geometry", self._srcstr)
         ## end if
+        self.hess = self._parse_multiblock(lines[1:], "Hessian",
+                                                    HessError.HESS_BLOCK)
 
-        # Convert geometry to numpy storage form
-        self.geom = np.array(self.geom, dtype=np.float_)
+    ## end def _load_hess
 
-        #=== Hessian and modes ===#
-        # Pull the Hessian
-        self.hess = parse_multiblock(self.in_str, self.Pat.hess_block,
-                self.Pat.hess_sec, self.Pat.hess_line, self.num_ats,
-                "Hessian", HessError.HESS_BLOCK)
 
-        # Pull the modes
-        self.modes = parse_multiblock(self.in_str, self.Pat.modes_block,
-                self.Pat.modes_sec, self.Pat.modes_line, self.num_ats,
-                "modes", HessError.MODES_BLOCK)
+    def _load_modes(self):
+        """ Parse the normal modes block. """
+
+        # Imports
+        from .error import HessError
+
+        lines = self._block_lines('normal_modes')
+        dims = self._block_dims(lines, 2, "modes", HessError.MODES_BLOCK)
+        if dims[0] != 3*self.num_ats:
+            raise HessError(HessError.MODES_BLOCK, "modes dimension " +
+                    "specification mismatched with geometry", self._srcstr)
+        ## end if
+        self.modes = self._parse_multiblock(lines[1:], "modes",
+                                                    HessError.MODES_BLOCK)
 
         # Extra check of 'dim' vs 'dim2' on modes
-        m_work = self.Pat.modes_block.search(self.in_str)
-        if scast(m_work.group("dim"), np.int_) != \
-                            scast(m_work.group("dim2"), np.int_):
+        if dims[0] != dims[1]:
             raise HessError(HessError.MODES_BLOCK,
                     "Normal mode block dimension specification mismatch",
-                    srcstr)
+                    self._srcstr)
         ## end if
 
-        #=== Frequencies ===#
+    ## end def _load_modes
+
+
+    def _load_freqs(self):
+        """ Parse the vibrational frequencies block. """
+
+        # Imports
+        from .error import HessError
+
         # Pull the block
-        m_work = self.Pat.freq_block.search(self.in_str)
+        lines = self._block_lines('vibrational_frequencies')
 
         # Check that number of frequencies indicated in the block matches
         #  that expected from the number of atoms
-        if 3*self.num_ats != scast(m_work.group("num"), np.int_):
+        if 3*self.num_ats != self._block_dims(lines, 1, "Frequencies",
+                                                HessError.FREQ_BLOCK)[0]:
             raise HessError(HessError.FREQ_BLOCK,
                     "Count in frequencies block != 3 * number of atoms",
-                    srcstr)
+                    self._srcstr)
         ## end if
 
-        # Retrieve the frequencies
-        self.freqs = np.array(
-                [scast(m.group("freq"), np.float_) for m in
-                self.Pat.freq_line.finditer(m_work.group("block"))])
+        # Retrieve the frequencies; row width and count are proofread
+        #  by the helper
+        self.freqs = self._parse_rowblock(lines[1:], 3*self.num_ats, 2,
+                            "frequencies", HessError.FREQ_BLOCK)[:, 1].copy()
 
-        # Proofread for proper size
-        if not self.freqs.shape[0] == 3*self.num_ats:
-            raise HessError(HessError.FREQ_BLOCK,
-                    "Number of frequencies != 3 * number of atoms", srcstr)
-        ## end if
+    ## end def _load_freqs
 
 
-        #=== Pull the single values that should always be present ===#
-        # Store the reported energy
-        self.energy = scast(self.Pat.energy.search(self.in_str).group("en"),
-                                                                    np.float_)
+    def _load_energy(self):
+        """ Retrieve the reported energy. """
+
+        # Imports
+        from .error import HessError
+
+        self.energy = self._parse_value('act_energy', "Energy value",
+                                                        HessError.ENERGY)
+
+    ## end def _load_energy
+
+
+    def _load_temp(self):
+        """ Retrieve the reported 'actual temperature'. """
+
+        # Imports
+        from .error import HessError
 
-        # Store the reported 'actual temperature'
-        self.temp = scast(self.Pat.temp.search(self.in_str).group("temp"),
-                                                                    np.float_)
+        self.temp = self._parse_value('actual_temperature',
+                            "'Actual temperature' value", HessError.TEMP)
+
+    ## end def _load_temp
+
+
+    def _load_dipders(self):
+        """ Parse the dipole derivatives block, if present. """
+
+        # Imports
+        import numpy as np
+        from .error import HessError
+        from .const import PRM
 
-        #=== Dipole derivatives ===#
         # Check if block found. Store None if not; otherwise import
-        m_work = self.Pat.dipder_block.search(self.in_str)
-        if m_work is None:
+        lines = self._block_lines('dipole_derivatives')
+        if lines is None:
             self.dipders = None
         else:
             # Check that number of derivatives rows indicated in the block
             #  matches that expected from the number of atoms
-            if 3*self.num_ats != scast(m_work.group("dim"), np.int_):
+            if 3*self.num_ats != self._block_dims(lines, 1,
+                        "Dipole derivatives", HessError.DIPDER_BLOCK)[0]:
                 raise HessError(HessError.DIPDER_BLOCK,
                         "Count in dipole derivatives block != 3 * # of atoms",
-                        srcstr)
+                        self._srcstr)
             ## end if
 
             # Retrieve the derivatives
-            self.dipders = np.array(
-                    [[scast(m.group("e{0}".format(i)), np.float_)
-                        for i in range(3)]
-                        for m in self.Pat.dipder_line.finditer(
-                                                    m_work.group("block")) ])
-
-            # Proofread for proper size. Don't have to proofread the width of
-            #  three, since any row not containing three numerical values will
-            #  result in the block getting truncated, per the Regex constrution.
-            if not self.dipders.shape[0] == 3*self.num_ats:
-                raise HessError(HessError.DIPDER_BLOCK,
-                        "Number of dipole derivative rows != \
-                        3 * number of atoms", srcstr)
-            ## end if
+            self.dipders = self._parse_rowblock(lines[1:], 3*self.num_ats, 3,
+                            "dipole derivative", HessError.DIPDER_BLOCK)
 
             # If max-absolute element is too big, overwrite with None
             if np.max(np.abs(self.dipders)) > PRM.MAX_SANE_DIPDER:
@@ -1258,220 +1566,218 @@ class OrcaHess(SuperOpanHess):
             ## end if
         ## end if
 
+    ## end def _load_dipders
+
+
+    def _load_ir(self):
+        """ Parse the IR spectrum block, if present and meaningful. """
+
+        # Imports
+        import numpy as np
+        from .error import HessError
+        from .const import DEF
 
-        #=== IR Spectrum ===#
         # If dipole derivs absent or munged, or if block missing, then skip
-        m_work = self.Pat.ir_block.search(self.in_str)
-        if self.dipders is None or m_work is None:
+        lines = (None if self.dipders is None
+                        else self._block_lines('ir_spectrum'))
+        if lines is None:
             self.ir_comps = None
             self.ir_mags = None
         else:
             # Complain if number of stated modes mismatches expectation
-            if 3*self.num_ats != np.int_(m_work.group("dim")):
+            if 3*self.num_ats != self._block_dims(lines, 1, "IR spectrum",
+                                                HessError.IR_BLOCK)[0]:
                 raise HessError(HessError.IR_BLOCK,
                         "Count in IR spectrum block != 3 * # of atoms",
-                        srcstr)
+                        self._srcstr)
             ## end if
 
-            # Pull the blocks
-            self.ir_comps = np.array(
-                    [[scast(m.group("e{0}".format(i)), np.float_)
-                        for i in range(3)]
-                        for m in self.Pat.ir_line.finditer(
-                                                    m_work.group("block")) ])
-            self.ir_mags = np.array(
-                    [scast(m.group("mag"), np.float_)
-                        for m in self.Pat.ir_line.finditer(
-                                                    m_work.group("block")) ])
-
-            # Confirm length of ir_mags conforms. Shouldn't need to check both,
-            #  since they both rely equally on Pat.ir_line.finditer.
-            if 3*self.num_ats != self.ir_mags.shape[0]:
-                raise HessError(HessError.IR_BLOCK,
-                        "Number of IR spectrum rows != \
-                        3 * number of atoms", srcstr)
-            ## end if
+            # Pull the block
+            work = self._parse_rowblock(lines[1:], 3*self.num_ats, 5,
+                            "IR spectrum", HessError.IR_BLOCK)
 
             # Confirm match of all frequencies with those reported separately
-            if not np.allclose(
-                    self.freqs,
-                    np.array([np.float_(m.group('freq'))
-                                for m in self.Pat.ir_line.finditer(
-                                m_work.group("block") )]),
-                    rtol=0,
-                    atol=DEF.HESS_IR_MATCH_TOL):
+            if not np.allclose(self.freqs, work[:, 0], rtol=0,
+                                            atol=DEF.HESS_IR_MATCH_TOL):
                 raise HessError(HessError.IR_BLOCK,
                         "Frequency mismatch between freq and IR blocks",
-                        srcstr)
+                        self._srcstr)
             ## end if
+
+            self.ir_comps = work[:, 2:].copy()
+            self.ir_mags = work[:, 1].copy()
         ## end if
 
+    ## end def _load_ir
+
+
+    def _load_polders(self):
+        """ Parse the polarizability derivatives block, if present. """
+
+        # Imports
+        from .error import HessError
 
-        #=== Polarizability Derivatives ===#
         # If block is missing, skip it
-        m_work = self.Pat.polder_block.search(self.in_str)
-        if m_work is None:
+        lines = self._block_lines('polarizability_derivatives')
+        if lines is None:
             self.polders = None
         else:
             # Check that number of derivatives rows indicated in the block
             #  matches that expected from the number of atoms
-            if 3*self.num_ats != np.int_(m_work.group("dim")):
+            if 3*self.num_ats != self._block_dims(lines, 1,
+                                "Polarizability derivatives",
+                                HessError.POLDER_BLOCK)[0]:
                 raise HessError(HessError.POLDER_BLOCK,
                         "Count in polarizability derivatives block \
-                        != 3 * # of atoms", srcstr)
+                        != 3 * # of atoms", self._srcstr)
             ## end if
 
             # Retrieve the derivatives
-            self.polders = np.array(
-                    [[scast(m.group("e{0}".format(i)), np.float_)
-                        for i in range(6)]
-                        for m in self.Pat.polder_line.finditer(
-                                                    m_work.group("block")) ])
-
-            # Proofread for proper size. Don't have to proofread the width of
-            #  six, since any row not containing six numerical values will
-            #  result in the block getting truncated.
-            if not self.polders.shape[0] == 3*self.num_ats:
-                raise HessError(HessError.POLDER_BLOCK,
-                        "Number of polarizability derivative rows != \
-                        3 * number of atoms", srcstr)
-            ## end if
+            self.polders = self._parse_rowblock(lines[1:], 3*self.num_ats, 6,
+                            "polarizability derivative",
+                            HessError.POLDER_BLOCK)
         ## end if
 
+    ## end def _load_polders
+
+
+    def _load_raman(self):
+        """ Parse the Raman spectrum block, if present and meaningful. """
+
+        # Imports
+        import numpy as np
+        from .error import HessError
+        from .const import DEF
 
-        #=== Raman Spectrum ===#
         # If polarizability derivs absent or munged, or if block missing,
         #  then skip
-        m_work = self.Pat.raman_block.search(self.in_str)
-        if self.polders is None or m_work is None:
+        lines = (None if self.polders is None
+                        else self._block_lines('raman_spectrum'))
+        if lines is None:
             self.raman_acts = None
             self.raman_depols = None
         else:
             # Complain if number of stated modes mismatches expectation
-            if 3*self.num_ats != np.int_(m_work.group("dim")):
+            if 3*self.num_ats != self._block_dims(lines, 1, "Raman spectrum",
+                                                HessError.RAMAN_BLOCK)[0]:
                 raise HessError(HessError.RAMAN_BLOCK,
                         "Count in Raman spectrum block != 3 * # of atoms",
-                        srcstr)
+                        self._srcstr)
             ## end if
 
-            # Pull the blocks
-            self.raman_acts = np.array(
-                    [np.float_(m.group("act"))
-                        for m in self.Pat.raman_line.finditer(
-                                                    m_work.group("block")) ])
-            self.raman_depols = np.array(
-                    [np.float_(m.group("depol"))
-                        for m in self.Pat.raman_line.finditer(
-                                                    m_work.group("block")) ])
-
-            # Confirm length of raman_acts conforms. Shouldn't need to check
-            #  both, since they both rely equally on Pat.raman_line.finditer.
-            if 3*self.num_ats != self.raman_acts.shape[0]:
-                raise HessError(HessError.RAMAN_BLOCK,
-                        "Number of Raman spectrum rows != \
-                        3 * number of atoms", srcstr)
-            ## end if
+            # Pull the block
+            work = self._parse_rowblock(lines[1:], 3*self.num_ats, 3,
+                            "Raman spectrum", HessError.RAMAN_BLOCK)
 
             # Confirm match of all frequencies with those reported separately
-            if not np.allclose(
-                    self.freqs,
-                    np.array([np.float_(m.group('freq'))
-                                for m in self.Pat.raman_line.finditer(
-                                m_work.group("block")) ]),
-                    rtol=0,
-                    atol=DEF.HESS_IR_MATCH_TOL):
+            if not np.allclose(self.freqs, work[:, 0], rtol=0,
+                                            atol=DEF.HESS_IR_MATCH_TOL):
                 raise HessError(HessError.RAMAN_BLOCK,
                         "Frequency mismatch between freq and Raman blocks",
-                        srcstr)
+                        self._srcstr)
             ## end if
+
+            self.raman_acts = work[:, 1].copy()
+            self.raman_depols = work[:, 2].copy()
         ## end if
 
+    ## end def _load_raman
+
+
+    def _load_joblist(self):
+        """ Parse the job list block, if present. """
+
+        # Imports
+        import numpy as np
+        from .error import HessError
 
-        #=== Job list ===#
         # Check if block found. Store None if not; otherwise import
-        m_work = self.Pat.jobs_block.search(self.in_str)
-        if m_work is None:
+        lines = self._block_lines('job_list')
+        if lines is None:
             self.joblist = None
         else:
             # Check that number of joblist rows indicated in the block
             #  matches that expected from the number of atoms
-            if 3*self.num_ats != np.int_(m_work.group("dim")):
+            if 3*self.num_ats != self._block_dims(lines, 1, "Job list",
+                                                HessError.JOB_BLOCK)[0]:
                 raise HessError(HessError.JOB_BLOCK,
-                        "Count in job list block != 3 * # of atoms", srcstr)
+                        "Count in job list block != 3 * # of atoms",
+                        self._srcstr)
             ## end if
 
-            # Retrieve the job list
-            self.joblist = np.array(
-                    [[scast(m.group("e{0}".format(i)), np.float_)
-                        for i in range(3)]
-                        for m in self.Pat.jobs_line.finditer(
-                                                    m_work.group("block")) ])
-
-            # Proofread for proper size. Don't have to proofread the width of
-            #  three, since any row not containing three numerical values will
-            #  result in the block getting truncated.
-            if not self.joblist.shape[0] == self.num_ats:
-                raise HessError(HessError.JOB_BLOCK,
-                        "Number of job list rows != number of atoms", srcstr)
-            ## end if
-
-            # Convert to boolean
-            self.joblist = np.equal(self.joblist, np.ones_like(self.joblist))
+            # Retrieve the job list, one row per atom, and convert
+            #  to boolean
+            work = self._parse_rowblock(lines[1:], self.num_ats, 4,
+                            "job list", HessError.JOB_BLOCK)
+            self.joblist = np.equal(work[:, 1:], 1)
 
         ## end if
 
+    ## end def _load_joblist
+
+
+    def _load_eigvals(self):
+        """ Parse the mass-weighted Hessian eigenvalues, if present. """
+
+        # Imports
+        from .error import HessError
 
-        #=== Mass-weighted Hessian -- Eigenvalues ===#
         # Pull the block; continue only if block is present
-        m_work = self.Pat.eigvals_block.search(self.in_str)
-        if m_work is None:
+        lines = self._block_lines('eigenvalues_mass_weighted_hessian')
+        if lines is None:
             self.mwh_eigvals = None
         else:
             # Check that number of eigenvalues indicated in the block matches
             #  that expected from the number of atoms
-            if 3*self.num_ats != np.int_(m_work.group("dim")):
+            if 3*self.num_ats != self._block_dims(lines, 1,
+                        "MWH eigenvalues", HessError.EIGVAL_BLOCK)[0]:
                 raise HessError(HessError.EIGVAL_BLOCK,
                         "Count in MWH eigenvalues block != 3 * number of atoms",
-                        srcstr)
+                        self._srcstr)
             ## end if
 
             # Retrieve the eigenvalues
-            self.mwh_eigvals = np.array(
-                    [np.float_(m.group("eig")) for m in
-                    self.Pat.eigvals_line.finditer(m_work.group("block"))])
-
-            # Proofread for proper size
-            if not self.mwh_eigvals.shape[0] == 3*self.num_ats:
-                raise HessError(HessError.EIGVAL_BLOCK,
-                        "Number of MWH eigenvalues != 3 * number of atoms",
-                        srcstr)
-            ## end if
+            self.mwh_eigvals = self._parse_rowblock(lines[1:],
+                    3*self.num_ats, 2, "MWH eigenvalues",
+                    HessError.EIGVAL_BLOCK)[:, 1].copy()
 
         ## end if
 
+    ## end def _load_eigvals
+
+
+    def _load_eigvecs(self):
+        """ Parse the mass-weighted Hessian eigenvectors, if present. """
+
+        # Imports
+        from .error import HessError
 
-        #=== Mass-weighted Hessian -- Eigenvalues ===#
         # See if the block is there; import if so
-        m_work = self.Pat.eigvecs_block.search(self.in_str)
-        if m_work is None:
+        lines = self._block_lines('eigenvectors_mass_weighted_hessian')
+        if lines is None:
             self.mwh_eigvecs = None
         else:
+            dims = self._block_dims(lines, 2, "MWH eigenvectors",
+                                                HessError.EIGVEC_BLOCK)
+            if dims[0] != 3*self.num_ats:
+                raise HessError(HessError.EIGVEC_BLOCK, "MWH eigenvectors " +
+                        "dimension specification mismatched with geometry",
+                        self._srcstr)
+            ## end if
+
             # Pull the eigenvectors
-            self.mwh_eigvecs = \
-                    parse_multiblock(self.in_str, self.Pat.eigvecs_block,
-                    self.Pat.eigvecs_sec, self.Pat.eigvecs_line, self.num_ats,
+            self.mwh_eigvecs = self._parse_multiblock(lines[1:],
                     "MWH eigenvectors", HessError.EIGVEC_BLOCK)
 
             # Extra check of 'dim' vs 'dim2' on modes
-            if scast(m_work.group("dim"), np.int_) != \
-                                scast(m_work.group("dim2"), np.int_):
+            if dims[0] != dims[1]:
                 raise HessError(HessError.EIGVEC_BLOCK,
                         "MWH eigenvectors dimension specification mismatch",
-                        srcstr)
+                        self._srcstr)
             ## end if
         ## end if
 
-    ## end def __init__
+    ## end def _load_eigvecs
 
 ## end class OrcaHess
 
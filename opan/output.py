@@ -96,12 +96,18 @@ class OrcaOutput(object):
 
         *   :meth:`~opan.output.OrcaOutput.en_last`
 
+        *   :meth:`~opan.output.OrcaOutput.refresh`
+
+        *   :meth:`~opan.output.OrcaOutput._scan`
+
     *   `Class Variables <OrcaOutput-ClassVars_>`_
 
         *   `Enumerations <OrcaOutput-ClassVars-Enums_>`_
 
             *   :class:`~opan.output.OrcaOutput.EN`
 
+            *   :class:`~opan.output.OrcaOutput.QTY`
+
             *   :class:`~opan.output.OrcaOutput.SPINCONT`
 
             *   :class:`~opan.output.OrcaOutput.THERMO`
@@ -125,6 +131,10 @@ class OrcaOutput(object):
 
     .. automethod:: en_last
 
+    .. automethod:: refresh
+
+    .. automethod:: _scan
+
     |
 
     .. _OrcaOutput-ClassVars:
@@ -173,6 +183,36 @@ class OrcaOutput(object):
             (no dispersion or gCP corrections)
 
 
+    .. class:: OrcaOutput.QTY
+
+        :class:`~opan.const.OpanEnum` for the quantity families that
+        can be selected for parsing.  See :meth:`__init__`.
+
+        |
+
+        .. attribute:: DIPMOM
+
+            Dipole moments (:attr:`~OrcaOutput.dipmoms`)
+
+        .. attribute:: EN
+
+            All SCF energies (:attr:`~OrcaOutput.en`)
+
+        .. attribute:: EN_LAST
+
+            Energies of the final SCF cycle only, read from the end
+            of the file
+
+        .. attribute:: SPINCONT
+
+            Spin contamination values (:attr:`~OrcaOutput.spincont`)
+
+        .. attribute:: THERMO
+
+            Thermochemistry (:attr:`~OrcaOutput.thermo` and
+            :attr:`~OrcaOutput.thermo_block`)
+
+
     .. class:: OrcaOutput.SPINCONT
 
         :class:`~opan.const.OpanEnum` for the spin contamination
@@ -313,6 +353,11 @@ class OrcaOutput(object):
         keys are those of :attr:`EN`, above.  Any energy type not found in the
         output is assigned as an empty list.
 
+    .. attribute:: OrcaOutput.incremental
+
+        |bool| --
+        |True| if the parser state is retained for :meth:`refresh`.
+
     .. attribute:: OrcaOutput.optimized
 
         |bool| --
@@ -321,6 +366,11 @@ class OrcaOutput(object):
 
         .. todo:: Update oo.optimized with any robustifications
 
+    .. attribute:: OrcaOutput.quantities
+
+        |frozenset| of |str| --
+        Members of :attr:`QTY` and :attr:`EN` selected for parsing.
+
     .. attribute:: OrcaOutput.spincont
 
         |dict| of |list| of |npfloat_|--
@@ -607,9 +657,87 @@ class OrcaOutput(object):
 
     #RESUME: Make patterns and constants for the virial block; update docstrings
 
+    # Quantity families selectable for parsing
+    class QTY(_OpEnum):
+        EN = "EN"
+        EN_LAST = "EN_LAST"
+        THERMO = "THERMO"
+        SPINCONT = "SPINCONT"
+        DIPMOM = "DIPMOM"
+    ## end class QTY
+
+    # Single-pass scan support. Every pattern above opens with fixed key
+    #  text, either at the match start or just after a lead-in of hyphens.
+    #  The keys are located in one pass over the lowercased output, and
+    #  the full pattern is then matched only at those locations. Values
+    #  are (attribute, key, lead), where lead is the fixed lead-in length,
+    #  or None for a lead-in line of hyphens.
+    _scan_keys = {
+        "final single point energy ": ('en', EN.SCFFINAL, 2),
+        "gcp correction ": ('en', EN.GCP, 2),
+        "dispersion correction ": ('en', EN.D3, 2),
+        "total energy after outlying charge correction":
+                                            ('en', EN.SCFOCC, 0),
+        "thermochemistry at ": ('thermo', THERMO.BLOCK, None),
+        "timings for individual modules": ('thermo', None, 0),
+        "temperature": ('thermo', THERMO.TEMP, 0),
+        "pressure": ('thermo', THERMO.PRESS, 0),
+        "electronic energy": ('thermo', THERMO.E_EL, 0),
+        "zero point energy": ('thermo', THERMO.E_ZPE, 0),
+        "thermal vibrational correction": ('thermo', THERMO.E_VIB, 0),
+        "thermal rotational correction": ('thermo', THERMO.E_ROT, 0),
+        "thermal translational correction": ('thermo', THERMO.E_TRANS, 0),
+        "thermal enthalpy correction": ('thermo', THERMO.H_IG, 0),
+        "electronic entropy ": ('thermo', THERMO.TS_EL, 0),
+        "vibrational entropy ": ('thermo', THERMO.TS_VIB, 0),
+        "translational entropy ": ('thermo', THERMO.TS_TRANS, 0),
+        "qrot ": ('thermo', THERMO.QROT, 0),
+        "dipole moment": ('dipmoms', None, None),
+        "expectation value of <s**2>": ('spincont', SPINCONT.ACTUAL, 0),
+        "ideal value s*(s+1) for s=": ('spincont', SPINCONT.IDEAL, 0),
+        "deviation ": ('spincont', SPINCONT.DEV, 0),
+        "orca terminated normally":
+                        ('completed', "ORCA TERMINATED NORMALLY", 0),
+        "scf converged after": ('converged', "SCF CONVERGED AFTER", 0),
+        "optimization has converged":
+                        ('optimized', "OPTIMIZATION HAS CONVERGED", 0)
+        }
+
+    # Attributes whose key text is scanned for each quantity family; the
+    #  success indicators are always scanned
+    _scan_attrs = {QTY.THERMO: 'thermo', QTY.SPINCONT: 'spincont',
+                   QTY.DIPMOM: 'dipmoms'}
+    _scan_flags = ('completed', 'converged', 'optimized')
+
+    # Size of the first block read from the end of the file for
+    #  QTY.EN_LAST; each later block is four times larger
+    _tail_block = 2**16
+
+    # Header of the THERMO.BLOCK pattern, matched on its own so that the
+    #  block can be delimited without the greedy regex search
+    _p_thermo_head = _re.compile("""
+        -+\\n                   # Hyphen line
+        THERMOCHEMISTRY\\       # Header text
+        AT\\ [0-9.]+\\ *K\\n    # Temperature
+        -+\\n                   # Hyphen line
+        """, _re.I | _re.X)
+
+    # Header of the dipole moment pattern, matched on its own to identify
+    #  a block whose magnitude has not yet been written
+    _p_dipmom_head = _re.compile("""
+        -+\\n                             # Hyphen line
+        dipole\\ moment.*\\n              # Block label
+        -+\\n                             # Hyphen line
+        """, _re.I | _re.X)
+
+    # Version of the parse, as recorded in the parse cache; increment
+    #  whenever the parsed data could change
+    _cache_version = 1
+
     ## end class variables
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, incremental=False, quantities=None,
+                                                                cache=None):
         """ Initialize :class:`OrcaOutput` object.
 
         Imports the data found in the output file found at `file_path`.
@@ -648,7 +776,35 @@ class OrcaOutput(object):
                 a standalone OPT -- i.e., not useful for a mode or
                 internal coordinate scan)
 
-
+        For an output still being written by a running job, pass
+        `incremental` as |True|.  Only complete lines are then parsed,
+        and any text appended to the file later is parsed by
+        :meth:`refresh`.
+
+        Passing `quantities` restricts parsing to the listed quantities;
+        the patterns for all others are skipped entirely.  Any of
+        :attr:`QTY.EN <OrcaOutput.QTY.EN>`, :attr:`QTY.THERMO
+        <OrcaOutput.QTY.THERMO>`, :attr:`QTY.SPINCONT
+        <OrcaOutput.QTY.SPINCONT>` and :attr:`QTY.DIPMOM
+        <OrcaOutput.QTY.DIPMOM>` select a whole family, and individual
+        :class:`EN` keys select single energies.  An unselected
+        :attr:`spincont` or :attr:`dipmoms` is stored as |None|, an
+        unselected :attr:`thermo_block` as |None| with no :attr:`thermo`,
+        and :attr:`en` holds only the selected energies.
+
+        :attr:`QTY.EN_LAST <OrcaOutput.QTY.EN_LAST>` selects only the
+        energies of the final SCF cycle (those of :meth:`en_last`), along
+        with any :class:`EN` keys listed.  The file is then read backward
+        from its end, stopping once the two last
+        :attr:`EN.SCFFINAL <OrcaOutput.EN.SCFFINAL>` energies are found;
+        only the text after the first of those is scanned, and the
+        success indicators reflect only that text.  Each :attr:`en` list
+        holds at most the one value from the final cycle, and a value not
+        reported in the final cycle is absent even if reported earlier.
+
+        The results of other loads are held in the parse cache of
+        :mod:`opan.utils.cache`, if enabled, and a repeat load of an
+        unchanged file with the same `quantities` is served from there.
 
         Parameters
         ----------
@@ -656,68 +812,460 @@ class OrcaOutput(object):
             |str| --
             Full path to the output file to be parsed.
 
+        incremental
+            |bool|, optional --
+            Whether to retain the parser state for later calls to
+            :meth:`refresh`.  Default |False|.
+
+        quantities
+            iterable of |str|, optional --
+            Members of :class:`QTY` and/or :class:`EN` to parse.
+            Default |None| parses all quantities.
+
+        cache
+            |bool| or :class:`~opan.utils.cache.ParseCache`, optional --
+            Parse cache to use, as for
+            :func:`~opan.utils.cache.get_cache`. Default is |None|, the
+            default cache if one is configured. Not used if
+            `incremental` is |True| or with
+            :attr:`QTY.EN_LAST <OrcaOutput.QTY.EN_LAST>`.
+
         Raises
         ------
         ~opan.error.OutputError
             (various typecodes) If indicated output is un-parseably
             malformed in some fashion
 
+        ~exceptions.ValueError
+            If `quantities` contains anything but :class:`QTY` and
+            :class:`EN` members, or combines
+            :attr:`QTY.EN_LAST <OrcaOutput.QTY.EN_LAST>` with other
+            families or with `incremental`
+
         """
 
+        # Imports
+        from .utils.cache import get_cache
+
         #TODO: (?) OrcaOutput: Add initialization parameter to indicate which
         # type of run should be expected?
 
+        # Store the source information and parsing mode
+        self.src_path = file_path
+        self.incremental = incremental
+        self._select(quantities)
+        self._reset()
+
+        # Serve from the parse cache if possible. Incremental and
+        #  final-cycle loads, which read only part of the file, are
+        #  not cached.
+        cache = None if incremental or self.QTY.EN_LAST in self.quantities \
+                                                    else get_cache(cache)
+        params = dict(quantities=sorted(self.quantities))
+        if cache is not None:
+            data, stamp = cache.load(file_path, 'output', params,
+                                                self._cache_version)
+            if data is not None:
+                self._from_cache(data)
+                return
+            ## end if
+        ## end if
+
+        # Collect the success indicators and all of the selected pattern-
+        #  retrieved values in a single pass over whatever is present
+        if self.QTY.EN_LAST in self.quantities:
+            self._read_last()
+        else:
+            self._read()
+        ## end if
+
+        # Cache the results
+        if cache is not None:
+            cache.store(file_path, 'output', self._to_cache(), stamp,
+                                            params, self._cache_version)
+        ## end if
+
+        #TODO: (?) OrcaOutput: Pull the final geometry and atom masses. Would
+        #  be nice not to require a Hessian calculation in order to have this
+        #  info available.
+        #  Masses and/or geometries may not always be in the output file,
+        #  depending on the %output settings.  Also have to address possible
+        #  multiples of the coordinates in, e.g., scans.
+
+        #RESUME: Pull the virial block info (may be absent)
+
+    ## end def __init__
+
+
+    def refresh(self):
+        """ Parse any complete lines appended to the output since last read.
+
+        Only the newly appended text is read and scanned.  The lists in
+        :attr:`en`, :attr:`spincont` and :attr:`dipmoms` are extended,
+        and :attr:`completed`, :attr:`converged`, :attr:`optimized`,
+        :attr:`thermo` and :attr:`thermo_block` are updated, exactly as
+        if the whole output had been parsed anew.  A matched pattern
+        that may still be completed by text not yet written is held
+        over until a later call.
+
+        If the file is now shorter than the text already read, it is
+        taken to have been replaced, and is parsed anew.
+
+        Returns
+        -------
+        changed
+            |bool| --
+            |True| if any new text was parsed, |False| otherwise.
+
+        Raises
+        ------
+        ~opan.error.OutputError
+            (typecode :attr:`~opan.error.OutputError.NOT_INCREMENTAL`) If
+            the instance was not created with `incremental` as |True|
+
+        """
+
         # Imports
-        from .utils import pack_tups
-        from .utils import safe_cast as scast
+        import os
         from .error import OutputError
+
+        if not self.incremental:
+            raise OutputError(OutputError.NOT_INCREMENTAL,
+                    "Refresh requires an incremental OrcaOutput",
+                    self.src_path)
+        ## end if
+
+        # Start over on a replaced file
+        if os.path.getsize(self.src_path) < self._offset:
+            self._reset()
+        ## end if
+
+        return self._read()
+
+    ## end def refresh
+
+
+    def _to_cache(self):
+        """ Flatten the parsed data for the parse cache.
+
+        Returns
+        -------
+        data
+            |dict| -- Flags and :attr:`thermo_block` as they are, the
+            lists of values as |nparray|, keyed as ``'en/<key>'``,
+            ``'spincont/<key>'`` and ``'dipmoms'``, with the key order
+            of :attr:`en` in ``'en_keys'``, and :attr:`thermo` as
+            |float| or |None| values, if found.
+
+        """
+
+        # Imports
         import numpy as np
 
-        # Get the output data
-        with open(file_path) as in_f:
-            datastr = in_f.read()
-        ##end with
+        data = dict(completed=self.completed, converged=self.converged,
+                    optimized=self.optimized, en_keys=list(self.en),
+                    thermo_block=self.thermo_block,
+                    dipmoms=None if self.dipmoms is None else
+                                np.array(self.dipmoms, dtype=np.float_))
+        for (k, l) in self.en.items():
+            data.update({ 'en/' + k : np.array(l, dtype=np.float_) })
+        ## next (k, l)
+        if self.spincont is not None:
+            for (k, l) in self.spincont.items():
+                data.update({ 'spincont/' + k :
+                                        np.array(l, dtype=np.float_) })
+            ## next (k, l)
+        ## end if
+        if hasattr(self, 'thermo'):
+            data.update(thermo=dict((k, None if v is None else float(v))
+                                        for (k, v) in self.thermo.items()))
+        ## end if
+
+        return data
+
+    ## end def _to_cache
+
+
+    def _from_cache(self, data):
+        """ Restore the parsed data from the parse cache.
 
-        # Check for normal termination (weird values in dicts, etc. would be
-        #  diagnostic also, but might as well define this since it's easy).
-        self.completed = datastr.find("ORCA TERMINATED NORMALLY") > -1
+        Parameters
+        ----------
+        data
+            |dict| -- Parsed data, as returned by :meth:`_to_cache`.
 
-        # Simple check for single-point SCF convergence
-        # TODO: Probably robustify convergence check to opt, and MDCI/MRCI/CAS
-        self.converged = datastr.find("SCF CONVERGED AFTER") > -1
+        """
 
-        # Simple check for optimization convergence
-        # TODO: Probably robustify optimization convergence check for
-        #  scans as well as single optimizations.  Multiple job runs promise
-        #  to be thoroughly annoying.
-        self.optimized = datastr.find("OPTIMIZATION HAS CONVERGED") > -1
+        # Imports
+        import numpy as np
 
-        # Store the source information
-        self.src_path = file_path
+        self.completed = data['completed']
+        self.converged = data['converged']
+        self.optimized = data['optimized']
+        self.thermo_block = data['thermo_block']
+        self.en = dict((k, list(data['en/' + k])) for k in data['en_keys'])
+        if self.spincont is not None:
+            for k in self.spincont:
+                self.spincont.update({ k : list(data['spincont/' + k]) })
+            ## next k
+        ## end if
+        if data['dipmoms'] is not None:
+            self.dipmoms = list(data['dipmoms'])
+        ## end if
+        if 'thermo' in data:
+            self.thermo = dict((k, None if v is None else np.float_(v))
+                                    for (k, v) in data['thermo'].items())
+        ## end if
+
+    ## end def _from_cache
+
+
+    def _select(self, quantities):
+        """ Set up the scan for the selected quantities.
 
-        # Initialize the energies dict as empty
-        self.en = dict()
+        Parameters
+        ----------
+        quantities
+            iterable of |str| or |None| --
+            Members of :class:`QTY` and/or :class:`EN`, as passed to
+            :meth:`__init__`.
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            If `quantities` is invalid
+
+        """
+
+        # Imports
+        import re
+
+        # Default to everything
+        if quantities is None:
+            quantities = (self.QTY.EN, self.QTY.THERMO, self.QTY.SPINCONT,
+                          self.QTY.DIPMOM)
+        ## end if
+        self.quantities = frozenset(quantities)
+
+        # Proof the selection
+        bad = [q for q in self.quantities if
+                                    not (q in self.QTY or q in self.EN)]
+        if len(bad) > 0:
+            raise ValueError("Invalid quantities: {0}".format(bad))
+        ## end if
+        if self.QTY.EN_LAST in self.quantities and (self.incremental or
+                    any(q in self.quantities for q in self._scan_attrs)):
+            raise ValueError("QTY.EN_LAST may only be combined with "
+                                                        "EN keys")
+        ## end if
+
+        # Energies to collect. The outlying charge corrected ones are
+        #  calculated from all of the others.
+        ens = set(q for q in self.quantities if q in self.EN)
+        if self.QTY.EN in self.quantities or (len(ens) == 0 and
+                                    self.QTY.EN_LAST in self.quantities):
+            ens.update(self.EN)
+        ## end if
+        self._occ = self.EN.OCC in ens or self.EN.SCFFINALOCC in ens
+        if self._occ:
+            ens.update(self.p_en)
+        ## end if
+        self._en_keys = [k for k in self.p_en if k in ens]
+
+        # Key text to scan, with its case-sensitive and case-insensitive
+        #  alternations (for the lowercased text of an all-ASCII output,
+        #  and for any other output, respectively)
+        attrs = set(self._scan_flags)
+        attrs.update(a for (q, a) in self._scan_attrs.items()
+                                                    if q in self.quantities)
+        self._keys = dict((t, v) for (t, v) in self._scan_keys.items()
+                    if v[0] in attrs or (v[0] == 'en' and v[1] in ens))
+        self._p_keys = re.compile("|".join(map(re.escape, self._keys)))
+        self._p_keys_i = re.compile(self._p_keys.pattern, re.I)
+
+    ## end def _select
+
+
+    def _reset(self):
+        """ Initialize all flags and selected values as not found. """
+
+        self.completed = False
+        self.converged = False
+        self.optimized = False
+        self.en = dict((k, []) for k in self._en_keys)
+        self.spincont = dict((k, []) for k in self.p_spincont) \
+                    if self.QTY.SPINCONT in self.quantities else None
+        self.dipmoms = [] if self.QTY.DIPMOM in self.quantities else None
+        self.thermo_block = None
+        if hasattr(self, 'thermo'):
+            del self.thermo
+        ## end if
+
+        # Parser state: bytes of the file read, retained text and its
+        #  position in the full text, match ends of the non-overlapping
+        #  patterns, held-over key locations, and the thermo block
+        #  header, closing blip, text and values found
+        self._offset = 0
+        self._buf = ''
+        self._buf_pos = 0
+        self._ends = dict()
+        self._pending = []
+        self._th_head = None
+        self._th_tail = None
+        self._th_text = None
+        self._th_vals = dict()
+
+    ## end def _reset
+
+
+    def _read(self):
+        """ Read and scan the unread portion of the output file.
+
+        In incremental mode, only complete lines are read.  The text is
+        decoded as for a file opened in text mode.
+
+        Returns
+        -------
+        changed
+            |bool| --
+            |True| if any new text was read, |False| otherwise.
+
+        """
+
+        # Get the new output data
+        with open(self.src_path, 'rb') as in_f:
+            in_f.seek(self._offset)
+            data = in_f.read()
+        ## end with
+        if self.incremental:
+            data = data[:data.rfind(b'\n') + 1]
+        ## end if
+        if len(data) == 0:
+            return False
+        ## end if
+        self._offset += len(data)
+
+        # Decode and scan
+        self._scan(self._decode(data))
+        self._calc_occ()
+
+        return True
+
+    ## end def _read
+
+
+    def _read_last(self):
+        """ Read and scan the final SCF cycle from the end of the file.
+
+        Blocks of increasing size are read from the end of the file until
+        they hold two :attr:`EN.SCFFINAL <OrcaOutput.EN.SCFFINAL>`
+        energies, or the whole file.  Only the text after the first of
+        the two is scanned.
+
+        """
+
+        # Imports
+        import os
+
+        p = self.p_en[self.EN.SCFFINAL]
+        size = self._tail_block
+        with open(self.src_path, 'rb') as in_f:
+            end = in_f.seek(0, os.SEEK_END)
+            while True:
+                # Read the block, starting at a line start
+                start = max(0, end - size)
+                in_f.seek(start)
+                data = in_f.read(end - start)
+                if start > 0:
+                    data = data[data.find(b'\n') + 1:]
+                ## end if
+
+                # Done with two energies, or with the whole file
+                text = self._decode(data)
+                ms = list(p.finditer(text))
+                if len(ms) >= 2 or start == 0:
+                    break
+                ## end if
+                size *= 4
+            ## loop
+        ## end with
+
+        # Cut to the line holding the end of the first of the energies
+        if len(ms) >= 2:
+            text = text[text.rfind('\n', 0, ms[-2].end()) + 1:]
+        ## end if
+
+        self._offset = end
+        self._scan(text)
+        self._calc_occ()
+
+    ## end def _read_last
+
+
+    @staticmethod
+    def _decode(data):
+        """ Decode `data` as for a file opened in text mode.
+
+        The text is decoded with the locale encoding, and with universal
+        newlines.
+
+        Parameters
+        ----------
+        data
+            |bytes| --
+            Raw contents read from the output file.
+
+        Returns
+        -------
+        text
+            |str| --
+            Decoded text.
+
+        """
+
+        # Imports
+        import locale
+
+        text = data.decode(locale.getpreferredencoding(False))
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        ## end if
+
+        return text
 
-        # Populate with the Regex-retrieved values.
-        #  If any are not found, this will store as an empty list.
-        for (k,p) in self.p_en.items():
-            self.en.update({ k :
-                    [scast(m.group(self.P_GROUP), np.float_) for m in
-                        p.finditer(datastr)] })
-        ##next (k,p)
+    ## end def _decode
+
+
+    def _calc_occ(self):
+        """ Calculate the COSMO outlying charge corrected energies.
+
+        In incremental mode, only the SCF cycles with a reported
+        :attr:`EN.SCFFINAL <OrcaOutput.EN.SCFFINAL>` energy are included.
+
+        """
+
+        # Imports
+        from .utils import pack_tups
+
+        # Only if the corrected energies are selected
+        if not self._occ:
+            return
+        ## end if
+
+        # Energies of the cycles to include
+        n = len(self.en[self.EN.SCFFINAL]) if self.incremental else None
+        ens = dict((k, self.en[k][:n]) for k in self.p_en)
 
         # Calculate just the outlying charge correction, if COSMO enabled,
         #  and then calculate the SCFFINAL result including the OCC.
-        if not self.en[self.EN.SCFOCC] == []:
+        if not ens[self.EN.SCFOCC] == []:
             self.en.update({ self.EN.OCC :
                     [t[0] - (t[1] - t[2] - t[3]) for t in
                     pack_tups(
-                        self.en[self.EN.SCFOCC],
-                        self.en[self.EN.SCFFINAL],
-                        self.en[self.EN.D3] if self.en[self.EN.D3] != []
-                                                                else 0,
-                        self.en[self.EN.GCP] if self.en[self.EN.GCP] != []
-                                                                else 0
+                        ens[self.EN.SCFOCC],
+                        ens[self.EN.SCFFINAL],
+                        ens[self.EN.D3] if ens[self.EN.D3] != [] else 0,
+                        ens[self.EN.GCP] if ens[self.EN.GCP] != [] else 0
                               )
                     ]       })
             self.en.update({ self.EN.SCFFINALOCC :
@@ -729,64 +1277,199 @@ class OrcaOutput(object):
                     ]       })
         ##end if
 
-        # Now collect the thermo quantities
-        # Just store the whole thermo block
-        try:
-            self.thermo_block = \
-                    self.p_thermo[self.THERMO.BLOCK].search(datastr).group()
-        except AttributeError:
-            # Block not found; store as None
-            self.thermo_block = None
-        else:
-            # Only store the block details if the block is actually found!
+    ## end def _calc_occ
 
-            # Initialize the empty dictionary for the numericals
-            self.thermo = dict()
 
-            # Iterate to pull the individual values
-            for (k,p) in self.p_thermo.items():
-                if k != self.THERMO.BLOCK:
-                    try:
-                        self.thermo.update({ k :
-                                    scast(p.search(datastr)
-                                            .group(self.P_GROUP), np.float_) })
-                    except AttributeError:
-                        # Value not found, probably due to monoatomic freq calc
-                        #  to autogenerate, e.g., enthalpy calculation
-                        # Add as just None'
-                        self.thermo.update({ k: None })
-                    ## end try
-                ## end if
-            ## next (k,p)
-        ## end try
+    def _scan(self, text):
+        """ Collect all flags and pattern values in one pass over `text`.
 
-        #TODO: (?) OrcaOutput: Pull the final geometry and atom masses. Would
-        #  be nice not to require a Hessian calculation in order to have this
-        #  info available.
-        #  Masses and/or geometries may not always be in the output file,
-        #  depending on the %output settings.  Also have to address possible
-        #  multiples of the coordinates in, e.g., scans.
+        The fixed key text of every selected pattern (see
+        :attr:`_scan_keys`) is located with a single alternation search.
+        The corresponding full pattern is then matched only at each key
+        location, with the same
+        non-overlapping (:attr:`en`, :attr:`spincont`, :attr:`dipmoms`)
+        or first-match (:attr:`thermo`) semantics as a separate
+        `finditer`/`search` over the whole text.  The results are thus
+        identical to those of the individual patterns.
 
-        # Pull all dipole moments
-        self.dipmoms = []
-        for m in OrcaOutput.p_dipmom.finditer(datastr):
-            self.dipmoms.append(scast(m.group(OrcaOutput.P_GROUP), np.float_))
-        ## next m
+        `text` continues any text scanned before.  In incremental mode,
+        the lead-in to the next line and any match that may be completed
+        by further text are retained for the next call.
 
-        # Initialize the spin contamination dict as empty
-        self.spincont = dict()
+        Parameters
+        ----------
+        text
+            |str| --
+            New text of the output file.
 
-        # Populate with the Regex-retrieved values.
-        #  If any are not found, this will store as an empty list.
-        for (k,p) in self.p_spincont.items():
-            self.spincont.update({ k :
-                    [scast(m.group(self.P_GROUP), np.float_) for m in
-                        p.finditer(datastr)] })
-        ##next (k,p)
+        """
 
-        #RESUME: Pull the virial block info (may be absent)
+        # Imports
+        import re
+        from .utils import safe_cast as scast
+        import numpy as np
 
-    ## end def __init__
+        # Text retained from earlier, followed by the new text. Positions
+        #  in buf are offset by base from those in the whole output.
+        buf = self._buf + text
+        base = self._buf_pos
+        new = len(self._buf)
+
+        # Lowercased ASCII text has the same character positions as the
+        #  original; anything else is scanned case-insensitively as-is.
+        try:
+            text.encode('ascii')
+        except UnicodeEncodeError:
+            scanstr, p_scan = text, self._p_keys_i
+        else:
+            scanstr, p_scan = text.lower(), self._p_keys
+        ## end try
+
+        # Pattern dicts by attribute name
+        pats = {'en': self.p_en, 'spincont': self.p_spincont,
+                'thermo': self.p_thermo}
+
+        def keys():
+            # Held-over key locations, then every key location in the new
+            #  text, including any overlapping an earlier one
+            for (pos, t) in self._pending:
+                yield (pos - base, t)
+            ## next (pos, t)
+            m = p_scan.search(scanstr)
+            while m is not None:
+                t = m.group().lower()
+                if t not in self._keys:
+                    # Non-ASCII text matched only by case folding
+                    t = next(t for t in self._keys if
+                                re.fullmatch(re.escape(t), m.group(), re.I))
+                ## end if
+                yield (new + m.start(), t)
+                m = p_scan.search(scanstr, m.start() + 1)
+            ## loop
+        ## end def keys
+
+        pending = []
+        for (pos, t) in keys():
+            (attr, k, lead) = self._keys[t]
+
+            # Success indicators are case-sensitive
+            if attr in ('completed', 'converged', 'optimized'):
+                if buf.startswith(k, pos):
+                    setattr(self, attr, True)
+                ## end if
+                continue
+            ## end if
+
+            # Only the last closing blip of the thermo block matters
+            if attr == 'thermo' and k is None:
+                self._th_tail = (base + pos, base + pos + len(t))
+                continue
+            ## end if
+
+            # Only the first match of the thermo block and values is kept
+            if attr == 'thermo' and (k in self._th_vals or
+                    (k == self.THERMO.BLOCK and self._th_head is not None)):
+                continue
+            ## end if
+
+            # Locate the candidate match start
+            if lead is None:
+                # Back up over the lead-in line of hyphens
+                start = pos - 2
+                if start < 0 or not buf.startswith('-\n', start):
+                    continue
+                ## end if
+                while start > 0 and buf[start - 1] == '-':
+                    start -= 1
+                ## loop
+            else:
+                start = pos - lead
+            ## end if
+
+            # Non-overlapping patterns resume after the prior match
+            start = max(start, self._ends.get((attr, k), 0) - base)
+            if start > pos - (2 if lead is None else lead):
+                continue
+            ## end if
+
+            # Attempt the actual match
+            if attr == 'dipmoms':
+                p = self.p_dipmom
+            elif k == self.THERMO.BLOCK:
+                p = self._p_thermo_head
+            else:
+                p = pats[attr][k]
+            ## end if
+            mch = p.match(buf, start)
+
+            if mch is None:
+                # Hold over a match that further lines may complete: any
+                #  that needs the line after the key, and a dipole block
+                #  still lacking its magnitude
+                if self.incremental and lead != 0 and \
+                        (buf.find('\n', pos) == len(buf) - 1 or
+                        (attr == 'dipmoms' and
+                                self._p_dipmom_head.match(buf, start))):
+                    pending.append((base + pos, t))
+                ## end if
+                continue
+            ## end if
+
+            # Store
+            if k == self.THERMO.BLOCK:
+                self._th_head = (base + mch.start(), base + mch.end())
+            elif attr == 'thermo':
+                self._th_vals.update({ k :
+                            scast(mch.group(self.P_GROUP), np.float_) })
+            else:
+                self._ends.update({ (attr, k) : base + mch.end() })
+                val = scast(mch.group(self.P_GROUP), np.float_)
+                if attr == 'dipmoms':
+                    self.dipmoms.append(val)
+                else:
+                    getattr(self, attr)[k].append(val)
+                ## end if
+            ## end if
+        ## next (pos, t)
+
+        # Keep the text from the thermo block header onward
+        if self._th_head is not None:
+            if self._th_text is None:
+                self._th_text = buf[self._th_head[0] - base:]
+            else:
+                self._th_text += text
+            ## end if
+        ## end if
+
+        # Store the whole thermo block, which runs to the last closing blip
+        #  after the first header, only if the block is actually found
+        if self._th_head is not None and self._th_tail is not None and \
+                                    self._th_tail[0] >= self._th_head[1]:
+            self.thermo_block = self._th_text[:self._th_tail[1] -
+                                                        self._th_head[0]]
+
+            # Value not found is probably due to monoatomic freq calc
+            #  to autogenerate, e.g., enthalpy calculation; store as None
+            self.thermo = dict()
+            for k in self.p_thermo:
+                if k != self.THERMO.BLOCK:
+                    self.thermo.update({ k : self._th_vals.get(k) })
+                ## end if
+            ## next k
+        ## end if
+
+        # Retain the text from the lead-in line of the last line or of the
+        #  first held-over key, whichever is earlier
+        self._pending = pending
+        if self.incremental:
+            keep = min([len(buf) - 1] + [pos - base for (pos, t) in pending])
+            keep = buf.rfind('\n', 0, keep) + 1
+            keep = buf.rfind('\n', 0, max(keep - 1, 0)) + 1
+            self._buf = buf[keep:]
+            self._buf_pos = base + keep
+        ## end if
+
+    ## end def _scan
 
 
     def en_last(self):
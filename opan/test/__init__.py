@@ -25,11 +25,13 @@
 from __future__ import absolute_import
 
 __all__ = ['opan_base',
-           'opan_utils_base', 'opan_utils_inertia', 'opan_utils_decorate',
+           'opan_utils_base', 'opan_utils_batch', 'opan_utils_cache',
+           'opan_utils_execute', 'opan_utils_inertia',
+           'opan_utils_decorate', 'opan_utils_schedule', 'opan_utils_symm',
            'opan_utils_vector',
-           'opan_xyz',
+           'opan_xyz', 'opan_vpt2_repo',
            'opan_error', 'opan_const', 'opan_supers',
-           'orca_engrad', 'orca_hess', 'utils']
+           'orca_engrad', 'orca_hess', 'orca_output', 'utils']
 
 from . import *
 
@@ -186,6 +186,104 @@ class TestOpanUtilsBaseTemplateSubst(unittest.TestCase):
         self.assertEqual(self.subst_widget_four,
                 ts(self.template, self.dict_widget_four))
 
+    def test_Utils_TemplateSubst_Recursive(self):
+        from collections import OrderedDict
+        from opan.utils import template_subst as ts
+
+        subs = OrderedDict([('NOUN', '<ADJ> widget'), ('ADJ', 'blue'),
+                            ('NUM', 'four')])
+        self.assertEqual(self.subst_widget_four.replace('widget',
+                        'blue widget'), ts(self.template, subs))
+
+    def test_Utils_TemplateSubst_OtherDelims(self):
+        from opan.utils import template_subst as ts
+
+        self.assertEqual(ts("a {|B|} {|C|} <B>", {'B': 'b', 'C': 'c'},
+                                        delims=['{|', '|}', 'x']), "a b c <B>")
+
+
+class TestOpanUtilsBaseCompiledTemplate(unittest.TestCase):
+
+    @staticmethod
+    def subst_seq(template, subs, delims):
+        # Reference substitution, by replacement in iteration order
+        for (k, v) in subs.items():
+            template = template.replace(delims[0] + k + delims[1], v)
+        ## next (k, v)
+        return template
+
+    def test_Utils_CompiledTemplate_Render(self):
+        from opan.utils import CompiledTemplate
+
+        ct = CompiledTemplate(TestOpanUtilsBaseTemplateSubst.template)
+        self.assertEqual(ct.tags, frozenset(['NOUN', 'NUM']))
+        self.assertEqual(ct.render(
+                    TestOpanUtilsBaseTemplateSubst.dict_widget_four),
+                    TestOpanUtilsBaseTemplateSubst.subst_widget_four)
+        self.assertEqual(ct.render({}), ct.template)
+        self.assertEqual(ct.render({'NUM': 'no', 'EXTRA': 'x'}),
+                                ct.template.replace('<NUM>', 'no'))
+
+    def test_Utils_CompiledTemplate_MatchesSequential(self):
+        # Random templates and substitutions built from characters that
+        #  include those of the delimiters, in both clean and ambiguous
+        #  arrangements
+        import random
+        from collections import OrderedDict
+        from opan.utils import CompiledTemplate
+
+        rng = random.Random(7)
+        alpha = 'AB<>{|}x\n'
+        for delims in [('<', '>'), ('{|', '|}'), ('|', '|'), ('<<', '>')]:
+            for _ in range(400):
+                keys = ['A', 'B', 'AB', 'x', ''] + \
+                        [''.join(rng.choice(alpha) for _ in range(2))]
+                tp = ''.join(rng.choice([rng.choice(alpha),
+                                delims[0] + rng.choice(keys) + delims[1]])
+                                        for _ in range(rng.randint(0, 12)))
+                subs = OrderedDict((k, ''.join(rng.choice(alpha[:2] +
+                            (alpha if rng.random() < 0.3 else ''))
+                            for _ in range(rng.randint(0, 3))))
+                                    for k in rng.sample(keys, 3))
+                ct = CompiledTemplate(tp, delims)
+                self.assertEqual(ct.render(subs),
+                                self.subst_seq(tp, subs, delims),
+                                msg=repr((tp, subs, delims)))
+            ## next _
+        ## next delims
+
+    def test_Utils_CompiledTemplate_BadValue(self):
+        from opan.utils import CompiledTemplate
+
+        self.assertRaises(TypeError, CompiledTemplate("<A>").render,
+                                                            {'A': 3})
+
+    def test_Utils_CompiledTemplate_Many(self):
+        import os, shutil, tempfile
+        from opan.utils import CompiledTemplate
+
+        ct = CompiledTemplate("! SP\n%coords <GEOM> end\n", ['<', '>'])
+        subs = [{'GEOM': str(i)} for i in range(5)]
+        texts = ct.render_many(subs)
+        self.assertEqual(texts[3], "! SP\n%coords 3 end\n")
+
+        tempdir = tempfile.mkdtemp()
+        try:
+            paths = [os.path.join(tempdir, 'disp{0}.txt'.format(i))
+                                                        for i in range(5)]
+            self.assertEqual(ct.write_many(zip(paths, subs)), paths)
+            self.assertEqual(ct.write_many({paths[0]: subs[4]}),
+                                                                paths[:1])
+            with open(paths[0]) as f:
+                self.assertEqual(f.read(), texts[4])
+            ## end with
+            with open(paths[2]) as f:
+                self.assertEqual(f.read(), texts[2])
+            ## end with
+        finally:
+            shutil.rmtree(tempdir)
+        ## end try
+
 
 class TestOpanUtilsBaseAssertNPFArray(unittest.TestCase):
 
@@ -282,6 +380,7 @@ def suite():
     s.addTests([tl.loadTestsFromTestCase(TestOpanUtilsBaseMisc),
                 tl.loadTestsFromTestCase(TestOpanUtilsBaseCheckGeom),
                 tl.loadTestsFromTestCase(TestOpanUtilsBaseTemplateSubst),
+                tl.loadTestsFromTestCase(TestOpanUtilsBaseCompiledTemplate),
                 tl.loadTestsFromTestCase(TestOpanUtilsBaseAssertNPFArray)
                 ])
     return s
@@ -0,0 +1,165 @@
+#-------------------------------------------------------------------------------
+# Name:        opan_utils_batch
+# Purpose:     Test objects for opan.utils.batch
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+
+import unittest
+
+
+class TestOpanUtilsBatch(unittest.TestCase):
+    # Tree of jobs: good output alone, good output with .hess and .engrad,
+    #  an .engrad alone, a broken .engrad alongside a good output, and a
+    #  file of an unrelated type
+
+    @classmethod
+    def setUpClass(cls):
+        import os, shutil, tempfile
+        import opan
+        from opan.test.orca_output import SuperOrcaOutput
+
+        cls.root = tempfile.mkdtemp()
+        res = os.path.join(os.path.dirname(opan.__file__), 'test',
+                                                    'resource', 'orca')
+        out = SuperOrcaOutput.file_text_good
+        with open(os.path.join(res, 'test_orca_v3.0.3.engrad')) as f:
+            engrad = f.read()
+
+        files = {('a', 'run.out'): out,
+                 ('b', 'sub', 'run.out'): out,
+                 ('c', 'grad.engrad'): engrad,
+                 ('d', 'run.OUT'): out,
+                 ('d', 'run.engrad'): engrad.replace('29', 'x', 1),
+                 ('d', 'run.gbw'): "binary"}
+        for (parts, text) in files.items():
+            path = os.path.join(cls.root, *parts)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(text)
+        shutil.copy(os.path.join(res, 'test_orca_v3.0.3.hess'),
+                            os.path.join(cls.root, 'b', 'sub', 'run.hess'))
+
+        cls.jobs = [os.path.join(cls.root, *p) for p in
+                        [('a', 'run'), ('b', 'sub', 'run'), ('c', 'grad'),
+                         ('d', 'run')]]
+        cls.expected = SuperOrcaOutput
+
+    @classmethod
+    def tearDownClass(cls):
+        import shutil
+        shutil.rmtree(cls.root)
+
+    def test_Utils_Batch_FindJobs(self):
+        from opan.const import EnumFileType as E_FT
+        from opan.utils.batch import find_jobs
+
+        jobs = find_jobs(self.root)
+        self.assertEqual(list(jobs), self.jobs)
+        self.assertEqual(jobs[self.jobs[1]],
+                    {E_FT.OUTPUT: self.jobs[1] + '.out',
+                     E_FT.HESS: self.jobs[1] + '.hess'})
+        self.assertEqual(jobs[self.jobs[3]],
+                    {E_FT.OUTPUT: self.jobs[3] + '.OUT',
+                     E_FT.GRAD: self.jobs[3] + '.engrad'})
+
+        jobs = find_jobs(self.root, [E_FT.HESS])
+        self.assertEqual(list(jobs), [self.jobs[1]])
+
+    def test_Utils_Batch_FindJobsBadType(self):
+        from opan.utils.batch import find_jobs
+        self.assertRaises(ValueError, find_jobs, self.root, ['BAD'])
+
+    def test_Utils_Batch_BadWorkersChunk(self):
+        from opan.utils.batch import iter_results
+        self.assertRaises(ValueError, iter_results, self.root, workers=0)
+        self.assertRaises(ValueError, iter_results, self.root, chunk=1.5)
+
+    def test_Utils_Batch_NumpyIntWorkersChunk(self):
+        import numpy as np
+        from opan.utils.batch import iter_results
+
+        rows = list(iter_results(self.root, workers=np.int64(1),
+                                        chunk=np.int64(1), cache=False))
+        self.assertEqual(sorted(r['job'] for r in rows), self.jobs)
+
+    def test_Utils_Batch_RowsMatchSerialAndPool(self):
+        from opan.utils.batch import iter_results
+
+        serial = sorted(iter_results(self.root, workers=1, cache=False),
+                                                    key=lambda r: r['job'])
+        pool = list(iter_results(self.root, workers=2, chunk=1,
+                                                            cache=False))
+        self.assertEqual(sorted(r['job'] for r in pool), self.jobs)
+        self.assertEqual(serial, sorted(pool, key=lambda r: r['job']))
+
+    def test_Utils_Batch_CollectResults(self):
+        import numpy as np
+        from opan.const import EnumFileType as E_FT
+        from opan.output import OrcaOutput as OO
+        from opan.utils.batch import collect_results
+
+        exp = self.expected
+        tbl = collect_results(self.root, workers=2, chunk=1, cache=False)
+
+        self.assertEqual(tbl['job'], self.jobs)
+        self.assertEqual(tbl[E_FT.HESS],
+                            [None, self.jobs[1] + '.hess', None, None])
+        self.assertEqual(tbl[E_FT.GRAD],
+                [None, None, self.jobs[2] + '.engrad',
+                                            self.jobs[3] + '.engrad'])
+
+        self.assertEqual(tbl['completed'].dtype, np.bool_)
+        for k in ['completed', 'converged', 'optimized']:
+            self.assertEqual(list(tbl[k]), [True, True, False, True], msg=k)
+
+        en = tbl[OO.EN.SCFFINAL]
+        self.assertEqual(en.dtype, np.float_)
+        self.assertTrue(np.array_equal(en[[0, 1, 3]],
+                                        [exp.en_scffinal[-1]] * 3))
+        self.assertTrue(np.isnan(en[2]))
+        self.assertAlmostEqual(tbl[OO.EN.GCP][0], exp.en_gcp[-1])
+        for (k, v) in exp.thermo.items():
+            self.assertAlmostEqual(tbl[k][0], v, msg=k)
+        self.assertTrue(np.isnan(tbl[OO.THERMO.TEMP][2]))
+
+        self.assertEqual(tbl['errors'][:3], [{}, {}, {}])
+        self.assertEqual(list(tbl['errors'][3]), [E_FT.GRAD])
+        self.assertIn('GradError', tbl['errors'][3][E_FT.GRAD])
+
+    def test_Utils_Batch_ExplicitJobs(self):
+        from opan.const import EnumFileType as E_FT
+        from opan.utils.batch import find_jobs, collect_results
+
+        jobs = find_jobs(self.root, [E_FT.GRAD])
+        tbl = collect_results(jobs, workers=1, cache=False)
+        self.assertEqual(tbl['job'], self.jobs[2:])
+        self.assertEqual(tbl[E_FT.OUTPUT], [None, None])
+
+## end class TestOpanUtilsBatch
+
+
+def suite():
+    s = unittest.TestSuite()
+    tl = unittest.TestLoader()
+    s.addTests([tl.loadTestsFromTestCase(TestOpanUtilsBatch)
+                ])
+    return s
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print("Module not executable.")
@@ -0,0 +1,390 @@
+#-------------------------------------------------------------------------------
+# Name:        opan_utils_cache
+# Purpose:     Test objects for opan.utils.cache
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+
+import unittest
+
+
+class SuperOpanUtilsCache(unittest.TestCase):
+    # Superclass for the cache tests, each run with a fresh cache and
+    #  source file in a scratch directory. The cache takes files of any
+    #  size, so that the small test files are cached.
+
+    src_text = "source file contents\n"
+
+    def setUp(self):
+        import os, tempfile
+        from opan.utils.cache import ParseCache
+
+        self.tempdir = tempfile.mkdtemp()
+        self.pc = ParseCache(os.path.join(self.tempdir, 'cache'),
+                                                            min_size=0)
+        self.src = self.write_src('src.txt', self.src_text)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tempdir)
+
+    def write_src(self, name, text, age=None):
+        # Write a source file, optionally dating it `age` seconds back
+        import os, time
+
+        path = os.path.join(self.tempdir, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        if age is not None:
+            t = time.time() - age
+            os.utime(path, (t, t))
+        return path
+
+    def store(self, path, kind='test', data=None, params=None, version=0):
+        # Store with a fresh stamp
+        data = dict(val=1.0) if data is None else data
+        return self.pc.store(path, kind, data,
+                             self.pc.load(path, kind, params, version)[1],
+                             params, version)
+
+## end class SuperOpanUtilsCache
+
+
+class TestOpanUtilsCacheParseCache(SuperOpanUtilsCache):
+
+    def test_Utils_Cache_MissThenHit(self):
+        self.assertIsNone(self.pc.load(self.src, 'test')[0])
+        self.assertTrue(self.store(self.src))
+        self.assertEqual(self.pc.load(self.src, 'test')[0], dict(val=1.0))
+
+    def test_Utils_Cache_RoundTripTypes(self):
+        import numpy as np
+
+        data = dict(arr=np.arange(6.0).reshape((2, 3)),
+                    flags=np.array([True, False]),
+                    syms=np.array(['H', 'O']),
+                    en=np.float_(-76.5), num=np.int_(3),
+                    lst=['H', 'O'], dct={'a': None, 'b': 2.5},
+                    txt="text", flag=True, none=None)
+        self.assertTrue(self.store(self.src, data=data))
+        hit = self.pc.load(self.src, 'test')[0]
+
+        self.assertEqual(sorted(hit), sorted(data))
+        for k in ['arr', 'flags', 'syms']:
+            self.assertEqual(hit[k].dtype, data[k].dtype, msg=k)
+            self.assertTrue(np.array_equal(hit[k], data[k]), msg=k)
+        for k in ['en', 'num', 'lst', 'dct', 'txt', 'flag', 'none']:
+            self.assertEqual(type(hit[k]), type(data[k]), msg=k)
+            self.assertEqual(hit[k], data[k], msg=k)
+
+    def test_Utils_Cache_ObjectArrayNotStored(self):
+        import numpy as np
+
+        self.assertFalse(self.store(self.src,
+                                    data=dict(obj=np.array([None, 1.0]))))
+        self.assertIsNone(self.pc.load(self.src, 'test')[0])
+
+    def test_Utils_Cache_KindAndParamsSeparate(self):
+        self.store(self.src, data=dict(val=1.0), params=dict(opt=True))
+        self.store(self.src, data=dict(val=2.0), params=dict(opt=False))
+        self.assertEqual(self.pc.load(self.src, 'test',
+                                    dict(opt=True))[0], dict(val=1.0))
+        self.assertEqual(self.pc.load(self.src, 'test',
+                                    dict(opt=False))[0], dict(val=2.0))
+        self.assertIsNone(self.pc.load(self.src, 'other',
+                                    dict(opt=True))[0])
+
+    def test_Utils_Cache_VersionSeparate(self):
+        self.store(self.src, data=dict(val=1.0), version=1)
+        self.assertEqual(self.pc.load(self.src, 'test', version=1)[0],
+                                                            dict(val=1.0))
+        self.assertIsNone(self.pc.load(self.src, 'test', version=2)[0])
+
+    def test_Utils_Cache_SmallFileNotStored(self):
+        self.pc.min_size = len(self.src_text) + 1
+        self.assertFalse(self.store(self.src))
+        self.pc.min_size = 0
+        self.assertIsNone(self.pc.load(self.src, 'test')[0])
+
+    def test_Utils_Cache_SameSizeRewriteMisses(self):
+        # Rewritten within the timestamp window, so must be hashed
+        self.store(self.src)
+        self.write_src('src.txt', self.src_text.upper())
+        self.assertIsNone(self.pc.load(self.src, 'test')[0])
+
+    def test_Utils_Cache_ResizedFileMisses(self):
+        self.store(self.src)
+        self.write_src('src.txt', self.src_text * 2, age=100)
+        self.assertIsNone(self.pc.load(self.src, 'test')[0])
+
+    def test_Utils_Cache_TouchedFileHits(self):
+        import os
+
+        self.store(self.src)
+        os.utime(self.src, (1e9, 1e9))
+        self.assertEqual(self.pc.load(self.src, 'test')[0], dict(val=1.0))
+
+    def test_Utils_Cache_HashOnlyWhenNeeded(self):
+        # Hashed only on the first load after the file was touched; the
+        #  refreshed entry is then trusted by size and modification time
+        import os
+        from opan.utils.cache import ParseCache
+
+        hashes = []
+        class CountingCache(ParseCache):
+            @staticmethod
+            def _hash(path):
+                hashes.append(path)
+                return ParseCache._hash(path)
+
+        pc = CountingCache(self.pc.path, min_size=0)
+        pc.store(self.src, 'test', dict(val=1.0),
+                                    pc.load(self.src, 'test')[1])
+        os.utime(self.src, (1e9, 1e9))
+        del hashes[:]
+        for i in range(3):
+            self.assertEqual(pc.load(self.src, 'test')[0], dict(val=1.0))
+        self.assertEqual(len(hashes), 1)
+
+    def test_Utils_Cache_ChangedDuringParseNotStored(self):
+        stamp = self.pc.load(self.src, 'test')[1]
+        self.write_src('src.txt', self.src_text * 2)
+        self.assertFalse(self.pc.store(self.src, 'test', dict(val=1.0),
+                                                                    stamp))
+
+    def test_Utils_Cache_CorruptEntryMisses(self):
+        import os
+
+        self.store(self.src)
+        for n in os.listdir(self.pc.path):
+            with open(os.path.join(self.pc.path, n), 'wb') as f:
+                f.write(b'garbage')
+        self.assertIsNone(self.pc.load(self.src, 'test')[0])
+
+    def test_Utils_Cache_MissingSourceRaises(self):
+        import os
+        self.assertRaises(OSError, self.pc.load,
+                            os.path.join(self.tempdir, 'absent'), 'test')
+
+    def test_Utils_Cache_LRUEviction(self):
+        import os, time
+        import numpy as np
+
+        data = dict(arr=np.zeros((1000,)))
+        srcs = [self.write_src('src{0}.txt'.format(i), str(i))
+                                                        for i in range(3)]
+        self.store(srcs[0], data=data)
+        self.pc.max_size = int(2.5 * self.pc.size)
+
+        # Age both entries, then use the first, leaving the second as LRU
+        self.store(srcs[1], data=data)
+        for i in range(2):
+            t = time.time() - 100
+            os.utime(self.pc._entry_path(srcs[i], 'test', None, 0), (t, t))
+        self.pc.load(srcs[0], 'test')
+        self.store(srcs[2], data=data)
+
+        self.assertEqual(len(os.listdir(self.pc.path)), 2)
+        self.assertLessEqual(self.pc.size, self.pc.max_size)
+        self.assertIsNotNone(self.pc.load(srcs[0], 'test')[0])
+        self.assertIsNone(self.pc.load(srcs[1], 'test')[0])
+        self.assertIsNotNone(self.pc.load(srcs[2], 'test')[0])
+
+    def test_Utils_Cache_OversizeNotStored(self):
+        import numpy as np
+
+        self.pc.max_size = 1000
+        self.assertFalse(self.store(self.src,
+                                    data=dict(arr=np.zeros((1000,)))))
+        self.assertEqual(self.pc.size, 0)
+
+    def test_Utils_Cache_Clear(self):
+        self.store(self.src)
+        self.assertGreater(self.pc.size, 0)
+        self.pc.clear()
+        self.assertEqual(self.pc.size, 0)
+        self.assertIsNone(self.pc.load(self.src, 'test')[0])
+
+    def test_Utils_Cache_UnwritableDirNotStored(self):
+        import os
+        from opan.utils.cache import ParseCache
+
+        pc = ParseCache(os.path.join(self.src, 'cache'), min_size=0)
+        self.assertFalse(pc.store(self.src, 'test', dict(val=1.0),
+                                        pc.load(self.src, 'test')[1]))
+
+## end class TestOpanUtilsCacheParseCache
+
+
+class TestOpanUtilsCacheGetCache(unittest.TestCase):
+
+    def setUp(self):
+        import os
+        self.env = dict((k, os.environ.get(k)) for k in
+                            ['OPAN_CACHE_DIR', 'OPAN_NO_CACHE'])
+
+    def tearDown(self):
+        import os
+        for (k, v) in self.env.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+    def test_Utils_Cache_GetCacheDefault(self):
+        import os
+        from opan.utils.cache import get_cache, cache_dir
+
+        os.environ.pop('OPAN_NO_CACHE', None)
+        os.environ['OPAN_CACHE_DIR'] = os.path.abspath('opan_cache_dir')
+        pc = get_cache(True)
+        self.assertEqual(pc.path, os.path.abspath('opan_cache_dir'))
+        self.assertEqual(pc.path, cache_dir())
+        self.assertIs(get_cache(), pc)
+
+    def test_Utils_Cache_GetCacheOptIn(self):
+        import os
+        from opan.utils.cache import get_cache
+
+        os.environ.pop('OPAN_NO_CACHE', None)
+        os.environ.pop('OPAN_CACHE_DIR', None)
+        self.assertIsNone(get_cache())
+        self.assertIsNotNone(get_cache(True))
+
+    def test_Utils_Cache_GetCacheInstance(self):
+        from opan.utils.cache import get_cache, ParseCache
+
+        pc = ParseCache('opan_cache_dir')
+        self.assertIs(get_cache(pc), pc)
+
+    def test_Utils_Cache_GetCacheOptOut(self):
+        import os
+        from opan.utils.cache import get_cache
+
+        self.assertIsNone(get_cache(False))
+        os.environ['OPAN_NO_CACHE'] = '1'
+        self.assertIsNone(get_cache(True))
+
+## end class TestOpanUtilsCacheGetCache
+
+
+class TestOpanUtilsCacheLoaders(SuperOpanUtilsCache):
+    # Cached loads must match uncached loads exactly
+
+    def assertLoadsMatch(self, mk, path):
+        import numpy as np
+
+        ref = mk(path, False)
+        for i in range(2):
+            obj = mk(path, self.pc)
+            pub = dict((k, v) for (k, v) in vars(ref).items()
+                                                        if k[0] != '_')
+            self.assertEqual(sorted(pub), sorted(k for k in vars(obj)
+                                                        if k[0] != '_'))
+            for (k, v) in pub.items():
+                w = getattr(obj, k)
+                self.assertEqual(type(w), type(v), msg=k)
+                if isinstance(v, np.ndarray):
+                    self.assertEqual(w.dtype, v.dtype, msg=k)
+                    self.assertTrue(np.array_equal(w, v), msg=k)
+                elif isinstance(v, list) and len(v) > 0 and \
+                                            isinstance(v[0], np.ndarray):
+                    self.assertTrue(np.array_equal(w, v), msg=k)
+                else:
+                    self.assertEqual(w, v, msg=k)
+        self.assertGreater(self.pc.size, 0)
+
+    def resource(self, *args):
+        import os
+        import opan
+        return os.path.join(os.path.dirname(opan.__file__),
+                                                    'test', 'resource', *args)
+
+    def test_Utils_Cache_LoaderEngrad(self):
+        from opan.grad import OrcaEngrad
+        self.assertLoadsMatch(lambda p, c: OrcaEngrad(path=p, keep_str=False,
+                                                            cache=c),
+                    self.resource('orca', 'test_orca_v3.0.3.engrad'))
+
+    def test_Utils_Cache_LoaderHess(self):
+        from opan.hess import OrcaHess
+        self.assertLoadsMatch(lambda p, c: OrcaHess(path=p, keep_str=False,
+                                                            cache=c),
+                    self.resource('orca', 'test_orca_v3.0.3.hess'))
+
+    def test_Utils_Cache_LoaderXYZ(self):
+        from opan.xyz import OpanXYZ
+        for b in [True, False]:
+            self.assertLoadsMatch(lambda p, c:
+                            OpanXYZ(path=p, bohrs=b, keep_str=False,
+                                                            cache=c),
+                            self.resource('test.trj'))
+
+    def test_Utils_Cache_LoaderOutput(self):
+        from opan.output import OrcaOutput
+        from opan.test.orca_output import SuperOrcaOutput
+
+        path = self.write_src('test.out', SuperOrcaOutput.file_text_good)
+        for q in [None, [OrcaOutput.QTY.THERMO],
+                    [OrcaOutput.EN.OCC, OrcaOutput.QTY.DIPMOM]]:
+            self.assertLoadsMatch(lambda p, c:
+                            OrcaOutput(p, quantities=q, cache=c), path)
+
+    def test_Utils_Cache_LoaderUpdatedFile(self):
+        from opan.grad import OrcaEngrad
+
+        with open(self.resource('orca', 'test_orca_v3.0.3.engrad')) as f:
+            text = f.read()
+        path = self.write_src('test.engrad', text)
+        self.assertEqual(OrcaEngrad(path=path, keep_str=False,
+                                                cache=self.pc).energy,
+                                                        -622.263206897403)
+        self.write_src('test.engrad', text.replace('-622.263206897403',
+                                                    '-623.263206897403'))
+        self.assertEqual(OrcaEngrad(path=path, keep_str=False,
+                                                cache=self.pc).energy,
+                                                        -623.263206897403)
+
+    def test_Utils_Cache_LoaderUncachedModes(self):
+        import os
+        from opan.hess import OrcaHess
+        from opan.output import OrcaOutput
+        from opan.test.orca_output import SuperOrcaOutput
+
+        out = self.write_src('test.out', SuperOrcaOutput.file_text_good)
+        OrcaOutput(out, incremental=True, cache=self.pc)
+        OrcaOutput(out, quantities=[OrcaOutput.QTY.EN_LAST], cache=self.pc)
+        hess = self.resource('orca', 'test_orca_v3.0.3.hess')
+        OrcaHess(path=hess, lazy=True, cache=self.pc)
+        self.assertIsNotNone(OrcaHess(path=hess, cache=self.pc).in_str)
+        self.assertFalse(os.path.isdir(self.pc.path))
+
+## end class TestOpanUtilsCacheLoaders
+
+
+def suite():
+    s = unittest.TestSuite()
+    tl = unittest.TestLoader()
+    s.addTests([tl.loadTestsFromTestCase(TestOpanUtilsCacheParseCache),
+                tl.loadTestsFromTestCase(TestOpanUtilsCacheGetCache),
+                tl.loadTestsFromTestCase(TestOpanUtilsCacheLoaders)
+                ])
+    return s
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print("Module not executable.")
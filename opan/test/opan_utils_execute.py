@@ -0,0 +1,276 @@
+#-------------------------------------------------------------------------------
+# Name:        opan_utils_execute
+# Purpose:     Test objects for opan.utils.execute
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+
+import unittest
+
+
+class SuperOpanUtilsExecute(unittest.TestCase):
+    # Superclass for the execution tests, run against the fake ORCA
+    #  wrapper script in a scratch directory
+
+    # Imports
+    import os as _os, sys as _sys
+    import opan as _opan
+
+    res_dir = _os.path.join(_os.path.dirname(_opan.__file__), 'test',
+                                                        'resource', 'orca')
+    exec_cmd = [_sys.executable, _os.path.join(res_dir, 'test_orca_fake.py'),
+                                                            '<INP>', '<OUT>']
+    engrad = _os.path.join(res_dir, 'test_orca_v3.0.3.engrad')
+    inp_tp = "! SP\n# FAKE energy <EN>\n# FAKE copy <SRC> <NAME>.engrad\n"
+    inp_tp_sleep = "! SP\n# FAKE sleep 30\n"
+
+    def setUp(self):
+        import tempfile
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tempdir)
+
+    def work_dir(self, name):
+        # Fresh working directory for one run
+        import os
+        path = os.path.join(self.tempdir, name)
+        os.mkdir(path)
+        return path
+
+    def subs(self, i):
+        return {'EN': '-{0}.5'.format(i), 'SRC': self.engrad}
+
+    def assertResults(self, res, i):
+        from opan.output import OrcaOutput
+        from opan.grad import OrcaEngrad
+
+        (oo, xyz, engrad, hess) = res
+        self.assertIsInstance(oo, OrcaOutput)
+        self.assertTrue(oo.completed)
+        self.assertEqual(oo.en[OrcaOutput.EN.SCFFINAL], [-i - 0.5])
+        self.assertIsNone(xyz)
+        self.assertIsInstance(engrad, OrcaEngrad)
+        self.assertIsNone(hess)
+
+## end class SuperOpanUtilsExecute
+
+
+class TestOpanUtilsExecuteBlocking(SuperOpanUtilsExecute):
+
+    def test_Utils_Execute_BlockingResult(self):
+        import os
+        from opan.utils.execute import execute_orca
+
+        cwd = os.getcwd()
+        work_dir = self.work_dir('a')
+        self.assertResults(execute_orca(self.inp_tp, work_dir,
+                                    self.exec_cmd, subs=self.subs(3)), 3)
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertTrue(os.path.isfile(os.path.join(work_dir,
+                                                        'orcarun.txt')))
+
+    def test_Utils_Execute_BlockingMissingFiles(self):
+        from opan.utils.execute import execute_orca
+
+        res = execute_orca("# FAKE fail\n", self.work_dir('a'),
+                                                            self.exec_cmd)
+        self.assertFalse(res[0].completed)
+        self.assertEqual(res[1:], (None, None, None))
+
+    def test_Utils_Execute_BlockingTimeout(self):
+        import os, subprocess as sp
+        from opan.utils.execute import execute_orca
+
+        cwd = os.getcwd()
+        self.assertRaises(sp.TimeoutExpired, execute_orca,
+                    self.inp_tp_sleep, self.work_dir('a'), self.exec_cmd,
+                    timeout=0.2)
+        self.assertEqual(os.getcwd(), cwd)
+
+    def test_Utils_Execute_BlockingBadArgsNoChdir(self):
+        import os
+        from opan.utils.execute import execute_orca
+
+        cwd = os.getcwd()
+        self.assertRaises(KeyError, execute_orca, self.inp_tp,
+                    self.work_dir('a'), self.exec_cmd, subs={'OUT': 'x'})
+        self.assertEqual(os.getcwd(), cwd)
+
+    def test_Utils_Execute_BlockingThreadStress(self):
+        # Many concurrent runs in distinct directories, plus runs
+        #  sharing one directory under distinct sim_name
+        import os
+        from concurrent.futures import ThreadPoolExecutor
+        from opan.utils.execute import execute_orca
+
+        shared = self.work_dir('shared')
+        def run(i):
+            if i % 2:
+                return execute_orca(self.inp_tp, shared, self.exec_cmd,
+                            subs=self.subs(i),
+                            sim_name='run{0}'.format(i))
+            else:
+                return execute_orca(self.inp_tp,
+                            self.work_dir('run{0}'.format(i)),
+                            self.exec_cmd, subs=self.subs(i))
+            ## end if
+        ## end def run
+
+        cwd = os.getcwd()
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(run, range(32)))
+        ## end with
+
+        self.assertEqual(os.getcwd(), cwd)
+        for (i, res) in enumerate(results):
+            self.assertResults(res, i)
+        ## next (i, res)
+        self.assertEqual(len([f for f in os.listdir(shared)
+                                            if f.endswith('.out')]), 16)
+
+## end class TestOpanUtilsExecuteBlocking
+
+
+class TestOpanUtilsExecuteFuture(SuperOpanUtilsExecute):
+
+    def test_Utils_Execute_FutureResult(self):
+        from opan.utils.execute import execute_orca, OrcaFuture
+
+        fut = execute_orca(self.inp_tp, self.work_dir('a'), self.exec_cmd,
+                            subs=self.subs(1), wait_to_complete=False)
+        self.assertIsInstance(fut, OrcaFuture)
+        self.assertResults(fut.result(timeout=30), 1)
+        self.assertEqual(fut.proc.returncode, 0)
+
+    def test_Utils_Execute_FutureMany(self):
+        from concurrent.futures import as_completed
+        from opan.utils.execute import execute_orca
+
+        futs = dict((execute_orca(self.inp_tp,
+                            self.work_dir('run{0}'.format(i)),
+                            self.exec_cmd, subs=self.subs(i),
+                            wait_to_complete=False), i) for i in range(12))
+        for fut in as_completed(futs, timeout=60):
+            self.assertResults(fut.result(), futs[fut])
+
+    def test_Utils_Execute_FutureTimeout(self):
+        import subprocess as sp
+        from opan.utils.execute import execute_orca
+
+        fut = execute_orca(self.inp_tp_sleep, self.work_dir('a'),
+                    self.exec_cmd, wait_to_complete=False, timeout=0.2)
+        self.assertRaises(sp.TimeoutExpired, fut.result, timeout=30)
+        self.assertIsNotNone(fut.proc.poll())
+
+    def test_Utils_Execute_FutureCancel(self):
+        from concurrent.futures import CancelledError
+        from opan.utils.execute import execute_orca
+
+        fut = execute_orca(self.inp_tp_sleep, self.work_dir('a'),
+                    self.exec_cmd, wait_to_complete=False)
+        self.assertTrue(fut.cancel())
+        self.assertTrue(fut.cancelled())
+        self.assertRaises(CancelledError, fut.result, timeout=30)
+        self.assertNotEqual(fut.proc.wait(timeout=30), 0)
+
+    def test_Utils_Execute_FutureCancelDone(self):
+        from opan.utils.execute import execute_orca
+
+        fut = execute_orca(self.inp_tp, self.work_dir('a'), self.exec_cmd,
+                            subs=self.subs(1), wait_to_complete=False)
+        fut.result(timeout=30)
+        self.assertFalse(fut.cancel())
+
+    def test_Utils_Execute_FutureBadArgs(self):
+        from opan.utils.execute import execute_orca
+
+        self.assertRaises(ValueError, execute_orca, self.inp_tp,
+                    self.work_dir('a'), self.exec_cmd, inp_ext='out',
+                    wait_to_complete=False)
+        self.assertRaises(KeyError, execute_orca, self.inp_tp,
+                    self.work_dir('b'), self.exec_cmd, subs={'NAME': 'x'},
+                    wait_to_complete=False)
+
+## end class TestOpanUtilsExecuteFuture
+
+
+class TestOpanUtilsExecuteAsync(SuperOpanUtilsExecute):
+
+    def setUp(self):
+        import asyncio
+        super(TestOpanUtilsExecuteAsync, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        import asyncio
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        super(TestOpanUtilsExecuteAsync, self).tearDown()
+
+    def test_Utils_Execute_AsyncMany(self):
+        import asyncio
+        from opan.utils.execute import execute_orca_async
+
+        coros = [execute_orca_async(self.inp_tp,
+                            self.work_dir('run{0}'.format(i)),
+                            self.exec_cmd, subs=self.subs(i))
+                                                        for i in range(12)]
+        results = self.loop.run_until_complete(asyncio.gather(*coros))
+        for (i, res) in enumerate(results):
+            self.assertResults(res, i)
+
+    def test_Utils_Execute_AsyncTimeout(self):
+        import subprocess as sp
+        from opan.utils.execute import execute_orca_async
+
+        self.assertRaises(sp.TimeoutExpired, self.loop.run_until_complete,
+                    execute_orca_async(self.inp_tp_sleep, self.work_dir('a'),
+                                            self.exec_cmd, timeout=0.2))
+
+    def test_Utils_Execute_AsyncCancel(self):
+        import asyncio, os, time
+        from opan.utils.execute import execute_orca_async
+
+        work_dir = self.work_dir('a')
+        task = asyncio.ensure_future(execute_orca_async(self.inp_tp_sleep,
+                            work_dir, self.exec_cmd), loop=self.loop)
+        self.loop.call_later(0.5, task.cancel)
+        t = time.time()
+        self.assertRaises(asyncio.CancelledError,
+                                    self.loop.run_until_complete, task)
+        self.assertLess(time.time() - t, 20)
+        self.assertFalse(os.path.isfile(os.path.join(work_dir,
+                                                        'orcarun.out')))
+
+## end class TestOpanUtilsExecuteAsync
+
+
+def suite():
+    s = unittest.TestSuite()
+    tl = unittest.TestLoader()
+    s.addTests([tl.loadTestsFromTestCase(TestOpanUtilsExecuteBlocking),
+                tl.loadTestsFromTestCase(TestOpanUtilsExecuteFuture),
+                tl.loadTestsFromTestCase(TestOpanUtilsExecuteAsync)
+                ])
+    return s
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print("Module not executable.")
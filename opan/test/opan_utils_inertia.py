@@ -148,6 +148,58 @@ class SuperOpanUtilsInertia(object):
         top = oui.principals(self.xyz.geoms[0], self.hess.atom_masses)[2]
         self.assertEqual(top, self.top)
 
+    def geom_stack(self):
+        # Stack of rigidly translated copies of the test geometry; all
+        #  inertial properties should match those of the original
+        import numpy as np
+        return np.array([self.xyz.geoms[0] + np.tile(shift, self.xyz.num_atoms)
+                        for shift in ([0., 0., 0.], [1.5, -2., 0.25],
+                                                        [-3., 0.5, 7.])])
+
+    def test_i_tensor_multi(self):
+        import numpy as np
+        import opan.utils.inertia as oui
+        tensors = oui.inertia_tensor_multi(self.geom_stack(),
+                                                    self.hess.atom_masses)
+        i_tensor = oui.inertia_tensor(self.xyz.geoms[0],
+                                                    self.hess.atom_masses)
+        self.assertEqual(tensors.shape, (3, 3, 3))
+        for g in range(tensors.shape[0]):
+            self.assertTrue(np.allclose(tensors[g], i_tensor,
+                                        rtol=1e-9, atol=1e-7),
+                            msg="Inertia tensor of geometry " + str(g))
+
+    def test_principals_multi(self):
+        import numpy as np
+        import opan.utils.inertia as oui
+        moments, axes, tops = oui.principals_multi(self.geom_stack(),
+                                                    self.hess.atom_masses)
+        mom_1, axes_1, top_1 = oui.principals(self.xyz.geoms[0],
+                                                    self.hess.atom_masses)
+        self.assertEqual(moments.shape, (3, 3))
+        self.assertEqual(axes.shape, (3, 3, 3))
+        for g in range(moments.shape[0]):
+            self.assertTrue(np.allclose(moments[g], mom_1,
+                                        rtol=1e-9, atol=1e-7),
+                            msg="Moments of geometry " + str(g))
+            self.assertTrue(np.allclose(axes[g], axes_1, atol=1e-6),
+                            msg="Axes of geometry " + str(g))
+            self.assertEqual(tops[g], self.top,
+                            msg="Top type of geometry " + str(g))
+
+    def test_rot_consts_multi(self):
+        import numpy as np
+        import opan.utils.inertia as oui
+        from opan.const import EnumUnitsRotConst as EURC
+        rc = oui.rot_consts_multi(self.geom_stack(), self.hess.atom_masses,
+                                                            EURC.INV_INERTIA)
+        rc_1 = oui.rot_consts(self.xyz.geoms[0], self.hess.atom_masses,
+                                                            EURC.INV_INERTIA)
+        self.assertEqual(rc.shape, (3, 3))
+        for g in range(rc.shape[0]):
+            self.assertTrue(np.allclose(rc[g], rc_1, rtol=1e-7),
+                            msg="Rotational constants of geometry " + str(g))
+
 ## end class SuperOpanUtilsInertia
 
 
@@ -240,6 +292,52 @@ class TestOpanUtilsInertiaAsymm(SuperOpanUtilsInertia, unittest.TestCase):
         self.assertRaises(ValueError, rot_consts, self.xyz.geoms[0],
                                 self.hess.atom_masses, units="ThisIsInvalid")
 
+    def test_UtilsInertiaMultiBadGeomShape(self):
+        from opan.utils.inertia import inertia_tensor_multi as itm
+        self.assertRaises(ValueError, itm, self.xyz.geoms[0],
+                                                    self.hess.atom_masses)
+
+    def test_UtilsInertiaMultiBadGeomMassesLengths(self):
+        from opan.utils.inertia import principals_multi as pm
+        import numpy as np
+        self.assertRaises(ValueError, pm,
+                        np.array([self.xyz.geoms[0][:-3]] * 2),
+                        self.hess.atom_masses)
+
+    def test_UtilsInertiaMultiSingleGeom(self):
+        from opan.utils.inertia import inertia_tensor_multi as itm
+        import numpy as np
+        self.assertEqual(itm(self.xyz.geoms[0][np.newaxis, :],
+                        self.hess.atom_masses).shape, (1, 3, 3))
+
+    def test_UtilsInertiaMultiPerCoordMasses(self):
+        from opan.utils.inertia import inertia_tensor as it, \
+                inertia_tensor_multi as itm
+        import numpy as np
+        masses = np.repeat(self.hess.atom_masses, 3) * \
+                    np.linspace(0.9, 1.1, 3 * self.xyz.num_atoms)
+        self.assertTrue(np.allclose(itm([self.xyz.geoms[0]], masses)[0],
+                                    it(self.xyz.geoms[0], masses),
+                                    rtol=1e-12, atol=1e-12))
+
+    def test_UtilsInertiaMultiCheckAllRotConstUnits(self):
+        from opan.utils.inertia import rot_consts, rot_consts_multi
+        from opan.const import EnumUnitsRotConst as EURC
+        import numpy as np
+        for u in EURC:
+            rc = rot_consts_multi([self.xyz.geoms[0]] * 2,
+                                        self.hess.atom_masses, units=u)
+            rc_1 = rot_consts(self.xyz.geoms[0], self.hess.atom_masses,
+                                                                units=u)
+            self.assertTrue(np.allclose(rc, rc_1[np.newaxis, :],
+                                        rtol=1e-9, atol=0),
+                            msg="Rotational constant units '" + str(u) + "'")
+
+    def test_UtilsInertiaMultiBadRotConstUnits(self):
+        from opan.utils.inertia import rot_consts_multi
+        self.assertRaises(ValueError, rot_consts_multi, [self.xyz.geoms[0]],
+                                    self.hess.atom_masses, "ThisIsInvalid")
+
 ## end class TestOpanUtilsInertiaAsymm
 
 
@@ -0,0 +1,258 @@
+#-------------------------------------------------------------------------------
+# Name:        opan_utils_schedule
+# Purpose:     Test objects for opan.utils.schedule
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+
+import unittest
+from opan.test.opan_utils_execute import SuperOpanUtilsExecute
+
+
+class TestOpanUtilsSchedulePal(unittest.TestCase):
+
+    def test_Utils_Schedule_PalNprocs(self):
+        from opan.utils.schedule import pal_nprocs
+
+        self.assertEqual(pal_nprocs("! SP\n* xyz 0 1\n*\n"), 1)
+        self.assertEqual(pal_nprocs("! SP PAL4 TightSCF\n"), 4)
+        self.assertEqual(pal_nprocs("! sp pal8\n! PAL2\n"), 2)
+        self.assertEqual(pal_nprocs("%pal nprocs 6 end\n"), 6)
+        self.assertEqual(pal_nprocs("! PAL4\n%PAL\n  NPROCS 12\nEND\n"), 12)
+        self.assertEqual(pal_nprocs("%pal nprocs 2 end\n%pal nprocs 3 end"),
+                                                                        3)
+        self.assertEqual(pal_nprocs("# append PAL4\n%palette end\n"), 1)
+
+## end class TestOpanUtilsSchedulePal
+
+
+class TestOpanUtilsSchedule(SuperOpanUtilsExecute):
+    # Jobs run through the fake ORCA wrapper, each stamping its run
+    #  times into a common log
+
+    def setUp(self):
+        import os
+        super(TestOpanUtilsSchedule, self).setUp()
+        self.log = os.path.join(self.tempdir, 'stamps.log')
+        self.state = os.path.join(self.tempdir, 'state.json')
+
+    def sched(self, **kwargs):
+        from opan.utils.schedule import OrcaScheduler
+        return OrcaScheduler(self.exec_cmd, **kwargs)
+
+    def add(self, sched, name, extra="", nprocs=1, energy='-1.5'):
+        import os
+        work_dir = os.path.join(self.tempdir, name)
+        if not os.path.isdir(work_dir):
+            os.mkdir(work_dir)
+        ## end if
+        inp = ("! SP\n%pal nprocs {0} end\n# FAKE energy {1}\n"
+               "# FAKE stamp {2}\n{3}").format(nprocs, energy, self.log, extra)
+        sched.add(name, inp, work_dir)
+
+    def stamps(self):
+        # Run intervals from the log, as (name, start, end)
+        import os
+        if not os.path.isfile(self.log):
+            return []
+        ## end if
+        with open(self.log) as f:
+            return [(os.path.basename(os.path.dirname(p)), float(s), float(e))
+                            for (p, s, e) in (l.split() for l in f)]
+        ## end with
+
+    def test_Utils_Schedule_BadArgs(self):
+        self.assertRaises(ValueError, self.sched, cores=0)
+        self.assertRaises(ValueError, self.sched, retries=-1)
+
+        s = self.sched(cores=4)
+        self.assertRaises(ValueError, self.add, s, 'a', nprocs=8)
+        self.assertRaises(ValueError, s.add, 'a', "", self.tempdir, nprocs=0)
+        s.add('a', "", self.tempdir)
+        self.assertRaises(ValueError, s.add, 'b', "", self.tempdir)
+        s.add('b', "", self.tempdir, sim_name='other')
+
+    def test_Utils_Schedule_CoreBudget(self):
+        from opan.const import EnumJobStatus as E_JS
+
+        nprocs = dict(zip('abcdefgh', [3, 1, 2, 2, 1, 1, 4, 1]))
+        s = self.sched(cores=4)
+        for (n, p) in sorted(nprocs.items()):
+            self.add(s, n, "# FAKE sleep 0.4\n", nprocs=p)
+        ## next (n, p)
+        self.assertEqual(s.job('g')['nprocs'], 4)
+
+        self.assertEqual(set(s.run().values()), {E_JS.DONE})
+        self.assertEqual(sorted(s.results), sorted(nprocs))
+
+        # Cores in use at the start of every run never exceed the budget,
+        #  and the budget is filled at some point
+        stamps = self.stamps()
+        self.assertEqual(sorted(n for (n, t0, t1) in stamps), sorted(nprocs))
+        loads = [sum(nprocs[n] for (n, t0, t1) in stamps if t0 <= t < t1)
+                                                for (_, t, _) in stamps]
+        self.assertLessEqual(max(loads), 4)
+        self.assertEqual(max(loads), 4)
+
+    def test_Utils_Schedule_Retries(self):
+        from opan.const import EnumJobStatus as E_JS
+
+        s = self.sched(cores=2, retries=1)
+        self.add(s, 'once', "# FAKE fail_times 1\n")
+        self.add(s, 'always', "# FAKE fail_times 5\n")
+        self.add(s, 'good')
+
+        self.assertEqual(s.run(), {'once': E_JS.DONE,
+                        'always': E_JS.FAILED, 'good': E_JS.DONE})
+        self.assertEqual(s.job('once')['attempts'], 2)
+        self.assertIsNone(s.job('once')['error'])
+        self.assertEqual(s.job('always')['attempts'], 2)
+        self.assertIn('terminate', s.job('always')['error'])
+        self.assertEqual(s.job('good')['attempts'], 1)
+        self.assertNotIn('always', s.results)
+        self.assertTrue(s.results['once'][0].completed)
+
+    def test_Utils_Schedule_ResetFailed(self):
+        from opan.const import EnumJobStatus as E_JS
+
+        s = self.sched(cores=1, retries=0)
+        self.add(s, 'once', "# FAKE fail_times 1\n")
+        self.assertEqual(s.run(), {'once': E_JS.FAILED})
+        s.reset()
+        self.assertEqual(s.job('once')['attempts'], 0)
+        self.assertEqual(s.run(), {'once': E_JS.DONE})
+
+    def test_Utils_Schedule_Timeout(self):
+        from opan.const import EnumJobStatus as E_JS
+
+        s = self.sched(cores=1, retries=0, timeout=0.3)
+        self.add(s, 'slow', "# FAKE sleep 30\n")
+        self.assertEqual(s.run(), {'slow': E_JS.FAILED})
+        self.assertIn('TimeoutExpired', s.job('slow')['error'])
+
+    def test_Utils_Schedule_StartFailure(self):
+        import os
+        from opan.const import EnumJobStatus as E_JS
+
+        s = self.sched(cores=1)
+        s.add('gone', "", os.path.join(self.tempdir, 'nonexistent'))
+        self.add(s, 'good')
+        self.assertEqual(s.run(), {'gone': E_JS.FAILED, 'good': E_JS.DONE})
+        self.assertEqual(s.job('gone')['attempts'], 1)
+
+    def test_Utils_Schedule_Resume(self):
+        from opan.const import EnumJobStatus as E_JS
+        from opan.output import OrcaOutput
+
+        s = self.sched(cores=2, state_path=self.state)
+        for n in 'abc':
+            self.add(s, n)
+        ## next n
+        s.run()
+        self.assertEqual(len(self.stamps()), 3)
+
+        # Re-defining the same campaign runs nothing more
+        s = self.sched(cores=2, state_path=self.state)
+        self.assertEqual(set(s.status.values()), {E_JS.DONE})
+        for n in 'abc':
+            self.add(s, n)
+        ## next n
+        s.run()
+        self.assertEqual(len(self.stamps()), 3)
+        self.assertEqual(s.results, {})
+        self.assertEqual(s.load_results('a')[0]
+                                .en[OrcaOutput.EN.SCFFINAL], [-1.5])
+
+        # A changed job is re-run, alone
+        self.add(s, 'b', energy='-2.5')
+        self.assertEqual(s.status['b'], E_JS.PENDING)
+        s.run()
+        self.assertEqual([n for (n, t0, t1) in self.stamps()][3:], ['b'])
+        self.assertEqual(s.results['b'][0].en[OrcaOutput.EN.SCFFINAL],
+                                                                    [-2.5])
+
+    def test_Utils_Schedule_ResumeInterrupted(self):
+        import json
+        from opan.const import EnumJobStatus as E_JS
+
+        s = self.sched(cores=1, state_path=self.state)
+        self.add(s, 'a')
+        self.add(s, 'b')
+
+        # As if killed while running 'a', partway through a later write
+        with open(self.state, 'a') as f:
+            f.write(json.dumps(dict(name='a', status=E_JS.RUNNING,
+                                    attempts=1)) + '\n{"name": "b", "st')
+        ## end with
+
+        s = self.sched(cores=1, state_path=self.state)
+        self.assertEqual(s.job('a')['status'], E_JS.PENDING)
+        self.assertEqual(s.job('a')['attempts'], 0)
+        self.assertEqual(s.run(), {'a': E_JS.DONE, 'b': E_JS.DONE})
+        s = self.sched(cores=1, state_path=self.state)
+        self.assertEqual(set(s.status.values()), {E_JS.DONE})
+
+    def test_Utils_Schedule_AddMany(self):
+        import os
+        from opan.const import EnumJobStatus as E_JS
+
+        jobs = [dict(name=str(i), inp_tp="", work_dir=self.tempdir,
+                        sim_name='run{0}'.format(i)) for i in range(50)]
+        s = self.sched(cores=1, state_path=self.state)
+        s.add_many(jobs)
+        with open(self.state) as f:
+            self.assertEqual(len(f.readlines()), 50)
+        ## end with
+
+        # Unchanged jobs are not recorded again; collisions are caught
+        #  within and across calls, with the preceding jobs kept
+        s = self.sched(cores=1, state_path=self.state)
+        self.assertEqual(list(s.status), [j['name'] for j in jobs])
+        s.add_many(jobs)
+        self.assertRaises(ValueError, s.add_many, [dict(name='x',
+                            inp_tp="", work_dir=self.tempdir, sim_name='y'),
+                            dict(name='z', inp_tp="",
+                            work_dir=self.tempdir, sim_name='run3')])
+        s.add('3', "", self.tempdir, sim_name='other')
+        s.add('z', "", self.tempdir, sim_name='run3')
+        s = self.sched(cores=1, state_path=self.state)
+        self.assertEqual(len(s.status), 52)
+        self.assertEqual(s.job('3')['sim_name'], 'other')
+        self.assertEqual(s.job('z')['work_dir'],
+                                            os.path.abspath(self.tempdir))
+        self.assertEqual(set(s.status.values()), {E_JS.PENDING})
+
+    def test_Utils_Schedule_ResumeSmallerBudget(self):
+        s = self.sched(cores=4, state_path=self.state)
+        self.add(s, 'a', nprocs=4)
+        s = self.sched(cores=2, state_path=self.state)
+        self.assertRaises(ValueError, s.run)
+
+## end class TestOpanUtilsSchedule
+
+
+def suite():
+    s = unittest.TestSuite()
+    tl = unittest.TestLoader()
+    s.addTests([tl.loadTestsFromTestCase(TestOpanUtilsSchedulePal),
+                tl.loadTestsFromTestCase(TestOpanUtilsSchedule)
+                ])
+    return s
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print("Module not executable.")
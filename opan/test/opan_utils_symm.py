@@ -0,0 +1,154 @@
+#-------------------------------------------------------------------------------
+# Name:        opan_utils_symm
+# Purpose:     Test objects for opan.utils.symm
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+
+import unittest
+
+
+class TestOpanUtilsSymmGeomSymmMatch(unittest.TestCase):
+
+    @staticmethod
+    def full_match(g, atwts, ax, theta, do_refl):
+        # Reference match factor from the full matrix of scaled distances
+        #  between the complex-augmented coordinates
+        import numpy as np
+        from opan.utils.symm import symm_op
+
+        wts = np.repeat(atwts, 3) * 1.j
+        pts_g = (np.asarray(g, dtype=np.float64) + wts).reshape((-1, 3))
+        pts_gx = (symm_op(g, ax, theta, do_refl).ravel() + wts) \
+                                                            .reshape((-1, 3))
+        dists = np.sqrt(np.sum(np.abs(pts_g[:, None, :] -
+                                        pts_gx[None, :, :])**2, axis=2))
+        scale_g = np.sqrt(np.sum(np.abs(pts_g)**2, axis=1))
+        scale_gx = np.sqrt(np.sum(np.abs(pts_gx)**2, axis=1))
+        scale = np.maximum(np.maximum(scale_g[:, None], scale_gx[None, :]),
+                                                                        1.0)
+        return min(np.max(np.min(dists / scale, axis=1)), 1.0)
+
+    def setUp(self):
+        # Random C6-symmetric cluster, with the axis along z
+        import numpy as np
+
+        rng = np.random.RandomState(0)
+        pts = rng.uniform(-5.0, 5.0, (20, 3))
+        rots = [np.array([[np.cos(t), -np.sin(t), 0.0],
+                          [np.sin(t), np.cos(t), 0.0],
+                          [0.0, 0.0, 1.0]]) for t in np.arange(6) * np.pi / 3]
+        self.g = np.concatenate([np.dot(pts, r.T) for r in rots]).ravel()
+        self.atwts = np.tile(rng.choice([1.008, 12.011, 15.999], 20), 6)
+
+    def test_Utils_Symm_GeomSymmMatch_SymmOp(self):
+        from opan.utils.symm import geom_symm_match as gsm
+        from opan.const import DEF
+        import numpy as np
+
+        for n in [2, 3, 6]:
+            self.assertLess(gsm(self.g, self.atwts, [0, 0, 1],
+                                    2 * np.pi / n, False),
+                            DEF.SYMM_MATCH_TOL, msg="C" + str(n))
+
+    def test_Utils_Symm_GeomSymmMatch_NonSymmOp(self):
+        from opan.utils.symm import geom_symm_match as gsm
+        from opan.const import DEF
+        import numpy as np
+
+        self.assertGreater(gsm(self.g, self.atwts, [0, 0, 1],
+                                    2 * np.pi / 4, False),
+                            DEF.SYMM_MATCH_TOL)
+        self.assertGreater(gsm(self.g, self.atwts, [0, 0, 1], 0.0, True),
+                            DEF.SYMM_MATCH_TOL)
+
+    def test_Utils_Symm_GeomSymmMatch_MatchesFull(self):
+        from opan.utils.symm import geom_symm_match as gsm
+        import numpy as np
+
+        rng = np.random.RandomState(1)
+        for i in range(20):
+            ax = rng.normal(size=(3,))
+            theta = rng.uniform(0.0, 2 * np.pi)
+            do_refl = bool(i % 2)
+            self.assertAlmostEqual(gsm(self.g, self.atwts, ax, theta, do_refl),
+                        self.full_match(self.g, self.atwts, ax, theta,
+                                                                do_refl),
+                        delta=1e-12, msg="Trial #" + str(i))
+
+
+class TestOpanUtilsSymmFindGroups(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Ensemble of randomly oriented and translated linear triatomics,
+        #  alternating between symmetric (D*h) and asymmetric (C*v) stretches
+        import numpy as np
+
+        rng = np.random.RandomState(2)
+        cls.atwts = np.array([15.999, 12.011, 15.999])
+        geoms, cls.groups = [], []
+        for i in range(12):
+            ax = rng.normal(size=(3,))
+            ax /= np.sqrt(np.dot(ax, ax))
+            pos = [-2.2, 0.0, 2.2] if i % 2 == 0 else [-2.0, 0.0, 2.5]
+            geoms.append((np.outer(pos, ax) + rng.uniform(-3, 3, 3)).ravel())
+            cls.groups.append(("D*h", 2) if i % 2 == 0 else ("C*v", 1))
+        ## next i
+        cls.geoms = np.array(geoms)
+
+    def test_Utils_Symm_FindGroups_Serial(self):
+        from opan.utils.symm import find_groups
+
+        self.assertEqual(find_groups(self.geoms, self.atwts, workers=1),
+                                                                self.groups)
+
+    def test_Utils_Symm_FindGroups_Parallel(self):
+        from opan.utils.symm import find_groups
+
+        self.assertEqual(find_groups(self.geoms, self.atwts, workers=2,
+                                                    chunk=5), self.groups)
+
+    def test_Utils_Symm_FindGroups_NumpyInts(self):
+        import numpy as np
+        from opan.utils.symm import find_groups
+
+        self.assertEqual(find_groups(self.geoms, self.atwts,
+                            workers=np.int64(2), chunk=np.int64(5)),
+                                                                self.groups)
+
+    def test_Utils_Symm_FindGroups_BadArgs(self):
+        from opan.utils.symm import find_groups
+
+        self.assertRaises(ValueError, find_groups, self.geoms[0], self.atwts)
+        self.assertRaises(ValueError, find_groups, self.geoms, self.atwts,
+                                                                workers=0)
+        self.assertRaises(ValueError, find_groups, self.geoms, self.atwts,
+                                                                chunk=0)
+
+
+def suite():
+    s = unittest.TestSuite()
+    tl = unittest.TestLoader()
+    s.addTests([tl.loadTestsFromTestCase(TestOpanUtilsSymmGeomSymmMatch),
+                tl.loadTestsFromTestCase(TestOpanUtilsSymmFindGroups)
+                ])
+    return s
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print("Module not executable.")
@@ -0,0 +1,1054 @@
+#-------------------------------------------------------------------------------
+# Name:        opan_vpt2_repo
+# Purpose:     Test objects for opan.vpt2.repo
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+
+import unittest
+
+
+def swmr_support():
+    # Whether the HDF5 library supports SWMR access
+    import h5py as h5
+    return h5.version.hdf5_version_tuple >= (1, 9, 178)
+
+
+def swmr_writer(fname, started, n_modes):
+    # Writer process for the SWMR test: stores gradients of value m for
+    #  each mode m, one batch per mode
+    import time
+    import numpy as np
+    from opan.const import EnumAnharmRepoData as E_ARD
+    from opan.const import EnumAnharmRepoLayout as E_ARL
+    from opan.const import EnumAnharmRepoMode as E_ARM
+    from opan.const import EnumDispDirection as E_DD
+    from opan.vpt2.repo import OpanAnharmRepo
+
+    repo = OpanAnharmRepo(fname, layout=E_ARL.STACKED,
+                                                mode=E_ARM.SWMR_WRITE)
+    repo.store_data(np.arange(12.), E_ARD.GEOM, 0, E_DD.NO_DISP)
+    repo.start_swmr({E_ARD.GRAD: (12,), E_ARD.ENERGY: ()})
+    started.set()
+    for m in range(n_modes):
+        with repo.batch():
+            repo.store_data(np.full(12, m, dtype=np.float_), E_ARD.GRAD, m,
+                                                            E_DD.NEGATIVE)
+            repo.store_data(float(m), E_ARD.ENERGY, m, E_DD.POSITIVE)
+        ## end with
+        time.sleep(0.01)
+    ## next m
+    repo.close()
+
+
+class SuperOpanVPT2Repo(unittest.TestCase):
+    # Superclass for repository tests, each in a fresh scratch directory
+
+    def setUp(self):
+        import os, tempfile
+        import numpy as np
+
+        self.tempdir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tempdir, 'repo.h5')
+
+        rng = np.random.RandomState(0)
+        self.hess = rng.uniform(-1, 1, (12, 12))
+        self.grad = rng.uniform(-1, 1, 12)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tempdir)
+
+## end class SuperOpanVPT2Repo
+
+
+class TestOpanVPT2RepoStorage(SuperOpanVPT2Repo):
+
+    def dset(self, repo, datatype, grp='m00003p'):
+        return repo._repo[grp][datatype]
+
+    def store_all(self, repo):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+
+        repo.store_data(self.hess, E_ARD.HESS, 3, E_DD.POSITIVE)
+        repo.store_data(self.grad, E_ARD.GRAD, 3, E_DD.POSITIVE)
+        repo.store_data(-1.5, E_ARD.ENERGY, 3, E_DD.POSITIVE)
+
+    def check_all(self, repo):
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+
+        self.assertTrue(np.array_equal(self.hess,
+                        repo.get_data(E_ARD.HESS, 3, E_DD.POSITIVE)))
+        self.assertTrue(np.array_equal(self.grad,
+                        repo.get_data(E_ARD.GRAD, 3, E_DD.POSITIVE)))
+        self.assertEqual(repo.get_data(E_ARD.ENERGY, 3, E_DD.POSITIVE), -1.5)
+
+    def test_VPT2Repo_Storage_Default(self):
+        import json
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoParam as E_ARP
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        repo = OpanAnharmRepo(self.fname)
+        self.assertEqual(json.loads(repo.get_param(E_ARP.STORAGE)),
+                                        dict((dt, {}) for dt in E_ARD))
+        self.store_all(repo)
+        self.assertIsNone(self.dset(repo, E_ARD.HESS).chunks)
+        self.assertIsNone(self.dset(repo, E_ARD.HESS).compression)
+        self.check_all(repo)
+        repo.close()
+
+    def test_VPT2Repo_Storage_PerType(self):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        repo = OpanAnharmRepo(self.fname, storage={
+                E_ARD.HESS: {'chunks': 'full', 'compression': 'gzip',
+                             'compression_opts': 4, 'shuffle': True},
+                E_ARD.GRAD: {'chunks': (100,)}})
+        self.store_all(repo)
+
+        hess = self.dset(repo, E_ARD.HESS)
+        self.assertEqual(hess.chunks, (12, 12))
+        self.assertEqual(hess.compression, 'gzip')
+        self.assertEqual(hess.compression_opts, 4)
+        self.assertTrue(hess.shuffle)
+        self.assertEqual(self.dset(repo, E_ARD.GRAD).chunks, (12,))
+        self.assertIsNone(self.dset(repo, E_ARD.GRAD).compression)
+        self.check_all(repo)
+        repo.close()
+
+    def test_VPT2Repo_Storage_AllTypes(self):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        repo = OpanAnharmRepo(self.fname, storage={'compression': 'lzf',
+                                                        'shuffle': True})
+        self.store_all(repo)
+        for dt in [E_ARD.HESS, E_ARD.GRAD]:
+            self.assertEqual(self.dset(repo, dt).compression, 'lzf')
+            self.assertIsNotNone(self.dset(repo, dt).chunks)
+        ## next dt
+        self.check_all(repo)
+        repo.close()
+
+    def test_VPT2Repo_Storage_Reopen(self):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        storage = {E_ARD.HESS: {'compression': 'gzip'}}
+        OpanAnharmRepo(self.fname, storage=storage).close()
+
+        # Recorded layout governs; restating it is fine
+        repo = OpanAnharmRepo(self.fname)
+        self.store_all(repo)
+        self.assertEqual(self.dset(repo, E_ARD.HESS).compression, 'gzip')
+        repo.close()
+        repo.load(self.fname, storage=storage)
+        self.assertEqual(repo.storage[E_ARD.HESS], {'compression': 'gzip'})
+        repo.close()
+
+        assertErrorAndTypecode(self, RepoError, OpanAnharmRepo,
+                    RepoError.STATUS, self.fname,
+                    storage={'compression': 'lzf'})
+
+    def test_VPT2Repo_Storage_LegacyRepoUntouched(self):
+        import h5py as h5
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        with h5.File(self.fname, 'w') as f:
+            f.create_group('param')
+        ## end with
+
+        repo = OpanAnharmRepo(self.fname)
+        self.assertEqual(repo.storage[E_ARD.HESS], {})
+        self.assertEqual(list(repo._repo['param']), [])
+        repo.close()
+
+    def test_VPT2Repo_Storage_BadOptions(self):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        for storage in [{'compression': 'szip'}, {'level': 3},
+                        {'compression': 'lzf', 'compression_opts': 4},
+                        {'compression': 'gzip', 'compression_opts': 10},
+                        {'chunks': (0, 4)}, {'chunks': 'auto'},
+                        {'shuffle': 1}, {E_ARD.HESS: 'gzip'}, ['gzip']]:
+            self.assertRaises(ValueError, OpanAnharmRepo, self.fname,
+                                                        storage=storage)
+        ## next storage
+
+    def test_VPT2Repo_Storage_ChunkRankMismatch(self):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        repo = OpanAnharmRepo(self.fname, storage={'chunks': (4, 4)})
+        self.assertRaises(ValueError, repo.store_data, self.grad,
+                                        E_ARD.GRAD, 3, E_DD.POSITIVE)
+        repo.close()
+
+## end class TestOpanVPT2RepoStorage
+
+
+class TestOpanVPT2RepoBatch(SuperOpanVPT2Repo):
+
+    def setUp(self):
+        from opan.vpt2.repo import OpanAnharmRepo
+        super(TestOpanVPT2RepoBatch, self).setUp()
+        self.repo = OpanAnharmRepo(self.fname)
+
+    def tearDown(self):
+        if self.repo.is_open():
+            self.repo.close()
+        ## end if
+        super(TestOpanVPT2RepoBatch, self).tearDown()
+
+    def store(self, mode, data=None, clobber=False):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+        self.repo.store_data(self.grad if data is None else data,
+                        E_ARD.GRAD, mode, E_DD.NEGATIVE, clobber=clobber)
+
+    def get(self, mode):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+        return self.repo.get_data(E_ARD.GRAD, mode, E_DD.NEGATIVE)
+
+    def has(self, mode):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+        return self.repo.has_data(E_ARD.GRAD, mode, E_DD.NEGATIVE)
+
+    def count_flushes(self, fxn):
+        # Number of flushes of the file during fxn()
+        import h5py as h5
+        from unittest import mock
+
+        with mock.patch.object(h5.File, 'flush', autospec=True,
+                                side_effect=h5.File.flush) as flush:
+            fxn()
+        ## end with
+        return flush.call_count
+
+    def test_VPT2Repo_Batch_DefersFlush(self):
+        def unbatched():
+            for m in range(10):
+                self.store(m)
+            ## next m
+        ## end def unbatched
+
+        def batched():
+            with self.repo.batch() as r:
+                self.assertIs(r, self.repo)
+                for m in range(10, 20):
+                    self.store(m)
+                ## next m
+                self.assertTrue(self.repo.is_dirty())
+            ## end with
+        ## end def batched
+
+        self.assertGreaterEqual(self.count_flushes(unbatched), 10)
+        self.repo.set_dirty(False)
+        self.assertEqual(self.count_flushes(batched), 2)
+        self.assertTrue(self.repo.is_dirty())
+        self.assertTrue(all(self.has(m) for m in range(20)))
+
+    def test_VPT2Repo_Batch_EmptyNoFlush(self):
+        def batched():
+            with self.repo.batch():
+                self.has(0)
+            ## end with
+        ## end def batched
+
+        self.assertEqual(self.count_flushes(batched), 0)
+
+    def test_VPT2Repo_Batch_Rollback(self):
+        import numpy as np
+        from opan.const import EnumAnharmRepoParam as E_ARP
+
+        self.store(0)
+        try:
+            with self.repo.batch():
+                self.store(1)
+                self.store(3)
+                self.store(0, data=2 * self.grad, clobber=True)
+                self.store(0, data=3 * self.grad, clobber=True)
+                self.repo.store_param(np.float_(0.1), E_ARP.INCREMENT)
+                self.assertTrue(np.array_equal(self.get(0), 3 * self.grad))
+                raise KeyError
+            ## end with
+        except KeyError:
+            pass
+        ## end try
+
+        self.assertFalse(self.has(1))
+        self.assertFalse(self.repo.has_param(E_ARP.INCREMENT))
+        self.assertTrue(np.array_equal(self.get(0), self.grad))
+        self.assertEqual(list(self.repo._repo['m00000n']), ['GRAD'])
+
+        # Groups created within the batch are removed with it
+        self.assertNotIn('m00001n', self.repo._repo)
+        self.assertNotIn('m00003n', self.repo._repo)
+
+    def test_VPT2Repo_Batch_Nested(self):
+        try:
+            with self.repo.batch():
+                with self.repo.batch():
+                    self.store(0)
+                ## end with
+                self.assertTrue(self.has(0))
+                raise KeyError
+            ## end with
+        except KeyError:
+            pass
+        ## end try
+        self.assertFalse(self.has(0))
+
+        with self.repo.batch():
+            with self.repo.batch():
+                self.store(0)
+            ## end with
+        ## end with
+        self.assertTrue(self.has(0))
+
+    def test_VPT2Repo_Batch_StatusErrors(self):
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        def close_in_batch():
+            with self.repo.batch():
+                self.repo.close()
+            ## end with
+        ## end def close_in_batch
+
+        def batch_unbound():
+            with OpanAnharmRepo().batch():
+                pass  # pragma: no cover
+            ## end with
+        ## end def batch_unbound
+
+        assertErrorAndTypecode(self, RepoError, close_in_batch,
+                                                        RepoError.STATUS)
+        self.assertTrue(self.repo.is_open())
+        assertErrorAndTypecode(self, RepoError, batch_unbound,
+                                                        RepoError.STATUS)
+
+## end class TestOpanVPT2RepoBatch
+
+
+class TestOpanVPT2RepoLayout(SuperOpanVPT2Repo):
+
+    def open(self, layout=None, **kwargs):
+        from opan.vpt2.repo import OpanAnharmRepo
+        return OpanAnharmRepo(self.fname, layout=layout, **kwargs)
+
+    def fill(self, repo):
+        # Gradients for modes 0-4 but (2, POSITIVE); one Hessian; and
+        #  reference values
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+
+        for m in range(5):
+            repo.store_data(m * self.grad, E_ARD.GRAD, m, E_DD.NEGATIVE)
+            if m != 2:
+                repo.store_data(-m * self.grad, E_ARD.GRAD, m,
+                                                            E_DD.POSITIVE)
+            ## end if
+        ## next m
+        repo.store_data(self.hess, E_ARD.HESS, 1, E_DD.POSITIVE)
+        repo.store_data(self.grad, E_ARD.GEOM, 0, E_DD.NO_DISP)
+        repo.store_data(-1.5, E_ARD.ENERGY, 0, E_DD.NO_DISP)
+
+    def grads(self):
+        # Expected stacked gradients, and their mask
+        import numpy as np
+
+        data = np.array([[m * self.grad, -m * self.grad]
+                                                for m in range(5)])
+        data[2, 1] = np.nan
+        present = np.ones((5, 2), dtype=bool)
+        present[2, 1] = False
+        return (data, present)
+
+    def check(self, repo):
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+
+        (data, present) = self.grads()
+        np.testing.assert_array_equal(repo.get_all(E_ARD.GRAD), data)
+        np.testing.assert_array_equal(repo.has_all(E_ARD.GRAD), present)
+        self.assertTrue(np.array_equal(repo.get_data(E_ARD.GRAD, 3,
+                                            E_DD.POSITIVE), -3 * self.grad))
+        self.assertFalse(repo.has_data(E_ARD.GRAD, 2, E_DD.POSITIVE))
+        self.assertFalse(repo.has_data(E_ARD.GRAD, 9, E_DD.NEGATIVE))
+        self.assertTrue(np.array_equal(repo.get_all(E_ARD.HESS)[1, 1],
+                                                                self.hess))
+        self.assertEqual(repo.has_all(E_ARD.HESS).sum(), 1)
+        self.assertTrue(np.array_equal(repo.get_data(E_ARD.GEOM, 0,
+                                                E_DD.NO_DISP), self.grad))
+        self.assertEqual(repo.get_data(E_ARD.ENERGY, 0, E_DD.NO_DISP), -1.5)
+
+    def test_VPT2Repo_Layout_Default(self):
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.const import EnumAnharmRepoParam as E_ARP
+
+        repo = self.open()
+        self.assertEqual(repo.layout, E_ARL.GROUPED)
+        self.assertEqual(repo.get_param(E_ARP.LAYOUT), E_ARL.GROUPED)
+        self.fill(repo)
+        self.assertIn('m00003p', repo._repo)
+        self.check(repo)
+        repo.close()
+
+    def test_VPT2Repo_Layout_Stacked(self):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+
+        repo = self.open(E_ARL.STACKED)
+        self.fill(repo)
+        self.assertEqual(sorted(repo._repo['stacked']), ['GRAD',
+                                    'GRAD.mask', 'HESS', 'HESS.mask'])
+        self.assertEqual(repo._repo['stacked']['GRAD'].shape, (5, 2, 12))
+        self.assertFalse(any(repo.P_mode_grp.match(n) for n in repo._repo))
+        self.check(repo)
+        repo.close()
+
+        # Recorded layout governs on reopening
+        repo = self.open()
+        self.assertEqual(repo.layout, E_ARL.STACKED)
+        self.check(repo)
+        repo.close()
+
+    def test_VPT2Repo_Layout_StackedStorage(self):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.const import EnumDispDirection as E_DD
+
+        repo = self.open(E_ARL.STACKED, storage={E_ARD.HESS:
+                            {'compression': 'gzip', 'chunks': (4, 4)}})
+        self.fill(repo)
+        repo.store_data(-1.5, E_ARD.ENERGY, 3, E_DD.NEGATIVE)
+        hess = repo._repo['stacked']['HESS']
+        self.assertEqual(hess.compression, 'gzip')
+        self.assertEqual(hess.chunks[1:], (2, 4, 4))
+        self.assertGreater(repo._repo['stacked']['ENERGY'].chunks[0], 1)
+        self.assertEqual(repo.get_data(E_ARD.ENERGY, 3, E_DD.NEGATIVE),
+                                                                    -1.5)
+        repo.close()
+
+    def test_VPT2Repo_Layout_BadLayout(self):
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+
+        self.assertRaises(ValueError, self.open, 'PACKED')
+        self.open(E_ARL.STACKED).close()
+        assertErrorAndTypecode(self, RepoError, self.open,
+                                        RepoError.STATUS, E_ARL.GROUPED)
+
+    def test_VPT2Repo_Layout_LegacyGrouped(self):
+        import h5py as h5
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+
+        with h5.File(self.fname, 'w') as f:
+            f.create_group('param')
+        ## end with
+
+        repo = self.open()
+        self.assertEqual(repo.layout, E_ARL.GROUPED)
+        self.assertEqual(list(repo._repo['param']), [])
+        repo.close()
+        assertErrorAndTypecode(self, RepoError, self.open,
+                                        RepoError.STATUS, E_ARL.STACKED)
+
+    def test_VPT2Repo_Layout_StoreMany(self):
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+
+        (data, present) = self.grads()
+        for layout in E_ARL:
+            repo = self.open(layout)
+            repo.store_many(data[[4, 0, 2]], E_ARD.GRAD, modes=[4, 0, 2])
+            repo.store_many(data[[1, 3]], E_ARD.GRAD, modes=[1, 3])
+            np.testing.assert_array_equal(repo.get_all(E_ARD.GRAD), data)
+            np.testing.assert_array_equal(repo.has_all(E_ARD.GRAD),
+                                                                present)
+
+            # Nothing stored on a clobber refused
+            assertErrorAndTypecode(self, RepoError, repo.store_many,
+                        RepoError.DATA, np.zeros((2, 2, 12)), E_ARD.GRAD,
+                        modes=[5, 1])
+            np.testing.assert_array_equal(repo.has_all(E_ARD.GRAD),
+                                                                present)
+
+            repo.store_many(np.zeros((2, 2, 12)), E_ARD.GRAD, modes=[5, 1],
+                                                                clobber=True)
+            self.assertEqual(repo.has_all(E_ARD.GRAD).sum(), 11)
+            self.assertFalse(repo.get_all(E_ARD.GRAD)[1].any())
+            repo.close()
+
+            self.tearDown()
+            self.setUp()
+        ## next layout
+
+    def test_VPT2Repo_Layout_BulkErrors(self):
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.const import EnumDispDirection as E_DD
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+
+        repo = self.open(E_ARL.STACKED)
+        self.assertRaises(ValueError, repo.get_all, 'FOO')
+        self.assertRaises(ValueError, repo.store_many, np.zeros((2, 3)),
+                                                                E_ARD.GRAD)
+        self.assertRaises(ValueError, repo.store_many, np.zeros((2, 2)),
+                                                E_ARD.ENERGY, modes=[0, 0])
+        self.assertRaises(ValueError, repo.store_many, np.zeros((2, 2)),
+                                                E_ARD.ENERGY, modes=[0])
+        assertErrorAndTypecode(self, RepoError, repo.get_all,
+                                                RepoError.DATA, E_ARD.GRAD)
+        self.assertEqual(repo.has_all(E_ARD.GRAD).shape, (0, 2))
+
+        repo.store_data(self.grad, E_ARD.GRAD, 0, E_DD.NEGATIVE)
+        assertErrorAndTypecode(self, RepoError, repo.store_data,
+                    RepoError.DATA, self.grad[:6], E_ARD.GRAD, 1,
+                    E_DD.NEGATIVE)
+        assertErrorAndTypecode(self, RepoError, repo.store_data,
+                    RepoError.DATA, self.grad, E_ARD.GRAD, 0,
+                    E_DD.NEGATIVE)
+        repo.close()
+        assertErrorAndTypecode(self, RepoError, repo.get_all,
+                                            RepoError.STATUS, E_ARD.GRAD)
+
+    def test_VPT2Repo_Layout_StackedBatchRollback(self):
+        import os
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.const import EnumDispDirection as E_DD
+
+        repo = self.open(E_ARL.STACKED)
+        self.fill(repo)
+        try:
+            with repo.batch():
+                repo.store_data(self.grad, E_ARD.GRAD, 0, E_DD.NEGATIVE,
+                                                                clobber=True)
+                repo.store_data(self.grad, E_ARD.GRAD, 2, E_DD.POSITIVE)
+                repo.store_data(self.grad, E_ARD.GRAD, 7, E_DD.POSITIVE)
+                repo.store_many(np.ones((2, 2, 12)), E_ARD.GRAD,
+                                                modes=[3, 0], clobber=True)
+                repo.store_data(-2.5, E_ARD.ENERGY, 1, E_DD.NEGATIVE)
+                raise KeyError
+            ## end with
+        except KeyError:
+            pass
+        ## end try
+
+        self.assertNotIn('ENERGY', repo._repo['stacked'])
+        self.check(repo)
+        repo.close()
+
+        # As is the stacked group itself, if created within the batch
+        os.remove(self.fname)
+        repo = self.open(E_ARL.STACKED)
+        try:
+            with repo.batch():
+                repo.store_many(np.ones((2, 2, 12)), E_ARD.GRAD)
+                raise KeyError
+            ## end with
+        except KeyError:
+            pass
+        ## end try
+        self.assertNotIn('stacked', repo._repo)
+        repo.close()
+
+    def test_VPT2Repo_Layout_Migrate(self):
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.const import EnumAnharmRepoParam as E_ARP
+
+        repo = self.open()
+        self.fill(repo)
+        repo.migrate(E_ARL.STACKED)
+        self.assertEqual(repo.layout, E_ARL.STACKED)
+        self.assertFalse(any(repo.P_mode_grp.match(n) for n in repo._repo))
+        self.check(repo)
+        repo.close()
+
+        repo = self.open()
+        self.assertEqual(repo.get_param(E_ARP.LAYOUT), E_ARL.STACKED)
+        self.check(repo)
+        repo.migrate(E_ARL.GROUPED)
+        self.assertNotIn('stacked', repo._repo)
+        self.assertIn('m00004n', repo._repo)
+        self.check(repo)
+        repo.migrate(E_ARL.GROUPED)
+        self.check(repo)
+        self.assertRaises(ValueError, repo.migrate, None)
+        repo.close()
+
+    def test_VPT2Repo_Layout_MigrateRollback(self):
+        from unittest import mock
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        repo = self.open()
+        self.fill(repo)
+        with mock.patch.object(OpanAnharmRepo, 'store_param',
+                                                side_effect=OSError):
+            self.assertRaises(OSError, repo.migrate, E_ARL.STACKED)
+        ## end with
+
+        self.assertEqual(repo.layout, E_ARL.GROUPED)
+        self.assertNotIn('GRAD', repo._repo.get('stacked', {}))
+        self.assertEqual(sorted(repo._repo['m00001p']), ['GRAD', 'HESS'])
+        self.check(repo)
+        repo.close()
+
+## end class TestOpanVPT2RepoLayout
+
+
+class TestOpanVPT2RepoCache(SuperOpanVPT2Repo):
+
+    def setUp(self):
+        from opan.vpt2.repo import OpanAnharmRepo
+        super(TestOpanVPT2RepoCache, self).setUp()
+        self.repo = OpanAnharmRepo(self.fname)
+        self.repo.cache_clear()
+
+    def tearDown(self):
+        if self.repo.is_open():
+            self.repo.close()
+        ## end if
+        super(TestOpanVPT2RepoCache, self).tearDown()
+
+    def store(self, mode, data=None, clobber=False):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+        self.repo.store_data(self.grad if data is None else data,
+                        E_ARD.GRAD, mode, E_DD.POSITIVE, clobber=clobber)
+
+    def get(self, mode):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+        return self.repo.get_data(E_ARD.GRAD, mode, E_DD.POSITIVE)
+
+    def has(self, mode):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+        return self.repo.has_data(E_ARD.GRAD, mode, E_DD.POSITIVE)
+
+    def test_VPT2Repo_Cache_HitsServedFromMemory(self):
+        import numpy as np
+        from unittest import mock
+        from opan.vpt2.repo import CacheInfo, OpanAnharmRepo
+
+        self.store(0)
+        with mock.patch.object(OpanAnharmRepo, '_get_data', autospec=True,
+                        side_effect=OpanAnharmRepo._get_data) as read:
+            for _ in range(3):
+                self.assertTrue(np.array_equal(self.get(0), self.grad))
+            ## next _
+            self.assertTrue(self.has(0))
+        ## end with
+
+        self.assertEqual(read.call_count, 1)
+        self.assertEqual(self.repo.cache_info(), CacheInfo(3, 1,
+                    self.repo.cache_size, 96 + self.repo.cache_entry_bytes))
+
+        self.repo.cache_clear()
+        self.assertEqual(self.repo.cache_info()[:2], (0, 0))
+        self.assertEqual(self.repo.cache_info().currsize, 0)
+
+    def test_VPT2Repo_Cache_ReturnsCopies(self):
+        import numpy as np
+
+        self.store(0)
+        self.get(0)[:] = 0
+        self.get(0)[:] = 0
+        self.assertTrue(np.array_equal(self.get(0), self.grad))
+
+    def test_VPT2Repo_Cache_Absence(self):
+        import numpy as np
+
+        self.assertFalse(self.has(0))
+        self.assertFalse(self.has(0))
+        self.assertEqual(self.repo.cache_info()[:2], (1, 1))
+        self.store(0)
+        self.assertTrue(self.has(0))
+        self.assertTrue(np.array_equal(self.get(0), self.grad))
+
+    def test_VPT2Repo_Cache_StoresInvalidate(self):
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.const import EnumAnharmRepoParam as E_ARP
+        from opan.const import EnumDispDirection as E_DD
+
+        self.store(0)
+        self.get(0)
+        self.store(0, data=2 * self.grad, clobber=True)
+        self.assertTrue(np.array_equal(self.get(0), 2 * self.grad))
+
+        # The reference geometry serves every mode
+        self.assertFalse(self.repo.has_data(E_ARD.GEOM, 3, E_DD.NO_DISP))
+        self.repo.store_data(self.grad, E_ARD.GEOM, 0, E_DD.NO_DISP)
+        self.assertTrue(self.repo.has_data(E_ARD.GEOM, 3, E_DD.NO_DISP))
+
+        self.assertFalse(self.repo.has_param(E_ARP.INCREMENT))
+        self.repo.store_param(0.1, E_ARP.INCREMENT)
+        self.assertEqual(self.repo.get_param(E_ARP.INCREMENT), 0.1)
+
+        # Bulk stores, in both layouts
+        self.assertFalse(self.has(1))
+        for (k, layout) in [(3, E_ARL.STACKED), (4, E_ARL.GROUPED)]:
+            self.repo.store_many(np.array([[-self.grad, k * self.grad]] * 2),
+                                                E_ARD.GRAD, clobber=True)
+            self.assertTrue(np.array_equal(self.get(1), k * self.grad))
+            self.repo.migrate(layout)
+            self.assertTrue(np.array_equal(self.get(1), k * self.grad))
+        ## next (k, layout)
+
+    def test_VPT2Repo_Cache_RollbackInvalidates(self):
+        import numpy as np
+
+        self.store(0)
+        try:
+            with self.repo.batch():
+                self.store(0, data=2 * self.grad, clobber=True)
+                self.assertTrue(np.array_equal(self.get(0), 2 * self.grad))
+                raise KeyError
+            ## end with
+        except KeyError:
+            pass
+        ## end try
+        self.assertTrue(np.array_equal(self.get(0), self.grad))
+
+    def test_VPT2Repo_Cache_CloseLoad(self):
+        import numpy as np
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+
+        self.store(0)
+        self.get(0)
+        self.repo.close()
+        self.assertEqual(self.repo.cache_info().currsize, 0)
+        assertErrorAndTypecode(self, RepoError, self.get, RepoError.STATUS,
+                                                                        0)
+
+        # Changed behind the closed instance's back
+        other = type(self.repo)(self.fname)
+        other.store_data(2 * self.grad, 'GRAD', 0, 'POSITIVE', clobber=True)
+        other.close()
+        self.repo.load(self.fname)
+        self.assertTrue(np.array_equal(self.get(0), 2 * self.grad))
+
+    def test_VPT2Repo_Cache_SizeBound(self):
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        self.repo.close()
+        entry = 96 + OpanAnharmRepo.cache_entry_bytes
+        self.repo = OpanAnharmRepo(self.fname, cache_size=3 * entry)
+        self.repo.cache_clear()
+        for m in range(4):
+            self.store(m)
+            self.get(m)
+        ## next m
+        self.assertEqual(self.repo.cache_info().currsize, 3 * entry)
+
+        # Least recently used goes first
+        self.get(1)
+        self.get(0)
+        self.get(1)
+        self.get(3)
+        self.assertEqual(self.repo.cache_info()[:2], (3, 5))
+
+    def test_VPT2Repo_Cache_Disabled(self):
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        self.repo.close()
+        self.repo = OpanAnharmRepo(self.fname, cache_size=0)
+        self.repo.cache_clear()
+        self.store(0)
+        self.get(0)
+        self.get(0)
+        self.assertEqual(self.repo.cache_info()[1:], (2, 0, 0))
+
+        for size in [-1, 1.5, None]:
+            self.assertRaises(ValueError, OpanAnharmRepo, self.fname,
+                                                        cache_size=size)
+        ## next size
+
+    def test_VPT2Repo_Cache_GetXYZ(self):
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoParam as E_ARP
+        from opan.const import EnumDispDirection as E_DD
+
+        self.repo.store_param(np.array([b'C', b'O']), E_ARP.ATOMS)
+        self.repo.store_data(self.grad[:6], E_ARD.GEOM, 2, E_DD.NEGATIVE)
+        for _ in range(2):
+            xyz = self.repo.get_XYZ(2, E_DD.NEGATIVE)
+            self.assertEqual(xyz.atom_syms, ['C', 'O'])
+            self.assertTrue(np.array_equal(xyz.geoms[0], self.grad[:6]))
+        ## next _
+        self.assertEqual(self.repo.cache_info()[:2], (2, 2))
+
+## end class TestOpanVPT2RepoCache
+
+
+class TestOpanVPT2RepoModes(SuperOpanVPT2Repo):
+
+    def make(self, layout=None):
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumDispDirection as E_DD
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        repo = OpanAnharmRepo(self.fname, layout=layout)
+        repo.store_data(self.grad, E_ARD.GRAD, 1, E_DD.POSITIVE)
+        repo.close()
+
+    def test_VPT2Repo_Modes_ReadOnly(self):
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.const import EnumAnharmRepoMode as E_ARM
+        from opan.const import EnumAnharmRepoParam as E_ARP
+        from opan.const import EnumDispDirection as E_DD
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        for layout in E_ARL:
+            self.make(layout)
+            repos = [OpanAnharmRepo(self.fname, mode=E_ARM.READONLY)
+                                                            for _ in range(2)]
+            for repo in repos:
+                self.assertEqual(repo.layout, layout)
+                self.assertTrue(np.array_equal(repo.get_data(E_ARD.GRAD, 1,
+                                            E_DD.POSITIVE), self.grad))
+                self.assertTrue(repo.is_dirty())
+                self.assertEqual(repo.has_all(E_ARD.GRAD).sum(), 1)
+            ## next repo
+
+            repo = repos[0]
+            for (fxn, args) in [
+                    (repo.store_data, (self.grad, E_ARD.GRAD, 2,
+                                                        E_DD.POSITIVE)),
+                    (repo.store_many, (np.zeros((1, 2, 12)), E_ARD.GRAD)),
+                    (repo.store_param, (0.1, E_ARP.INCREMENT)),
+                    (repo.set_dirty, (False,)),
+                    (repo.migrate, (E_ARL.STACKED if layout ==
+                                        E_ARL.GROUPED else E_ARL.GROUPED,))]:
+                assertErrorAndTypecode(self, RepoError, fxn,
+                                                    RepoError.STATUS, *args)
+            ## next (fxn, args)
+            for repo in repos:
+                repo.close()
+            ## next repo
+
+            self.tearDown()
+            self.setUp()
+        ## next layout
+
+    def test_VPT2Repo_Modes_ReadOnlyLegacy(self):
+        import h5py as h5
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.const import EnumAnharmRepoMode as E_ARM
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        with h5.File(self.fname, 'w') as f:
+            pass
+        ## end with
+
+        repo = OpanAnharmRepo(self.fname, mode=E_ARM.READONLY)
+        self.assertEqual(repo.layout, E_ARL.GROUPED)
+        self.assertTrue(repo.is_dirty())
+        repo.close()
+        with h5.File(self.fname, 'r') as f:
+            self.assertEqual(list(f), [])
+        ## end with
+
+    def test_VPT2Repo_Modes_BadMode(self):
+        import os
+        from opan.const import EnumAnharmRepoMode as E_ARM
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        self.assertRaises(ValueError, OpanAnharmRepo, self.fname,
+                                                            mode='APPEND')
+        self.assertRaises(IOError, OpanAnharmRepo, self.fname,
+                                                    mode=E_ARM.READONLY)
+        self.assertFalse(os.path.exists(self.fname))
+
+    def test_VPT2Repo_Modes_StartSWMRErrors(self):
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        repo = OpanAnharmRepo(self.fname)
+        assertErrorAndTypecode(self, RepoError, repo.start_swmr,
+                                                        RepoError.STATUS)
+        repo.close()
+        assertErrorAndTypecode(self, RepoError, repo.start_swmr,
+                                                        RepoError.STATUS)
+
+    def test_VPT2Repo_Modes_RefreshEmptiesCache(self):
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        self.make()
+        repo = OpanAnharmRepo(self.fname)
+        repo.has_data('GRAD', 1, 'POSITIVE')
+        self.assertGreater(repo.cache_info().currsize, 0)
+        repo.refresh()
+        self.assertEqual(repo.cache_info().currsize, 0)
+        repo.close()
+        assertErrorAndTypecode(self, RepoError, repo.refresh,
+                                                        RepoError.STATUS)
+
+    @unittest.skipIf(swmr_support(), "HDF5 library supports SWMR")
+    def test_VPT2Repo_Modes_SWMRUnsupported(self):
+        import os
+        from opan.const import EnumAnharmRepoMode as E_ARM
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        for mode in [E_ARM.SWMR_WRITE, E_ARM.SWMR_READ]:
+            assertErrorAndTypecode(self, RepoError, OpanAnharmRepo,
+                                RepoError.STATUS, self.fname, mode=mode)
+        ## next mode
+        self.assertFalse(os.path.exists(self.fname))
+
+    @unittest.skipUnless(swmr_support(), "HDF5 library lacks SWMR")
+    def test_VPT2Repo_Modes_SWMRWriterLimits(self):
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoLayout as E_ARL
+        from opan.const import EnumAnharmRepoMode as E_ARM
+        from opan.const import EnumAnharmRepoParam as E_ARP
+        from opan.const import EnumDispDirection as E_DD
+        from opan.error import RepoError
+        from opan.test.utils import assertErrorAndTypecode
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        repo = OpanAnharmRepo(self.fname, mode=E_ARM.SWMR_WRITE)
+        assertErrorAndTypecode(self, RepoError, repo.start_swmr,
+                                                        RepoError.STATUS)
+        repo.close()
+
+        self.tearDown()
+        self.setUp()
+        repo = OpanAnharmRepo(self.fname, layout=E_ARL.STACKED,
+                                                mode=E_ARM.SWMR_WRITE)
+        repo.start_swmr({E_ARD.GRAD: (12,)})
+        for (fxn, args) in [
+                (repo.store_param, (0.1, E_ARP.INCREMENT)),
+                (repo.store_data, (self.grad, E_ARD.GEOM, 0, E_DD.NO_DISP)),
+                (repo.store_data, (self.hess, E_ARD.HESS, 0, E_DD.POSITIVE)),
+                (repo.migrate, (E_ARL.GROUPED,))]:
+            assertErrorAndTypecode(self, RepoError, fxn, RepoError.STATUS,
+                                                                    *args)
+        ## next (fxn, args)
+
+        repo.store_data(self.grad, E_ARD.GRAD, 3, E_DD.POSITIVE)
+        self.assertTrue(np.array_equal(repo.get_data(E_ARD.GRAD, 3,
+                                            E_DD.POSITIVE), self.grad))
+        repo.close()
+
+    @unittest.skipUnless(swmr_support(), "HDF5 library lacks SWMR")
+    def test_VPT2Repo_Modes_SWMRReaderProcess(self):
+        # A reader process follows a writer process, never seeing a
+        #  value marked stored but not (fully) written
+        import multiprocessing as mp
+        import time
+        import numpy as np
+        from opan.const import EnumAnharmRepoData as E_ARD
+        from opan.const import EnumAnharmRepoMode as E_ARM
+        from opan.const import EnumDispDirection as E_DD
+        from opan.vpt2.repo import OpanAnharmRepo
+
+        n_modes = 30
+        started = mp.Event()
+        proc = mp.Process(target=swmr_writer, args=(self.fname, started,
+                                                                n_modes))
+        proc.start()
+        self.assertTrue(started.wait(30))
+
+        repo = OpanAnharmRepo(self.fname, mode=E_ARM.SWMR_READ)
+        self.assertTrue(np.array_equal(repo.get_data(E_ARD.GEOM, 0,
+                                        E_DD.NO_DISP), np.arange(12.)))
+        counts = set()
+        t0 = time.time()
+        while time.time() - t0 < 60:
+            done = not proc.is_alive()
+            repo.refresh()
+            present = repo.has_all(E_ARD.GRAD)[:, 0]
+            if present.any():
+                grads = repo.get_all(E_ARD.GRAD)[:, 0]
+                for m in np.nonzero(present)[0]:
+                    self.assertTrue((grads[m] == m).all())
+                ## next m
+            ## end if
+            counts.add(int(present.sum()))
+            if done:
+                break
+            ## end if
+            time.sleep(0.005)
+        ## loop
+        proc.join(30)
+
+        self.assertEqual(proc.exitcode, 0)
+        self.assertEqual(max(counts), n_modes)
+        self.assertGreater(len(counts), 2)
+        self.assertEqual(repo.get_data(E_ARD.ENERGY, n_modes - 1,
+                                            E_DD.POSITIVE), n_modes - 1)
+        repo.close()
+
+## end class TestOpanVPT2RepoModes
+
+
+def suite():
+    s = unittest.TestSuite()
+    tl = unittest.TestLoader()
+    s.addTests([tl.loadTestsFromTestCase(TestOpanVPT2RepoStorage),
+                tl.loadTestsFromTestCase(TestOpanVPT2RepoBatch),
+                tl.loadTestsFromTestCase(TestOpanVPT2RepoLayout),
+                tl.loadTestsFromTestCase(TestOpanVPT2RepoCache),
+                tl.loadTestsFromTestCase(TestOpanVPT2RepoModes)
+                ])
+    return s
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print("Module not executable.")
@@ -140,6 +140,7 @@ class SuperOpanXYZ(unittest.TestCase):
         file_start = 'file_start'
         const_numats = 'const_numats'
         atom_counts = 'atom_counts'
+        bad_coord = 'bad_coord'
 
         bad_lategeom_atomnum = 'bad_lategeom_atomnum'
         diff_lategeom_atomnum = 'diff_lategeom_atomnum'
@@ -151,6 +152,9 @@ class SuperOpanXYZ(unittest.TestCase):
 
         Cu_1st_as_atomnum = 'Cu_1st_as_atomnum'
         Cu_late_as_atomnum = 'Cu_late_as_atomnum'
+        blank_separated = 'blank_separated'
+        truncated = 'truncated'
+        blank_descs = 'blank_descs'
     ## end class names
 
     # Known-good data for this particular trajectory
@@ -256,6 +260,9 @@ class SuperOpanXYZ(unittest.TestCase):
                             ('H       1.421470      1.048067', 'shmarb'),
                 names.const_numats :
                             ('1.052449\n4', '1.052449\n6'),
+                names.bad_coord :
+                            ('1.421470      1.048067',
+                                        '1.421470      1.0.48067'),
                 names.bad_lategeom_atomnum :
                             ('Cu     -0.822629', '300    -0.822629'),
                 names.diff_lategeom_atomnum :
@@ -274,7 +281,9 @@ class SuperOpanXYZ(unittest.TestCase):
                 names.Cu_1st_as_atomnum :
                             ('Cu     -0.698514', '29     -0.822629'),
                 names.Cu_late_as_atomnum :
-                            ('Cu     -0.822629', '29     -0.822629')
+                            ('Cu     -0.822629', '29     -0.822629'),
+                names.blank_separated :
+                            ('1.052449\n4', '1.052449\n\n4')
                             }
 
 ## end class SuperOpanXYZ
@@ -321,6 +330,14 @@ class TestOpanXYZGoodFileData(SuperOpanXYZ):
     def test_XYZ_GoodFileDataNumAtoms(self):
         self.assertEqual(self.xyz.num_atoms, self.num_atoms)
 
+    def test_XYZ_GoodFileDataInStrDiscarded(self):
+        from opan.xyz import OpanXYZ
+        xyz = OpanXYZ(path=self.file_name, keep_str=False)
+        self.assertIsNone(xyz.in_str)
+
+    def test_XYZ_GoodFileDataInStrKept(self):
+        self.assertEqual(self.xyz.in_str, self.file_text_good)
+
     def test_XYZ_GoodFileDataNumGeoms(self):
         self.assertEqual(self.xyz.num_geoms, self.num_geoms)
 
@@ -395,10 +412,205 @@ class TestOpanXYZGoodFileData(SuperOpanXYZ):
         # Have to use assertTrue b/c numpy confuses assertEqual &c.
         self.assertTrue(all(self.xyz.displ_single(0,0,0) == [0.0, 0.0, 0.0]))
 
+    def test_XYZ_GoodFileDataMultiDisplacements(self):
+        import numpy as np
+
+        displs = self.xyz.displ_multi(None, 0, [1, 0])
+        self.assertEqual(displs.shape, (self.num_geoms, 2, 3))
+        self.assertTrue(np.allclose(displs[:, 0, :],
+                                    np.array(self.displ_Cu_O), atol=1e-6))
+        self.assertTrue(np.all(displs[:, 1, :] == 0.0))
+
+    def test_XYZ_GoodFileDataMultiDistances(self):
+        import numpy as np
+
+        dists = self.xyz.dist_multi(None, [0, 1], [1, 2])
+        self.assertEqual(dists.shape, (self.num_geoms, 2))
+        self.assertTrue(np.allclose(dists[:, 0], self.dist_Cu_O, atol=1e-5))
+        self.assertTrue(np.allclose(dists[:, 1], self.dist_O_H1, atol=1e-5))
+
+    def test_XYZ_GoodFileDataMultiAngles(self):
+        import numpy as np
+
+        angles = self.xyz.angle_multi(None, [0, 0], 1, [2, 0])
+        self.assertEqual(angles.shape, (self.num_geoms, 2))
+        self.assertTrue(np.allclose(angles[:, 0], self.angle_Cu_O_H1,
+                                                                atol=1e-2))
+        self.assertTrue(np.all(angles[:, 1] == 0.0))
+
+    def test_XYZ_GoodFileDataMultiDihedrals(self):
+        import numpy as np
+
+        diheds = self.xyz.dihed_multi(None, 3, 1, 0, 2)
+        self.assertEqual(diheds.shape, (self.num_geoms, 1))
+        self.assertTrue(np.allclose(diheds[:, 0], self.dihed_H2_O_Cu_H1,
+                                                                atol=1e-2))
+
+    def test_XYZ_GoodFileDataDistMatrix(self):
+        import numpy as np
+
+        dists = self.xyz.dist_matrix()
+        self.assertEqual(dists.shape,
+                        (self.num_geoms, self.num_atoms, self.num_atoms))
+        self.assertTrue(np.allclose(dists[:, 0, 1], self.dist_Cu_O,
+                                                                atol=1e-5))
+        self.assertTrue(np.allclose(dists[:, 2, 1], self.dist_O_H1,
+                                                                atol=1e-5))
+        self.assertTrue(np.array_equal(dists,
+                                    dists.transpose((0, 2, 1))))
+        self.assertTrue(np.all(np.diagonal(dists, axis1=1, axis2=2) == 0.0))
+
+    def test_XYZ_GoodFileDataNeighborList(self):
+        import numpy as np
+
+        # Cutoff between the O-H and Cu-O distances
+        pairs, dists = self.xyz.neighbor_list(0, 2.5)
+        self.assertTrue(np.array_equal(pairs, [[1, 2], [1, 3]]))
+        self.assertAlmostEqual(dists[0], self.dist_O_H1[0], delta=1e-5)
+
+        # Cutoff catching everything matches the distance matrix
+        pairs, dists = self.xyz.neighbor_list(-1, 100.0)
+        i, j = np.triu_indices(self.num_atoms, 1)
+        self.assertTrue(np.array_equal(pairs, np.column_stack((i, j))))
+        self.assertTrue(np.allclose(dists,
+                            self.xyz.dist_matrix(-1)[0, i, j], atol=1e-10))
+
+    def test_XYZ_GoodFileDataMultiMatchesSingle(self):
+        import numpy as np
+
+        g_nums = [0, 7, -1]
+        diheds = self.xyz.dihed_multi(g_nums, [3, 2], [1, 1], [0, 0], [2, 3])
+        for i, g in enumerate(g_nums):
+            for j, ats in enumerate([(3, 1, 0, 2), (2, 1, 0, 3)]):
+                self.assertAlmostEqual(diheds[i, j],
+                            self.xyz.dihed_single(g, *ats), delta=1e-8,
+                            msg="Geometry {0}, atoms {1}".format(g, ats))
+
 
 ## end class TestOpanXYZGoodData
 
 
+class TestOpanXYZStreamFileData(SuperOpanXYZ):
+    # Ensuring streamed reading of a known OpenBabel xyz file reports the
+    #  same geometries and geometric parameters as a full load
+
+    @classmethod
+    def setUpClass(cls):
+        from opan.test.utils import setUpTestDir
+
+        # Set up the directory and add the good and truncated files
+        setUpTestDir(cls.testdir)
+
+        # Write the files
+        with open(cls.file_name, 'w') as f:
+            f.write(cls.file_text_good)
+        with open(cls.file_name + cls.names.truncated, 'w') as f:
+            f.write(cls.file_text_good.rsplit('\n', 3)[0])
+
+        # Reduce the first description to whitespace only and blank
+        #  out the second
+        lines = cls.file_text_good.split('\n')
+        lines[1] = '   '
+        lines[cls.num_atoms + 3] = ''
+        with open(cls.file_name + cls.names.blank_descs, 'w') as f:
+            f.write('\n'.join(lines))
+
+    @classmethod
+    def tearDownClass(cls):
+        import os
+        from opan.test.utils import tearDownTestDir
+
+        # Delete the xyz files
+        os.remove(cls.file_name)
+        os.remove(cls.file_name + cls.names.truncated)
+        os.remove(cls.file_name + cls.names.blank_descs)
+
+        # Remove the test directory
+        tearDownTestDir(cls.testdir)
+
+    def setUp(self):
+        # Load the object, with a chunk size not dividing the number
+        #  of geometries
+
+        # Imports
+        from opan.xyz import OpanXYZStream
+
+        # Create the object
+        self.xyz = OpanXYZStream(path=self.file_name, chunk=5)
+
+        # Long messages
+        self.longMessage = True
+
+    def test_XYZ_StreamFileDataNumAtoms(self):
+        self.assertEqual(self.xyz.num_atoms, self.num_atoms)
+
+    def test_XYZ_StreamFileDataNumGeoms(self):
+        self.assertEqual(self.xyz.num_geoms, self.num_geoms)
+
+    def test_XYZ_StreamFileDataAtomSyms(self):
+        self.assertEqual(self.xyz.atom_syms, self.atom_syms)
+
+    def test_XYZ_StreamFileDataChunks(self):
+        import numpy as np
+
+        chunks = list(self.xyz.iter_chunks())
+        self.assertEqual([c.shape[0] for c in chunks], [5, 5, 5, 1])
+        self.assertTrue(np.allclose(np.concatenate(chunks),
+                                    np.array(self.geoms), atol=1e-6))
+
+    def test_XYZ_StreamFileDataRandomAccess(self):
+        import numpy as np
+
+        for g in [9, -1, 3, 15, 0]:
+            self.assertTrue(np.allclose(self.xyz.geom_single(g),
+                                    self.geoms[g], atol=1e-6),
+                        msg="Geometry #" + str(g))
+
+    def test_XYZ_StreamFileDataDistances(self):
+        for t in zip(self.dist_Cu_O, self.xyz.dist_iter(None, 0, 1),
+                                        range(self.dist_Cu_O.shape[0])):
+            self.assertAlmostEqual(t[0], t[1], delta=1e-5,
+                        msg="Cu-O distance mismatch at geom #" + str(t[2]) +
+                        ": " + str(t[0:2]))
+
+    def test_XYZ_StreamFileDataDihedrals(self):
+        for t in zip(self.dihed_H2_O_Cu_H1,
+                                    self.xyz.dihed_iter(None, 3, 1, 0, 2),
+                                    range(self.dihed_H2_O_Cu_H1.shape[0])):
+            self.assertAlmostEqual(t[0], t[1], delta=1e-2,
+                        msg="H2-Cu-O-H1 dihedral mismatch at geom #" +
+                        str(t[2]) + ": " + str(t[0:2]))
+
+    def test_XYZ_StreamFileDataBadIndex(self):
+        with self.assertRaises(IndexError):
+            self.xyz.geom_single(self.num_geoms)
+
+    def test_XYZ_StreamFileDataTruncated(self):
+        from opan.error import XYZError
+        from opan.xyz import OpanXYZStream
+
+        self.assertErrorAndTypecode(XYZError, OpanXYZStream,
+                        XYZError.XYZFILE,
+                        path=(self.file_name + self.names.truncated))
+
+    def test_XYZ_StreamFileDataBlankDescs(self):
+        import numpy as np
+        from opan.xyz import OpanXYZStream
+
+        xyz = OpanXYZStream(path=(self.file_name + self.names.blank_descs),
+                            chunk=5)
+
+        self.assertEqual(xyz.num_geoms, self.num_geoms)
+        self.assertTrue(np.allclose(np.concatenate(list(xyz.iter_chunks())),
+                                    np.array(self.geoms), atol=1e-6))
+        for g in [0, 1, 2]:
+            self.assertTrue(np.allclose(xyz.geom_single(g),
+                                    self.geoms[g], atol=1e-6),
+                        msg="Geometry #" + str(g))
+
+## end class TestOpanXYZStreamFileData
+
+
 class TestOpanXYZAltFileData(SuperOpanXYZ):
     # Ensuring successful import of an XYZ file with valid data of alternative
     #  formatting to that contained in SuperOpanXYZ.file_text_good
@@ -456,6 +668,22 @@ class TestOpanXYZAltFileData(SuperOpanXYZ):
         self.assertEqual(xyz.atom_syms[0].upper(),
                                         self.good_direct_atoms[0])
 
+    def test_XYZ_AltFileDataBlankSeparated(self):
+
+        from opan.xyz import OpanXYZ
+        from opan.error import XYZError
+
+        try:
+            xyz = OpanXYZ(path=(self.file_name +
+                                            self.names.blank_separated))
+        except XYZError:  # pragma: no cover
+            self.fail("XYZ import failed when success was expected.")
+
+        self.assertEqual(xyz.num_geoms, self.num_geoms)
+        for g in range(self.num_geoms):
+            self.assertAlmostEqual(xyz.geoms[g][0], self.geoms[g][0],
+                        delta=1e-6, msg="Geometry #" + str(g))
+
 ## end class TestOpanXYZAltFileData
 
 
@@ -526,6 +754,22 @@ class TestOpanXYZGoodDirectData(SuperOpanXYZ):
                             " (" + self.xyz.atom_syms[tup[2]].capitalize() +
                             ")")
 
+    def test_XYZ_GoodDirectDataNeighborListCluster(self):
+        # Cell-list neighbors of a random cluster must match the pairs
+        #  found from the full distance matrix
+        import numpy as np
+        from opan.xyz import OpanXYZ
+
+        rng = np.random.RandomState(0)
+        x = OpanXYZ(atom_syms=['C'] * 300,
+                            coords=rng.uniform(-15.0, 15.0, (900,)))
+
+        pairs, dists = x.neighbor_list(0, 4.0)
+        dm = x.dist_matrix(0)[0]
+        i, j = np.nonzero(np.triu(dm <= 4.0, 1))
+        self.assertTrue(np.array_equal(pairs, np.column_stack((i, j))))
+        self.assertTrue(np.allclose(dists, dm[i, j], atol=1e-10))
+
 ## end class TestOpanXYZGoodDirectData
 
 
@@ -581,6 +825,16 @@ class TestOpanXYZBadFileData(SuperOpanXYZ):
                         XYZError.XYZFILE,
                         path=(self.file_name + self.names.atom_counts))
 
+    def test_XYZ_BadFileDataBadCoord(self):
+        # Non-numeric coordinate value should throw an XYZError
+
+        from opan.error import XYZError
+        from opan.xyz import OpanXYZ
+
+        self.assertErrorAndTypecode(XYZError, OpanXYZ,
+                        XYZError.XYZFILE,
+                        path=(self.file_name + self.names.bad_coord))
+
     def test_XYZ_BadFileDataConstNumats(self):
         # Multiple-geometry file should have identical num_ats specs at the
         #  head of each geometry block.
@@ -866,6 +1120,61 @@ class TestOpanXYZBadUsage(SuperOpanXYZ):
         self.assertErrorAndTypecode(XYZError, x.dihed_single,
                         XYZError.DIHED, 0, 6, 0, 3, 4)
 
+    def test_XYZ_BadUsageMultiInvalidIndices(self):
+        import numpy as np
+        from opan.xyz import OpanXYZ
+
+        # Load the test file
+        x = OpanXYZ(path=self.file_name)
+
+        # Invalid values are nan by default
+        dists = x.dist_multi([0, 1000000], [1, 1000000], 0)
+        self.assertFalse(np.isnan(dists[0, 0]))
+        self.assertTrue(np.isnan(dists[0, 1]))
+        self.assertTrue(np.all(np.isnan(dists[1, :])))
+        self.assertTrue(np.all(np.isnan(x.angle_multi(0, 0, [0, 1], 1)[0])))
+
+        # Errors are raised if indicated
+        self.assertRaises(IndexError, x.dist_multi, 0, 1000000, 0,
+                                                        invalid_error=True)
+        self.assertRaises(IndexError, x.dist_multi, 1000000, 0, 1,
+                                                        invalid_error=True)
+        self.assertRaises(ValueError, x.angle_multi, 0, 0, 0, 1,
+                                                        invalid_error=True)
+        self.assertRaises(ValueError, x.dihed_multi, 0, 0, 1, 2, 0,
+                                                        invalid_error=True)
+
+        # Mismatched index lengths are always an error
+        self.assertRaises(ValueError, x.dist_multi, 0, [0, 1], [0, 1, 2])
+
+    def test_XYZ_BadUsageNeighborListCutoff(self):
+        from opan.xyz import OpanXYZ
+
+        # Load the test file
+        x = OpanXYZ(path=self.file_name)
+
+        # Non-positive cutoff
+        self.assertRaises(ValueError, x.neighbor_list, 0, 0.0)
+        self.assertRaises(IndexError, x.dist_matrix, [0, 1000000])
+
+    def test_XYZ_BadUsageMultiLinearDihedAngle(self):
+        import os
+        import numpy as np
+        from opan.xyz import OpanXYZ
+        from opan.error import XYZError
+
+        # Construct path to benzene test file
+        bz_path = os.path.join(os.path.pardir, 'test', 'resource', 'inertia',
+                            'C6H6_Planar.xyz')
+
+        # Load benzene test file from inside inertia
+        x = OpanXYZ(path=bz_path)
+
+        # Linear trio gives nan, or raises if indicated
+        self.assertTrue(np.isnan(x.dihed_multi(0, 6, 0, 3, 4)[0, 0]))
+        self.assertErrorAndTypecode(XYZError, x.dihed_multi,
+                        XYZError.DIHED, 0, 6, 0, 3, 4, invalid_error=True)
+
     def test_XYZ_BadUsageBadNoneParamsWithIters(self):
 
         from opan.xyz import OpanXYZ
@@ -912,7 +1221,8 @@ def suite_FileData():
     tl = unittest.TestLoader()
     s.addTests([tl.loadTestsFromTestCase(TestOpanXYZAltFileData),
                 tl.loadTestsFromTestCase(TestOpanXYZBadFileData),
-                tl.loadTestsFromTestCase(TestOpanXYZGoodFileData)
+                tl.loadTestsFromTestCase(TestOpanXYZGoodFileData),
+                tl.loadTestsFromTestCase(TestOpanXYZStreamFileData)
                 ])
     return s
 
@@ -74,6 +74,7 @@ class SuperOrcaEngrad(SuperOrca):
         geom = 'geom'
         atomicnum = 'atomicnum'
         atomicsym = 'atomicsym'
+        trailing = 'trailing'
 
     bad_block_substs = {
             names.numats: ('umber of', 'asdlkjf'),
@@ -94,7 +95,8 @@ class SuperOrcaEngrad(SuperOrca):
                         }
 
     alt_data_substs = {
-            names.atomicsym: ('29    -1.5545432', 'Cu    -1.5545432')
+            names.atomicsym: ('29    -1.5545432', 'Cu    -1.5545432'),
+            names.trailing: ('1.9892043\n', '1.9892043   ! trailing\n')
                         }
 
     atoms = ['CU', 'O', 'H', 'H']
@@ -179,6 +181,27 @@ class TestOrcaEngradKnownGood(SuperOrcaEngrad):
     def test_ENGRAD_KnownGoodCheckGeomMatches(self):
         self.assertTrue(self.oe.check_geom(self.oe.geom, self.oe.atom_syms))
 
+    def test_ENGRAD_KnownGoodInStrDiscarded(self):
+        from opan.grad import OrcaEngrad
+        oe = OrcaEngrad(path=self.file_name, keep_str=False)
+        self.assertIsNone(oe.in_str)
+
+    def test_ENGRAD_KnownGoodInStrKept(self):
+        self.assertEqual(self.oe.in_str, self.file_text_good)
+
+    def test_ENGRAD_KnownGoodBulkMatchesRegex(self):
+        # Known-good file must be accepted by the bulk parse, and the
+        #  reference regex parse must reproduce its data exactly
+        import numpy as np
+        from opan.grad import OrcaEngrad
+        oe = OrcaEngrad(path=self.file_name, keep_str=True)
+        self.assertTrue(oe._parse_bulk())
+        grad, geom, syms = oe.gradient, oe.geom, oe.atom_syms
+        oe._parse_regex("")
+        self.assertTrue(np.array_equal(grad, oe.gradient))
+        self.assertTrue(np.array_equal(geom, oe.geom))
+        self.assertEqual(syms, oe.atom_syms)
+
 ## end class TestOrcaEngradKnownGood
 
 
@@ -224,6 +247,17 @@ class TestOrcaEngradAltGoodData(SuperOrcaEngrad):
         except Exception:
             self.fail("Failed to load .engrad file with atomic symbol")
 
+    def test_ENGRAD_AltDataTrailingTextRegexParse(self):
+        # Trailing text after the final coordinates is not accepted by the
+        #  bulk parse, but is tolerated by the full regex parse
+        import numpy as np
+        from opan.grad import OrcaEngrad
+
+        oe = OrcaEngrad(path=(self.file_name + self.names.trailing))
+        self.assertEqual(oe.atom_syms, self.atoms)
+        self.assertTrue(np.allclose(oe.gradient, self.gradient, atol=1e-10))
+        self.assertTrue(np.allclose(oe.geom, self.geom, atol=1e-7))
+
 
 ## end class TestOrcaEngradAltGoodData
 
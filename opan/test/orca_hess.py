@@ -936,6 +936,15 @@ class TestOrcaHessKnownGood(SuperOrcaHess):
                     self.mwh_eigvals[i],
                     delta=1e-8, msg="MWH eigenvector (" + str(i) + ')')
 
+    def test_HESS_KnownGoodInStrDiscarded(self):
+        from opan.hess import OrcaHess
+        self.assertIsNone(OrcaHess(path=self.file_name,
+                                        keep_str=False).in_str)
+
+    def test_HESS_KnownGoodInStrKept(self):
+        with open(self.file_name) as f:
+            self.assertEqual(self.oh.in_str, f.read())
+
     def test_HESS_KnownGoodMWHEigvecs(self):
         self.assertEqual(self.oh.mwh_eigvecs.shape, self.mwh_eigvecs.shape)
         for i in range(self.oh.mwh_eigvecs.shape[0]):
@@ -945,6 +954,23 @@ class TestOrcaHessKnownGood(SuperOrcaHess):
                         delta=1e-8, msg="MWH eigenvectors element (" +
                                                 str(i) + ',' + str(j) + ')')
 
+    def test_HESS_KnownGoodPatterns(self):
+        # The public block patterns still match the file
+        from opan.hess import OrcaHess
+
+        with open(self.file_name) as f:
+            text = f.read()
+        ## end with
+        m = OrcaHess.Pat.hess_block.search(text)
+        self.assertEqual(int(m.group('dim')), self.hess.shape[0])
+        m = OrcaHess.Pat.at_block.search(text)
+        self.assertEqual(int(m.group('num')), len(self.atoms))
+        self.assertAlmostEqual(float(OrcaHess.Pat.energy.search(text)
+                                        .group('en')), self.energy)
+        self.assertEqual(len(OrcaHess.Pat.freq_line.findall(
+                OrcaHess.Pat.freq_block.search(text).group('block'))),
+                                                        len(self.freqs))
+
 
 ## end class TestOrcaEngradKnownGood
 
@@ -1494,6 +1520,84 @@ class TestOrcaHessAltData(SuperOrcaHess):
 ## end class TestOrcaHessAltData
 
 
+class TestOrcaHessLazy(SuperOrcaHess):
+    # Deferred parsing of blocks other than the geometry and Hessian
+
+    @classmethod
+    def setUpClass(cls):
+        from opan.test.utils import setUpTestDir
+
+        setUpTestDir(cls.testdir)
+
+        # Write the good file and a file with a truncated optional block
+        with open(cls.file_name, 'w') as f:
+            f.write(cls.file_text_good)
+        with open(cls.file_name + cls.names.dipders, 'w') as f:
+            f.write(cls.file_text_good
+                            .replace(*cls.trunc_block_substs[cls.names.dipders]))
+
+    @classmethod
+    def tearDownClass(cls):
+        import os
+        from opan.test.utils import tearDownTestDir
+
+        os.remove(cls.file_name)
+        os.remove(cls.file_name + cls.names.dipders)
+
+        tearDownTestDir(cls.testdir)
+
+    def setUp(self):
+        self.longMessage = True
+
+    def test_HESS_LazyDeferred(self):
+        from opan.hess import OrcaHess
+
+        oh = OrcaHess(path=self.file_name, lazy=True, keep_str=True)
+
+        # Geometry and Hessian are loaded immediately
+        self.assertTrue(self.np.allclose(oh.hess, self.hess, atol=1e-6))
+        self.assertTrue(self.np.allclose(oh.geom, self.geom, atol=1e-6))
+
+        # Everything else is not yet parsed
+        for attr in ['freqs', 'modes', 'dipders', 'ir_comps', 'polders',
+                     'raman_acts', 'joblist', 'mwh_eigvals', 'mwh_eigvecs',
+                     'energy', 'temp', 'in_str']:
+            self.assertNotIn(attr, oh.__dict__, msg=attr)
+
+    def test_HESS_LazyMatchesEager(self):
+        from opan.hess import OrcaHess
+
+        oh_lazy = OrcaHess(path=self.file_name, lazy=True, keep_str=True)
+        oh = OrcaHess(path=self.file_name, keep_str=True)
+
+        for attr in ['freqs', 'modes', 'dipders', 'ir_comps', 'ir_mags',
+                     'polders', 'raman_acts', 'raman_depols', 'joblist',
+                     'mwh_eigvals', 'mwh_eigvecs', 'energy', 'temp']:
+            self.assertTrue(self.np.array_equal(getattr(oh_lazy, attr),
+                                                getattr(oh, attr)), msg=attr)
+
+            # Parsed values are retained
+            self.assertIn(attr, oh_lazy.__dict__, msg=attr)
+
+        self.assertEqual(oh_lazy.in_str, oh.in_str)
+
+    def test_HESS_LazyErrorOnAccess(self):
+        from opan.error import HessError
+        from opan.hess import OrcaHess
+
+        oh = OrcaHess(path=(self.file_name + self.names.dipders), lazy=True)
+        self.assertErrorAndTypecode(HessError, getattr,
+                    HessError.DIPDER_BLOCK, oh, 'dipders')
+
+    def test_HESS_LazyMissingAttr(self):
+        from opan.hess import OrcaHess
+
+        oh = OrcaHess(path=self.file_name, lazy=True)
+        self.assertRaises(AttributeError, getattr, oh, 'not_an_attribute')
+
+## end class TestOrcaHessLazy
+
+
 class TestOrcaHessLiveData(SuperOrcaHess):
 
     def setUp(self):
@@ -1525,6 +1629,7 @@ def suite():
                 tl.loadTestsFromTestCase(TestOrcaHessBadData),
                 tl.loadTestsFromTestCase(TestOrcaHessBadUsage),
                 tl.loadTestsFromTestCase(TestOrcaHessKnownGood),
+                tl.loadTestsFromTestCase(TestOrcaHessLazy),
                 tl.loadTestsFromTestCase(TestOrcaHessLiveData),
                 tl.loadTestsFromTestCase(TestOrcaHessMissingBlocks),
                 tl.loadTestsFromTestCase(TestOrcaHessTruncatedBlocks)
@@ -0,0 +1,573 @@
+#-------------------------------------------------------------------------------
+# Name:        orca_output
+# Purpose:     Tests for opan.output.OrcaOutput
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+import unittest
+from opan.test.opan_supers import SuperOrca
+
+
+# ============================  OrcaOutput ================================= #
+
+class SuperOrcaOutput(SuperOrca):
+    # Superclass for all ORCA output test cases
+
+    # Imports
+    from textwrap import dedent
+    from opan.test.utils import assertErrorAndTypecode
+
+    # Superclass constants
+    file_name = 'test.out'
+    scf_cycle = dedent("""\
+
+        --------------
+        SCF ITERATIONS
+        --------------
+        ITER       Energy         Delta-E        Max-DP      RMS-DP
+          0  -1715.7590911512  0.000000000  0.00123456  0.00012345
+          1  -1715.759{0}  -0.000600000  0.00012345  0.00001234
+
+                       *****************************************
+                       *                SUCCESS                *
+                       *    SCF CONVERGED AFTER   2 CYCLES     *
+                       *****************************************
+
+        Total Energy after outlying charge correction =  -1715.75{1} Eh
+
+        ----------------------
+        UHF SPIN CONTAMINATION
+        ----------------------
+
+        Expectation value of <S**2>     :     0.75{2}
+        Ideal value S*(S+1) for S=0.5   :     0.750000
+        Deviation                       :     0.00{2}
+
+        -------------------------   ----------------
+        Dispersion correction           -0.00{3}
+        -------------------------   ----------------
+
+        -------------------------   ----------------
+        gCP correction                   0.01{4}
+        -------------------------   ----------------
+
+        -------------------------   --------------------
+        FINAL SINGLE POINT ENERGY     -1715.759{0}
+        -------------------------   --------------------
+
+        -------------
+        DIPOLE MOMENT
+        -------------
+                                        X             Y             Z
+        Total Dipole Moment    :      0.02345      -0.03456       0.00000
+                                -----------------------------------------
+        Magnitude (a.u.)       :      0.04177
+        Magnitude (Debye)      :      {5}
+        """)
+    scf_values = [('691151236', '9600000', '3612', '8341299', '0281522',
+                                                            '0.10617'),
+                  ('701234567', '9700000', '2500', '8342000', '0282000',
+                                                            '0.20617')]
+    thermo_text = dedent("""\
+
+                            ***        THE OPTIMIZATION HAS CONVERGED     ***
+
+        --------------------------
+        THERMOCHEMISTRY AT 298.15K
+        --------------------------
+
+        Temperature         ... 298.15 K
+        Pressure            ... 1.00 atm
+
+        Electronic energy                ...  -1715.75970123 Eh
+        Zero point energy                ...      0.02123456 Eh
+        Thermal vibrational correction   ...      0.00012345 Eh
+        Thermal rotational correction    ...      0.00141628 Eh
+        Thermal translational correction ...      0.00141629 Eh
+        Thermal Enthalpy correction       ...      0.00094421 Eh
+        Electronic entropy               ...      0.00000000 Eh
+        Vibrational entropy              ...      0.00003456 Eh
+        Translational entropy            ...      0.01634532 Eh
+
+         qrot = 43.10
+
+        Timings for individual modules:
+
+        Sum of individual times         ...      123.456 sec
+
+                             ****ORCA TERMINATED NORMALLY****
+        """)
+    file_text_good = scf_cycle.format(*scf_values[0]) + \
+                        scf_cycle.format(*scf_values[1]) + thermo_text
+
+    en_scffinal = [-1715.759691151236, -1715.759701234567]
+    en_scfocc = [-1715.759600000, -1715.759700000]
+    en_d3 = [-0.008341299, -0.008342000]
+    en_gcp = [0.010281522, 0.010282000]
+    spin_actual = [0.753612, 0.752500]
+    spin_dev = [0.003612, 0.002500]
+    dipmoms = [0.10617, 0.20617]
+    thermo = {'TEMP': 298.15, 'PRESS': 1.00, 'E_EL': -1715.75970123,
+              'E_ZPE': 0.02123456, 'E_VIB': 0.00012345,
+              'E_ROT': 0.00141628, 'E_TRANS': 0.00141629,
+              'H_IG': 0.00094421, 'TS_EL': 0.0, 'TS_VIB': 0.00003456,
+              'TS_TRANS': 0.01634532, 'QROT': 43.10}
+
+    def write_file(self, text):
+        with open(self.file_name, 'w') as f:
+            f.write(text)
+
+    def assertMatchesPatterns(self, oo, text):
+        # Compare the single-pass results to separate passes of each
+        #  of the class patterns over the whole text
+        import numpy as np
+        from opan.output import OrcaOutput as OO
+
+        def vals(p):
+            return [np.float_(m.group(OO.P_GROUP)) for m in p.finditer(text)]
+
+        for k in OO.p_en:
+            self.assertEqual(oo.en[k], vals(OO.p_en[k]), msg=k)
+        for k in OO.p_spincont:
+            self.assertEqual(oo.spincont[k], vals(OO.p_spincont[k]), msg=k)
+        self.assertEqual(oo.dipmoms, vals(OO.p_dipmom))
+
+        m = OO.p_thermo[OO.THERMO.BLOCK].search(text)
+        self.assertEqual(oo.thermo_block, m.group() if m else None)
+        if m:
+            for k in OO.p_thermo:
+                if k != OO.THERMO.BLOCK:
+                    m = OO.p_thermo[k].search(text)
+                    self.assertEqual(oo.thermo[k], np.float_(m.group(
+                                    OO.P_GROUP)) if m else None, msg=k)
+        else:
+            self.assertFalse(hasattr(oo, 'thermo'))
+
+        self.assertEqual(oo.completed, "ORCA TERMINATED NORMALLY" in text)
+        self.assertEqual(oo.converged, "SCF CONVERGED AFTER" in text)
+        self.assertEqual(oo.optimized, "OPTIMIZATION HAS CONVERGED" in text)
+
+## end class SuperOrcaOutput
+
+
+class TestOrcaOutputKnownGood(SuperOrcaOutput):
+    # Testing values parsed from a known-good output file
+
+    @classmethod
+    def setUpClass(cls):
+        from opan.test.utils import setUpTestDir
+
+        # Set up the directory
+        setUpTestDir(cls.testdir)
+
+        # Write the file
+        with open(cls.file_name, 'w') as f:
+            f.write(cls.file_text_good)
+
+    @classmethod
+    def tearDownClass(cls):
+        import os
+        from opan.test.utils import tearDownTestDir
+
+        # Delete the output file
+        os.remove(cls.file_name)
+
+        # Remove the working directory
+        tearDownTestDir(cls.testdir)
+
+    def setUp(self):
+        from opan.output import OrcaOutput
+        self.oo = OrcaOutput(self.file_name)
+        self.longMessage = True
+
+    def test_OUTPUT_KnownGoodFlags(self):
+        self.assertTrue(self.oo.completed)
+        self.assertTrue(self.oo.converged)
+        self.assertTrue(self.oo.optimized)
+
+    def test_OUTPUT_KnownGoodEnergies(self):
+        from opan.output import OrcaOutput as OO
+        for k, ref in [(OO.EN.SCFFINAL, self.en_scffinal),
+                       (OO.EN.SCFOCC, self.en_scfocc),
+                       (OO.EN.D3, self.en_d3), (OO.EN.GCP, self.en_gcp)]:
+            self.assertEqual(len(self.oo.en[k]), len(ref), msg=k)
+            for i in range(len(ref)):
+                self.assertAlmostEqual(self.oo.en[k][i], ref[i],
+                                delta=1e-12, msg=k + " index " + str(i))
+
+    def test_OUTPUT_KnownGoodOCC(self):
+        from opan.output import OrcaOutput as OO
+        for i in range(len(self.en_scffinal)):
+            occ = self.en_scfocc[i] - (self.en_scffinal[i] -
+                                        self.en_d3[i] - self.en_gcp[i])
+            self.assertAlmostEqual(self.oo.en[OO.EN.OCC][i], occ,
+                                                        delta=1e-10)
+            self.assertAlmostEqual(self.oo.en[OO.EN.SCFFINALOCC][i],
+                                        self.en_scffinal[i] + occ,
+                                        delta=1e-10)
+
+    def test_OUTPUT_KnownGoodEnLast(self):
+        from opan.output import OrcaOutput as OO
+        self.assertAlmostEqual(self.oo.en_last()[OO.EN.SCFFINAL],
+                                    self.en_scffinal[-1], delta=1e-12)
+
+    def test_OUTPUT_KnownGoodSpinCont(self):
+        from opan.output import OrcaOutput as OO
+        for k, ref in [(OO.SPINCONT.ACTUAL, self.spin_actual),
+                       (OO.SPINCONT.IDEAL, [0.75, 0.75]),
+                       (OO.SPINCONT.DEV, self.spin_dev)]:
+            self.assertEqual(self.oo.spincont[k], ref, msg=k)
+
+    def test_OUTPUT_KnownGoodDipoles(self):
+        self.assertEqual(self.oo.dipmoms, self.dipmoms)
+
+    def test_OUTPUT_KnownGoodThermo(self):
+        for k, v in self.thermo.items():
+            self.assertAlmostEqual(self.oo.thermo[k], v, delta=1e-10,
+                                                                msg=k)
+
+    def test_OUTPUT_KnownGoodThermoBlock(self):
+        self.assertTrue(self.oo.thermo_block.startswith('-' * 26 +
+                                            '\nTHERMOCHEMISTRY AT 298.15K'))
+        self.assertTrue(self.oo.thermo_block.endswith(
+                                            'Timings for individual modules'))
+
+    def test_OUTPUT_KnownGoodMatchesPatterns(self):
+        self.assertMatchesPatterns(self.oo, self.file_text_good)
+
+## end class TestOrcaOutputKnownGood
+
+
+class TestOrcaOutputAltData(SuperOrcaOutput):
+    # Ensuring variant outputs give the same results as separate
+    #  searches with each of the patterns
+
+    @classmethod
+    def setUpClass(cls):
+        from opan.test.utils import setUpTestDir
+        setUpTestDir(cls.testdir)
+
+    @classmethod
+    def tearDownClass(cls):
+        import os
+        from opan.test.utils import tearDownTestDir
+        if os.path.isfile(cls.file_name):
+            os.remove(cls.file_name)
+        tearDownTestDir(cls.testdir)
+
+    def check_text(self, text):
+        from opan.output import OrcaOutput
+        self.write_file(text)
+        self.assertMatchesPatterns(OrcaOutput(self.file_name), text)
+
+    def test_OUTPUT_AltDataNoThermo(self):
+        from opan.output import OrcaOutput
+        text = self.scf_cycle.format(*self.scf_values[0])
+        self.write_file(text)
+        oo = OrcaOutput(self.file_name)
+        self.assertIsNone(oo.thermo_block)
+        self.assertFalse(oo.completed)
+        self.assertMatchesPatterns(oo, text)
+
+    def test_OUTPUT_AltDataNoClosingBlip(self):
+        self.check_text(self.file_text_good.replace('Timings', 'Timing'))
+
+    def test_OUTPUT_AltDataThermoHeadersRepeated(self):
+        self.check_text(self.file_text_good + self.thermo_text.replace(
+                                            '298.15K', 'bad K') +
+                                            self.thermo_text)
+
+    def test_OUTPUT_AltDataCaseVariants(self):
+        self.check_text(self.file_text_good.lower())
+        self.check_text(self.file_text_good.upper())
+
+    def test_OUTPUT_AltDataOverlappingKeys(self):
+        # Key text of one pattern running directly into that of another
+        self.check_text(self.file_text_good.replace('Temperature  ',
+                                'temperaturelectronic energy ... 1.5 Eh'))
+
+    def test_OUTPUT_AltDataDipoleUnterminated(self):
+        # Block without a magnitude line, absorbed into the following one
+        self.check_text(self.file_text_good.replace(
+                                'Magnitude (Debye)      :      0.10617', ''))
+
+    def test_OUTPUT_AltDataStartOfFile(self):
+        # Key text and lead-in lines right at the start of the file
+        self.check_text("-\nDIPOLE MOMENT\n-\n\nMagnitude (Debye)  :  1.5\n" +
+                                                        self.file_text_good)
+        self.check_text("\nFINAL SINGLE POINT ENERGY   -1.5\n-\n" +
+                                                        self.file_text_good)
+
+## end class TestOrcaOutputAltData
+
+
+class TestOrcaOutputIncremental(SuperOrcaOutput):
+    # Ensuring incremental parsing of a growing output file tracks a
+    #  full parse of the text written so far
+
+    @classmethod
+    def setUpClass(cls):
+        from opan.test.utils import setUpTestDir
+        setUpTestDir(cls.testdir)
+
+    @classmethod
+    def tearDownClass(cls):
+        import os
+        from opan.test.utils import tearDownTestDir
+        if os.path.isfile(cls.file_name):
+            os.remove(cls.file_name)
+        tearDownTestDir(cls.testdir)
+
+    def setUp(self):
+        from opan.output import OrcaOutput
+        self.write_file('')
+        self.oo = OrcaOutput(self.file_name, incremental=True)
+        self.longMessage = True
+
+    def append(self, text):
+        with open(self.file_name, 'a') as f:
+            f.write(text)
+
+    def assertMatchesFull(self, text):
+        # The incremental results must be those of the complete lines of
+        #  the text written so far
+        self.assertMatchesPatterns(self.oo, text[:text.rfind('\n') + 1])
+
+    def test_OUTPUT_IncrementalEmptyFile(self):
+        self.assertFalse(self.oo.refresh())
+        self.assertMatchesFull('')
+
+    def test_OUTPUT_IncrementalLineByLine(self):
+        text = self.file_text_good
+        written = ''
+        for line in text.splitlines(True):
+            self.append(line)
+            written += line
+            self.assertTrue(self.oo.refresh())
+            self.assertMatchesFull(written)
+        ## next line
+        self.assertFalse(self.oo.refresh())
+
+    def test_OUTPUT_IncrementalRandomChunks(self):
+        import random
+        rng = random.Random(0)
+        text = self.file_text_good
+        pos = 0
+        while pos < len(text):
+            step = rng.randint(1, 200)
+            self.append(text[pos:pos + step])
+            pos += step
+            self.oo.refresh()
+            self.assertMatchesFull(text[:pos])
+        ## loop
+        self.assertEqual(self.oo.en[self.oo.EN.SCFFINAL], self.en_scffinal)
+        self.assertEqual(len(self.oo.en[self.oo.EN.OCC]), 2)
+
+    def test_OUTPUT_IncrementalPartialLineHeld(self):
+        self.append('Deviation                       :     0.00')
+        self.assertFalse(self.oo.refresh())
+        self.append('3612\n')
+        self.assertTrue(self.oo.refresh())
+        self.assertEqual(self.oo.spincont[self.oo.SPINCONT.DEV], [0.003612])
+
+    def test_OUTPUT_IncrementalHeldMatches(self):
+        # Energy awaiting its trailing hyphen line, and dipole block
+        #  awaiting its magnitude
+        self.append('-----\nFINAL SINGLE POINT ENERGY     -1.5\n')
+        self.oo.refresh()
+        self.assertEqual(self.oo.en[self.oo.EN.SCFFINAL], [])
+        self.append('-----\n-----\nDIPOLE MOMENT\n-----\n\n')
+        self.oo.refresh()
+        self.assertEqual(self.oo.en[self.oo.EN.SCFFINAL], [-1.5])
+        self.assertEqual(self.oo.dipmoms, [])
+        self.append('Magnitude (Debye)      :      0.5\n')
+        self.oo.refresh()
+        self.assertEqual(self.oo.dipmoms, [0.5])
+
+    def test_OUTPUT_IncrementalFlagsUpdate(self):
+        self.append(self.scf_cycle.format(*self.scf_values[0]))
+        self.oo.refresh()
+        self.assertTrue(self.oo.converged)
+        self.assertFalse(self.oo.completed)
+        self.assertIsNone(self.oo.thermo_block)
+        self.append(self.thermo_text)
+        self.oo.refresh()
+        self.assertTrue(self.oo.completed)
+        self.assertTrue(self.oo.optimized)
+        self.assertIsNotNone(self.oo.thermo_block)
+
+    def test_OUTPUT_IncrementalReplacedFile(self):
+        self.append(self.file_text_good)
+        self.oo.refresh()
+        text = self.scf_cycle.format(*self.scf_values[1])
+        self.write_file(text)
+        self.assertTrue(self.oo.refresh())
+        self.assertMatchesFull(text)
+
+    def test_OUTPUT_IncrementalNotIncremental(self):
+        from opan.error import OutputError
+        from opan.output import OrcaOutput
+        self.assertErrorAndTypecode(OutputError,
+                    OrcaOutput(self.file_name).refresh,
+                    OutputError.NOT_INCREMENTAL)
+
+## end class TestOrcaOutputIncremental
+
+
+class TestOrcaOutputSelective(SuperOrcaOutput):
+    # Ensuring parsing of selected quantities only gives the same values
+    #  as a full parse, and skips everything else
+
+    @classmethod
+    def setUpClass(cls):
+        from opan.test.utils import setUpTestDir
+        from opan.output import OrcaOutput
+        setUpTestDir(cls.testdir)
+        with open(cls.file_name, 'w') as f:
+            f.write(cls.file_text_good)
+        cls.full = OrcaOutput(cls.file_name)
+
+    @classmethod
+    def tearDownClass(cls):
+        import os
+        from opan.test.utils import tearDownTestDir
+        os.remove(cls.file_name)
+        tearDownTestDir(cls.testdir)
+
+    def setUp(self):
+        self.longMessage = True
+
+    def assertSameFlags(self, oo):
+        self.assertEqual(oo.completed, self.full.completed)
+        self.assertEqual(oo.converged, self.full.converged)
+        self.assertEqual(oo.optimized, self.full.optimized)
+
+    def test_OUTPUT_SelectiveAllFamilies(self):
+        from opan.output import OrcaOutput as OO
+        oo = OO(self.file_name, quantities=[OO.QTY.EN, OO.QTY.THERMO,
+                                        OO.QTY.SPINCONT, OO.QTY.DIPMOM])
+        self.assertMatchesPatterns(oo, self.file_text_good)
+        self.assertEqual(oo.en, self.full.en)
+
+    def test_OUTPUT_SelectiveEnergies(self):
+        from opan.output import OrcaOutput as OO
+        oo = OO(self.file_name, quantities=[OO.QTY.EN])
+        self.assertSameFlags(oo)
+        self.assertEqual(oo.en, self.full.en)
+        self.assertIsNone(oo.spincont)
+        self.assertIsNone(oo.dipmoms)
+        self.assertIsNone(oo.thermo_block)
+        self.assertFalse(hasattr(oo, 'thermo'))
+
+    def test_OUTPUT_SelectiveSingleEnergy(self):
+        from opan.output import OrcaOutput as OO
+        oo = OO(self.file_name, quantities=[OO.EN.SCFFINAL])
+        self.assertEqual(list(oo.en), [OO.EN.SCFFINAL])
+        self.assertEqual(oo.en[OO.EN.SCFFINAL], self.en_scffinal)
+        self.assertEqual(oo.en_last(), {OO.EN.SCFFINAL:
+                                                    self.en_scffinal[-1]})
+
+    def test_OUTPUT_SelectiveOCC(self):
+        from opan.output import OrcaOutput as OO
+        oo = OO(self.file_name, quantities=[OO.EN.OCC])
+        self.assertEqual(oo.en, self.full.en)
+
+    def test_OUTPUT_SelectiveFamilies(self):
+        from opan.output import OrcaOutput as OO
+        oo = OO(self.file_name, quantities=[OO.QTY.THERMO])
+        self.assertSameFlags(oo)
+        self.assertEqual(oo.en, {})
+        self.assertEqual(oo.thermo_block, self.full.thermo_block)
+        self.assertEqual(oo.thermo, self.full.thermo)
+        oo = OO(self.file_name, quantities=[OO.QTY.SPINCONT, OO.QTY.DIPMOM])
+        self.assertEqual(oo.spincont, self.full.spincont)
+        self.assertEqual(oo.dipmoms, self.full.dipmoms)
+        self.assertIsNone(oo.thermo_block)
+
+    def test_OUTPUT_SelectiveEnLast(self):
+        from opan.output import OrcaOutput as OO
+        oo = OO(self.file_name, quantities=[OO.QTY.EN_LAST])
+        self.assertSameFlags(oo)
+        self.assertEqual(oo.en_last(), self.full.en_last())
+        self.assertTrue(all(len(v) == 1 for v in oo.en.values()))
+
+    def test_OUTPUT_SelectiveEnLastKey(self):
+        from opan.output import OrcaOutput as OO
+        oo = OO(self.file_name, quantities=[OO.QTY.EN_LAST, OO.EN.D3])
+        self.assertEqual(oo.en, {OO.EN.D3: [self.en_d3[-1]]})
+
+    def test_OUTPUT_SelectiveEnLastLongFile(self):
+        # Last two energies not within the first block read
+        from opan.output import OrcaOutput as OO
+        fill = 'Filler line of no interest at all\n' * 4000
+        text = (self.scf_cycle.format(*self.scf_values[0]) + fill +
+                self.scf_cycle.format(*self.scf_values[1]) + fill +
+                self.thermo_text)
+        fname = self.file_name + '.long'
+        with open(fname, 'w') as f:
+            f.write(text)
+        try:
+            oo = OO(fname, quantities=[OO.QTY.EN_LAST])
+            self.assertEqual(oo.en_last(), OO(fname).en_last())
+        finally:
+            import os
+            os.remove(fname)
+
+    def test_OUTPUT_SelectiveEnLastSingleCycle(self):
+        from opan.output import OrcaOutput as OO
+        fname = self.file_name + '.one'
+        with open(fname, 'w') as f:
+            f.write(self.scf_cycle.format(*self.scf_values[0]))
+        try:
+            oo = OO(fname, quantities=[OO.QTY.EN_LAST])
+            self.assertEqual(oo.en_last(), OO(fname).en_last())
+        finally:
+            import os
+            os.remove(fname)
+
+    def test_OUTPUT_SelectiveIncremental(self):
+        from opan.output import OrcaOutput as OO
+        oo = OO(self.file_name, incremental=True,
+                                    quantities=[OO.QTY.DIPMOM])
+        self.assertFalse(oo.refresh())
+        self.assertEqual(oo.dipmoms, self.full.dipmoms)
+
+    def test_OUTPUT_SelectiveBadQuantities(self):
+        from opan.output import OrcaOutput as OO
+        self.assertRaises(ValueError, OO, self.file_name,
+                                                quantities=['FOO'])
+        self.assertRaises(ValueError, OO, self.file_name,
+                        quantities=[OO.QTY.EN_LAST, OO.QTY.THERMO])
+        self.assertRaises(ValueError, OO, self.file_name,
+                        incremental=True, quantities=[OO.QTY.EN_LAST])
+
+## end class TestOrcaOutputSelective
+
+
+def suite():
+    s = unittest.TestSuite()
+    tl = unittest.TestLoader()
+    s.addTests([tl.loadTestsFromTestCase(TestOrcaOutputAltData),
+                tl.loadTestsFromTestCase(TestOrcaOutputIncremental),
+                tl.loadTestsFromTestCase(TestOrcaOutputKnownGood),
+                tl.loadTestsFromTestCase(TestOrcaOutputSelective)
+                ])
+    return s
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print("Module not executable.")
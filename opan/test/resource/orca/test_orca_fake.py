@@ -0,0 +1,113 @@
+#-------------------------------------------------------------------------------
+# Name:        test_orca_fake
+# Purpose:     Stand-in for an ORCA wrapper script, for testing of the
+#                execution automation of Open Anharmonic
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+""" Fake ORCA run: ``python test_orca_fake.py <input> <output>``.
+
+Behavior is directed by lines of the input of the form
+``# FAKE <directive> [args]``:
+
+``sleep <s>``
+    Sleep `s` seconds before writing the output
+
+``energy <E>``
+    Report `E` as the final single point energy (default -1.0)
+
+``copy <src> <dest>``
+    Copy file `src` to `dest` (e.g., a resource .engrad or .hess)
+
+``fail``
+    Write the output without the normal termination report, and exit
+    with status 1
+
+``fail_times <n>``
+    As ``fail``, for the first `n` runs of the input; the runs are
+    counted in the file :file:`<input>.fails`
+
+``stamp <path>``
+    On exit, append the absolute path of the input and the start and
+    end times of the run to the file `path`
+
+The input text is echoed at the top of the output, as ORCA does, and
+relative paths are taken from the working directory.
+
+"""
+
+import os
+import shutil
+import sys
+import time
+
+
+def main():
+    start = time.time()
+    inp_path, out_path = sys.argv[1:3]
+    with open(inp_path) as f:
+        inp = f.read()
+
+    energy = '-1.0'
+    fail = False
+    stamp = None
+    for line in inp.splitlines():
+        words = line.split()
+        if words[:2] != ['#', 'FAKE']:
+            continue
+        if words[2] == 'sleep':
+            time.sleep(float(words[3]))
+        elif words[2] == 'energy':
+            energy = words[3]
+        elif words[2] == 'copy':
+            shutil.copy(words[3], words[4])
+        elif words[2] == 'fail':
+            fail = True
+        elif words[2] == 'fail_times':
+            count_path = inp_path + '.fails'
+            count = 0
+            if os.path.isfile(count_path):
+                with open(count_path) as f:
+                    count = int(f.read())
+            with open(count_path, 'w') as f:
+                f.write(str(count + 1))
+            fail = fail or count < int(words[3])
+        elif words[2] == 'stamp':
+            stamp = words[3]
+
+    with open(out_path, 'w') as f:
+        f.write("INPUT FILE\n" + inp + "\n")
+        f.write("-------------------------   --------------------\n"
+                "FINAL SINGLE POINT ENERGY     {0}\n"
+                "-------------------------   --------------------\n"
+                .format(energy))
+        if not fail:
+            f.write("\n                             "
+                    "****ORCA TERMINATED NORMALLY****\n")
+
+    if stamp:
+        with open(stamp, 'a') as f:
+            f.write("{0} {1!r} {2!r}\n".format(os.path.abspath(inp_path),
+                                                start, time.time()))
+
+    return 1 if fail else 0
+
+## end def main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
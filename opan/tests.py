@@ -68,17 +68,25 @@ if __name__ == '__main__':
     SUPERS = 'supers'
     UTILS = 'utils'
     UTILS_BASE = 'utils_base'
+    UTILS_BATCH = 'utils_batch'
+    UTILS_CACHE = 'utils_cache'
     UTILS_DECORATE = 'utils_decorate'
+    UTILS_EXECUTE = 'utils_execute'
     UTILS_INERTIA = 'utils_inertia'
+    UTILS_SCHEDULE = 'utils_schedule'
+    UTILS_SYMM = 'utils_symm'
     UTILS_VECTOR = 'utils_vector'
     XYZ = 'xyz'
     XYZ_FILEDATA = 'xyz_filedata'
     XYZ_DIRECTDATA = 'xyz_directdata'
     XYZ_USAGE = 'xyz_usage'
+    VPT2 = 'vpt2'
+    VPT2_REPO = 'vpt2_repo'
 
     ORCA = 'orca'
     ORCA_ENGRAD = 'orca_engrad'
     ORCA_HESS = 'orca_hess'
+    ORCA_OUTPUT = 'orca_output'
 
     # Prefix string for long arguments
     PFX = "--{0}"
@@ -92,6 +100,7 @@ if __name__ == '__main__':
     gp_error = prs.add_argument_group(title="opan.error Tests")
     gp_utils = prs.add_argument_group(title="opan.utils Tests")
     gp_xyz = prs.add_argument_group(title="opan.xyz Tests")
+    gp_vpt2 = prs.add_argument_group(title="opan.vpt2 Tests")
 
     gp_orca = prs.add_argument_group(title="ORCA Object Tests")
 
@@ -125,10 +134,20 @@ if __name__ == '__main__':
             action='store_true', help="Run all opan.utils tests")
     gp_utils.add_argument(PFX.format(UTILS_BASE),
             action='store_true', help="Run opan.utils.base tests")
+    gp_utils.add_argument(PFX.format(UTILS_BATCH),
+            action='store_true', help="Run opan.utils.batch tests")
+    gp_utils.add_argument(PFX.format(UTILS_CACHE),
+            action='store_true', help="Run opan.utils.cache tests")
+    gp_utils.add_argument(PFX.format(UTILS_EXECUTE),
+            action='store_true', help="Run opan.utils.execute tests")
     gp_utils.add_argument(PFX.format(UTILS_INERTIA),
             action='store_true', help="Run opan.utils.inertia tests")
     gp_utils.add_argument(PFX.format(UTILS_DECORATE),
             action='store_true', help="Run opan.utils.decorate tests")
+    gp_utils.add_argument(PFX.format(UTILS_SCHEDULE),
+            action='store_true', help="Run opan.utils.schedule tests")
+    gp_utils.add_argument(PFX.format(UTILS_SYMM),
+            action='store_true', help="Run opan.utils.symm tests")
     gp_utils.add_argument(PFX.format(UTILS_VECTOR),
             action='store_true', help="Run opan.utils.vector tests")
 
@@ -142,6 +161,12 @@ if __name__ == '__main__':
     gp_xyz.add_argument(PFX.format(XYZ_USAGE),
             action='store_true', help="Run opan.xyz usage tests")
 
+    # ====  VPT2  ==== #
+    gp_vpt2.add_argument(PFX.format(VPT2),
+            action='store_true', help="Run all opan.vpt2 tests")
+    gp_vpt2.add_argument(PFX.format(VPT2_REPO),
+            action='store_true', help="Run opan.vpt2.repo tests")
+
     # ====  ORCA Objects  ==== #
     gp_orca.add_argument(PFX.format(ORCA),
             action='store_true', help="Run all ORCA object tests")
@@ -149,6 +174,8 @@ if __name__ == '__main__':
             action='store_true', help="Run OrcaEngrad tests")
     gp_orca.add_argument(PFX.format(ORCA_HESS),
             action='store_true', help="Run OrcaHess tests")
+    gp_orca.add_argument(PFX.format(ORCA_OUTPUT),
+            action='store_true', help="Run OrcaOutput tests")
 
     # Pull the dictionary of the stored flags, with the unused args,
     #  and update sys.argv
@@ -156,6 +183,10 @@ if __name__ == '__main__':
     params = vars(ns)
     sys.argv = sys.argv[:1] + args_left
 
+    # Keep the loaders out of any configured parse cache, so that every
+    #  test exercises the parsers; the cache tests use their own
+    os.environ['OPAN_NO_CACHE'] = '1'
+
     # Create the test suite to be compiled for running
     TestMasterSuite = unittest.TestSuite()
 
@@ -179,6 +210,18 @@ if __name__ == '__main__':
     if any_params(params, [ALL, UTILS, UTILS_BASE]):
         TestMasterSuite.addTest(opan.test.opan_utils_base.suite())
 
+    # opan.utils.batch
+    if any_params(params, [ALL, UTILS, UTILS_BATCH]):
+        TestMasterSuite.addTest(opan.test.opan_utils_batch.suite())
+
+    # opan.utils.cache
+    if any_params(params, [ALL, UTILS, UTILS_CACHE]):
+        TestMasterSuite.addTest(opan.test.opan_utils_cache.suite())
+
+    # opan.utils.execute
+    if any_params(params, [ALL, UTILS, UTILS_EXECUTE]):
+        TestMasterSuite.addTest(opan.test.opan_utils_execute.suite())
+
     # opan.utils.inertia
     if any_params(params, [ALL, UTILS, UTILS_INERTIA]):
         TestMasterSuite.addTest(opan.test.opan_utils_inertia.suite())
@@ -187,6 +230,14 @@ if __name__ == '__main__':
     if any_params(params, [ALL, UTILS, UTILS_DECORATE]):
         TestMasterSuite.addTest(opan.test.opan_utils_decorate.suite())
 
+    # opan.utils.schedule
+    if any_params(params, [ALL, UTILS, UTILS_SCHEDULE]):
+        TestMasterSuite.addTest(opan.test.opan_utils_schedule.suite())
+
+    # opan.utils.symm
+    if any_params(params, [ALL, UTILS, UTILS_SYMM]):
+        TestMasterSuite.addTest(opan.test.opan_utils_symm.suite())
+
     # opan.utils.vector
     if any_params(params, [ALL, UTILS, UTILS_VECTOR]):
         TestMasterSuite.addTest(opan.test.opan_utils_vector.suite())
@@ -203,6 +254,10 @@ if __name__ == '__main__':
     if any_params(params, [ALL, XYZ, XYZ_USAGE]):
         TestMasterSuite.addTest(opan.test.opan_xyz.suite_Usage())
 
+    # opan.vpt2.repo
+    if any_params(params, [ALL, VPT2, VPT2_REPO]):
+        TestMasterSuite.addTest(opan.test.opan_vpt2_repo.suite())
+
 
     # OrcaEngrad
     if any_params(params, [ALL, ORCA, ORCA_ENGRAD]):
@@ -212,6 +267,10 @@ if __name__ == '__main__':
     if any_params(params, [ALL, ORCA, ORCA_HESS]):
         TestMasterSuite.addTest(opan.test.orca_hess.suite())
 
+    # OrcaOutput
+    if any_params(params, [ALL, ORCA, ORCA_OUTPUT]):
+        TestMasterSuite.addTest(opan.test.orca_output.suite())
+
 
     # Create the text test runner and execute
     ttr = unittest.TextTestRunner(buffer=True,
@@ -23,6 +23,11 @@
 
 **Sub-Modules**
 
+:mod:`~opan.utils.batch` -- Parallel loading of the results of many
+|orca| jobs
+
+:mod:`~opan.utils.cache` -- Persistent on-disk cache of parsed file contents
+
 :mod:`~opan.utils.decorate` -- Custom Open Anharmonic decorators
 
 :mod:`~opan.utils.execute` -- Functions for execution of external computational
@@ -31,6 +36,9 @@ software packages
 :mod:`~opan.utils.inertia` -- Inertia-related tools (center of mass,
 rotational constants, principal moments/axes, etc.)
 
+:mod:`~opan.utils.schedule` -- Local scheduling of many |orca| jobs
+on a budget of processor cores
+
 :mod:`~opan.utils.symm` -- Molecular symmetry utility functions
 (\ **INCOMPLETE**\ )
 
@@ -55,16 +63,22 @@ rotational constants, principal moments/axes, etc.)
 .. autofunction::
     opan.utils.base.template_subst(template, subs[, delims=['<', '>']])
 
+**Classes**
+
+.. autoclass:: opan.utils.base.CompiledTemplate
+    :members:
+
 
 """
 
 from __future__ import absolute_import
 
-__all__ = ['decorate', 'execute', 'inertia', 'symm', 'vector']
+__all__ = ['batch', 'cache', 'decorate', 'execute', 'inertia', 'schedule',
+           'symm', 'vector']
 
 from . import *
 from .base import check_geom, delta_fxn, make_timestamp, pack_tups
-from .base import safe_cast, template_subst, iterable
+from .base import safe_cast, template_subst, iterable, CompiledTemplate
 from .base import assert_npfloatarray
 
 
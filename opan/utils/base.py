@@ -33,10 +33,14 @@ safe_cast        -- Robustified casting with a post-check to confirm the cast
                         actually resulted in the proper type
 template_subst   -- Perform a field-based substitution into a string template
 
+CompiledTemplate -- String template tokenized once, for repeated field-based
+                        substitution
+
 
 """
 
 # Imports
+from functools import lru_cache as _lru_cache
 from ..const import DEF as _DEF
 from .decorate import arraysqueeze as _arraysqueeze
 
@@ -473,21 +477,198 @@ def template_subst(template, subs, delims=('<', '>')):
         String generated from the parsed template, with all tag
         substitutions performed.
 
+    See Also
+    --------
+    CompiledTemplate
+        Reusable form of `template`, for rendering many substitutions.
+        This function compiles `template` on each call, retaining the
+        most recently used templates.
+
     """
 
-    # Store the template into the working variable
-    subst_text = template
+    return _compile_template(template, tuple(delims)[:2]).render(subs)
+
+## end def template_subst
 
-    # Iterate over subs and perform the .replace() calls
-    for (k,v) in subs.items():
-        subst_text = subst_text.replace(
-                delims[0] + k + delims[1], v)
-    ## next tup
 
-    # Return the result
-    return subst_text
+class CompiledTemplate(object):
+    """ Template text, tokenized once for repeated tag substitution.
 
-## end def template_subst
+    Rendering gives results identical to :func:`template_subst`. The
+    template is split on its delimited tags at instantiation, and each
+    call to :meth:`render` then fills all tags in a single pass, in
+    place of one scan of the whole text for every key in `subs`.
+
+    Single-pass rendering applies whenever it cannot differ from
+    replacement in iteration order: the open and close delimiters share
+    no characters, the template has no delimiter characters outside its
+    tags, and no key or value of `subs` is other than a |str| or
+    contains a delimiter character. Otherwise, including the recursive
+    substitution described for :func:`template_subst`, the template is
+    rendered by the sequential replacement of that function.
+
+    Parameters
+    ----------
+    template
+        |str| -- Template containing tags delimited by `delims`
+
+    delims
+        iterable of |str|, optional -- As for :func:`template_subst`
+
+    Instance Variables
+    ------------------
+    template
+        |str| -- Template text
+
+    delims
+        |tuple| of |str| -- Open and close delimiters
+
+    tags
+        |frozenset| of |str| -- Names of the delimited tags found in
+        `template`
+
+    """
+
+    def __init__(self, template, delims=('<', '>')):
+
+        # Imports
+        import re
+
+        (op, cl) = tuple(delims)[:2]
+        self.template = template
+        self.delims = (op, cl)
+
+        # Literal text at even indices, tag names at odd
+        if op and cl:
+            self._segs = re.compile(re.escape(op) + "((?:(?!" + re.escape(op)
+                    + ").)*?)" + re.escape(cl), re.S).split(template)
+        else:
+            self._segs = [template]
+        ## end if
+        self._names = self._segs[1::2]
+        self._raws = [op + n + cl for n in self._names]
+        self.tags = frozenset(self._names)
+
+        # Whether single-pass rendering can apply
+        self._chars = frozenset(op + cl)
+        self._single = bool(op and cl) and set(op).isdisjoint(cl) and \
+                    all(self._chars.isdisjoint(t) for t in self._segs)
+
+    ## end def __init__
+
+
+    def render(self, subs):
+        """ Substitute into the template.
+
+        Parameters
+        ----------
+        subs
+            |dict| of |str| -- As for :func:`template_subst`
+
+        Returns
+        -------
+        subst_text
+            |str| -- Template text with all tag substitutions performed
+
+        """
+
+        chars = self._chars
+        if not (self._single and all(isinstance(k, str) and
+                    isinstance(v, str) and chars.isdisjoint(v)
+                                            for (k, v) in subs.items())):
+            return self._render_seq(subs)
+        ## end if
+
+        segs = list(self._segs)
+        get = subs.get
+        segs[1::2] = [get(n, r) for (n, r) in zip(self._names, self._raws)]
+        return ''.join(segs)
+
+    ## end def render
+
+
+    def render_many(self, subs_seq):
+        """ Substitute each of a series of `subs` into the template.
+
+        Parameters
+        ----------
+        subs_seq
+            iterable of |dict| of |str| -- Substitutions, each as for
+            :func:`template_subst`
+
+        Returns
+        -------
+        texts
+            |list| of |str| -- Rendered text for each element of
+            `subs_seq`
+
+        """
+
+        return [self.render(subs) for subs in subs_seq]
+
+    ## end def render_many
+
+
+    def write_many(self, jobs):
+        """ Render a series of substitutions, writing each to a file.
+
+        Parameters
+        ----------
+        jobs
+            |dict| or iterable of |tuple| -- Path of each file to write,
+            with the `subs` to render into it, as a |dict| or as
+            ``(path, subs)`` pairs. Existing files are overwritten.
+
+        Returns
+        -------
+        paths
+            |list| of |str| -- Paths written, in order
+
+        """
+
+        if hasattr(jobs, 'items'):
+            jobs = jobs.items()
+        ## end if
+
+        paths = []
+        for (path, subs) in jobs:
+            with open(path, 'w') as out_fl:
+                out_fl.write(self.render(subs))
+            ## end with
+            paths.append(path)
+        ## next (path, subs)
+
+        return paths
+
+    ## end def write_many
+
+
+    def _render_seq(self, subs):
+        """ Substitute by replacement in the iteration order of `subs`. """
+
+        # Store the template into the working variable
+        subst_text = self.template
+
+        # Iterate over subs and perform the .replace() calls
+        for (k,v) in subs.items():
+            subst_text = subst_text.replace(
+                    self.delims[0] + k + self.delims[1], v)
+        ## next tup
+
+        # Return the result
+        return subst_text
+
+    ## end def _render_seq
+
+## end class CompiledTemplate
+
+
+@_lru_cache(maxsize=32)
+def _compile_template(template, delims):
+    """ Cached :class:`CompiledTemplate`, for :func:`template_subst`. """
+    return CompiledTemplate(template, delims)
+
+## end def _compile_template
 
 
 def iterable(y):
@@ -0,0 +1,396 @@
+#-------------------------------------------------------------------------------
+# Name:        utils.batch
+# Purpose:     Submodule containing utility functions for parallel bulk
+#                loading of computational results for Open Anharmonic
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+""" Functions for loading the results of many |orca| jobs in parallel.
+
+A *job* is the set of files in one directory sharing a base name, such as
+:file:`run.out`, :file:`run.hess` and :file:`run.engrad`, identified by
+the path of that base name. :func:`find_jobs` discovers the jobs in a
+directory tree by the file extensions of
+:attr:`DEF.FILE_EXTS <opan.const.DEF.FILE_EXTS>`, and
+:func:`iter_results` loads each job in a
+:class:`concurrent.futures.ProcessPoolExecutor`, yielding one row per
+job as the loads complete. :func:`collect_results` gathers the rows into
+columns.
+
+An error loading any file is recorded in the row for the job, and the
+remaining files and jobs are loaded regardless.
+
+**Result Rows**
+
+Each row is a |dict| with the following keys:
+
+``'job'``
+    |str| -- Path of the job base name
+
+:class:`~opan.const.EnumFileType` values
+    |str| or |None| -- Path of the file of each type loaded, if present
+
+:class:`OrcaOutput.EN <opan.output.OrcaOutput.EN>` values
+    |npfloat_| or |None| -- Final value of each energy in the output,
+    as from :meth:`~opan.output.OrcaOutput.en_last`
+
+:class:`OrcaOutput.THERMO <opan.output.OrcaOutput.THERMO>` values,
+other than :attr:`~opan.output.OrcaOutput.THERMO.BLOCK`
+    |npfloat_| or |None| -- Thermochemistry values in the output
+
+``'completed'``, ``'converged'``, ``'optimized'``
+    |bool| -- Success indicators of the output; |False| if absent
+
+``'errors'``
+    |dict| -- Description of the error raised loading each file that
+    failed to load, keyed by :class:`~opan.const.EnumFileType`
+
+The .hess, .engrad and .xyz files are only validated: each is fully
+parsed to confirm it is well-formed, and the parsed |nparray| data are
+then discarded rather than carried in the rows. These parses cost about
+as much as loading the files again, so omit those types from `jobs`
+(see the `file_types` argument of :func:`find_jobs`) where validation is
+not wanted. The data can be reloaded from the file paths in the rows,
+from the parse cache of :mod:`opan.utils.cache` if one is configured.
+
+**Functions**
+
+.. autofunction:: collect_results
+
+.. autofunction:: find_jobs
+
+.. autofunction:: iter_results
+
+"""
+
+
+# Module-level imports
+from ..const import EnumFileType as _E_FT
+
+
+# Module-level data
+#: |tuple| -- File types loaded by default
+_DEF_TYPES = (_E_FT.OUTPUT, _E_FT.GRAD, _E_FT.HESS)
+
+#: |tuple| -- Success indicators of :class:`~opan.output.OrcaOutput`
+_FLAGS = ('completed', 'converged', 'optimized')
+
+
+def find_jobs(root, file_types=_DEF_TYPES):
+    """ Discover the |orca| jobs in a directory tree.
+
+    File extensions are matched case-insensitively.
+
+    Parameters
+    ----------
+    root
+        |str| -- Top of the directory tree to search.
+
+    file_types
+        iterable of :class:`~opan.const.EnumFileType`, optional --
+        Types of file to discover. Default is
+        :attr:`~opan.const.EnumFileType.OUTPUT`,
+        :attr:`~opan.const.EnumFileType.GRAD` and
+        :attr:`~opan.const.EnumFileType.HESS`.
+
+    Returns
+    -------
+    jobs
+        |dict| -- Files of each job, as a |dict| of path by
+        :class:`~opan.const.EnumFileType`, keyed by the path of the job
+        base name, in sorted order.
+
+    Raises
+    ------
+    ~exceptions.ValueError
+        If `file_types` includes a value that is not an
+        :class:`~opan.const.EnumFileType` with an |orca| file extension
+
+    """
+
+    # Imports
+    import os
+    from collections import OrderedDict
+    from ..const import DEF, EnumSoftware as E_SW
+
+    # Map the extensions to the file types
+    exts = {}
+    for ft in file_types:
+        if ft not in DEF.FILE_EXTS[E_SW.ORCA]:
+            raise ValueError("Invalid file type: {0}".format(ft))
+        ## end if
+        exts.update({ '.' + DEF.FILE_EXTS[E_SW.ORCA][ft].lower() : ft })
+    ## next ft
+
+    # Walk the tree
+    jobs = {}
+    for (dirpath, dirnames, filenames) in os.walk(root):
+        for fname in filenames:
+            (base, ext) = os.path.splitext(fname)
+            if ext.lower() in exts:
+                jobs.setdefault(os.path.join(dirpath, base), {}) \
+                        .update({ exts[ext.lower()] :
+                                        os.path.join(dirpath, fname) })
+            ## end if
+        ## next fname
+    ## next (dirpath, dirnames, filenames)
+
+    return OrderedDict(sorted(jobs.items()))
+
+## end def find_jobs
+
+
+def iter_results(jobs, workers=None, chunk=None, cache=None):
+    """ Load jobs in parallel, iterating over the results as they complete.
+
+    The jobs are split into chunks that are distributed over a
+    :class:`concurrent.futures.ProcessPoolExecutor`; the rows of each
+    chunk are yielded as soon as the chunk is done, so rows arrive in
+    completion order, not in the order of `jobs`.
+
+    Parameters
+    ----------
+    jobs
+        |str| or |dict| -- Top of a directory tree to search with
+        :func:`find_jobs` using its default file types, or the jobs to
+        load in the form returned by :func:`find_jobs`.
+
+    workers
+        |int|, optional --
+        Number of worker processes. |None| uses :func:`os.cpu_count`;
+        ``1`` loads serially in the calling process.
+
+    chunk
+        |int|, optional --
+        Number of jobs per dispatched task. |None| sizes the chunks to
+        give about four tasks per worker, up to 64 jobs per chunk.
+
+    cache
+        |bool| or :class:`~opan.utils.cache.ParseCache`, optional --
+        Parse cache passed to each loader, as for
+        :func:`~opan.utils.cache.get_cache`. Default is |None|, the
+        default cache if one is configured.
+
+    Returns
+    -------
+    rows
+        iterator of |dict| -- Results for each job, as described in
+        :mod:`opan.utils.batch`
+
+    Raises
+    ------
+    ~exceptions.ValueError
+        If `workers` or `chunk` is not a positive integer
+
+    """
+
+    # Imports
+    import os
+    from numbers import Integral
+
+    # Proof the inputs here, rather than on the first iteration
+    if isinstance(jobs, str):
+        jobs = find_jobs(jobs)
+    ## end if
+    jobs = list(jobs.items())
+    if workers is None:
+        workers = os.cpu_count() or 1
+    ## end if
+    if not (isinstance(workers, Integral) and workers > 0):
+        raise ValueError("'workers' must be a positive integer")
+    ## end if
+    if chunk is None:
+        chunk = min(64, max(1, -(-len(jobs) // (4 * workers))))
+    ## end if
+    if not (isinstance(chunk, Integral) and chunk > 0):
+        raise ValueError("'chunk' must be a positive integer")
+    ## end if
+
+    return _iter_chunks(jobs, workers, chunk, cache)
+
+## end def iter_results
+
+
+def collect_results(jobs, workers=None, chunk=None, cache=None):
+    """ Load jobs in parallel into a columnar table.
+
+    Parameters
+    ----------
+    jobs, workers, chunk, cache
+        As for :func:`iter_results`
+
+    Returns
+    -------
+    table
+        |dict| -- One column per row key described in
+        :mod:`opan.utils.batch`, with one entry per job, sorted by
+        job path. Energies and thermochemistry values are
+        |nparray| of |npfloat_|, with NaN for values not found; success
+        indicators are |nparray| of |bool|; and all other columns are
+        |list|.
+
+    Raises
+    ------
+    ~exceptions.ValueError
+        If `workers` or `chunk` is not a positive integer
+
+    """
+
+    # Imports
+    import numpy as np
+    from collections import OrderedDict
+    from ..output import OrcaOutput
+
+    rows = sorted(iter_results(jobs, workers, chunk, cache),
+                                                    key=lambda r: r['job'])
+
+    table = OrderedDict()
+    for key in _row_template():
+        col = [r[key] for r in rows]
+        if key in OrcaOutput.EN or key in OrcaOutput.THERMO:
+            col = np.array([np.nan if v is None else v for v in col],
+                                                        dtype=np.float_)
+        elif key in _FLAGS:
+            col = np.array(col, dtype=bool)
+        ## end if
+        table.update({ key : col })
+    ## next key
+
+    return table
+
+## end def collect_results
+
+
+def _iter_chunks(jobs, workers, chunk, cache):
+    """ Generator for :func:`iter_results`, from the proofed inputs. """
+
+    # Imports
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # Serial case; no point starting a pool
+    if workers == 1 or len(jobs) <= chunk:
+        for (job, files) in jobs:
+            yield _load_job(job, files, cache)
+        ## next (job, files)
+        return
+    ## end if
+
+    # Dispatch the chunks and yield as they complete
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futs = [ex.submit(_load_chunk, jobs[i:i + chunk], cache)
+                                    for i in range(0, len(jobs), chunk)]
+        for fut in as_completed(futs):
+            for row in fut.result():
+                yield row
+            ## next row
+        ## next fut
+    ## end with
+
+## end def _iter_chunks
+
+
+def _row_template():
+    """ Empty result row, with every value absent. """
+
+    # Imports
+    from collections import OrderedDict
+    from ..output import OrcaOutput
+
+    row = OrderedDict(job=None)
+    row.update((ft, None) for ft in _E_FT if ft != _E_FT.INPUTFILE)
+    row.update((k, None) for k in OrcaOutput.EN)
+    row.update((k, None) for k in OrcaOutput.THERMO
+                                        if k != OrcaOutput.THERMO.BLOCK)
+    row.update((k, False) for k in _FLAGS)
+    row.update(errors={})
+
+    return row
+
+## end def _row_template
+
+
+def _load_job(job, files, cache):
+    """ Load the files of one job into a result row.
+
+    Parameters
+    ----------
+    job
+        |str| -- Path of the job base name
+
+    files
+        |dict| -- Path of each file, by :class:`~opan.const.EnumFileType`
+
+    cache
+        As for :func:`iter_results`
+
+    Returns
+    -------
+    row
+        |dict| -- Result row, as described in :mod:`opan.utils.batch`
+
+    """
+
+    # Imports
+    from ..output import OrcaOutput
+    from ..grad import OrcaEngrad
+    from ..hess import OrcaHess
+    from ..xyz import OpanXYZ
+
+    row = _row_template()
+    row.update(job=job)
+
+    for (ft, path) in sorted(files.items()):
+        row.update({ ft : path })
+        try:
+            if ft == _E_FT.OUTPUT:
+                oo = OrcaOutput(path, quantities=[OrcaOutput.QTY.EN,
+                                    OrcaOutput.QTY.THERMO], cache=cache)
+                row.update((k, getattr(oo, k)) for k in _FLAGS)
+                row.update(oo.en_last())
+                row.update(getattr(oo, 'thermo', {}))
+            elif ft == _E_FT.GRAD:
+                OrcaEngrad(path=path, keep_str=False, cache=cache)
+            elif ft == _E_FT.HESS:
+                OrcaHess(path=path, keep_str=False, cache=cache)
+            elif ft == _E_FT.XYZ:
+                OpanXYZ(path=path, keep_str=False, cache=cache)
+            ## end if
+        except Exception as e:
+            row['errors'].update({ ft :
+                            "{0}: {1}".format(type(e).__name__, e) })
+        ## end try
+    ## next (ft, path)
+
+    return row
+
+## end def _load_job
+
+
+def _load_chunk(jobs, cache):
+    """ Worker for :func:`iter_results`; loads one chunk of jobs serially.
+
+    Module-level so that it can be pickled to the worker processes.
+
+    """
+
+    return [_load_job(job, files, cache) for (job, files) in jobs]
+
+## end def _load_chunk
+
+
+if __name__ == '__main__':      # pragma: no cover
+    print("Module not executable.")
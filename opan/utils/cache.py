@@ -0,0 +1,550 @@
+#-------------------------------------------------------------------------------
+# Name:        utils.cache
+# Purpose:     Submodule containing the persistent on-disk cache of parsed
+#                file contents for the Open Anharmonic file loaders
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+""" Persistent on-disk cache of parsed file contents.
+
+The file loaders :class:`~opan.grad.OrcaEngrad`,
+:class:`~opan.hess.OrcaHess`, :class:`~opan.output.OrcaOutput` and
+:class:`~opan.xyz.OpanXYZ` store the data parsed from each file in a
+:class:`ParseCache`, as one uncompressed .npz file per source file.
+A repeat load of an unchanged file is then served from the cache,
+without parsing.
+
+Each entry is identified by the absolute path of the source file, the
+kind of loader, the version of its parse and any loader options
+affecting the parsed data, and is validated against the size,
+modification time and SHA-1 hash of the contents of the source file. The
+hash is only computed when the size and modification time alone cannot
+be trusted: when either has changed, or when the file was modified too
+close to the time the entry was written for a same-size rewrite within
+the timestamp resolution to be ruled out.
+
+The total size of the entries is bounded by
+:attr:`ParseCache.max_size`, with the least recently used entries
+evicted first. Source files smaller than :attr:`ParseCache.min_size` are
+never cached, since reading an entry back costs more than parsing them.
+
+Caching is opt-in. By default the loaders use the cache only if the
+:envvar:`OPAN_CACHE_DIR` environment variable names the cache directory.
+Passing ``cache=True`` to a loader enables it in any case, in the
+directory given by :func:`cache_dir`. Caching is disabled for all
+loaders if the :envvar:`OPAN_NO_CACHE` environment variable is set to a
+non-empty value, and for a single load by passing ``cache=False`` to the
+loader. Failure to write to the cache directory is not an error; the
+data are simply not cached.
+
+Classes
+-------
+
+.. autoclass:: ParseCache
+    :members:
+
+Functions
+---------
+
+.. autofunction:: cache_dir
+
+.. autofunction:: get_cache
+
+"""
+
+# Imports
+from ..const import DEF as _DEF
+
+
+# Module-level data
+#: |int| -- Version of the entry layout; entries of other versions are
+#: never served
+_VERSION = 1
+
+#: |float| -- Seconds by which the modification time of a source file must
+#: predate an entry for a matching size and modification time to be
+#: trusted without hashing the contents
+_RACY_WINDOW = 2.0
+
+#: |dict| -- Default :class:`ParseCache` instances, keyed by directory
+_caches = {}
+
+
+def cache_dir():
+    """ Default directory for the parse cache.
+
+    Returns
+    -------
+    path
+        |str| -- The value of :envvar:`OPAN_CACHE_DIR`, if set and
+        non-empty; otherwise :file:`opan` in :envvar:`XDG_CACHE_HOME`, if
+        set and non-empty, or else in :file:`~/.cache`.
+
+    """
+
+    # Imports
+    import os
+
+    path = os.environ.get('OPAN_CACHE_DIR')
+    if not path:
+        base = os.environ.get('XDG_CACHE_HOME') or \
+                        os.path.join(os.path.expanduser('~'), '.cache')
+        path = os.path.join(base, 'opan')
+    ## end if
+
+    return os.path.abspath(path)
+
+## end def cache_dir
+
+
+def get_cache(cache=None):
+    """ Resolve the `cache` argument of a file loader.
+
+    Parameters
+    ----------
+    cache
+        |bool|, :class:`ParseCache` or |None|, optional -- |True| for the
+        default cache in :func:`cache_dir`, |False| for no caching, or the
+        specific :class:`ParseCache` to use. |None| (the default) is
+        treated as |True| if :envvar:`OPAN_CACHE_DIR` is set and
+        non-empty, and as |False| otherwise.
+
+    Returns
+    -------
+    pc
+        :class:`ParseCache` or |None| -- The cache to use, or |None| if
+        caching is disabled, either by `cache` or by
+        :envvar:`OPAN_NO_CACHE`.
+
+    """
+
+    # Imports
+    import os
+
+    if isinstance(cache, ParseCache):
+        return cache
+    ## end if
+    if cache is None:
+        cache = bool(os.environ.get('OPAN_CACHE_DIR'))
+    ## end if
+    if not cache or os.environ.get('OPAN_NO_CACHE'):
+        return None
+    ## end if
+
+    path = cache_dir()
+    if path not in _caches:
+        _caches.update({ path : ParseCache(path) })
+    ## end if
+    return _caches[path]
+
+## end def get_cache
+
+
+class ParseCache(object):
+    """ Size-bounded on-disk cache of parsed file contents.
+
+    Each entry holds a flat |dict| of parsed data. |nparray| values and
+    NumPy scalars are stored as arrays, and are returned as such;
+    |nparray| values of object dtype are not supported. All other values
+    must be representable in JSON (|str|, |int|, |float|, |bool|, |None|,
+    |list| and |dict| with |str| keys), and are returned as the
+    corresponding Python types.
+
+    The cache is safe for use by multiple threads and processes: entries
+    are written to a temporary file and moved into place, and any entry
+    that cannot be read is treated as absent.
+
+    Instance Variables
+    ------------------
+    path
+        |str| -- Absolute path of the cache directory; created on the first
+        store, if needed.
+
+    max_size
+        |int| -- Limit in bytes on the total size of the entries.
+
+    min_size
+        |int| -- Size in bytes below which source files are not cached.
+
+    """
+
+    def __init__(self, path=None, max_size=_DEF.CACHE_MAX_SIZE,
+                                            min_size=_DEF.CACHE_MIN_SIZE):
+        """ Initialize a cache in the indicated directory.
+
+        Parameters
+        ----------
+        path
+            |str|, optional -- Cache directory. Default is
+            :func:`cache_dir`.
+
+        max_size
+            |int|, optional -- Limit in bytes on the total size of the
+            entries. Default is :attr:`opan.const.DEF.CACHE_MAX_SIZE`.
+
+        min_size
+            |int|, optional -- Size in bytes below which source files are
+            not cached. Default is :attr:`opan.const.DEF.CACHE_MIN_SIZE`.
+
+        """
+
+        # Imports
+        import os
+
+        self.path = os.path.abspath(cache_dir() if path is None else path)
+        self.max_size = max_size
+        self.min_size = min_size
+
+    ## end def __init__
+
+
+    def load(self, src_path, kind, params=None, version=0):
+        """ Retrieve the cached data for a source file.
+
+        Parameters
+        ----------
+        src_path
+            |str| -- Path to the source file.
+
+        kind
+            |str| -- Name of the loader.
+
+        params
+            |dict|, optional -- Loader options affecting the parsed data,
+            with JSON-representable values.
+
+        version
+            |int|, optional -- Version of the parse by the loader, to be
+            incremented whenever the parsed data could change.
+
+        Returns
+        -------
+        data
+            |dict| or |None| -- The cached data, or |None| if there is no
+            valid entry or the source file is smaller than
+            :attr:`min_size`.
+
+        stamp
+            :func:`os.stat` result -- Status of the source file, taken
+            before the entry was examined; to be passed to :meth:`store`
+            after a parse on a miss.
+
+        Raises
+        ------
+        ~exceptions.OSError
+            If the source file does not exist or cannot be accessed
+
+        """
+
+        # Imports
+        import json, os, time
+        import numpy as np
+
+        stamp = os.stat(src_path)
+        if stamp.st_size < self.min_size:
+            return None, stamp
+        ## end if
+        entry = self._entry_path(src_path, kind, params, version)
+
+        try:
+            with np.load(entry, allow_pickle=False) as npz:
+                meta = json.loads(str(npz['__meta__']))
+                if meta['size'] != stamp.st_size:
+                    return None, stamp
+                ## end if
+                data = dict((name, npz[name]) for name in npz.files
+                                                    if name != '__meta__')
+            ## end with
+        except Exception:
+            return None, stamp
+        ## end try
+
+        # A matching status is trusted only if the file was not modified
+        #  within the window before the entry was written; otherwise, or if
+        #  the modification time differs, the contents must match.
+        # Entries verified by hash are refreshed, so that the hash need not
+        #  be computed again for an unchanged file.
+        trusted = meta['mtime'] == stamp.st_mtime_ns and \
+                    stamp.st_mtime_ns < (meta['stored'] - _RACY_WINDOW) * 1e9
+        if not trusted:
+            try:
+                if self._hash(src_path) != meta['hash']:
+                    return None, stamp
+                ## end if
+            except OSError:
+                return None, stamp
+            ## end try
+            if stamp.st_mtime_ns < (time.time() - _RACY_WINDOW) * 1e9:
+                meta.update(mtime=stamp.st_mtime_ns, stored=time.time())
+                self._write(entry, data, meta)
+            ## end if
+        ## end if
+
+        # Mark as recently used
+        try:
+            os.utime(entry, None)
+        except OSError:  # pragma: no cover
+            pass
+        ## end try
+
+        # Restore the scalars and the non-array values
+        for name in meta['scalars']:
+            data.update({ name : data[name][()] })
+        ## next name
+        data.update(meta['values'])
+
+        return data, stamp
+
+    ## end def load
+
+
+    def store(self, src_path, kind, data, stamp, params=None, version=0):
+        """ Store the data parsed from a source file.
+
+        Nothing is stored if the source file is smaller than
+        :attr:`min_size` or has changed since `stamp` was taken, or if the
+        data cannot be stored. Entries are then
+        evicted, least recently used first, until the total size is within
+        :attr:`max_size`.
+
+        Parameters
+        ----------
+        src_path
+            |str| -- Path to the source file.
+
+        kind
+            |str| -- Name of the loader.
+
+        data
+            |dict| -- Parsed data, as described for :class:`ParseCache`.
+
+        stamp
+            :func:`os.stat` result -- Status of the source file before it
+            was read for parsing, as returned by :meth:`load`.
+
+        params
+            |dict|, optional -- Loader options affecting the parsed data,
+            with JSON-representable values.
+
+        version
+            |int|, optional -- Version of the parse by the loader, to be
+            incremented whenever the parsed data could change.
+
+        Returns
+        -------
+        stored
+            |bool| -- |True| if the data were stored.
+
+        """
+
+        # Imports
+        import os, time
+        import numpy as np
+
+        if stamp.st_size < self.min_size:
+            return False
+        ## end if
+
+        # Split the data between the arrays and the JSON values
+        arrays = {}
+        meta = dict(scalars=[], values={})
+        for (name, val) in data.items():
+            if isinstance(val, np.generic):
+                meta['scalars'].append(name)
+                val = np.asarray(val)
+            ## end if
+            if isinstance(val, np.ndarray):
+                if val.dtype.hasobject:
+                    return False
+                ## end if
+                arrays.update({ name : val })
+            else:
+                meta['values'].update({ name : val })
+            ## end if
+        ## next (name, val)
+
+        # Hash the contents, confirming they are those that were parsed
+        try:
+            meta.update(hash=self._hash(src_path))
+            st = os.stat(src_path)
+        except OSError:
+            return False
+        ## end try
+        if (st.st_size, st.st_mtime_ns) != \
+                                    (stamp.st_size, stamp.st_mtime_ns):
+            return False
+        ## end if
+        meta.update(size=st.st_size, mtime=st.st_mtime_ns,
+                                                    stored=time.time())
+
+        entry = self._entry_path(src_path, kind, params, version)
+        if not self._write(entry, arrays, meta):
+            return False
+        ## end if
+        self._evict()
+        return os.path.isfile(entry)
+
+    ## end def store
+
+
+    def clear(self):
+        """ Remove all entries. """
+
+        # Imports
+        import os
+
+        for (path, st) in self._entries():
+            try:
+                os.remove(path)
+            except OSError:  # pragma: no cover
+                pass
+            ## end try
+        ## next (path, st)
+
+    ## end def clear
+
+
+    @property
+    def size(self):
+        """ |int| -- Total size in bytes of the entries. """
+        return sum(st.st_size for (path, st) in self._entries())
+
+    ## end def size
+
+
+    def _entry_path(self, src_path, kind, params, version):
+        """ Path of the entry for a source file. """
+
+        # Imports
+        import hashlib, json, os
+        from .. import __version__
+
+        key = json.dumps([_VERSION, __version__, kind, version,
+                    os.path.abspath(src_path), params or {}], sort_keys=True)
+        return os.path.join(self.path,
+                    hashlib.sha1(key.encode('utf-8')).hexdigest() + '.npz')
+
+    ## end def _entry_path
+
+
+    @staticmethod
+    def _hash(src_path):
+        """ SHA-1 hex digest of the contents of a file. """
+
+        # Imports
+        import hashlib
+
+        h = hashlib.sha1()
+        with open(src_path, 'rb') as in_fl:
+            for chunk in iter(lambda: in_fl.read(2**20), b''):
+                h.update(chunk)
+            ## next chunk
+        ## end with
+        return h.hexdigest()
+
+    ## end def _hash
+
+
+    def _write(self, entry, arrays, meta):
+        """ Write an entry atomically; |True| if written. """
+
+        # Imports
+        import json, os, tempfile
+        import numpy as np
+
+        arrays = dict(arrays)
+        arrays.update(__meta__=np.array(json.dumps(meta)))
+
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            (fd, tmp) = tempfile.mkstemp(suffix='.tmp', dir=self.path)
+        except OSError:
+            return False
+        ## end try
+        try:
+            with os.fdopen(fd, 'wb') as out_fl:
+                np.savez(out_fl, **arrays)
+            ## end with
+            if os.path.getsize(tmp) > self.max_size:
+                os.remove(tmp)
+                return False
+            ## end if
+            os.replace(tmp, entry)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            ## end try
+            return False
+        ## end try
+
+        return True
+
+    ## end def _write
+
+
+    def _entries(self):
+        """ List of (path, :func:`os.stat` result) for all entries. """
+
+        # Imports
+        import os
+
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            return []
+        ## end try
+
+        entries = []
+        for name in names:
+            if name.endswith('.npz'):
+                path = os.path.join(self.path, name)
+                try:
+                    entries.append((path, os.stat(path)))
+                except OSError:  # pragma: no cover
+                    pass
+                ## end try
+            ## end if
+        ## next name
+        return entries
+
+    ## end def _entries
+
+
+    def _evict(self):
+        """ Remove least recently used entries until within the limit. """
+
+        # Imports
+        import os
+
+        entries = sorted(self._entries(), key=lambda e: e[1].st_mtime)
+        total = sum(st.st_size for (path, st) in entries)
+        while total > self.max_size and len(entries) > 0:
+            (path, st) = entries.pop(0)
+            try:
+                os.remove(path)
+            except OSError:  # pragma: no cover
+                pass
+            ## end try
+            total -= st.st_size
+        ## loop
+
+    ## end def _evict
+
+## end class ParseCache
+
@@ -28,9 +28,17 @@
 
 
 # Module-level imports
+import asyncio as _asyncio
+import types as _types
+from concurrent.futures import Future as _Future
 from ..const import DEF as _DEF, EnumSoftware as _E_SW, EnumFileType as _E_FT
 
 
+# Decorator for generator-based coroutines; asyncio.coroutine is needed on
+#  Python 3.4, but is removed from Python 3.11
+_coroutine = getattr(_types, 'coroutine', None) or _asyncio.coroutine
+
+
 # Functions
 
 def execute_orca(inp_tp, work_dir, exec_cmd, subs=None, subs_delims=("<",">"),
@@ -38,7 +46,7 @@ def execute_orca(inp_tp, work_dir, exec_cmd, subs=None, subs_delims=("<",">"),
             inp_ext=_DEF.FILE_EXTS[_E_SW.ORCA][_E_FT.INPUTFILE],
             out_ext=_DEF.FILE_EXTS[_E_SW.ORCA][_E_FT.OUTPUT],
             wait_to_complete=True,
-            bohrs=False):
+            bohrs=False, timeout=None):
     """Executes |orca| on a dynamically constructed input file.
 
     .. warning:: Function is still under active development! Execution with
@@ -60,10 +68,16 @@ def execute_orca(inp_tp, work_dir, exec_cmd, subs=None, subs_delims=("<",">"),
     If `wait_to_complete` is |True|, the :func:`subprocess.call` syntax will
     be used and the function will not return until execution of the
     wrapper script completes.
-    If |False|, *[indicate what will be returned if not waiting]*.
+    If |False|, the wrapper script is started in the background and an
+    :class:`OrcaFuture` is returned at once. See also
+    :func:`execute_orca_async`.
 
-    .. todo:: execute_orca: The different output modes, depending on waiting
-              or not.
+    In either case, the input file is written, and the wrapper script
+    run, in `work_dir` by explicit path, without changing the working
+    directory of the calling process. The function is thus safe to call
+    concurrently from multiple threads, e.g. from a
+    :class:`concurrent.futures.ThreadPoolExecutor`, provided each call
+    uses a distinct `work_dir` or `sim_name`.
 
     The command to call |orca| must be specified in the parameter list syntax of
     the `args` argument to the :class:`subprocess.Popen` constructor.
@@ -111,8 +125,7 @@ def execute_orca(inp_tp, work_dir, exec_cmd, subs=None, subs_delims=("<",">"),
 
     If `wait_to_complete` == |False|:
 
-        **TBD**, but current intention is to return the PID of the spawned
-        subprocess.
+        An :class:`OrcaFuture`, whose result is the above |tuple|.
 
 
     **Signature**
@@ -165,18 +178,25 @@ def execute_orca(inp_tp, work_dir, exec_cmd, subs=None, subs_delims=("<",">"),
         |bool|, optional --
         Whether to wait within this function for |orca| execution to
         complete (|True|), or to spawn/fork a child process and return
-        (|False|). Default is |True|. |False| **IS NOT YET IMPLEMENTED**.
+        (|False|). Default is |True|.
 
     bohrs
         |bool|, optional --
         Flag to indicate the units (Bohrs or Angstroms) of the
         coordinates in .xyz and .trj files.
 
+    timeout
+        |float|, optional --
+        Seconds after which the wrapper script is killed. If
+        `wait_to_complete` is |True|, :exc:`subprocess.TimeoutExpired`
+        is then raised; otherwise, it is set as the exception of the
+        :class:`OrcaFuture`. Default |None| waits indefinitely.
+
 
     Returns
     -------
     [varies]
-        |tuple| of objects or |int| PID.
+        |tuple| of objects or :class:`OrcaFuture`.
         Varies depending on `wait_to_complete`; see *Return Values* above
 
 
@@ -192,125 +212,335 @@ def execute_orca(inp_tp, work_dir, exec_cmd, subs=None, subs_delims=("<",">"),
     ~exceptions.TypeError
         If any elements in `subs` are not tuples
 
+    ~subprocess.TimeoutExpired
+        If `wait_to_complete` is |True| and the wrapper script runs
+        longer than `timeout`
+
     """
 
     # Imports
-    import os, subprocess as sp
-    from ..output import OrcaOutput
-    from ..xyz import OpanXYZ
-    from ..grad import OrcaEngrad
-    from ..hess import OrcaHess
-    from ..utils import template_subst
+    import subprocess as sp
+
+    # All file access is by explicit path in work_dir, and the working
+    #  directory of the process is never changed, so that concurrent
+    #  calls from multiple threads cannot interfere.
+    (cmd, out_fname) = _setup_orca(inp_tp, work_dir, exec_cmd, subs,
+                                subs_delims, sim_name, inp_ext, out_ext)
+
+    if not wait_to_complete:
+        return OrcaFuture(cmd, work_dir, out_fname, sim_name, bohrs,
+                                                                timeout)
+    ## end if
+
+    # Run ORCA; subprocess.call kills the child on timeout
+    sp.call(cmd, cwd=work_dir, timeout=timeout)
+
+    # Bind ORCA_XXXXX objects and return, with None for any missing
+    return _load_orca(work_dir, out_fname, sim_name, bohrs)
+
+## end def execute_orca
+
+
+@_coroutine
+def execute_orca_async(inp_tp, work_dir, exec_cmd, subs=None,
+            subs_delims=("<",">"),
+            sim_name="orcarun",
+            inp_ext=_DEF.FILE_EXTS[_E_SW.ORCA][_E_FT.INPUTFILE],
+            out_ext=_DEF.FILE_EXTS[_E_SW.ORCA][_E_FT.OUTPUT],
+            bohrs=False, timeout=None):
+    """Executes |orca| as an :mod:`asyncio` coroutine.
+
+    Equivalent to :func:`execute_orca`, with the wrapper script run by
+    :func:`asyncio.create_subprocess_exec` and the results then loaded in
+    the default executor of the event loop, so that the loop is not
+    blocked. Wrap in :func:`asyncio.ensure_future` for a task to use as a
+    handle to the run; cancelling the task kills the wrapper script.
+
+    The input file is written, and the wrapper script run, in `work_dir`
+    by explicit path, without changing the working directory.
+
+    As for any :mod:`asyncio` subprocess on POSIX systems, a child
+    watcher must be attached to the event loop, as is done by default
+    for the event loop of the main thread.
+
+    Parameters
+    ----------
+    inp_tp, work_dir, exec_cmd, subs, subs_delims
+        As for :func:`execute_orca`
+
+    sim_name, inp_ext, out_ext, bohrs
+        As for :func:`execute_orca`
+
+    timeout
+        |float|, optional --
+        Seconds after which the wrapper script is killed. Default |None|
+        waits indefinitely.
+
+    Returns
+    -------
+    results
+        |tuple| -- ``(OrcaOutput, OpanXYZ, OrcaEngrad, OrcaHess)``, as
+        for :func:`execute_orca`
+
+    Raises
+    ------
+    ~subprocess.TimeoutExpired
+        If the wrapper script runs longer than `timeout`
+
+    ~asyncio.CancelledError
+        If the coroutine is cancelled
+
+    ~exceptions.ValueError, ~exceptions.KeyError
+        As for :func:`execute_orca`
+
+    """
+
+    # Imports
+    import subprocess as sp
+
+    (cmd, out_fname) = _setup_orca(inp_tp, work_dir, exec_cmd, subs,
+                                subs_delims, sim_name, inp_ext, out_ext)
+    proc = yield from _asyncio.create_subprocess_exec(*cmd, cwd=work_dir)
+
+    # Kill on timeout or cancellation, waiting to reap the process
+    try:
+        yield from _asyncio.wait_for(proc.wait(), timeout)
+    except (_asyncio.TimeoutError, _asyncio.CancelledError) as e:
+        _kill(proc)
+        yield from _asyncio.shield(proc.wait())
+        if isinstance(e, _asyncio.TimeoutError):
+            raise sp.TimeoutExpired(cmd, timeout)
+        ## end if
+        raise
+    ## end try
+
+    results = yield from _asyncio.get_event_loop().run_in_executor(None,
+                    _load_orca, work_dir, out_fname, sim_name, bohrs)
+    return results
+
+## end def execute_orca_async
+
+
+class OrcaFuture(_Future):
+    """ Handle to a background |orca| run.
+
+    Returned by :func:`execute_orca` with `wait_to_complete` as |False|.
+    A :class:`concurrent.futures.Future`, usable with
+    :func:`concurrent.futures.wait` and
+    :func:`concurrent.futures.as_completed`, whose result is the
+    ``(OrcaOutput, OpanXYZ, OrcaEngrad, OrcaHess)`` |tuple| of
+    :func:`execute_orca`.
+
+    The wrapper script is started on instantiation and monitored by a
+    daemon thread. The future remains pending until the script exits, so
+    that :meth:`cancel` can stop the run at any time before then. If the
+    script runs longer than the timeout, it is killed and
+    :exc:`subprocess.TimeoutExpired` is set as the exception.
+
+    Instance Variables
+    ------------------
+    proc
+        :class:`subprocess.Popen` -- The wrapper script process
+
+    """
+
+    def __init__(self, cmd, work_dir, out_fname, sim_name, bohrs, timeout):
+        """ Start the wrapper script and its monitor thread.
+
+        Parameters
+        ----------
+        cmd
+            |list| of |str| -- Wrapper script call, with all tags
+            substituted
+
+        work_dir
+            |str| -- Working directory for the run
+
+        out_fname
+            |str| -- Name of the output file in `work_dir`
+
+        sim_name, bohrs, timeout
+            As for :func:`execute_orca`
+
+        """
+
+        # Imports
+        import subprocess as sp
+        import threading
+
+        super(OrcaFuture, self).__init__()
+        self._lock = threading.Lock()
+        self.proc = sp.Popen(cmd, cwd=work_dir)
+        threading.Thread(target=self._monitor, daemon=True,
+                    args=(cmd, work_dir, out_fname, sim_name, bohrs,
+                                                        timeout)).start()
+
+    ## end def __init__
+
+
+    def cancel(self):
+        """ Cancel the run, killing the wrapper script if still running.
+
+        Returns
+        -------
+        cancelled
+            |bool| -- |True| if cancelled; |False| if the run had
+            already completed.
 
-    # Special key constants
-    INPKEY = "INP"
-    OUTKEY = "OUT"
-    NAMEKEY = "NAME"
+        """
 
-    # Store old dir; switch to new; default exception fine for
-    #  handling case of invalid dir.
-    olddir = os.getcwd()
-    os.chdir(work_dir)
+        with self._lock:
+            cancelled = super(OrcaFuture, self).cancel()
+            if cancelled:
+                _kill(self.proc)
+            ## end if
+        ## end with
+
+        return cancelled
+
+    ## end def cancel
+
+
+    def _monitor(self, cmd, work_dir, out_fname, sim_name, bohrs, timeout):
+        """ Wait for the wrapper script, then set the result. """
+
+        # Imports
+        import subprocess as sp
+
+        try:
+            try:
+                self.proc.wait(timeout)
+            except sp.TimeoutExpired:
+                _kill(self.proc)
+                self.proc.wait()
+                raise sp.TimeoutExpired(cmd, timeout)
+            ## end try
+            if self.cancelled():
+                return
+            ## end if
+            results = _load_orca(work_dir, out_fname, sim_name, bohrs)
+        except Exception as e:
+            with self._lock:
+                if not self.cancelled():
+                    self.set_exception(e)
+                ## end if
+            ## end with
+        else:
+            with self._lock:
+                if not self.cancelled():
+                    self.set_result(results)
+                ## end if
+            ## end with
+        ## end try
+
+    ## end def _monitor
+
+## end class OrcaFuture
+
+
+def _setup_orca(inp_tp, work_dir, exec_cmd, subs, subs_delims, sim_name,
+                                                        inp_ext, out_ext):
+    """ Write the input file and build the wrapper script call.
+
+    All file access is by explicit path in `work_dir`. Arguments are as
+    for :func:`execute_orca`.
+
+    Returns
+    -------
+    cmd
+        |list| of |str| -- `exec_cmd`, with the special tags substituted
+
+    out_fname
+        |str| -- Name of the output file
+
+    Raises
+    ------
+    ~exceptions.ValueError, ~exceptions.KeyError
+        As for :func:`execute_orca`
+
+    """
+
+    # Imports
+    import os
+    from .base import template_subst
 
     # Check for inp_ext identical to out_ext
     if inp_ext == out_ext:
         raise ValueError("'inp_ext' and 'out_ext' cannot be identical.")
     ##end if
 
-    # Build the input and output file names and store the substitution keys
-    if inp_ext:
-        inp_fname = sim_name + '.' + inp_ext
-    else:
-        inp_fname = sim_name
-    ##end if
-    if out_ext:
-        out_fname = sim_name + '.' + out_ext
-    else:
-        out_fname = sim_name
-    ##end if
-
-    SPECIALSUBS = {INPKEY: inp_fname, OUTKEY: out_fname, NAMEKEY: sim_name}
+    # Build the input and output file names
+    inp_fname = sim_name + ('.' + inp_ext if inp_ext else '')
+    out_fname = sim_name + ('.' + out_ext if out_ext else '')
+    specials = {"INP": inp_fname, "OUT": out_fname, "NAME": sim_name}
 
     # Complain if special tags used in subs
-    if not set(SPECIALSUBS.keys()).isdisjoint(subs):
+    subs = {} if subs is None else subs
+    if not set(specials).isdisjoint(subs):
         raise KeyError("Redefinition of special tag(s) is forbidden: {0}"
-                .format(list(set(SPECIALSUBS.keys()).intersection(subs))))
+                .format(list(set(specials).intersection(subs))))
     ## end if
 
-    # Perform the replacement into the exec_cmd of the input and output
-    #  filenames.
-    exec_cmd_subs = [
-                s.replace(subs_delims[0] + INPKEY + subs_delims[1], inp_fname)
-            for s in exec_cmd]
-    exec_cmd_subs = [
-                s.replace(subs_delims[0] + OUTKEY + subs_delims[1], out_fname)
-            for s in exec_cmd_subs]
-    exec_cmd_subs = [
-                s.replace(subs_delims[0] + NAMEKEY + subs_delims[1], sim_name)
-            for s in exec_cmd_subs]
-
-    # Perform the content substitutions into the template string
-    augsubs = subs.copy().update(SPECIALSUBS)
-    input_text = template_subst(inp_tp, augsubs, delims=subs_delims)
-
-    # Create and write the input file
-    with open(inp_fname, 'w') as input_file:
-        input_file.write(input_text)
+    # Substitute the special tags into the call, and all tags into
+    #  the input
+    cmd = [template_subst(c, specials, delims=subs_delims)
+                                                    for c in exec_cmd]
+    augsubs = dict(subs)
+    augsubs.update(specials)
+    with open(os.path.join(work_dir, inp_fname), 'w') as input_file:
+        input_file.write(template_subst(inp_tp, augsubs,
+                                                    delims=subs_delims))
     ##end with
 
-    # Perform the ORCA call; collect return values as appropriate
-    #!TODO: execute_orca: Implement non-waiting return
-    if wait_to_complete:
-        # Run ORCA
-        sp.call(exec_cmd_subs, cwd=os.getcwd())
+    return cmd, out_fname
 
-        # Bind ORCA_XXXXX objects and return. Have to address possibility of
-        #  any or all of these not existing.
-        try:
-            o_out = OrcaOutput(out_fname,'file')
-        except IOError:
-            o_out = None
-        ## end try
+## end def _setup_orca
 
-        try:
-            o_xyz = OpanXYZ(path=os.path.join(work_dir, sim_name + ".xyz"), \
-                                                                bohrs=bohrs)
-        except IOError:
-            o_xyz = None
-        ## end try
 
-        try:
-            o_trj = OpanXYZ(path=os.path.join(work_dir, sim_name + ".trj"), \
-                                                                bohrs=bohrs)
-        except IOError:
-            o_trj = None
-        ## end try
+def _load_orca(work_dir, out_fname, sim_name, bohrs):
+    """ Load the results of a run, by explicit path in `work_dir`.
 
-        try:
-            o_engrad = OrcaEngrad(os.path.join(work_dir, sim_name + ".engrad"))
-        except IOError:
-            o_engrad = None
-        ## end try
+    Returns
+    -------
+    results
+        |tuple| -- ``(OrcaOutput, OpanXYZ, OrcaEngrad, OrcaHess)``; each
+        is |None| if its file is absent.
+
+    """
 
+    # Imports
+    import os
+    from ..output import OrcaOutput
+    from ..xyz import OpanXYZ
+    from ..grad import OrcaEngrad
+    from ..hess import OrcaHess
+
+    def load(fname, fxn):
         try:
-            o_hess = OrcaHess(os.path.join(work_dir, sim_name + ".hess"))
+            return fxn(os.path.join(work_dir, fname))
         except IOError:
-            o_hess = None
+            return None
         ## end try
+    ## end def load
 
-    else:
-        raise NotImplementedError("Background execution not yet implemented.")
-    ## end if
+    return (load(out_fname, OrcaOutput),
+            load(sim_name + ".xyz", lambda p: OpanXYZ(path=p, bohrs=bohrs)),
+            load(sim_name + ".engrad", lambda p: OrcaEngrad(path=p)),
+            load(sim_name + ".hess", lambda p: OrcaHess(path=p)))
 
-    # Return to prior working directory
-    os.chdir(olddir)
+## end def _load_orca
 
-    # Return something appropriate, either computation results or information
-    #  on the queued computation.
-    #TODO: execute_orca: Must refine this, esp for the different exec modes
-    return o_out, o_xyz, o_engrad, o_hess
 
-## end def execute_orca
+def _kill(proc):
+    """ Kill a process, if still running. """
+
+    try:
+        proc.kill()
+    except OSError:  # pragma: no cover
+        pass
+    ## end try
+
+## end def _kill
 
 
 if __name__ == '__main__':      # pragma: no cover
@@ -39,6 +39,18 @@ Open Anharmonic.
 .. autofunction:: opan.utils.inertia.rot_consts
     (geom, masses[, units[, on_tol]])
 
+**Batched Functions**
+
+These accept a k x 3N stack of geometries (e.g., the frames of an IRC or
+MD trajectory) sharing a common set of masses, recentering each geometry
+only once and computing all tensors and moments in single vectorized calls.
+
+.. autofunction:: opan.utils.inertia.inertia_tensor_multi(geoms, masses)
+
+.. autofunction:: opan.utils.inertia.principals_multi(geoms, masses[, on_tol])
+
+.. autofunction:: opan.utils.inertia.rot_consts_multi(geoms, masses[, units])
+
 """
 
 
@@ -151,7 +163,7 @@ def ctr_geom(geom, masses):
 
     # Calculate the shift vector. Possible bad shape of geom or masses is
     #  addressed internally by the ctr_mass call.
-    shift = np.tile(ctr_mass(geom, masses), geom.shape[0] / 3)
+    shift = np.tile(ctr_mass(geom, masses), geom.shape[0] // 3)
 
     # Shift the geometry and return
     ctr_geom = geom - shift
@@ -196,47 +208,14 @@ def inertia_tensor(geom, masses):
 
     """
 
-    # Imports
-    import numpy as np
-
     # Center the geometry. Takes care of any improper shapes of geom or
     #  masses via the internal call to 'ctr_mass' within the call to 'ctr_geom'
     geom = ctr_geom(geom, masses)
 
-    # Expand the masses if required. Shape should only ever be (N,) or (3N,),
-    #  else would raise an exception within the above 'ctr_geom' call
-    if geom.shape[0] == 3*masses.shape[0]:
-        masses = masses.repeat(3)
-    ## end if
-
-    # Initialize the tensor matrix
-    tensor = np.zeros((3,3))
-
-    # Fill the matrix
-    for i in range(3):
-        for j in range(i,3):
-            if i == j:
-                # On-diagonal element; calculate indices to include
-                ind = np.concatenate([np.array(list(map(lambda v: v % 3,
-                                        range(i+1, i+3)))) + o for o in
-                                        range(0,geom.shape[0],3)])
-
-                # Calculate the tensor element
-                tensor[i,i] = np.multiply(np.square(geom[ind]),
-                                                        masses[ind]).sum()
-            else:
-                # Off-diagonal element; calculate the indices
-                ind_i = np.array(range(i,geom.shape[0]+i,3))
-                ind_j = np.array(range(j,geom.shape[0]+j,3))
-
-                # Calculate the tensor element and its symmetric partner
-                tensor[i,j] = np.multiply(
-                        np.sqrt(np.multiply(masses[ind_i], masses[ind_j])) ,
-                        np.multiply(geom[ind_i], geom[ind_j]) ).sum() * -1
-                tensor[j,i] = tensor[i,j]
-            ## end if
-        ## next j
-    ## next i
+    # Assemble the tensor on the single centered geometry, reshaped as a
+    #  stack of one
+    tensor = _tensor_stack(geom.reshape((1, geom.shape[0] // 3, 3)),
+                            _mass_grid(masses, geom.shape[0]))[0]
 
     # Return the tensor
     return tensor
@@ -296,20 +275,17 @@ def principals(geom, masses, on_tol=_DEF.ORTHONORM_TOL):
     """
 
     # Imports
-    import numpy as np
     from scipy import linalg as spla
-    from ..const import PRM, EnumTopType as ETT
-    from ..error import InertiaError, VectorError
-    from .vector import rej, parallel_check as prlchk
-    from .vector import orthonorm_check as orthchk
 
     # Center the geometry. Takes care of any improper shapes of geom or
     #  masses via the internal call to 'ctr_mass' within the call to
     #  'ctr_geom'.  Will need the centered geometry eventually anyways.
     geom = ctr_geom(geom, masses)
 
-    # Get the inertia tensor
-    tensor = inertia_tensor(geom, masses)
+    # Get the inertia tensor directly from the centered geometry, without
+    #  recentering it a second time
+    tensor = _tensor_stack(geom.reshape((1, geom.shape[0] // 3, 3)),
+                            _mass_grid(masses, geom.shape[0]))[0]
 
     # Orthogonalize and store eigenvalues/-vectors. eigh documentation says it
     #  will return ordered eigenvalues.... Store eigenvalues directly to
@@ -317,6 +293,500 @@ def principals(geom, masses, on_tol=_DEF.ORTHONORM_TOL):
     #  to a holding variable.
     moments, vecs = spla.eigh(tensor)
 
+    # Detect the top type and condition the axes
+    top = _top_type(moments)
+    axes = _cond_axes(geom, vecs, top, on_tol)
+
+    # Return the moments, axes, and top type
+    return moments, axes, top
+
+##end def principals
+
+
+def rot_consts(geom, masses, units=_EURC.INV_INERTIA, on_tol=_DEF.ORTHONORM_TOL):
+    """Rotational constants for a given molecular system.
+
+    Calculates the rotational constants for the provided system with numerical
+    value given in the units provided in `units`.  The orthnormality tolerance
+    `on_tol` is required in order to be passed through to the
+    :func:`principals` function.
+
+    If the system is linear or a single atom, the effectively-zero principal
+    moments of inertia will be assigned values of
+    :data:`opan.const.PRM.ZERO_MOMENT_TOL`
+    before transformation into the appropriate rotational constant units.
+
+    The moments of inertia are always sorted in increasing order as
+    :math:`0 \\leq I_A \\leq I_B \\leq I_C`; the rotational constants
+    calculated from these will thus always be in **decreasing** order
+    as :math:`B_A \\geq B_B \\geq B_C`, retaining the
+    ordering and association with the three principal ``axes[:,i]`` generated
+    by :func:`principals`.
+
+    Parameters
+    ----------
+    geom
+        length-3N |npfloat_| --
+        Coordinates of the atoms
+
+    masses
+        length-N OR length-3N |npfloat_| --
+        Atomic masses of the atoms. Length-3N option is to allow calculation of
+        a per-coordinate perturbed value.
+
+    units
+        :class:`~opan.const.EnumUnitsRotConst`, optional --
+        Enum value indicating the desired units of the output rotational
+        constants. Default is :data:`~opan.const.EnumUnitsRotConst.INV_INERTIA`
+        :math:`\\left(1\\over \\mathrm{uB^2}\\right)`
+
+    on_tol
+        |npfloat_|,  optional --
+        Tolerance for deviation from unity/zero for principal axis dot
+        products, within which axes are considered orthonormal. Default is
+        :data:`opan.const.DEF.ORTHONORM_TOL`
+
+    Returns
+    -------
+    rc
+        length-3 |npfloat_| --
+        Vector of rotational constants in the indicated units
+
+    """
+
+    # Imports
+    import numpy as np
+    from ..const import EnumTopType as ETT, EnumUnitsRotConst as EURC, PRM
+
+    # Ensure units are valid
+    if not units in EURC:
+        raise ValueError("'{0}' is not a valid units value".format(units))
+    ## end if
+
+    # Retrieve the moments, axes and top type. Geom and masses are proofed
+    #  internally in this call.
+    mom, ax, top = principals(geom, masses, on_tol)
+
+    # Check for special cases
+    if top == ETT.ATOM:
+        # All moments are zero; set to zero-moment threshold
+        mom = np.repeat(PRM.ZERO_MOMENT_TOL, 3)
+    elif top == ETT.LINEAR:
+        # First moment is zero; set to zero-moment threshold
+        mom[0] = PRM.ZERO_MOMENT_TOL
+    ## end if
+
+    # Calculate the values in the indicated units
+    rc = _rc_convert(mom, units)
+
+    # Return the result
+    return rc
+
+## end def rot_consts
+
+
+@_arraysqueeze(1)  # geoms deliberately not squeezed; k == 1 is valid
+def inertia_tensor_multi(geoms, masses):
+    """Generate the 3x3 moment-of-inertia tensors for a stack of geometries.
+
+    Batched analogue of :func:`inertia_tensor`, intended for computing
+    inertial properties along entire trajectories (IRC paths, MD runs,
+    etc.). Each geometry is recentered to its center of mass exactly once,
+    and all of the tensors are then assembled in a single vectorized
+    operation.
+
+    Parameters
+    ----------
+    geoms
+        k x 3N |npfloat_| --
+        Stack of geometries, one per row, all with the same atoms in
+        the same order
+
+    masses
+        length-N OR length-3N |npfloat_| --
+        Atomic masses of the atoms, common to all geometries. Length-3N
+        option is to allow calculation of a per-coordinate perturbed value.
+
+    Returns
+    -------
+    tensors
+        k x 3 x 3 |npfloat_| --
+        Moment of inertia tensor for each geometry
+
+    Raises
+    ------
+    ~exceptions.ValueError
+        If shapes of `geoms` & `masses` are inconsistent
+
+    """
+
+    # Center the geometries, proofing the shapes, and assemble the tensors
+    tensors = _tensor_stack(*_ctr_stack(geoms, masses))
+
+    # Return the tensors
+    return tensors
+
+## end def inertia_tensor_multi
+
+
+@_arraysqueeze(1)  # geoms deliberately not squeezed; k == 1 is valid
+def principals_multi(geoms, masses, on_tol=_DEF.ORTHONORM_TOL):
+    """Principal axes and moments of inertia for a stack of geometries.
+
+    Batched analogue of :func:`principals`. The principal moments of all
+    geometries are obtained from a single stacked call to
+    :func:`numpy.linalg.eigh`; the top type detection and axis
+    conditioning are then applied geometry-by-geometry exactly as in
+    :func:`principals`, so that the results match those of repeated
+    single-geometry calls.
+
+    Parameters
+    ----------
+    geoms
+        k x 3N |npfloat_| --
+        Stack of geometries, one per row, all with the same atoms in
+        the same order
+
+    masses
+        length-N OR length-3N |npfloat_| --
+        Atomic masses of the atoms, common to all geometries. Length-3N
+        option is to allow calculation of a per-coordinate perturbed value.
+
+    on_tol
+        |npfloat_|,  optional --
+        Tolerance for deviation from unity/zero for principal axis dot products
+        within which axes are considered orthonormal. Default is
+        :data:`opan.const.DEF.ORTHONORM_TOL`.
+
+    Returns
+    -------
+    moments
+        k x 3 |npfloat_| --
+        Principal inertial moments of each geometry, sorted in increasing
+        order along each row
+
+    axes
+        k x 3 x 3 |npfloat_| --
+        Principal axes of each geometry, processed as in :func:`principals`.
+        The axis corresponding to ``moments[g,i]`` is retrieved as
+        ``axes[g,:,i]``
+
+    tops
+        |list| of :class:`~opan.const.EnumTopType` --
+        Detected molecular top type of each geometry
+
+    """
+
+    # Imports
+    import numpy as np
+
+    # Center the geometries once, then build and diagonalize all tensors
+    ctrs, m3 = _ctr_stack(geoms, masses)
+    moments, vecs = np.linalg.eigh(_tensor_stack(ctrs, m3))
+
+    # Top types and axis conditioning are inherently per-geometry
+    tops = [_top_type(mom) for mom in moments]
+    axes = np.array([_cond_axes(ctr.reshape(-1), vec, top, on_tol)
+                        for ctr, vec, top in zip(ctrs, vecs, tops)])
+
+    # Return the moments, axes, and top types
+    return moments, axes, tops
+
+## end def principals_multi
+
+
+@_arraysqueeze(1)  # geoms deliberately not squeezed; k == 1 is valid
+def rot_consts_multi(geoms, masses, units=_EURC.INV_INERTIA):
+    """Rotational constants for a stack of geometries.
+
+    Batched analogue of :func:`rot_consts`.  Since the rotational constants
+    depend only on the principal moments, the principal axes are not
+    generated; the calculation is fully vectorized over the stack.
+    Effectively-zero moments of linear and single-atom systems are treated
+    as in :func:`rot_consts`.
+
+    Parameters
+    ----------
+    geoms
+        k x 3N |npfloat_| --
+        Stack of geometries, one per row, all with the same atoms in
+        the same order
+
+    masses
+        length-N OR length-3N |npfloat_| --
+        Atomic masses of the atoms, common to all geometries. Length-3N
+        option is to allow calculation of a per-coordinate perturbed value.
+
+    units
+        :class:`~opan.const.EnumUnitsRotConst`, optional --
+        Enum value indicating the desired units of the output rotational
+        constants. Default is :data:`~opan.const.EnumUnitsRotConst.INV_INERTIA`
+        :math:`\\left(1\\over \\mathrm{uB^2}\\right)`
+
+    Returns
+    -------
+    rc
+        k x 3 |npfloat_| --
+        Rotational constants of each geometry in the indicated units
+
+    Raises
+    ------
+    ~opan.error.InertiaError
+        (typecode :attr:`~opan.error.InertiaError.NEG_MOMENT`) If any
+        geometry yields a negative principal moment
+
+    """
+
+    # Imports
+    import numpy as np
+    from ..const import EnumUnitsRotConst as EURC, PRM
+    from ..error import InertiaError
+
+    # Ensure units are valid
+    if not units in EURC:
+        raise ValueError("'{0}' is not a valid units value".format(units))
+    ## end if
+
+    # Center the geometries once, then build and diagonalize all tensors.
+    #  Only the moments are needed.
+    mom = np.linalg.eigvalsh(_tensor_stack(*_ctr_stack(geoms, masses)))
+
+    # Invalid moment check, as in 'principals'
+    if np.any(mom[:, 0] < -PRM.ZERO_MOMENT_TOL):  # pragma: no cover
+        raise InertiaError(InertiaError.NEG_MOMENT,
+                    "Negative principal inertial moment", "")
+    ## end if
+
+    # Special cases: linear systems have a zero first moment; atoms have
+    #  all three moments zero. Set zeros to the zero-moment threshold.
+    atoms = np.all(mom < PRM.ZERO_MOMENT_TOL, axis=1)
+    mom[mom[:, 0] < PRM.ZERO_MOMENT_TOL, 0] = PRM.ZERO_MOMENT_TOL
+    mom[atoms, :] = PRM.ZERO_MOMENT_TOL
+
+    # Calculate the values in the indicated units and return
+    rc = _rc_convert(mom, units)
+    return rc
+
+## end def rot_consts_multi
+
+
+def _mass_grid(masses, n_coords):
+    """Expand atomic masses to an N x 3 per-coordinate array.
+
+    Parameters
+    ----------
+    masses
+        length-N OR length-3N |npfloat_| --
+        Atomic masses of the atoms; assumed already proofed against
+        `n_coords`
+
+    n_coords
+        |int| --
+        Number of coordinates (3N) in each geometry
+
+    Returns
+    -------
+    m3
+        N x 3 |npfloat_| --
+        Per-coordinate masses, arranged as the coordinates
+
+    """
+
+    # If N masses are provided, expand to 3N; if 3N, retain.
+    if n_coords == 3*masses.shape[0]:
+        masses = masses.repeat(3)
+    ## end if
+
+    # Reshape and return
+    return masses.reshape((n_coords // 3, 3))
+
+## end def _mass_grid
+
+
+def _ctr_stack(geoms, masses):
+    """Proof a stack of geometries and shift each to its center of mass.
+
+    Parameters
+    ----------
+    geoms
+        k x 3N |npfloat_| --
+        Stack of geometries, one per row
+
+    masses
+        length-N OR length-3N |npfloat_| --
+        Atomic masses of the atoms
+
+    Returns
+    -------
+    ctrs
+        k x N x 3 |npfloat_| --
+        Centered atomic coordinates
+
+    m3
+        N x 3 |npfloat_| --
+        Per-coordinate masses, as returned by :func:`_mass_grid`
+
+    Raises
+    ------
+    ~exceptions.ValueError
+        If `geoms` & `masses` shapes are inconsistent
+
+    """
+
+    # Imports
+    import numpy as np
+
+    # Shape check
+    geoms = np.asarray(geoms, dtype=np.float_)
+    if len(geoms.shape) != 2:
+        raise ValueError("Geometries are not a k x 3N stack")
+    ## end if
+    if len(masses.shape) != 1:
+        raise ValueError("Masses cannot be parsed as a vector")
+    ## end if
+    if not geoms.shape[1] % 3 == 0:
+        raise ValueError("Geometries are not length-3N")
+    ## end if
+    if geoms.shape[1] != 3*masses.shape[0] and \
+                                        geoms.shape[1] != masses.shape[0]:
+        raise ValueError("Inconsistent geometry and masses vector lengths")
+    ## end if
+
+    # Per-coordinate masses and atom-grouped coordinates
+    m3 = _mass_grid(masses, geoms.shape[1])
+    geoms = geoms.reshape((geoms.shape[0], geoms.shape[1] // 3, 3))
+
+    # Centers of mass, computed as in 'ctr_mass': the mass sum is divided by
+    #  three for the three (possibly perturbed) replicates of each mass.
+    ctrs = np.einsum('knc,nc->kc', geoms, m3) / (m3.sum() / 3)
+
+    # Shift and return
+    return geoms - ctrs[:, np.newaxis, :], m3
+
+## end def _ctr_stack
+
+
+def _tensor_stack(ctrs, m3):
+    """Assemble inertia tensors for a stack of centered geometries.
+
+    The tensor is assembled as
+    :math:`\\mathrm{tr}\\left(G\\right)\\mathbf{1} - G`, with
+    :math:`G_{ab} = \\sum_n \\sqrt{m_{n,a}m_{n,b}}\\,r_{n,a}r_{n,b}`,
+    which reproduces the per-coordinate mass weighting of [Kro92]_,
+    Eq. (2.26), as used by :func:`inertia_tensor`.
+
+    Parameters
+    ----------
+    ctrs
+        k x N x 3 |npfloat_| --
+        *CENTERED* atomic coordinates
+
+    m3
+        N x 3 |npfloat_| --
+        Per-coordinate masses
+
+    Returns
+    -------
+    tensors
+        k x 3 x 3 |npfloat_| --
+        Moment of inertia tensors
+
+    """
+
+    # Imports
+    import numpy as np
+
+    # Mass-weighted second-moment matrices
+    msq = np.sqrt(m3[:, :, np.newaxis] * m3[:, np.newaxis, :])
+    gram = np.einsum('kna,knb,nab->kab', ctrs, ctrs, msq)
+
+    # Inertia tensors
+    tensors = np.einsum('kaa->k', gram)[:, np.newaxis, np.newaxis] * \
+                                            np.identity(3) - gram
+    return tensors
+
+## end def _tensor_stack
+
+
+def _rc_convert(mom, units):
+    """Convert principal moments to rotational constants.
+
+    Parameters
+    ----------
+    mom
+        |nparray| of |npfloat_| --
+        Principal moments, of any shape, with any zero moments already
+        replaced by :data:`opan.const.PRM.ZERO_MOMENT_TOL`
+
+    units
+        :class:`~opan.const.EnumUnitsRotConst` --
+        Enum value indicating the desired units of the output rotational
+        constants; assumed already validated
+
+    Returns
+    -------
+    rc
+        |nparray| of |npfloat_| --
+        Rotational constants in the indicated units, shaped as `mom`
+
+    """
+
+    # Imports
+    import numpy as np
+    from ..const import EnumUnitsRotConst as EURC, PHYS
+
+    # Calculate the values in the indicated units
+    if units == EURC.INV_INERTIA:            # 1/(amu*B^2)
+        rc = 1.0 / (2.0 * mom)
+    elif units == EURC.ANGFREQ_ATOMIC:       # 1/Ta
+        rc = PHYS.PLANCK_BAR / (2.0 * mom * PHYS.ME_PER_AMU)
+    elif units == EURC.ANGFREQ_SECS:      # 1/s
+        rc = PHYS.PLANCK_BAR / (2.0 * mom * PHYS.ME_PER_AMU) / PHYS.SEC_PER_TA
+    elif units == EURC.CYCFREQ_ATOMIC:    # cyc/Ta
+        rc = PHYS.PLANCK_BAR / (4.0 * np.pi * mom * PHYS.ME_PER_AMU)
+    elif units == EURC.CYCFREQ_HZ:        # cyc/s
+        rc = PHYS.PLANCK_BAR / (4.0 * np.pi * mom * PHYS.ME_PER_AMU) / \
+                                                            PHYS.SEC_PER_TA
+    elif units == EURC.CYCFREQ_MHZ:       # Mcyc/s
+        rc = PHYS.PLANCK_BAR / (4.0 * np.pi * mom * PHYS.ME_PER_AMU) / \
+                                                    PHYS.SEC_PER_TA / 1.0e6
+    elif units == EURC.WAVENUM_ATOMIC:       # cyc/B
+        rc = PHYS.PLANCK / (mom * PHYS.ME_PER_AMU) / \
+            (8.0 * np.pi**2.0 * PHYS.LIGHT_SPEED)
+    elif units == EURC.WAVENUM_CM:           # cyc/cm
+        rc = PHYS.PLANCK / (mom * PHYS.ME_PER_AMU) / \
+            (8.0 * np.pi**2.0 * PHYS.LIGHT_SPEED * PHYS.ANG_PER_BOHR) * 1.0e8
+    else:               # pragma: no cover -- Valid units; not implemented
+        raise NotImplementedError("Units conversion not yet implemented.")
+    ## end if
+
+    # Return the result
+    return rc
+
+## end def _rc_convert
+
+
+def _top_type(moments):
+    """Detect the molecular top type from sorted principal moments.
+
+    Parameters
+    ----------
+    moments
+        length-3 |npfloat_| --
+        Principal inertial moments, sorted in increasing order
+
+    Returns
+    -------
+    top
+        :class:`~opan.const.EnumTopType` --
+        Detected molecular top type
+
+    """
+
+    # Imports
+    from ..const import PRM, EnumTopType as ETT
+    from ..error import InertiaError
+
     # 'fail' init for 'top
     top = None
 
@@ -356,6 +826,51 @@ def principals(geom, masses, on_tol=_DEF.ORTHONORM_TOL):
                     "Unrecognized molecular top type","")
     ## end if
 
+    # Return the top type
+    return top
+
+## end def _top_type
+
+
+def _cond_axes(geom, vecs, top, on_tol):
+    """Condition raw principal axes for repeatable orientation.
+
+    Parameters
+    ----------
+    geom
+        length-3N |npfloat_| --
+        *CENTERED* molecular geometry
+
+    vecs
+        3 x 3 |npfloat_| --
+        Eigenvectors of the inertia tensor, as columns sorted with the
+        principal moments
+
+    top
+        :class:`~opan.const.EnumTopType` --
+        Molecular top type of the geometry
+
+    on_tol
+        |npfloat_| --
+        Tolerance for deviation from unity/zero for principal axis dot products
+        within which axes are considered orthonormal
+
+    Returns
+    -------
+    axes
+        3 x 3 |npfloat_| --
+        Principal axes, as column vectors, processed for repeatability
+
+    """
+
+    # Imports
+    import numpy as np
+    from scipy import linalg as spla
+    from ..const import PRM, EnumTopType as ETT
+    from ..error import InertiaError, VectorError
+    from .vector import rej, parallel_check as prlchk
+    from .vector import orthonorm_check as orthchk
+
     # Initialize the axes
     axes = np.zeros((3,3))
 
@@ -490,114 +1005,10 @@ def principals(geom, masses, on_tol=_DEF.ORTHONORM_TOL):
                     "Axis conditioning broke orthonormality","")
     ## end if
 
-    # Return the moments, axes, and top type
-    return moments, axes, top
-
-##end def principals
-
-
-def rot_consts(geom, masses, units=_EURC.INV_INERTIA, on_tol=_DEF.ORTHONORM_TOL):
-    """Rotational constants for a given molecular system.
-
-    Calculates the rotational constants for the provided system with numerical
-    value given in the units provided in `units`.  The orthnormality tolerance
-    `on_tol` is required in order to be passed through to the
-    :func:`principals` function.
-
-    If the system is linear or a single atom, the effectively-zero principal
-    moments of inertia will be assigned values of
-    :data:`opan.const.PRM.ZERO_MOMENT_TOL`
-    before transformation into the appropriate rotational constant units.
-
-    The moments of inertia are always sorted in increasing order as
-    :math:`0 \\leq I_A \\leq I_B \\leq I_C`; the rotational constants
-    calculated from these will thus always be in **decreasing** order
-    as :math:`B_A \\geq B_B \\geq B_C`, retaining the
-    ordering and association with the three principal ``axes[:,i]`` generated
-    by :func:`principals`.
-
-    Parameters
-    ----------
-    geom
-        length-3N |npfloat_| --
-        Coordinates of the atoms
-
-    masses
-        length-N OR length-3N |npfloat_| --
-        Atomic masses of the atoms. Length-3N option is to allow calculation of
-        a per-coordinate perturbed value.
-
-    units
-        :class:`~opan.const.EnumUnitsRotConst`, optional --
-        Enum value indicating the desired units of the output rotational
-        constants. Default is :data:`~opan.const.EnumUnitsRotConst.INV_INERTIA`
-        :math:`\\left(1\\over \\mathrm{uB^2}\\right)`
-
-    on_tol
-        |npfloat_|,  optional --
-        Tolerance for deviation from unity/zero for principal axis dot
-        products, within which axes are considered orthonormal. Default is
-        :data:`opan.const.DEF.ORTHONORM_TOL`
-
-    Returns
-    -------
-    rc
-        length-3 |npfloat_| --
-        Vector of rotational constants in the indicated units
-
-    """
-
-    # Imports
-    import numpy as np
-    from ..const import EnumTopType as ETT, EnumUnitsRotConst as EURC, PRM, PHYS
-
-    # Ensure units are valid
-    if not units in EURC:
-        raise ValueError("'{0}' is not a valid units value".format(units))
-    ## end if
-
-    # Retrieve the moments, axes and top type. Geom and masses are proofed
-    #  internally in this call.
-    mom, ax, top = principals(geom, masses, on_tol)
-
-    # Check for special cases
-    if top == ETT.ATOM:
-        # All moments are zero; set to zero-moment threshold
-        mom = np.repeat(PRM.ZERO_MOMENT_TOL, 3)
-    elif top == ETT.LINEAR:
-        # First moment is zero; set to zero-moment threshold
-        mom[0] = PRM.ZERO_MOMENT_TOL
-    ## end if
+    # Return the axes
+    return axes
 
-    # Calculate the values in the indicated units
-    if units == EURC.INV_INERTIA:            # 1/(amu*B^2)
-        rc = 1.0 / (2.0 * mom)
-    elif units == EURC.ANGFREQ_ATOMIC:       # 1/Ta
-        rc = PHYS.PLANCK_BAR / (2.0 * mom * PHYS.ME_PER_AMU)
-    elif units == EURC.ANGFREQ_SECS:      # 1/s
-        rc = PHYS.PLANCK_BAR / (2.0 * mom * PHYS.ME_PER_AMU) / PHYS.SEC_PER_TA
-    elif units == EURC.CYCFREQ_ATOMIC:    # cyc/Ta
-        rc = PHYS.PLANCK_BAR / (4.0 * np.pi * mom * PHYS.ME_PER_AMU)
-    elif units == EURC.CYCFREQ_HZ:        # cyc/s
-        rc = PHYS.PLANCK_BAR / (4.0 * np.pi * mom * PHYS.ME_PER_AMU) / \
-                                                            PHYS.SEC_PER_TA
-    elif units == EURC.CYCFREQ_MHZ:       # Mcyc/s
-        rc = PHYS.PLANCK_BAR / (4.0 * np.pi * mom * PHYS.ME_PER_AMU) / \
-                                                    PHYS.SEC_PER_TA / 1.0e6
-    elif units == EURC.WAVENUM_ATOMIC:       # cyc/B
-        rc = PHYS.PLANCK / (mom * PHYS.ME_PER_AMU) / \
-            (8.0 * np.pi**2.0 * PHYS.LIGHT_SPEED)
-    elif units == EURC.WAVENUM_CM:           # cyc/cm
-        rc = PHYS.PLANCK / (mom * PHYS.ME_PER_AMU) / \
-            (8.0 * np.pi**2.0 * PHYS.LIGHT_SPEED * PHYS.ANG_PER_BOHR) * 1.0e8
-    else:               # pragma: no cover -- Valid units; not implemented
-        raise NotImplementedError("Units conversion not yet implemented.")
-    ## end if
-
-    # Return the result
-    return rc
-
-## end def rot_consts
+## end def _cond_axes
 
 
 @_arraysqueeze(0,1)
@@ -0,0 +1,689 @@
+#-------------------------------------------------------------------------------
+# Name:        utils.schedule
+# Purpose:     Submodule containing a local job scheduler for multi-job
+#                |orca| workflows in Open Anharmonic
+#
+# Author:      Brian Skinn
+#                bskinn@alum.mit.edu
+#
+# Created:     16 Oct 2026
+# Copyright:   (c) Brian Skinn 2016
+# License:     The MIT License; see "license.txt" for full license terms
+#                   and contributor agreement.
+#
+#       This file is part of opan (Open Anharmonic), a system for automated
+#       computation of anharmonic properties of molecular systems via wrapper
+#       calls to computational/quantum chemical software packages.
+#
+#       http://www.github.com/bskinn/opan
+#
+#-------------------------------------------------------------------------------
+
+""" Local scheduling of many |orca| jobs on a budget of processor cores.
+
+:class:`OrcaScheduler` runs a queue of jobs through
+:func:`~opan.utils.execute.execute_orca` in the background, keeping as
+many running at once as fit within a budget of cores. The number of
+cores a job occupies is read from its input by :func:`pal_nprocs`, from
+the ``%pal nprocs`` block or a ``PALn`` simple keyword, so that the
+machine is kept fully loaded without being oversubscribed.
+
+A run is judged successful if its output reports normal termination
+(:attr:`OrcaOutput.completed <opan.output.OrcaOutput.completed>`);
+failed runs are retried a set number of times. If a path is given for
+the queue state, every job added and every change of job status is
+appended to it as a line of JSON, so a campaign that is interrupted
+resumes without re-running the jobs already finished. The file is
+compacted to one line per job at the start of each run.
+
+**Classes**
+
+.. autoclass:: OrcaScheduler
+    :members:
+
+**Functions**
+
+.. autofunction:: pal_nprocs
+
+"""
+
+
+# Module-level imports
+import re as _re
+from ..const import EnumJobStatus as _E_JS
+
+
+# Module-level data
+#: Compiled regex for the ``%pal`` block of an |orca| input
+_P_PAL_BLOCK = _re.compile("^[ \\t]*%pal\\b(?P<body>.*?)\\bend\\b",
+                                            _re.I | _re.M | _re.S)
+
+#: Compiled regex for ``nprocs`` within a ``%pal`` block
+_P_NPROCS = _re.compile("\\bnprocs\\s+(?P<n>\\d+)", _re.I)
+
+#: Compiled regex for a ``PALn`` simple input keyword
+_P_PAL_KEYWORD = _re.compile("^[ \\t]*!.*?\\bpal(?P<n>\\d+)\\b",
+                                            _re.I | _re.M)
+
+#: |tuple| -- Keys of the definition of a job
+_DEFN_KEYS = ('inp_tp', 'work_dir', 'subs', 'sim_name', 'nprocs')
+
+#: |tuple| -- Keys of the run state of a job
+_STATE_KEYS = ('status', 'attempts', 'error')
+
+
+def pal_nprocs(inp_text):
+    """ Number of parallel processes requested by an |orca| input.
+
+    The ``nprocs`` value of the last ``%pal`` block takes precedence
+    over a ``PALn`` simple input keyword; if neither is present, the
+    input is taken to be serial.
+
+    Parameters
+    ----------
+    inp_text
+        |str| -- Text of the |orca| input
+
+    Returns
+    -------
+    nprocs
+        |int| -- Number of processes
+
+    """
+
+    for m in reversed(list(_P_PAL_BLOCK.finditer(inp_text))):
+        mn = _P_NPROCS.search(m.group('body'))
+        if mn:
+            return int(mn.group('n'))
+        ## end if
+    ## next m
+
+    ms = _P_PAL_KEYWORD.findall(inp_text)
+    if ms:
+        return int(ms[-1])
+    ## end if
+
+    return 1
+
+## end def pal_nprocs
+
+
+class OrcaScheduler(object):
+    """ Queue of |orca| jobs, run locally within a budget of cores.
+
+    Jobs are defined with :meth:`add` or :meth:`add_many` and run with
+    :meth:`run`. Each job
+    is executed by :func:`~opan.utils.execute.execute_orca` in its own
+    working directory (or under its own `sim_name`), using the same
+    wrapper script call for every job.
+
+    Queued jobs are started first-fit, in the order added: whenever
+    cores come free, each waiting job that fits in the cores remaining
+    is started, so that smaller jobs fill the gaps left beside larger
+    ones.
+
+    If `state_path` is given and the file exists, the queue is restored
+    from it on instantiation. Jobs recorded as
+    :attr:`~opan.const.EnumJobStatus.RUNNING`, as left by a campaign
+    that was killed, are returned to
+    :attr:`~opan.const.EnumJobStatus.PENDING`.
+
+    Instance Variables
+    ------------------
+    exec_cmd
+        |list| of |str| -- Wrapper script call, as for
+        :func:`~opan.utils.execute.execute_orca`
+
+    cores
+        |int| -- Budget of cores
+
+    retries
+        |int| -- Number of times a failed job is re-run
+
+    state_path
+        |str| or |None| -- Path of the persisted queue state
+
+    subs_delims, timeout, bohrs
+        As for :func:`~opan.utils.execute.execute_orca`; `timeout`
+        applies to each run
+
+    results
+        |dict| -- Results |tuple| of
+        :func:`~opan.utils.execute.execute_orca` for each job completed
+        by this instance, by job name. Results of jobs completed in an
+        earlier session are available from :meth:`load_results`.
+
+    """
+
+    def __init__(self, exec_cmd, cores=None, retries=1, state_path=None,
+                        subs_delims=("<",">"), timeout=None, bohrs=False):
+        """ Initialize the queue, restoring it from `state_path` if present.
+
+        Parameters
+        ----------
+        exec_cmd
+            |list| of |str| -- Wrapper script call, as for
+            :func:`~opan.utils.execute.execute_orca`
+
+        cores
+            |int|, optional -- Budget of cores. |None| uses
+            :func:`os.cpu_count`.
+
+        retries
+            |int|, optional -- Number of times a failed job is re-run
+            before it is marked :attr:`~opan.const.EnumJobStatus.FAILED`.
+            Default is 1.
+
+        state_path
+            |str|, optional -- Path of a JSON file in which to persist
+            the queue state. Default |None| keeps the state only in
+            memory.
+
+        subs_delims, timeout, bohrs
+            As for :func:`~opan.utils.execute.execute_orca`
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            If `cores` is not a positive integer, or `retries` is not a
+            non-negative integer
+
+        """
+
+        # Imports
+        import os
+        from collections import OrderedDict
+
+        if cores is None:
+            cores = os.cpu_count() or 1
+        ## end if
+        if not (isinstance(cores, int) and cores > 0):
+            raise ValueError("'cores' must be a positive integer")
+        ## end if
+        if not (isinstance(retries, int) and retries >= 0):
+            raise ValueError("'retries' must be a non-negative integer")
+        ## end if
+
+        self.exec_cmd = list(exec_cmd)
+        self.cores = cores
+        self.retries = retries
+        self.state_path = state_path
+        self.subs_delims = subs_delims
+        self.timeout = timeout
+        self.bohrs = bohrs
+        self.results = {}
+        self._jobs = OrderedDict()
+        self._slots = {}
+
+        if state_path is not None and os.path.isfile(state_path):
+            self._load_state()
+        ## end if
+
+    ## end def __init__
+
+
+    @property
+    def status(self):
+        """ |dict| -- Status of each job, by name, in the order added. """
+
+        # Imports
+        from collections import OrderedDict
+
+        return OrderedDict((n, j['status']) for (n, j) in self._jobs.items())
+
+    ## end def status
+
+
+    def job(self, name):
+        """ Copy of the definition and state of a job.
+
+        Parameters
+        ----------
+        name
+            |str| -- Name of the job
+
+        Returns
+        -------
+        job
+            |dict| -- Values of `inp_tp`, `work_dir`, `subs`, `sim_name`
+            and `nprocs` as for :meth:`add`, plus ``'status'``
+            (:class:`~opan.const.EnumJobStatus`), ``'attempts'`` (|int|)
+            and ``'error'`` (|str| describing the last failure, or
+            |None|)
+
+        """
+
+        # Imports
+        import copy
+
+        return copy.deepcopy(self._jobs[name])
+
+    ## end def job
+
+
+    def add(self, name, inp_tp, work_dir, subs=None, sim_name="orcarun",
+                                                            nprocs=None):
+        """ Add a job to the queue.
+
+        If a job of the same name is already queued with an identical
+        definition, as when the script defining a campaign is re-run to
+        resume it, its recorded state is kept. If the definition
+        differs, the job is reset to
+        :attr:`~opan.const.EnumJobStatus.PENDING` under the new
+        definition.
+
+        Parameters
+        ----------
+        name
+            |str| -- Unique name of the job
+
+        inp_tp, work_dir, subs, sim_name
+            As for :func:`~opan.utils.execute.execute_orca`.
+            `work_dir` is stored as an absolute path.
+
+        nprocs
+            |int|, optional -- Cores occupied by the job. |None| reads
+            it from the input, after substitution of `subs`, with
+            :func:`pal_nprocs`.
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            If `nprocs` is not a positive integer or exceeds the budget
+            of cores, or if another job already runs in the same
+            `work_dir` with the same `sim_name`
+
+        """
+
+        self.add_many([dict(name=name, inp_tp=inp_tp, work_dir=work_dir,
+                            subs=subs, sim_name=sim_name, nprocs=nprocs)])
+
+    ## end def add
+
+
+    def add_many(self, jobs):
+        """ Add several jobs to the queue.
+
+        Equivalent to calling :meth:`add` for each job in turn, but with
+        a single write to the state file.
+
+        Parameters
+        ----------
+        jobs
+            iterable of |dict| -- Keyword arguments to :meth:`add` for
+            each job
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            As for :meth:`add`. The jobs preceding the offending one are
+            added.
+
+        """
+
+        added = []
+        try:
+            for kwargs in jobs:
+                if self._add(**kwargs):
+                    added.append(kwargs['name'])
+                ## end if
+            ## next kwargs
+        finally:
+            self._log_state(added, _DEFN_KEYS + _STATE_KEYS)
+        ## end try
+
+    ## end def add_many
+
+
+    def reset(self, names=None):
+        """ Return jobs to the queue for another full set of attempts.
+
+        Parameters
+        ----------
+        names
+            iterable of |str|, optional -- Jobs to reset. Default |None|
+            resets all :attr:`~opan.const.EnumJobStatus.FAILED` jobs.
+
+        """
+
+        if names is None:
+            names = [n for (n, j) in self._jobs.items()
+                                            if j['status'] == _E_JS.FAILED]
+        ## end if
+        names = list(names)
+
+        for n in names:
+            self._jobs[n].update(status=_E_JS.PENDING, attempts=0,
+                                                                error=None)
+            self.results.pop(n, None)
+        ## next n
+
+        self._log_state(names, _STATE_KEYS)
+
+    ## end def reset
+
+
+    def run(self):
+        """ Run all pending jobs, returning when none are left.
+
+        If interrupted, e.g. by :exc:`KeyboardInterrupt`, the jobs still
+        running are killed and returned to
+        :attr:`~opan.const.EnumJobStatus.PENDING` before the exception
+        propagates.
+
+        Returns
+        -------
+        status
+            |dict| -- As for :attr:`status`
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            If a pending job needs more cores than the budget, as may
+            happen if the budget is reduced when resuming a campaign
+
+        """
+
+        # Imports
+        from concurrent.futures import wait, FIRST_COMPLETED
+        from .execute import execute_orca
+
+        queue = [n for (n, j) in self._jobs.items()
+                                            if j['status'] == _E_JS.PENDING]
+        for n in queue:
+            if self._jobs[n]['nprocs'] > self.cores:
+                raise ValueError("Job '{0}' needs {1} cores; budget is {2}"
+                            .format(n, self._jobs[n]['nprocs'], self.cores))
+            ## end if
+        ## next n
+        running = {}
+        free = self.cores
+        self._save_state()
+
+        try:
+            while queue or running:
+                # Start every waiting job that fits, in queue order
+                (waiting, changed) = ([], [])
+                for (i, name) in enumerate(queue):
+                    job = self._jobs[name]
+                    if free == 0:
+                        waiting.extend(queue[i:])
+                        break
+                    elif job['nprocs'] > free:
+                        waiting.append(name)
+                        continue
+                    ## end if
+                    changed.append(name)
+                    job.update(attempts=job['attempts'] + 1)
+                    try:
+                        fut = execute_orca(job['inp_tp'], job['work_dir'],
+                                self.exec_cmd, subs=job['subs'],
+                                subs_delims=self.subs_delims,
+                                sim_name=job['sim_name'],
+                                wait_to_complete=False, bohrs=self.bohrs,
+                                timeout=self.timeout)
+                    except Exception as e:
+                        # Could not even start; retrying will not help
+                        job.update(status=_E_JS.FAILED, error="{0}: {1}"
+                                            .format(type(e).__name__, e))
+                    else:
+                        running.update({ fut : name })
+                        free -= job['nprocs']
+                        job.update(status=_E_JS.RUNNING)
+                    ## end try
+                ## next name
+                queue = waiting
+                self._log_state(changed, _STATE_KEYS)
+
+                # Collect whatever finishes first
+                (done, _) = wait(running, return_when=FIRST_COMPLETED)
+                changed = []
+                for fut in done:
+                    name = running.pop(fut)
+                    job = self._jobs[name]
+                    free += job['nprocs']
+                    error = self._check(fut)
+                    if error is None:
+                        self.results.update({ name : fut.result() })
+                        job.update(status=_E_JS.DONE, error=None)
+                    elif job['attempts'] <= self.retries:
+                        queue.append(name)
+                        job.update(status=_E_JS.PENDING, error=error)
+                    else:
+                        job.update(status=_E_JS.FAILED, error=error)
+                    ## end if
+                    changed.append(name)
+                ## next fut
+                self._log_state(changed, _STATE_KEYS)
+            ## loop
+        finally:
+            if running:
+                for (fut, name) in running.items():
+                    fut.cancel()
+                    self._jobs[name].update(status=_E_JS.PENDING,
+                                attempts=self._jobs[name]['attempts'] - 1)
+                ## next (fut, name)
+                self._log_state(running.values(), _STATE_KEYS)
+            ## end if
+        ## end try
+
+        return self.status
+
+    ## end def run
+
+
+    def load_results(self, name):
+        """ Load the results of a job from its files on disk.
+
+        Parameters
+        ----------
+        name
+            |str| -- Name of the job
+
+        Returns
+        -------
+        results
+            |tuple| -- ``(OrcaOutput, OpanXYZ, OrcaEngrad, OrcaHess)``,
+            as for :func:`~opan.utils.execute.execute_orca`
+
+        """
+
+        # Imports
+        from ..const import DEF, EnumSoftware as E_SW, EnumFileType as E_FT
+        from .execute import _load_orca
+
+        job = self._jobs[name]
+        return _load_orca(job['work_dir'], job['sim_name'] + '.' +
+                            DEF.FILE_EXTS[E_SW.ORCA][E_FT.OUTPUT],
+                            job['sim_name'], self.bohrs)
+
+    ## end def load_results
+
+
+    def _add(self, name, inp_tp, work_dir, subs=None, sim_name="orcarun",
+                                                            nprocs=None):
+        """ Add a job as for :meth:`add`; |True| if its entry changed. """
+
+        # Imports
+        import os
+        from .base import template_subst
+
+        subs = {} if subs is None else dict(subs)
+        if nprocs is None:
+            nprocs = pal_nprocs(template_subst(inp_tp, subs,
+                                            delims=self.subs_delims))
+        ## end if
+        if not (isinstance(nprocs, int) and nprocs > 0):
+            raise ValueError("'nprocs' must be a positive integer")
+        ## end if
+        if nprocs > self.cores:
+            raise ValueError("Job '{0}' needs {1} cores; budget is {2}"
+                                    .format(name, nprocs, self.cores))
+        ## end if
+
+        defn = dict(inp_tp=inp_tp, work_dir=os.path.abspath(work_dir),
+                        subs=subs, sim_name=sim_name, nprocs=nprocs)
+
+        slot = (defn['work_dir'], sim_name)
+        other = self._slots.get(slot, name)
+        if other != name:
+            raise ValueError("Job '{0}' collides with job '{1}'"
+                                                    .format(name, other))
+        ## end if
+
+        old = self._jobs.get(name)
+        if old is not None:
+            if all(old[k] == defn[k] for k in _DEFN_KEYS):
+                return False
+            ## end if
+            self._slots.pop((old['work_dir'], old['sim_name']))
+        ## end if
+
+        defn.update(status=_E_JS.PENDING, attempts=0, error=None)
+        self._jobs.update({ name : defn })
+        self._slots.update({ slot : name })
+        self.results.pop(name, None)
+        return True
+
+    ## end def _add
+
+
+    @staticmethod
+    def _check(fut):
+        """ Description of the failure of a finished run, or |None|. """
+
+        try:
+            out = fut.result()[0]
+        except Exception as e:
+            return "{0}: {1}".format(type(e).__name__, e)
+        ## end try
+
+        if out is None:
+            return "No output file"
+        elif not out.completed:
+            return "ORCA did not terminate normally"
+        ## end if
+
+        return None
+
+    ## end def _check
+
+
+    def _load_state(self):
+        """ Restore the queue from the state file.
+
+        Each line holds the name of a job and either its full entry or
+        an update of its run state, applied in order. An incomplete
+        final line, as left by a write that was cut short, is ignored.
+
+        """
+
+        # Imports
+        import json
+        from collections import OrderedDict
+
+        with open(self.state_path) as in_fl:
+            lines = in_fl.read().split('\n')
+        ## end with
+
+        self._jobs = OrderedDict()
+        for line in lines[:-1]:
+            job = json.loads(line)
+            name = job.pop('name')
+            if name in self._jobs:
+                self._jobs[name].update(job)
+            else:
+                self._jobs.update({ name : job })
+            ## end if
+        ## next line
+
+        self._slots = {}
+        for (name, job) in self._jobs.items():
+            if job['status'] == _E_JS.RUNNING:
+                job.update(status=_E_JS.PENDING,
+                                            attempts=job['attempts'] - 1)
+            ## end if
+            self._slots.update({ (job['work_dir'], job['sim_name']) : name })
+        ## next (name, job)
+
+        # Drop any incomplete line, so that later entries are not
+        #  appended to it
+        if lines[-1]:
+            self._save_state()
+        ## end if
+
+    ## end def _load_state
+
+
+    def _log_state(self, names, keys):
+        """ Append entries of jobs to the state file, if in use.
+
+        Parameters
+        ----------
+        names
+            iterable of |str| -- Jobs to record
+
+        keys
+            |tuple| of |str| -- Keys of each job entry to record
+
+        """
+
+        # Imports
+        import json
+
+        if self.state_path is None:
+            return
+        ## end if
+
+        lines = []
+        for n in names:
+            job = dict((k, self._jobs[n][k]) for k in keys)
+            job.update(name=n)
+            lines.append(json.dumps(job, sort_keys=True) + '\n')
+        ## next n
+
+        if lines:
+            with open(self.state_path, 'a') as out_fl:
+                out_fl.write(''.join(lines))
+            ## end with
+        ## end if
+
+    ## end def _log_state
+
+
+    def _save_state(self):
+        """ Rewrite the state file atomically, if in use. """
+
+        # Imports
+        import json, os, tempfile
+
+        if self.state_path is None:
+            return
+        ## end if
+
+        lines = []
+        for (n, j) in self._jobs.items():
+            job = dict(j)
+            job.update(name=n)
+            lines.append(json.dumps(job, sort_keys=True) + '\n')
+        ## next (n, j)
+
+        (fd, tmp) = tempfile.mkstemp(suffix='.tmp',
+                    dir=os.path.dirname(os.path.abspath(self.state_path)))
+        try:
+            with os.fdopen(fd, 'w') as out_fl:
+                out_fl.write(''.join(lines))
+            ## end with
+            os.replace(tmp, self.state_path)
+        except Exception:
+            os.remove(tmp)
+            raise
+        ## end try
+
+    ## end def _save_state
+
+## end class OrcaScheduler
+
+
+if __name__ == '__main__':      # pragma: no cover
+    print("Module not executable.")
@@ -221,15 +221,63 @@ def symm_op(g, ax, theta, do_refl):
 
 
 def geom_symm_match(g, atwts, ax, theta, do_refl):
-    """ [Revised match factor calculation]
+    """ Match factor of a geometry with its image under a symmetry operation.
+
+    The match factor is computed as follows. Each coordinate of each atom
+    in `g` and in its transform is augmented by its atomic weight as an
+    imaginary part. The (complex) distance between every atom of `g` and
+    every atom of the transform is then scaled by the larger of the two
+    atoms' augmented vector norms, or by unity if both are smaller. The
+    factor is the maximum over the atoms of `g` of the smallest scaled
+    distance to any transformed atom, capped at unity.
+
+    Augmenting each coordinate by an imaginary weight :math:`w` is
+    equivalent to appending a fourth, real coordinate of
+    :math:`\\sqrt{3}\\,w`, so the distances are Euclidean in four
+    dimensions. The nearest transformed atom to each atom is thus located
+    with a KD-tree in :math:`O(\\log N)`, and only the transformed atoms
+    close enough to possibly give a smaller scaled distance are examined
+    further.
+
+    Parameters
+    ----------
+    g
+        length-3N |npfloat_| --
+        Geometry to test, centered at the origin
+
+    atwts
+        length-N |npfloat_| --
+        Atomic weights of the atoms
+
+    ax
+        length-3 |npfloat_| --
+        Axis of the operation
+
+    theta
+        |npfloat_| --
+        Rotation angle about `ax`, in radians
+
+    do_refl
+        |bool| --
+        If |True|, the rotation is followed by reflection through the
+        plane normal to `ax`
+
+    Returns
+    -------
+    fac
+        |npfloat_| --
+        Match factor on the interval [0, 1]; zero for an exact match
 
-    .. todo:: Complete geom_symm_match docstring
+    Raises
+    ------
+    ~exceptions.ValueError
+        If the size of `g` is not three times that of `atwts`
 
     """
 
     # Imports
     import numpy as np
-    from scipy import linalg as spla
+    from scipy.spatial import cKDTree
 
     # Convert g and atwts to n-D vectors
     g = make_nd_vec(g, nd=None, t=np.float64, norm=False)
@@ -243,53 +291,39 @@ def geom_symm_match(g, atwts, ax, theta, do_refl):
     # Calculate transformed geometry
     gx = symm_op(g, ax, theta, do_refl)
 
-    # Push g to a column vector
-    g = g.reshape((g.shape[0],1))
-
-    # Augment g and gx with imaginary atomic weights
-    ex_wts = atwts.repeat(3,axis=0).T.reshape((atwts.shape[0]*3,1)) * 1.j
-    g = np.add(g, ex_wts)
-    gx = np.add(gx, ex_wts)
-
-##        # Define calc as the outer product of the augmented vectors
-##        calc = np.dot(g.reshape((g.shape[0],1)), \
-##                            np.reciprocal(gx.reshape((1,gx.shape[0]))))
-##
-##        # Calculate the complex magnitude of each element and take log10,
-##        #  then abs again
-##        calc = np.abs(np.log10(np.abs(calc)))
-
-    # Expand g and gx as column vectors of coordinates
-    calc_g = g.reshape((g.shape[0] // 3, 3))
-    calc_gx = gx.reshape((gx.shape[0] // 3, 3))
-##
-##        # Expand each into a square matrix of identical column vectors
-##        calc_g = calc_g.repeat(g.shape[0], axis=1)
-##        calc_gx = gx.repeat(gx.shape[0], axis=1)
-
-    # Calc is the absolute distance between the calc-ed values,
-    #  scaled by the maximum of the individual atom distances or unity.
-
-    # Calculate the unscaled distances
-    calc = [[spla.norm(np.subtract(calc_g[i,:], calc_gx[j,:])) \
-                            for j in range(calc_gx.shape[0])] \
-                            for i in range(calc_g.shape[0])]
-
-    # Calculate the scale factors
-    scale_g = np.array([spla.norm(calc_g[i,:]) for i in \
-                range(calc_g.shape[0])]).reshape((calc_g.shape[0],1)) \
-                .repeat(calc_g.shape[0], axis=1)
-    scale_gx = np.array([spla.norm(calc_gx[j,:]) for j in \
-                range(calc_g.shape[0])]).reshape((1,calc_gx.shape[0])) \
-                .repeat(calc_gx.shape[0], axis=0)
-    scale = np.maximum(np.maximum(scale_g, scale_gx),
-                np.ones_like(scale_g, dtype=np.float64))
-
-    # Scale calc
-    calc = np.divide(calc, scale)
-
-    # Take the minimum of each row
-    mins = np.min(calc, axis=1)
+    # Augment g and gx with the weights as the fourth coordinate
+    ex_wts = np.sqrt(3.0) * atwts
+    pts_g = np.column_stack((g.reshape((-1, 3)), ex_wts))
+    pts_gx = np.column_stack((gx.reshape((-1, 3)), ex_wts))
+
+    # Calculate the scale factors, the augmented norms
+    scale_g = np.sqrt(np.sum(pts_g * pts_g, axis=1))
+    scale_gx = np.sqrt(np.sum(pts_gx * pts_gx, axis=1))
+
+    # Locate the nearest transformed atom to each atom. The scaled distance
+    #  to it is an upper bound on the minimum scaled distance for the atom.
+    tree = cKDTree(pts_gx)
+    dists, nbrs = tree.query(pts_g)
+    mins = dists / np.maximum(np.maximum(scale_g, scale_gx[nbrs]), 1.0)
+
+    # Refine the minimum for each atom. A transformed atom at unscaled
+    #  distance d can only give a smaller scaled distance than the bound m
+    #  if d < m * max(scale_g + d, 1), by the triangle inequality; i.e., if
+    #  d < max(m, m * scale_g / (1 - m)). If the bound is at least unity,
+    #  all transformed atoms are checked.
+    for i in range(pts_g.shape[0]):
+        if mins[i] < 1.0:
+            rad = max(mins[i], mins[i] * scale_g[i] / (1.0 - mins[i]))
+            cands = tree.query_ball_point(pts_g[i], rad * (1.0 + 1e-8))
+        else:
+            cands = slice(None)
+        ## end if
+        calc = np.sqrt(np.sum((pts_gx[cands] - pts_g[i])**2, axis=1)) / \
+                np.maximum(np.maximum(scale_gx[cands], scale_g[i]), 1.0)
+        if calc.shape[0] > 0:
+            mins[i] = min(mins[i], np.min(calc))
+        ## end if
+    ## next i
 
     # Take the maximum of the minima for the final factor
     fac = np.max(mins)
@@ -695,6 +729,127 @@ def geom_find_group(g, atwts, pr_ax, mom, tt, \
 ## end def geom_find_group
 
 
+def find_groups(geoms, atwts, workers=None, chunk=None,
+        nmax=_DEF.SYMM_MATCH_NMAX,
+        tol=_DEF.SYMM_MATCH_TOL,
+        dig=_DEF.SYMM_ATWT_ROUND_DIGITS,
+        avmax=_DEF.SYMM_AVG_MAX):
+    """ Point-group assignment for an ensemble of geometries.
+
+    Each geometry is centered, its principal axes and moments are computed
+    (via :func:`opan.utils.inertia.principals_multi`), and the result is
+    passed to :func:`geom_find_group`. The ensemble is split into contiguous
+    chunks that are distributed over a
+    :class:`concurrent.futures.ProcessPoolExecutor`; the results are
+    returned in input order regardless of completion order.
+
+    Any exception raised for a geometry propagates out of this function,
+    as for a direct call to :func:`geom_find_group`.
+
+    Parameters
+    ----------
+    geoms
+        k x 3N |npfloat_| --
+        Stack of geometries, one per row, all with the same atoms in the
+        same order
+
+    atwts
+        length-N |npfloat_| --
+        Atomic weights, common to all geometries
+
+    workers
+        |int|, optional --
+        Number of worker processes. |None| uses :func:`os.cpu_count`;
+        ``1`` runs serially in the calling process.
+
+    chunk
+        |int|, optional --
+        Number of geometries per dispatched task. |None| sizes the chunks
+        to give about four tasks per worker.
+
+    nmax, tol, dig, avmax
+        Passed through to :func:`geom_find_group`
+
+    Returns
+    -------
+    groups
+        |list| --
+        :func:`geom_find_group` result for each geometry, in input order
+
+    Raises
+    ------
+    ~exceptions.ValueError
+        If `geoms` is not a 2-D stack, or if `workers` or `chunk` is
+        not a positive integer
+
+    """
+
+    # Imports
+    import numpy as np
+    import os
+    from numbers import Integral
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Proof the inputs
+    geoms = np.asarray(geoms, dtype=np.float64)
+    if len(geoms.shape) != 2:
+        raise ValueError("Geometries are not a k x 3N stack")
+    ## end if
+    if workers is None:
+        workers = os.cpu_count() or 1
+    ## end if
+    if not (isinstance(workers, Integral) and workers > 0):
+        raise ValueError("'workers' must be a positive integer")
+    ## end if
+    if chunk is None:
+        chunk = max(1, -(-geoms.shape[0] // (4 * workers)))
+    ## end if
+    if not (isinstance(chunk, Integral) and chunk > 0):
+        raise ValueError("'chunk' must be a positive integer")
+    ## end if
+
+    # Common arguments for every chunk
+    args = (atwts, nmax, tol, dig, avmax)
+
+    # Serial case; no point starting a pool
+    if workers == 1 or geoms.shape[0] <= chunk:
+        return _find_groups_chunk(geoms, *args)
+    ## end if
+
+    # Dispatch the chunks and collect in submission (= input) order
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futs = [ex.submit(_find_groups_chunk, geoms[i:i + chunk], *args)
+                            for i in range(0, geoms.shape[0], chunk)]
+        groups = [grp for fut in futs for grp in fut.result()]
+    ## end with
+
+    return groups
+
+## end def find_groups
+
+
+def _find_groups_chunk(geoms, atwts, nmax, tol, dig, avmax):
+    """ Worker for :func:`find_groups`; processes one chunk serially.
+
+    Module-level so that it can be pickled to the worker processes.
+
+    """
+
+    # Imports
+    from .inertia import _ctr_stack, principals_multi
+
+    # principals_multi centers the stack itself; geom_find_group needs the
+    #  centered geometries too, as flat vectors
+    moms, axes, tops = principals_multi(geoms, atwts)
+    ctrs = _ctr_stack(geoms, atwts)[0].reshape(geoms.shape)
+
+    # Assign the groups
+    return [geom_find_group(g, atwts, ax, mom, tt, nmax, tol, dig, avmax)
+                for g, ax, mom, tt in zip(ctrs, axes, moms, tops)]
+
+## end def _find_groups_chunk
+
+
 def g_subset(g, atwts, atwt,
             digits=_DEF.SYMM_ATWT_ROUND_DIGITS):
     """ Extract a subset of a geometry matching a desired atom.
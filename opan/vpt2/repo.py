@@ -29,10 +29,22 @@
 
 .. autoclass:: OpanAnharmRepo
 
+.. autoclass:: CacheInfo
+
 
 """
 
 # Imports
+import re as _re
+from collections import namedtuple as _namedtuple
+from contextlib import contextmanager as _contextmanager
+from ..const import DEF as _DEF
+
+
+#: Statistics of the read cache of an :class:`OpanAnharmRepo`, as
+#: returned by :meth:`OpanAnharmRepo.cache_info`
+CacheInfo = _namedtuple('CacheInfo', ['hits', 'misses', 'maxsize',
+                                                            'currsize'])
 
 
 class OpanAnharmRepo(object):
@@ -42,8 +54,124 @@ class OpanAnharmRepo(object):
     Such consistency must be checked/handled at a higher level. This is just
     a wrapper class to facilitate I/O interactions!
 
-    Currently no chunking or any filters are used. May or may not be worth
-    robustification. Things stored are not likely to be huge....
+    **Storage Layout**
+
+    The HDF5 dataset layout of each
+    :class:`~opan.const.EnumAnharmRepoData` type is set by the `storage`
+    argument when a repository is created, and is recorded in the
+    repository as the
+    :attr:`~opan.const.EnumAnharmRepoParam.STORAGE` parameter, which
+    governs all later stores. `storage` is a |dict| of options, applied
+    to all data types, or a |dict| of such |dict| keyed by data type.
+    The options are:
+
+    ``'chunks'``
+        |True| for chunks sized by :mod:`h5py`, ``'full'`` for one chunk
+        per dataset, or a |tuple| of |int| chunk shape, trimmed to the
+        shape of each dataset
+
+    ``'compression'``
+        ``'gzip'`` or ``'lzf'``
+
+    ``'compression_opts'``
+        |int| gzip level, 0 to 9
+
+    ``'shuffle'``
+        |bool| -- Whether to apply the byte-shuffle filter, which
+        usually improves the compression of floating-point data
+
+    Compression and shuffling imply chunking. Scalar data, such as
+    energies, are always stored contiguously. Without options, datasets
+    are stored contiguously and unfiltered, as in repositories that
+    predate the storage parameter; such a repository opened without
+    `storage` is left as is.
+
+    **Data Layout**
+
+    The data of the displaced geometries are arranged per the `layout`
+    argument when a repository is created, recorded in the repository as
+    the :attr:`~opan.const.EnumAnharmRepoParam.LAYOUT` parameter:
+
+    :attr:`~opan.const.EnumAnharmRepoLayout.GROUPED`
+        The default, and the arrangement of repositories that predate
+        the layout parameter: one group per mode and displacement
+        direction, holding one dataset per data type
+
+    :attr:`~opan.const.EnumAnharmRepoLayout.STACKED`
+        One floating-point dataset per data type in the ``stacked``
+        group, of shape ``(n_modes, 2, ...)``, the second axis running
+        over the :attr:`~opan.const.EnumDispDirection.NEGATIVE` and
+        :attr:`~opan.const.EnumDispDirection.POSITIVE` directions, with
+        a companion boolean mask of the values stored. Values not stored
+        are NaN. The stacks grow along the mode axis as needed, and so
+        are always chunked: a ``'chunks'`` shape in `storage` applies to
+        each value, and each chunk holds as many modes as fit in
+        :attr:`stack_chunk_bytes`, or one
+
+    Values at the reference geometry are stored the same way in either.
+    :meth:`store_data`, :meth:`get_data` and :meth:`has_data` work
+    alike on both, as do the bulk :meth:`store_many`, :meth:`get_all`
+    and :meth:`has_all`; the latter are a single read or write of a
+    stacked repository, but one per value of a grouped one.
+    :meth:`migrate` rearranges an existing repository.
+
+    **Caching**
+
+    Values read by :meth:`get_data` and :meth:`get_param`, and thus by
+    :meth:`has_data`, :meth:`has_param` and :meth:`get_XYZ`, are kept in
+    an in-memory least-recently-used cache, as is the absence of values
+    sought but not found. A repeat read is served from the cache without
+    validating its arguments or touching the file; arrays are returned
+    as copies, so that callers may modify them freely. The cache holds
+    at most `cache_size` bytes of values, and is emptied by
+    :meth:`close`, :meth:`load` and a rolled-back batch. A store drops
+    the entries it overwrites. :meth:`cache_info` reports the hit and
+    miss counts and the current size, for tuning `cache_size`, and
+    :meth:`cache_clear` resets the cache and the counts.
+
+    **Access Modes**
+
+    The `mode` argument, an :class:`~opan.const.EnumAnharmRepoMode`, sets
+    how the file is opened. The default,
+    :attr:`~opan.const.EnumAnharmRepoMode.READWRITE`, allows no other
+    process to access the file while it is open, and
+    :attr:`~opan.const.EnumAnharmRepoMode.READONLY` no other process to
+    write it. In the read-only modes, every store raises
+    |RepoError| (typecode :attr:`~opan.error.RepoError.STATUS`).
+
+    For one process to write a repository while others read it, the
+    writer opens it as
+    :attr:`~opan.const.EnumAnharmRepoMode.SWMR_WRITE`, stores the
+    parameters and reference-geometry data, and then calls
+    :meth:`start_swmr`, after which readers may open it as
+    :attr:`~opan.const.EnumAnharmRepoMode.SWMR_READ`. HDF5 forbids the
+    creation of any dataset or group once SWMR writing has started, so
+    the repository must be stacked (see *Data Layout*, above), with the
+    stack of each data type to be stored created beforehand, e.g., by
+    the `shapes` argument of :meth:`start_swmr`. Displaced data are then
+    stored as usual, growing the stacks, and each store or batch is
+    visible to readers once it returns. Readers call :meth:`refresh` to
+    see data stored since they opened the file or last refreshed.
+    The SWMR modes require HDF5 1.10 or later.
+
+    **Batched Writes**
+
+    Outside a batch, every :meth:`store_data` and :meth:`store_param`
+    sets the dirty flag and flushes the file, so that each store is on
+    disk when the call returns. Within ``with repo.batch():``, the dirty
+    flag is set and flushed once, before the first store of the batch,
+    and the file is flushed once more when the batch exits, committing
+    it. If the batch exits by an exception, its stores are instead
+    rolled back: datasets and groups it created are deleted, and
+    datasets it overwrote with `clobber` are restored. Nested batches
+    join the outermost one.
+
+    The crash-safety guarantee is thus per batch rather than per store:
+    if the process dies within a batch, the stores of that batch may be
+    partly on disk or absent, but all earlier batches are intact, and
+    the repository is left flagged dirty. As for any HDF5 file not
+    opened for SWMR, a crash while the file is being modified may
+    leave it in need of repair (e.g., with ``h5clear``).
 
     .. todo:: Main docstring for OpanAnharmRepo (renamed to VPT2...)
 
@@ -74,17 +202,37 @@ class OpanAnharmRepo(object):
     # Data group names
     G_param = 'param'
     G_geom_ref = 'geom_ref'
+    G_stacked = 'stacked'
     G = frozenset([
                 G_geom_ref,
-                G_param
+                G_param,
+                G_stacked
                     ])
 
-    # Dynamic formatting names
+    # Dynamic formatting names, and the pattern they produce
     F_mode_fmt = 'm%05d%c'
+    P_mode_grp = _re.compile('^m(\\d{5,})([np])$')
+
+    # Target size of the chunks of stacked datasets
+    stack_chunk_bytes = 2**16
+
+    # Nominal bytes charged to each read-cache entry, beyond its values
+    cache_entry_bytes = 64
+
+    # Storage layout options, and their valid settings where enumerable
+    storage_opts = frozenset(['chunks', 'compression', 'compression_opts',
+                                                                'shuffle'])
+    storage_compressions = frozenset(['gzip', 'lzf'])
 
     # String for 'dirty' flag
     N_dirty = 'dirty'
 
+    # Suffix of datasets set aside by a clobber within a batch
+    S_backup = '.bak'
+
+    # Suffix of the presence mask of a stacked dataset
+    S_mask = '.mask'
+
     # dict for translating DispDir enum to direction code
     dircode = {
                 _E_DD.NEGATIVE: 'n',
@@ -92,21 +240,87 @@ class OpanAnharmRepo(object):
                 _E_DD.POSITIVE: 'p'
                 }
 
+    # dict for translating DispDir enum to index along the direction
+    #  axis of stacked data
+    dispidx = {
+                _E_DD.NEGATIVE: 0,
+                _E_DD.POSITIVE: 1
+                }
+
 
     # Instance methods
-    def __init__(self, fname=None):
-        """ .. todo:: REPO.__init__ docstring
+    def __init__(self, fname=None, storage=None, layout=None,
+                                    cache_size=_DEF.REPO_CACHE_MAX_SIZE,
+                                    mode=None):
+        """ Bind a repository file, if given.
+
+        Parameters
+        ----------
+        fname
+            |str|, optional -- Path of the HDF5 repository file, created
+            if absent. |None| leaves the instance unbound, for later
+            :meth:`load`.
+
+        storage
+            |dict|, optional -- Dataset storage layout; see *Storage
+            Layout*, above. If `fname` is already a repository with a
+            recorded layout, `storage` must be |None| or match it.
+
+        layout
+            :class:`~opan.const.EnumAnharmRepoLayout`, optional --
+            Arrangement of the displaced data; see *Data Layout*, above.
+            If `fname` is already a repository, `layout` must be |None|
+            or match its arrangement; use :meth:`migrate` to change it.
+
+        cache_size
+            |int|, optional -- Limit in bytes on the size of the read
+            cache; see *Caching*, above. Zero disables the cache.
+
+        mode
+            :class:`~opan.const.EnumAnharmRepoMode`, optional -- Access
+            mode of `fname`; see *Access Modes*, above. Default is
+            :attr:`~opan.const.EnumAnharmRepoMode.READWRITE`.
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            If `storage` is malformed, `layout` or `mode` is invalid, or
+            `cache_size` is not a non-negative |int|
+
+        ~opan.error.RepoError
+            (typecode :attr:`~opan.error.RepoError.STATUS`) If `storage`
+            or `layout` conflicts with that recorded in the repository,
+            or if a SWMR `mode` is not supported by the HDF5 library
 
         """
 
         # Imports
-        import h5py as h5
+        from ..const import EnumAnharmRepoLayout as E_ARL
+
+        # Proof the layouts before touching any file
+        self._storage_req = self._norm_storage(storage)
+        self.storage = self._norm_storage({})
+        self._layout_req = self._check_layout(layout)
+        self.layout = E_ARL.GROUPED
+
+        # Empty read cache
+        if not (isinstance(cache_size, int) and cache_size >= 0):
+            raise ValueError("'cache_size' must be a non-negative integer")
+        ## end if
+        self.cache_size = cache_size
+        self.cache_clear()
+
+        # No batch in progress
+        self._batch = None
+        self._batch_depth = 0
 
         # If string passed, try opening h5.File; otherwise init with repo
         #  link as None
+        self.mode = self._check_mode(mode)
         if isinstance(fname, str):
             self.fname = fname
-            self._repo = h5.File(fname)
+            self._repo = self._open(fname, self.mode)
+            self._init_storage()
         elif fname is None:
             self._repo = None
             self.fname = None
@@ -125,10 +339,18 @@ class OpanAnharmRepo(object):
         import h5py as h5
         from ..error import RepoError
 
+        # Cannot close with a batch uncommitted
+        if self._batch_depth > 0:
+            raise RepoError(RepoError.STATUS,
+                    "Cannot close within a batch",
+                    "File: {0}".format(self.fname))
+        ## end if
+
         # Close the repo if it's bound, and wipe link; else complain
         if self._repo != None:
             self._repo.close()
             self._repo = None
+            self._cache_discard()
             # Leave self.fname defined for potential easy re-opening later on.
         else:
             raise RepoError(RepoError.STATUS,
@@ -139,8 +361,11 @@ class OpanAnharmRepo(object):
     ## end def close
 
 
-    def load(self, fname):
+    def load(self, fname, storage=None, layout=None, mode=None):
         """ .. todo:: REPO.load docstring
+
+        `storage`, `layout` and `mode` are as for :meth:`__init__`.
+
         """
 
         # Imports
@@ -156,8 +381,13 @@ class OpanAnharmRepo(object):
 
         # If string passed, try opening h5.File; otherwise complain
         if isinstance(fname, str):
+            self._storage_req = self._norm_storage(storage)
+            self._layout_req = self._check_layout(layout)
+            self.mode = self._check_mode(mode)
+            self._cache_discard()
             self.fname = fname
-            self._repo = h5.File(fname)
+            self._repo = self._open(fname, self.mode)
+            self._init_storage()
         else:
             raise TypeError("Invalid filename type: {0}".format(type(fname)))
         ## end if
@@ -189,9 +419,14 @@ class OpanAnharmRepo(object):
 
         # Imports
         import h5py as h5
+        import numpy as np
         from ..error import RepoError as RErr
         from ..const import EnumDispDirection as _E_DD
         from ..const import EnumAnharmRepoData
+        from ..const import EnumAnharmRepoLayout as E_ARL
+
+        # Must be open for writing
+        self._check_store()
 
         # Must be valid mode
         if not (mode >=0 and isinstance(mode, int)):
@@ -210,6 +445,36 @@ class OpanAnharmRepo(object):
                     "data type enum value".format(datatype))
         ## end if
 
+        # Drop any cached value, or absence; the reference-geometry group
+        #  serves every mode
+        if disp == _E_DD.NO_DISP:
+            self._cache_discard(lambda k: k[0] == datatype and
+                                                    k[2] == _E_DD.NO_DISP)
+        else:
+            self._cache_discard(key=(datatype, mode, disp))
+        ## end if
+
+        # Displaced data of a stacked repository go in place in the stack
+        if disp != _E_DD.NO_DISP and self.layout == E_ARL.STACKED:
+            if self._repo is None:
+                raise RErr(RErr.STATUS,
+                            "Cannot store; no repository open", "")
+            ## end if
+            d = self.dispidx[disp]
+            (dset, mask) = self._stack_dsets(datatype, np.shape(data),
+                                                                mode + 1)
+            if mask[mode, d] and not clobber:
+                raise RErr(RErr.DATA,
+                        "Data to be stored exist and clobber == False",
+                        self._repo.filename)
+            ## end if
+            self._log_rows(datatype, dset, mask, slice(mode, mode + 1))
+            dset[mode, d] = data
+            mask[mode, d] = True
+            self._post_store()
+            return
+        ## end if
+
         # Get the appropriate geom group name
         if disp == _E_DD.NO_DISP:
             grpname = self.G_geom_ref
@@ -218,8 +483,9 @@ class OpanAnharmRepo(object):
         ## end if
 
         # Get the group, creating if absent
+        self._check_create()
         try:
-            grp = self._repo.require_group(grpname)
+            grp = self._require_group(grpname)
         except AttributeError:
             # Presume repo not open/attached
             raise RErr(RErr.STATUS,
@@ -231,7 +497,7 @@ class OpanAnharmRepo(object):
         #  and h5py can't do that
         if datatype in grp.keys():
             if clobber:
-                grp.pop(datatype)
+                self._remove(grp, datatype)
             else:
                 raise RErr(RErr.DATA,
                         "Dataset to be stored exists and clobber == False",
@@ -239,25 +505,39 @@ class OpanAnharmRepo(object):
             ## end if
         ## end if
 
-        # Store the new data. DOES NOT ENSURE CONSISTENCY with any
-        #  other data in the repository.
-        grp.create_dataset(datatype, data=data)
+        # Store the new data, in the layout for the type. DOES NOT ENSURE
+        #  CONSISTENCY with any other data in the repository.
+        kwargs = self._dset_kwargs(datatype, data)
+        self._pre_store()
+        grp.create_dataset(datatype, data=data, **kwargs)
 
-        # Set as dirty and flush the repo
-        self.set_dirty(True)
-        self._repo.flush()
+        # Set as dirty and flush the repo, or log to the batch
+        self._post_store(grp, datatype)
 
     ## end def store_geom
 
 
     def get_data(self, datatype, mode, disp):
         """ .. todo:: docstring for get_data
+
+        Served from the read cache where possible; see *Caching*, above.
+
         """
 
+        return self._cache_read((datatype, mode, disp), self._get_data,
+                                                    datatype, mode, disp)
+
+    ## end def get_data
+
+
+    def _get_data(self, datatype, mode, disp):
+        """ Read a value from the file, for :meth:`get_data`. """
+
         # Imports
         import os
         from ..const import EnumDispDirection as _E_DD
         from ..const import EnumAnharmRepoData
+        from ..const import EnumAnharmRepoLayout as E_ARL
         from ..error import RepoError as RErr
 
         # Must be valid mode
@@ -277,6 +557,22 @@ class OpanAnharmRepo(object):
                     "repository data type enum value".format(datatype))
         ## end if
 
+        # Displaced data of a stacked repository come from the stack
+        if disp != _E_DD.NO_DISP and self.layout == E_ARL.STACKED:
+            if self._repo is None:
+                raise RErr(RErr.STATUS,
+                            "Cannot load; no repository open", "")
+            ## end if
+            d = self.dispidx[disp]
+            (dset, mask) = self._stack_dsets(datatype)
+            if dset is None or mode >= mask.shape[0] or not mask[mode, d]:
+                raise RErr(RErr.DATA,
+                        "'{0}' data for mode {1}, direction {2} not found"
+                        .format(datatype, mode, disp), self.fname)
+            ## end if
+            return dset[mode, d]
+        ## end if
+
         # Get the appropriate geom group name
         if disp == _E_DD.NO_DISP:
             grpname = self.G_geom_ref
@@ -301,18 +597,18 @@ class OpanAnharmRepo(object):
         ## end if
 
         # Group found, try loading the data object; complain if not found
-        try:
-            out_data = grp.get(datatype).value
-        except AttributeError:
+        dset = grp.get(datatype)
+        if dset is None:
             raise RErr(RErr.DATA,
                     "Dataset '" + datatype + "' not found",
                     self.fname)
-        ## end try
+        ## end if
+        out_data = dset[()]
 
         # Return as-is (h5py creates NumPy arrays of appropriate dimensions)
         return out_data
 
-    ## end def get_data
+    ## end def _get_data
 
 
     def has_data(self, datatype, mode, disp):
@@ -341,6 +637,313 @@ class OpanAnharmRepo(object):
     ## end def has_data
 
 
+    def store_many(self, data, datatype, modes=None, clobber=False):
+        """ Store the displaced values of one data type for many modes.
+
+        Values that are entirely NaN are skipped, so that the output of
+        :meth:`get_all` may be stored as is. In a stacked repository,
+        the values are written in one operation; in a grouped one, they
+        are stored in one batch (see *Batched Writes*, above). Either
+        way, nothing is stored if any value would clobber one already
+        stored with `clobber` |False|.
+
+        Parameters
+        ----------
+        data
+            |nparray| -- Values, of shape ``(len(modes), 2, ...)``, the
+            second axis running over the
+            :attr:`~opan.const.EnumDispDirection.NEGATIVE` and
+            :attr:`~opan.const.EnumDispDirection.POSITIVE` directions
+
+        datatype
+            :class:`~opan.const.EnumAnharmRepoData` -- Type of the values
+
+        modes
+            iterable of |int|, optional -- Mode of each row of `data`.
+            Default is ``range(len(data))``.
+
+        clobber
+            |bool|, optional -- Whether to overwrite values already
+            stored
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            If `data`, `datatype` or `modes` is invalid
+
+        ~opan.error.RepoError
+            (typecode :attr:`~opan.error.RepoError.DATA`) If a value is
+            already stored and `clobber` is |False|, or if the values do
+            not match the shape of the stacked values already stored
+
+        """
+
+        # Imports
+        import numpy as np
+        from ..const import EnumAnharmRepoData as E_ARD
+        from ..const import EnumAnharmRepoLayout as E_ARL
+        from ..const import EnumDispDirection as _E_DD
+        from ..error import RepoError as RErr
+
+        if not datatype in E_ARD:
+            raise ValueError("'{0}' is not a valid data type enum value"
+                                                        .format(datatype))
+        ## end if
+        data = np.asarray(data, dtype=np.float_)
+        if data.ndim < 2 or data.shape[1] != 2:
+            raise ValueError("'data' must be of shape (n_modes, 2, ...)")
+        ## end if
+        modes = list(range(data.shape[0]) if modes is None else modes)
+        if not all(isinstance(m, (int, np.integer)) and m >= 0
+                                                            for m in modes):
+            raise ValueError("Modes must be non-negative integers")
+        ## end if
+        modes = [int(m) for m in modes]
+        if len(modes) != data.shape[0] or len(set(modes)) != len(modes):
+            raise ValueError("'modes' must be distinct, one per row of " +
+                                                                "'data'")
+        ## end if
+        if self._repo is None:
+            raise RErr(RErr.STATUS, "Cannot store; no repository open", "")
+        ## end if
+        self._check_store()
+        self._cache_discard(lambda k: k[0] == datatype and
+                                                    k[2] != _E_DD.NO_DISP)
+
+        # Values to store, by (row, direction)
+        present = ~np.isnan(data).all(axis=tuple(range(2, data.ndim)))
+        if not present.any():
+            return
+        ## end if
+
+        if self.layout == E_ARL.GROUPED:
+            dirs = sorted(self.dispidx, key=self.dispidx.get)
+            with self.batch():
+                for (i, d) in zip(*np.nonzero(present)):
+                    self.store_data(data[i, d], datatype, modes[i],
+                                                dirs[d], clobber=clobber)
+                ## next (i, d)
+            ## end with
+            return
+        ## end if
+
+        # Stacked: h5py selects rows by increasing index, or by slice
+        order = np.argsort(modes)
+        (data, present) = (data[order], present[order])
+        srt = np.array(modes)[order]
+        rows = srt.tolist()
+        if rows == list(range(rows[0], rows[-1] + 1)):
+            rows = slice(rows[0], rows[-1] + 1)
+        ## end if
+
+        # Check for clobbering before any stack is grown
+        (dset, mask) = self._stack_dsets(datatype)
+        if mask is not None and not clobber:
+            within = srt < mask.shape[0]
+            if (mask[()][srt[within]] & present[within]).any():
+                raise RErr(RErr.DATA,
+                        "Data to be stored exist and clobber == False",
+                        self._repo.filename)
+            ## end if
+        ## end if
+
+        (dset, mask) = self._stack_dsets(datatype, data.shape[2:],
+                                                        max(modes) + 1)
+        stored = mask[rows]
+        self._log_rows(datatype, dset, mask, rows)
+        block = dset[rows]
+        block[present] = data[present]
+        dset[rows] = block
+        mask[rows] = stored | present
+        self._post_store()
+
+    ## end def store_many
+
+
+    def get_all(self, datatype):
+        """ Stacked displaced values of one data type, for all modes.
+
+        Parameters
+        ----------
+        datatype
+            :class:`~opan.const.EnumAnharmRepoData` -- Type of the values
+
+        Returns
+        -------
+        data
+            |nparray| of |npfloat_| -- Values, of shape
+            ``(n_modes, 2, ...)``, as for :meth:`store_many`, with
+            `n_modes` one more than the highest mode stored. Values not
+            stored are NaN; see :meth:`has_all`.
+
+        Raises
+        ------
+        ~opan.error.RepoError
+            (typecode :attr:`~opan.error.RepoError.DATA`) If no displaced
+            values of `datatype` are stored
+
+        """
+
+        # Imports
+        import numpy as np
+        from ..const import EnumAnharmRepoLayout as E_ARL
+        from ..error import RepoError as RErr
+
+        if self.layout == E_ARL.STACKED:
+            (dset, mask) = self._stack_dsets(self._check_all(datatype))
+            out = None if dset is None else dset[()]
+        else:
+            index = self._grouped_index(self._check_all(datatype))
+            out = None
+            for ((m, d), grpname) in sorted(index.items()):
+                value = self._repo[grpname][datatype][()]
+                if out is None:
+                    out = np.full((max(index)[0] + 1, 2) + np.shape(value),
+                                                    np.nan, dtype=np.float_)
+                ## end if
+                out[m, d] = value
+            ## next ((m, d), grpname)
+        ## end if
+
+        if out is None:
+            raise RErr(RErr.DATA,
+                    "No displaced '{0}' data found".format(datatype),
+                    self.fname)
+        ## end if
+        return out
+
+    ## end def get_all
+
+
+    def has_all(self, datatype):
+        """ Which displaced values of one data type are stored.
+
+        Parameters
+        ----------
+        datatype
+            :class:`~opan.const.EnumAnharmRepoData` -- Type of the values
+
+        Returns
+        -------
+        present
+            |nparray| of |bool| -- Of shape ``(n_modes, 2)``, matching
+            the first two axes of :meth:`get_all`; ``(0, 2)`` if none
+            are stored
+
+        """
+
+        # Imports
+        import numpy as np
+        from ..const import EnumAnharmRepoLayout as E_ARL
+
+        if self.layout == E_ARL.STACKED:
+            (dset, mask) = self._stack_dsets(self._check_all(datatype))
+            if mask is not None:
+                return mask[()]
+            ## end if
+            return np.zeros((0, 2), dtype=bool)
+        ## end if
+
+        index = self._grouped_index(self._check_all(datatype))
+        out = np.zeros((max(index)[0] + 1 if index else 0, 2), dtype=bool)
+        for (m, d) in index:
+            out[m, d] = True
+        ## next (m, d)
+        return out
+
+    ## end def has_all
+
+
+    def migrate(self, layout):
+        """ Rearrange the displaced data into another layout.
+
+        All displaced data are moved in one batch (see *Batched Writes*,
+        above), and the new layout is recorded. HDF5 does not reclaim
+        the space of deleted datasets; repack the file (e.g., with
+        ``h5repack``) to shrink it afterward.
+
+        Parameters
+        ----------
+        layout
+            :class:`~opan.const.EnumAnharmRepoLayout` -- Layout sought;
+            if already in use, nothing is done
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            If `layout` is invalid
+
+        ~opan.error.RepoError
+            (typecode :attr:`~opan.error.RepoError.STATUS`) If no
+            repository is open
+
+        """
+
+        # Imports
+        from ..const import EnumAnharmRepoData as E_ARD
+        from ..const import EnumAnharmRepoLayout as E_ARL
+        from ..const import EnumAnharmRepoParam as E_ARP
+        from ..error import RepoError as RErr
+
+        layout = self._check_layout(layout)
+        if layout is None:
+            raise ValueError("'layout' must be given")
+        ## end if
+        if self._repo is None:
+            raise RErr(RErr.STATUS, "Cannot migrate; no repository open", "")
+        ## end if
+        self._check_store()
+        if layout == self.layout:
+            return
+        ## end if
+
+        old = self.layout
+        self._check_create()
+        with self.batch():
+            data = dict((dt, self.get_all(dt)) for dt in E_ARD
+                                                if self.has_all(dt).any())
+
+            # Set the old arrangement aside
+            if old == E_ARL.GROUPED:
+                names = [n for n in self._repo if self.P_mode_grp.match(n)]
+                for name in names:
+                    grp = self._repo[name]
+                    for dt in [dt for dt in E_ARD if dt in grp]:
+                        self._remove(grp, dt)
+                    ## next dt
+                ## next name
+            else:
+                grp = self._repo.get(self.G_stacked, {})
+                for dt in [dt for dt in E_ARD if dt in grp]:
+                    self._remove(grp, dt)
+                    self._remove(grp, dt + self.S_mask)
+                ## next dt
+            ## end if
+
+            try:
+                self.layout = layout
+                for (dt, values) in data.items():
+                    self.store_many(values, dt)
+                ## next (dt, values)
+                self.store_param(layout, E_ARP.LAYOUT, clobber=True)
+            except Exception:
+                self.layout = old
+                raise
+            ## end try
+        ## end with
+
+        # Drop the groups left empty
+        for name in list(self._repo):
+            if (self.P_mode_grp.match(name) or name == self.G_stacked) \
+                                            and len(self._repo[name]) == 0:
+                del self._repo[name]
+            ## end if
+        ## next name
+        self._flush()
+
+    ## end def migrate
+
+
     def store_param(self, value, param, clobber=False):
         """ .. todo:: store_param docstring
         """
@@ -354,10 +957,13 @@ class OpanAnharmRepo(object):
             raise ValueError("'{0}' is not a valid " +
                     "parameter enum value".format(param))
         ## end if
+        self._check_store()
+        self._check_create()
+        self._cache_discard(key=(self.G_param, param))
 
         # Get the params group, complaining if repo not bound
         try:
-            grp = self._repo.require_group(self.G_param)
+            grp = self._require_group(self.G_param)
         except AttributeError:
             raise RErr(RErr.STATUS,
                         "Cannot store; no repository open", "")
@@ -375,7 +981,7 @@ class OpanAnharmRepo(object):
         #  and h5py can't do that
         if param in grp.keys():
             if clobber:
-                grp.pop(param)
+                self._remove(grp, param)
             else:
                 raise RErr(RErr.DATA,
                         "Parameter to be stored exists and clobber == False",
@@ -385,19 +991,31 @@ class OpanAnharmRepo(object):
 
         # Store the new data. DOES NOT ENSURE CONSISTENCY with any
         #  other data in the repository.
+        self._pre_store()
         grp.create_dataset(param, data=value)
 
-        # Set as dirty and flush the repo
-        self.set_dirty(True)
-        self._repo.flush()
+        # Set as dirty and flush the repo, or log to the batch
+        self._post_store(grp, param)
 
     ## end def store_param
 
 
     def get_param(self, param):
         """ .. todo:: docstring for get_param
+
+        Served from the read cache where possible; see *Caching*, above.
+
         """
 
+        return self._cache_read((self.G_param, param), self._get_param,
+                                                                    param)
+
+    ## end def get_param
+
+
+    def _get_param(self, param):
+        """ Read a parameter from the file, for :meth:`get_param`. """
+
         # Imports
         import os
         from ..const import EnumAnharmRepoParam
@@ -409,29 +1027,34 @@ class OpanAnharmRepo(object):
                     "parameter enum value".format(param))
         ## end if
 
-        # Get the params group, complaining if repo not bound
+        # Get the params group, complaining if repo not bound. Not
+        #  'require_group', which cannot work in the read-only modes
         try:
-            grp = self._repo.require_group(self.G_param)
+            grp = self._repo.get(self.G_param)
         except AttributeError:
             raise RErr(RErr.STATUS,
                         "Cannot load; no repository open", "")
         ## end try
 
-        # Group should be guaranteed present with 'require_group', try
-        #  loading the parameter; complain if not found.
-        try:
-            out_param = grp.get(param).value
-        except AttributeError:
+        # Try loading the parameter; complain if it or the group is not
+        #  found. String parameters are read back as bytes by h5py 3 and
+        #  later; return them as str.
+        dset = None if grp is None else grp.get(param)
+        if dset is None:
             raise RErr(RErr.DATA,
                     "Parameter '" + param + "' not found",
                     self.fname)
-        ## end try
+        ## end if
+        out_param = dset[()]
+        if isinstance(out_param, bytes):
+            out_param = out_param.decode()
+        ## end if
 
         # Return
-        self._repo.flush()
+        self._flush()
         return out_param
 
-    ## end def get_param
+    ## end def _get_param
 
 
     def has_param(self, param):
@@ -467,17 +1090,23 @@ class OpanAnharmRepo(object):
 
         # Get the return value from the dataset, complaining if repo not
         #  bound. Using 'require_dataset' since any repo w/o a defined
-        #  'dirty' value is just going to be assumed to be dirty.
+        #  'dirty' value is just going to be assumed to be dirty; only
+        #  assumed so if the repo is read-only.
         try:
-            retval = self._repo.require_dataset(self.N_dirty, \
-                                shape=(), dtype=bool, data=True).value
+            if self._writable():
+                retval = self._repo.require_dataset(self.N_dirty, \
+                                shape=(), dtype=bool, data=True)[()]
+            else:
+                dset = self._repo.get(self.N_dirty)
+                retval = True if dset is None else dset[()]
+            ## end if
         except AttributeError:
             raise RErr(RErr.STATUS,
                         "Cannot report dirty status; no repository open", "")
         ## end try
 
         # Either way it evaluated, should be good to return. Flush first.
-        self._repo.flush()
+        self._flush()
         return retval
 
     ## end def is_dirty
@@ -487,10 +1116,14 @@ class OpanAnharmRepo(object):
         """ .. todo:: set_clean docstring
         """
 
+        # Imports
+        from ..error import RepoError as RErr
+
         # Complain if 'dirty' isn't boolean
         if not isinstance(dirty, bool):
             raise ValueError("'dirty' must be Boolean")
         ## end if
+        self._check_store()
 
         # Try to retrieve the dataset; complain if repo not bound.
         try:
@@ -508,6 +1141,845 @@ class OpanAnharmRepo(object):
     ## end def set_dirty
 
 
+    @_contextmanager
+    def batch(self):
+        """ Context manager grouping stores into one committed batch.
+
+        See *Batched Writes*, above. The ``as`` target is the repository.
+
+        Raises
+        ------
+        ~opan.error.RepoError
+            (typecode :attr:`~opan.error.RepoError.STATUS`) On entry, if
+            no repository is open
+
+        """
+
+        # Imports
+        from ..error import RepoError as RErr
+
+        if not self.is_open():
+            raise RErr(RErr.STATUS,
+                        "Cannot start batch; no repository open", "")
+        ## end if
+
+        # Nested batches join the outermost
+        if self._batch_depth == 0:
+            self._batch = {'new': set(), 'backup': set(), 'rows': [],
+                        'sizes': {}, 'groups': [], 'started': False}
+        ## end if
+        self._batch_depth += 1
+
+        ok = False
+        try:
+            yield self
+            ok = True
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                (b, self._batch) = (self._batch, None)
+                self._end_batch(b, ok)
+            ## end if
+        ## end try
+
+    ## end def batch
+
+
+    def start_swmr(self, shapes=None):
+        """ Begin SWMR writing; see *Access Modes*, above.
+
+        Parameters
+        ----------
+        shapes
+            |dict|, optional -- Shape of one value of each
+            :class:`~opan.const.EnumAnharmRepoData` type to be stored,
+            as a |tuple| of |int|, keyed by type. An empty stack is
+            created for each type not yet stored. E.g., for `N` atoms,
+            ``{GRAD: (3*N,), HESS: (3*N, 3*N), ENERGY: ()}``.
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            If `shapes` is malformed
+
+        ~opan.error.RepoError
+            (typecode :attr:`~opan.error.RepoError.STATUS`) If no
+            repository is open in
+            :attr:`~opan.const.EnumAnharmRepoMode.SWMR_WRITE` mode, if it
+            is not stacked, or within a batch
+
+        ~opan.error.RepoError
+            (typecode :attr:`~opan.error.RepoError.DATA`) If a shape in
+            `shapes` does not match that of the stack already stored
+
+        """
+
+        # Imports
+        from ..const import EnumAnharmRepoData as E_ARD
+        from ..const import EnumAnharmRepoLayout as E_ARL
+        from ..const import EnumAnharmRepoMode as E_ARM
+        from ..error import RepoError as RErr
+
+        if not (self.is_open() and self.mode == E_ARM.SWMR_WRITE):
+            raise RErr(RErr.STATUS, "Cannot start SWMR writing; no " +
+                        "repository open in SWMR_WRITE mode", self.fname)
+        ## end if
+        if self.layout != E_ARL.STACKED:
+            raise RErr(RErr.STATUS, "SWMR writing requires the stacked " +
+                                                        "layout", self.fname)
+        ## end if
+        if self._batch_depth > 0:
+            raise RErr(RErr.STATUS, "Cannot start SWMR writing within a " +
+                                                        "batch", self.fname)
+        ## end if
+
+        shapes = {} if shapes is None else shapes
+        if not (isinstance(shapes, dict) and all(dt in E_ARD for dt in
+                                                                shapes)):
+            raise ValueError("'shapes' must be a dict keyed by data type")
+        ## end if
+        for (dt, shape) in shapes.items():
+            if not all(isinstance(n, int) and n >= 0 for n in shape):
+                raise ValueError("Invalid shape for '{0}': {1}"
+                                                        .format(dt, shape))
+            ## end if
+        ## next (dt, shape)
+
+        if self._repo.swmr_mode:
+            return
+        ## end if
+
+        # Create everything to be written: stacks, and the dirty flag
+        for (dt, shape) in shapes.items():
+            self._stack_dsets(dt, tuple(shape), 0)
+        ## next (dt, shape)
+        self.is_dirty()
+
+        self._repo.flush()
+        self._repo.swmr_mode = True
+
+    ## end def start_swmr
+
+
+    def refresh(self):
+        """ Catch up with the data stored by a SWMR writer.
+
+        Makes visible the data stored since the file was opened or last
+        refreshed, in :attr:`~opan.const.EnumAnharmRepoMode.SWMR_READ`
+        mode, and empties the read cache in any mode.
+
+        Raises
+        ------
+        ~opan.error.RepoError
+            (typecode :attr:`~opan.error.RepoError.STATUS`) If no
+            repository is open
+
+        """
+
+        # Imports
+        from ..const import EnumAnharmRepoMode as E_ARM
+        from ..error import RepoError as RErr
+
+        if not self.is_open():
+            raise RErr(RErr.STATUS, "Cannot refresh; no repository open", "")
+        ## end if
+
+        self._cache_discard()
+        if self.mode != E_ARM.SWMR_READ:
+            return
+        ## end if
+
+        # Only the stacks and the dirty flag may change under SWMR. The
+        #  writer stores values before marking them in the masks, so the
+        #  masks are refreshed first, never to mark values not yet seen
+        grp = self._repo.get(self.G_stacked)
+        names = [] if grp is None else sorted(grp, key=lambda n:
+                                                not n.endswith(self.S_mask))
+        dsets = [grp[name] for name in names]
+        if self.N_dirty in self._repo:
+            dsets.append(self._repo[self.N_dirty])
+        ## end if
+        for dset in dsets:
+            dset.refresh()
+        ## next dset
+
+    ## end def refresh
+
+
+    def cache_info(self):
+        """ Statistics of the read cache; see *Caching*, above.
+
+        Returns
+        -------
+        info
+            :class:`CacheInfo` -- |int| `hits` and `misses` since the
+            last :meth:`cache_clear`, and the limit `maxsize` and
+            current total `currsize` of the cache, in bytes
+
+        """
+
+        return CacheInfo(self._cache_hits, self._cache_misses,
+                                    self.cache_size, self._cache_bytes)
+
+    ## end def cache_info
+
+
+    def cache_clear(self):
+        """ Empty the read cache and reset its statistics. """
+
+        # Imports
+        from collections import OrderedDict
+
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    ## end def cache_clear
+
+
+    def _cache_read(self, key, fxn, *args):
+        """ Value of `key` from the cache, else read by ``fxn(*args)``
+        and cached.
+
+        A |RepoError| for a value not found is cached, and raised anew
+        on each hit.
+
+        """
+
+        # Imports
+        import numpy as np
+        from ..error import RepoError as RErr
+
+        try:
+            value = self._cache[key][0]
+        except (KeyError, TypeError):
+            # Missing, or unhashable args for fxn to reject
+            self._cache_misses += 1
+            try:
+                value = fxn(*args)
+            except RErr as e:
+                if e.tc not in (RErr.DATA, RErr.GROUP):
+                    raise
+                ## end if
+                # Fresh instance, so as not to hold the traceback
+                value = RErr(e.tc, e.msg, e.src)
+            ## end try
+            self._cache_add(key, value)
+        else:
+            self._cache_hits += 1
+            self._cache.move_to_end(key)
+        ## end try
+
+        if isinstance(value, RErr):
+            raise RErr(value.tc, value.msg, value.src)
+        ## end if
+        return value.copy() if isinstance(value, np.ndarray) else value
+
+    ## end def _cache_read
+
+
+    def _cache_add(self, key, value):
+        """ Cache `value` under `key`, evicting the least recently used
+        entries to fit.
+        """
+
+        # Imports
+        import numpy as np
+
+        size = self.cache_entry_bytes
+        if isinstance(value, (np.ndarray, np.generic)):
+            size += value.nbytes
+        ## end if
+        if size > self.cache_size:
+            return
+        ## end if
+
+        self._cache[key] = (value, size)
+        self._cache_bytes += size
+        while self._cache_bytes > self.cache_size:
+            self._cache_bytes -= self._cache.popitem(last=False)[1][1]
+        ## loop
+
+    ## end def _cache_add
+
+
+    def _cache_discard(self, match=None, key=None):
+        """ Drop the cache entry for `key`, or those whose keys satisfy
+        `match`, or else all entries; the statistics are kept.
+        """
+
+        # Imports
+        from collections import OrderedDict
+
+        if key is not None:
+            keys = [key] if key in self._cache else []
+        elif match is not None:
+            keys = [k for k in self._cache if match(k)]
+        else:
+            self._cache = OrderedDict()
+            self._cache_bytes = 0
+            return
+        ## end if
+
+        for k in keys:
+            self._cache_bytes -= self._cache.pop(k)[1]
+        ## next k
+
+    ## end def _cache_discard
+
+
+    def _pre_store(self):
+        """ Flag dirty ahead of the first store of a batch. """
+
+        if self._batch is not None and not self._batch['started']:
+            self.set_dirty(True)
+            self._repo.flush()
+            self._batch['started'] = True
+        ## end if
+
+    ## end def _pre_store
+
+
+    def _post_store(self, grp=None, name=None):
+        """ Complete a store: log any new dataset to the batch, or flag
+        and flush.
+        """
+
+        if self._batch is None:
+            self.set_dirty(True)
+            self._repo.flush()
+        elif grp is not None:
+            self._batch['new'].add((grp.name, name))
+        ## end if
+
+    ## end def _post_store
+
+
+    def _require_group(self, name):
+        """ Group `name`, created if absent; within a batch, a created
+        group is logged for removal on rollback.
+        """
+
+        grp = self._repo.get(name)
+        if grp is None:
+            self._pre_store()
+            grp = self._repo.create_group(name)
+            if self._batch is not None:
+                self._batch['groups'].append(name)
+            ## end if
+        ## end if
+        return grp
+
+    ## end def _require_group
+
+
+    def _remove(self, grp, name):
+        """ Remove a dataset to be clobbered; within a batch, set aside
+        the version from before the batch, for rollback.
+        """
+
+        key = (grp.name, name)
+        if self._batch is None or key in self._batch['new']:
+            grp.pop(name)
+        else:
+            self._pre_store()
+            bak = name + self.S_backup
+            if bak in grp:
+                # Stale, from a batch interrupted by a crash
+                grp.pop(bak)
+            ## end if
+            grp.move(name, bak)
+            self._batch['backup'].add(key)
+        ## end if
+
+    ## end def _remove
+
+
+    def _flush(self):
+        """ Flush the file, unless within a batch or read-only. """
+
+        if self._batch is None and self._writable():
+            self._repo.flush()
+        ## end if
+
+    ## end def _flush
+
+
+    def _end_batch(self, b, commit):
+        """ Commit or roll back the batch `b`, then flush. """
+
+        if not b['started']:
+            return
+        ## end if
+
+        if commit:
+            for (grpname, name) in b['backup']:
+                self._repo[grpname].pop(name + self.S_backup)
+            ## next (grpname, name)
+        else:
+            for (grpname, name) in b['new']:
+                self._repo[grpname].pop(name)
+            ## next (grpname, name)
+            for (grpname, name) in b['backup']:
+                self._repo[grpname].move(name + self.S_backup, name)
+            ## next (grpname, name)
+            for (dsname, rows, data, present) in reversed(b['rows']):
+                self._repo[dsname][rows] = data
+                self._repo[dsname + self.S_mask][rows] = present
+            ## next (dsname, rows, data, present)
+            for (dsname, n_modes) in b['sizes'].items():
+                self._repo[dsname].resize(n_modes, axis=0)
+                self._repo[dsname + self.S_mask].resize(n_modes, axis=0)
+            ## next (dsname, n_modes)
+            for grpname in reversed(b['groups']):
+                del self._repo[grpname]
+            ## next grpname
+            self._cache_discard()
+        ## end if
+
+        self._repo.flush()
+
+    ## end def _end_batch
+
+
+    def _init_storage(self):
+        """ Adopt the recorded storage and data layouts, or record the
+        requested ones.
+
+        A new repository records the requested layouts, or the defaults.
+        An existing repository without a recorded storage layout records
+        the requested one, if any, and is otherwise left untouched. An
+        existing repository without a recorded data layout is grouped.
+
+        """
+
+        # Imports
+        import json
+        from ..const import EnumAnharmRepoLayout as E_ARL
+        from ..const import EnumAnharmRepoParam as E_ARP
+        from ..error import RepoError as RErr
+
+        # Check for a new repository first; nothing is recorded in one
+        #  opened read-only
+        req = self._storage_req
+        writable = self._writable()
+        new = writable and len(self._repo) == 0
+        rec = None
+        if self.has_param(E_ARP.STORAGE):
+            rec = self._norm_storage(json.loads(
+                                        self.get_param(E_ARP.STORAGE)))
+        ## end if
+        if self.has_param(E_ARP.LAYOUT):
+            layout = self.get_param(E_ARP.LAYOUT)
+        else:
+            layout = None if new else E_ARL.GROUPED
+        ## end if
+
+        if (rec is not None and req is not None and req != rec) or \
+                (layout is not None and self._layout_req is not None and
+                                            self._layout_req != layout):
+            fname = self.fname
+            self._repo.close()
+            self._repo = None
+            raise RErr(RErr.STATUS,
+                    "Requested storage or data layout conflicts with the " +
+                    "layout recorded in the repository", fname)
+        ## end if
+
+        if new:
+            self.layout = self._layout_req or E_ARL.GROUPED
+            self.store_param(self.layout, E_ARP.LAYOUT)
+        else:
+            self.layout = layout
+        ## end if
+
+        if rec is not None:
+            self.storage = rec
+        elif writable and (req is not None or new):
+            self.storage = req if req is not None else \
+                                                self._norm_storage({})
+            self.store_param(json.dumps(self.storage, sort_keys=True),
+                                                            E_ARP.STORAGE)
+        else:
+            self.storage = self._norm_storage({})
+        ## end if
+
+    ## end def _init_storage
+
+
+    @classmethod
+    def _norm_storage(cls, storage):
+        """ Proof a storage layout, expanding it to all data types.
+
+        Options set to |None| or |False| are dropped, and chunk shapes
+        are stored as |list|, so that equal layouts compare equal
+        however written, and as recorded in JSON.
+
+        Returns
+        -------
+        storage
+            |dict| of |dict| -- Options for each
+            :class:`~opan.const.EnumAnharmRepoData` type, or |None| if
+            `storage` is |None|
+
+        """
+
+        # Imports
+        from ..const import EnumAnharmRepoData as E_ARD
+
+        if storage is None:
+            return None
+        ## end if
+        if not isinstance(storage, dict):
+            raise ValueError("'storage' must be a dict")
+        ## end if
+
+        # Options for every type, or keyed by type
+        if storage and all(k in E_ARD for k in storage):
+            by_type = dict((dt, storage.get(dt, {})) for dt in E_ARD)
+        else:
+            by_type = dict((dt, storage) for dt in E_ARD)
+        ## end if
+
+        out = {}
+        for (dt, opts) in by_type.items():
+            if not isinstance(opts, dict):
+                raise ValueError("Options for '{0}' must be a dict"
+                                                            .format(dt))
+            ## end if
+            if not cls.storage_opts.issuperset(opts):
+                raise ValueError("Invalid storage option(s): {0}".format(
+                        sorted(set(opts).difference(cls.storage_opts))))
+            ## end if
+            opts = dict((k, v) for (k, v) in opts.items()
+                                        if v is not None and v is not False)
+
+            chunks = opts.get('chunks')
+            if isinstance(chunks, (tuple, list)):
+                if not (chunks and all(isinstance(c, int) and c > 0
+                                                        for c in chunks)):
+                    raise ValueError("Invalid chunk shape: {0}"
+                                                        .format(chunks))
+                ## end if
+                opts.update(chunks=list(chunks))
+            elif not (chunks is None or chunks is True or
+                                                    chunks == 'full'):
+                raise ValueError("Invalid 'chunks': {0}".format(chunks))
+            ## end if
+
+            comp = opts.get('compression')
+            if comp is not None and comp not in cls.storage_compressions:
+                raise ValueError("Invalid 'compression': {0}".format(comp))
+            ## end if
+            if 'compression_opts' in opts:
+                level = opts['compression_opts']
+                if comp != 'gzip' or not (isinstance(level, int) and
+                                                        0 <= level <= 9):
+                    raise ValueError("'compression_opts' must be a gzip " +
+                                                        "level, 0 to 9")
+                ## end if
+            ## end if
+
+            if not opts.get('shuffle', True) is True:
+                raise ValueError("'shuffle' must be Boolean")
+            ## end if
+
+            out.update({ dt : opts })
+        ## next (dt, opts)
+
+        return out
+
+    ## end def _norm_storage
+
+
+    def _dset_kwargs(self, datatype, data):
+        """ Keyword arguments to :meth:`h5py:Group.create_dataset` for
+        `data` of type `datatype`, per the storage layout.
+        """
+
+        # Imports
+        import numpy as np
+
+        # h5py cannot chunk or filter scalar or empty data
+        shape = np.shape(data)
+        if shape == () or 0 in shape:
+            return {}
+        ## end if
+
+        kwargs = dict(self.storage[datatype])
+        chunks = kwargs.get('chunks')
+        if chunks == 'full':
+            kwargs.update(chunks=shape)
+        elif isinstance(chunks, list):
+            if len(chunks) != len(shape):
+                raise ValueError(("Chunk shape {0} does not match data " +
+                        "shape {1}").format(tuple(chunks), shape))
+            ## end if
+            kwargs.update(chunks=tuple(min(c, n)
+                                        for (c, n) in zip(chunks, shape)))
+        ## end if
+
+        return kwargs
+
+    ## end def _dset_kwargs
+
+
+    @staticmethod
+    def _check_layout(layout):
+        """ Proof a requested data layout, passing |None|. """
+
+        # Imports
+        from ..const import EnumAnharmRepoLayout as E_ARL
+
+        if not (layout is None or layout in E_ARL):
+            raise ValueError("'{0}' is not a valid layout enum value"
+                                                        .format(layout))
+        ## end if
+        return layout
+
+    ## end def _check_layout
+
+
+    @staticmethod
+    def _check_mode(mode):
+        """ Proof a requested access mode, defaulting |None|. """
+
+        # Imports
+        from ..const import EnumAnharmRepoMode as E_ARM
+
+        if mode is None:
+            return E_ARM.READWRITE
+        ## end if
+        if not mode in E_ARM:
+            raise ValueError("'{0}' is not a valid access mode enum value"
+                                                            .format(mode))
+        ## end if
+        return mode
+
+    ## end def _check_mode
+
+
+    @staticmethod
+    def _open(fname, mode):
+        """ Open the HDF5 file `fname` in access `mode`. """
+
+        # Imports
+        import h5py as h5
+        from ..const import EnumAnharmRepoMode as E_ARM
+        from ..error import RepoError as RErr
+
+        # SWMR arrived in the HDF5 1.10 development series
+        if mode in (E_ARM.SWMR_WRITE, E_ARM.SWMR_READ) and \
+                            h5.version.hdf5_version_tuple < (1, 9, 178):
+            raise RErr(RErr.STATUS, "SWMR access requires HDF5 1.10 or " +
+                    "later; found {0}".format(h5.version.hdf5_version),
+                    fname)
+        ## end if
+
+        if mode == E_ARM.READWRITE:
+            return h5.File(fname, 'a')
+        elif mode == E_ARM.READONLY:
+            return h5.File(fname, 'r')
+        elif mode == E_ARM.SWMR_WRITE:
+            return h5.File(fname, 'a', libver='latest')
+        else:
+            return h5.File(fname, 'r', libver='latest', swmr=True)
+        ## end if
+
+    ## end def _open
+
+
+    def _writable(self):
+        """ Whether the access mode allows stores. """
+
+        # Imports
+        from ..const import EnumAnharmRepoMode as E_ARM
+
+        return self.mode in (E_ARM.READWRITE, E_ARM.SWMR_WRITE)
+
+    ## end def _writable
+
+
+    def _check_store(self):
+        """ Complain of a store to a repository open read-only. """
+
+        # Imports
+        from ..error import RepoError as RErr
+
+        if self._repo is not None and not self._writable():
+            raise RErr(RErr.STATUS,
+                    "Cannot store; repository open read-only ({0})"
+                    .format(self.mode), self.fname)
+        ## end if
+
+    ## end def _check_store
+
+
+    def _check_create(self):
+        """ Complain of a store that would create an HDF5 object once
+        SWMR writing has started.
+        """
+
+        # Imports
+        from ..const import EnumAnharmRepoMode as E_ARM
+        from ..error import RepoError as RErr
+
+        if self._repo is not None and self.mode == E_ARM.SWMR_WRITE and \
+                                                    self._repo.swmr_mode:
+            raise RErr(RErr.STATUS,
+                    "Cannot create datasets or groups once SWMR writing " +
+                    "has started", self.fname)
+        ## end if
+
+    ## end def _check_create
+
+
+    def _check_all(self, datatype):
+        """ Proof `datatype` and the binding for a bulk read. """
+
+        # Imports
+        from ..const import EnumAnharmRepoData as E_ARD
+        from ..error import RepoError as RErr
+
+        if not datatype in E_ARD:
+            raise ValueError("'{0}' is not a valid data type enum value"
+                                                        .format(datatype))
+        ## end if
+        if self._repo is None:
+            raise RErr(RErr.STATUS, "Cannot load; no repository open", "")
+        ## end if
+        return datatype
+
+    ## end def _check_all
+
+
+    def _grouped_index(self, datatype):
+        """ Group names holding displaced `datatype` values in the grouped
+        layout, keyed by (mode, direction index).
+        """
+
+        idx = dict((self.dircode[d], i) for (d, i) in self.dispidx.items())
+        out = {}
+        for name in self._repo:
+            match = self.P_mode_grp.match(name)
+            if match and datatype in self._repo[name]:
+                out.update({ (int(match.group(1)), idx[match.group(2)]) :
+                                                                    name })
+            ## end if
+        ## next name
+        return out
+
+    ## end def _grouped_index
+
+
+    def _stack_dsets(self, datatype, shape=None, n_modes=0):
+        """ Stacked dataset of `datatype` and its presence mask.
+
+        Given the `shape` of one value, they are created if absent, else
+        checked against `shape`, and grown to at least `n_modes` modes.
+        Otherwise, (|None|, |None|) is returned if they are absent.
+
+        """
+
+        # Imports
+        import numpy as np
+        from ..error import RepoError as RErr
+
+        grp = self._repo.get(self.G_stacked)
+        if grp is None or datatype not in grp:
+            if shape is None:
+                return (None, None)
+            ## end if
+
+            self._check_create()
+            grp = self._require_group(self.G_stacked)
+            self._pre_store()
+            dset = grp.create_dataset(datatype,
+                        shape=(n_modes, 2) + shape,
+                        maxshape=(None, 2) + shape, dtype=np.float_,
+                        fillvalue=np.nan,
+                        **self._stack_kwargs(datatype, shape))
+            mask = grp.create_dataset(datatype + self.S_mask,
+                        shape=(n_modes, 2), maxshape=(None, 2), dtype=bool,
+                        chunks=True)
+            if self._batch is not None:
+                self._batch['new'].update([(grp.name, datatype),
+                                    (grp.name, datatype + self.S_mask)])
+            ## end if
+            return (dset, mask)
+        ## end if
+
+        dset = grp[datatype]
+        mask = grp[datatype + self.S_mask]
+        if shape is not None:
+            if dset.shape[2:] != shape:
+                raise RErr(RErr.DATA,
+                        "Shape {0} of data to be stored does not match "
+                        "stacked shape {1}".format(shape, dset.shape[2:]),
+                        self._repo.filename)
+            ## end if
+            if dset.shape[0] < n_modes:
+                # Within a batch, keep the size from before it
+                self._pre_store()
+                b = self._batch
+                if b is not None and (grp.name, datatype) not in b['new']:
+                    b['sizes'].setdefault(dset.name, dset.shape[0])
+                ## end if
+                dset.resize(n_modes, axis=0)
+                mask.resize(n_modes, axis=0)
+            ## end if
+        ## end if
+        return (dset, mask)
+
+    ## end def _stack_dsets
+
+
+    def _stack_kwargs(self, datatype, shape):
+        """ Filter and chunk keyword arguments to
+        :meth:`h5py:Group.create_dataset` for a stack of `datatype`
+        values of `shape`.
+        """
+
+        # Imports
+        import numpy as np
+
+        kwargs = dict(self.storage[datatype])
+        chunks = kwargs.pop('chunks', None)
+        if chunks is True:
+            return dict(kwargs, chunks=True)
+        elif isinstance(chunks, list):
+            if len(chunks) != len(shape):
+                raise ValueError(("Chunk shape {0} does not match data " +
+                        "shape {1}").format(tuple(chunks), shape))
+            ## end if
+            chunks = tuple(min(c, n) for (c, n) in zip(chunks, shape))
+        else:
+            chunks = shape
+        ## end if
+
+        size = 2 * np.dtype(np.float_).itemsize * int(np.prod(chunks))
+        rows = max(1, self.stack_chunk_bytes // size)
+        return dict(kwargs, chunks=(rows, 2) + chunks)
+
+    ## end def _stack_kwargs
+
+
+    def _log_rows(self, datatype, dset, mask, rows):
+        """ Within a batch, keep the stacked `rows` about to be written,
+        for rollback.
+        """
+
+        b = self._batch
+        if b is None or (dset.parent.name, datatype) in b['new']:
+            return
+        ## end if
+        self._pre_store()
+        b['rows'].append((dset.name, rows, dset[rows], mask[rows]))
+
+    ## end def _log_rows
+
+
     def get_XYZ(self, mode, disp):
         """ .. todo:: docstring for get_xyz
         """
@@ -516,9 +1988,13 @@ class OpanAnharmRepo(object):
         from ..xyz import OpanXYZ as XYZ
         from ..const import EnumAnharmRepoParam, EnumAnharmRepoData
 
+        # Symbols may come back from HDF5 as bytes
+        atoms = [a.decode() if isinstance(a, bytes) else a
+                    for a in self.get_param(EnumAnharmRepoParam.ATOMS)]
+
         # Generate XYZ and return
-        out_XYZ = XYZ(atom_syms=self.get_param(EnumAnharmRepoParam.atoms), \
-                        coords=self.get_data(EnumAnharmRepoData.geom, mode, disp))
+        out_XYZ = XYZ(atom_syms=atoms, \
+                coords=self.get_data(EnumAnharmRepoData.GEOM, mode, disp))
         return out_XYZ
 
     ## end def get_XYZ
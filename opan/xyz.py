@@ -21,7 +21,7 @@
 
 """ Module implementing OpenBabel XYZ parsing and interpretation.
 
-The single class :class:`~opan.xyz.OpanXYZ` imports molecular geometries
+The class :class:`~opan.xyz.OpanXYZ` imports molecular geometries
 in the OpenBabel `XYZ format
 <http://openbabel.org/wiki/XYZ_(format)>`__ |extlink|, with
 the following variations:
@@ -58,6 +58,9 @@ the following variations:
         :func:`~opan.xyz.OpanXYZ.dihed_single` -- Dihedral angle
         among four atoms
 
+        :func:`~opan.xyz.OpanXYZ.neighbor_list` -- Atom pairs within
+        a cutoff distance
+
     .. _toc-generators:
 
     :ref:`Generators <generators>`
@@ -100,13 +103,51 @@ the following variations:
 
         :func:`~opan.xyz.OpanXYZ.dihed_iter` -- Dihedral angles
 
+    .. _toc-batch:
+
+    :ref:`Batch Methods <batch>`
+
+        All return |nparray| values computed at once over a set of
+        geometries and a set of atom index tuples, with the geometries
+        along the first axis and the tuples along the second.
+
+        `g_nums` can be a single index, an iterable of R indices, or |None|
+        for all geometries. The `ats_#` parameters can each be a single
+        index, an iterable of indices, or |None| for ``range(N)``; all
+        iterables must be the same length T, and single values are used
+        for all T index tuples.
+
+        If the optional parameter `invalid_error` is |False| (the
+        default), results corresponding to invalid indices (or coincident
+        atoms, or insufficiently nonlinear dihedral trios) are ``nan``.
+        If |True|, the same errors are raised as from the corresponding
+        :samp:`{x}_single` method.
+
+        :func:`~opan.xyz.OpanXYZ.displ_multi` -- Displacement vectors
+
+        :func:`~opan.xyz.OpanXYZ.dist_multi` -- Euclidean distances
+
+        :func:`~opan.xyz.OpanXYZ.angle_multi` -- Span angles
+
+        :func:`~opan.xyz.OpanXYZ.dihed_multi` -- Dihedral angles
+
+        :func:`~opan.xyz.OpanXYZ.dist_matrix` -- Full interatomic distance
+        matrices (takes only `g_nums`)
+
+
+Trajectories too large to hold in memory can instead be read with
+:class:`~opan.xyz.OpanXYZStream`, which indexes the geometries in the file
+and reads them from disk as needed, while providing the same methods and
+generators.
 
 |
 
-**Class Definition**
+**Class Definitions**
 
 .. autoclass:: OpanXYZ
 
+.. autoclass:: OpanXYZStream
+
 
 """
 
@@ -141,6 +182,10 @@ class OpanXYZ(object):
     the instance will contain the single geometry represented by the
     provided inputs.
 
+    When loading from `path`, the complete text of the file is retained in
+    :attr:`in_str` unless the optional keyword argument `keep_str` is
+    |False|.
+
     In both forms, the optional keyword argument `bohrs` can be specified, to
     indicate the units of the coordinates as Bohrs (|True|)
     or Angstroms (|False|).
@@ -207,7 +252,8 @@ class OpanXYZ(object):
 
     .. attribute:: in_str
 
-        |str| -- Complete contents of the input file
+        |str| -- Complete contents of the input file, unless loaded with
+        `keep_str` |False|, in which case |None|
 
     .. attribute:: num_atoms
 
@@ -238,6 +284,8 @@ class OpanXYZ(object):
 
     .. automethod:: dihed_single(g_num, at_1, at_2, at_3, at_4)
 
+    .. automethod:: neighbor_list(g_num, cutoff)
+
 
     |
 
@@ -256,6 +304,23 @@ class OpanXYZ(object):
     .. automethod:: dihed_iter(g_nums, ats_1, ats_2, ats_3, ats_4)
 
 
+    |
+
+    .. _batch:
+
+    **Batch Methods**
+
+    .. automethod:: displ_multi(g_nums, ats_1, ats_2)
+
+    .. automethod:: dist_multi(g_nums, ats_1, ats_2)
+
+    .. automethod:: angle_multi(g_nums, ats_1, ats_2, ats_3)
+
+    .. automethod:: dihed_multi(g_nums, ats_1, ats_2, ats_3, ats_4)
+
+    .. automethod:: dist_matrix(g_nums=None)
+
+
     """
 
     # Imports
@@ -310,6 +375,10 @@ class OpanXYZ(object):
     (?P<c3>[0-9.-]+)        # Third coordinate
     """, _re.I | _re.X | _re.M)
 
+    # Version of the parse, as recorded in the parse cache; increment
+    #  whenever the parsed data could change
+    _cache_version = 1
+
 
     def __init__(self, **kwargs):
         """ Initialize XYZ data from file or existing geometry.
@@ -332,7 +401,10 @@ class OpanXYZ(object):
         if 'path' in kwargs:
             # All set for load from file. 'bohrs' defaults False here
             self._load_file(kwargs['path'], \
-                    bohrs=(kwargs['bohrs'] if 'bohrs' in kwargs else False))
+                    bohrs=(kwargs['bohrs'] if 'bohrs' in kwargs else False),
+                    keep_str=(kwargs['keep_str'] if 'keep_str' in kwargs
+                                                                else True),
+                    cache=(kwargs['cache'] if 'cache' in kwargs else None))
         else:
             # Look for the from-coordinates objects
             if all((k in kwargs) for k in ('atom_syms', 'coords')):
@@ -434,13 +506,15 @@ class OpanXYZ(object):
         # Store the atoms as vector
         self.atom_syms = list(map(str.upper, list(atom_syms)))
 
-        # Store the single geometry by bracketing with an array
-        self.geoms = [coords / (1.0 if bohrs else PHYS.ANG_PER_BOHR)]
+        # Store the single geometry as the only row of the stack
+        self._geom_arr = np.reshape(coords, (1, -1)) / \
+                                    (1.0 if bohrs else PHYS.ANG_PER_BOHR)
+        self.geoms = list(self._geom_arr)
 
     ## end def _load_data
 
 
-    def _load_file(self, XYZ_path, bohrs=False):
+    def _load_file(self, XYZ_path, bohrs=False, keep_str=True, cache=None):
         """ Initialize OpanXYZ geometry object from OpenBabel file
 
         Import of an arbitrary number of multiple geometries from an OpenBabel
@@ -458,6 +532,19 @@ class OpanXYZ(object):
             Flag for whether coordinates are interpreted as in Bohrs or
             Angstroms. Default is |False| (Angstroms).
 
+        keep_str
+            |bool|, optional --
+            Flag for whether to retain the complete text of the file in
+            :attr:`in_str`. Default is |True|. If |False|, the text is
+            discarded once parsed and :attr:`in_str` is |None|.
+
+        cache
+            |bool| or :class:`~opan.utils.cache.ParseCache`, optional --
+            Parse cache to use, as for
+            :func:`~opan.utils.cache.get_cache`. Default is |None|, the
+            default cache if one is configured. Used only if `keep_str`
+            is |False|.
+
         Raises
         ------
         ~opan.error.XYZError
@@ -471,9 +558,9 @@ class OpanXYZ(object):
 
         # Imports
         import numpy as np
-        from .const import CIC, PHYS, atom_num, atom_sym
         from .error import XYZError
         from .utils import safe_cast as scast
+        from .utils.cache import get_cache
 
         # Complain if already initialized
         if 'geoms' in dir(self):
@@ -481,6 +568,22 @@ class OpanXYZ(object):
                     "Cannot overwrite contents of existing OpanXYZ", "")
         ## end if
 
+        # Serve from the parse cache if possible
+        params = dict(bohrs=bool(bohrs))
+        cache = None if keep_str else get_cache(cache)
+        if cache is not None:
+            data, stamp = cache.load(XYZ_path, 'xyz', params,
+                                                self._cache_version)
+            if data is not None:
+                self.XYZ_path = XYZ_path
+                self.in_str = None
+                data.update(_geom_arr=data['geoms'],
+                                            geoms=list(data['geoms']))
+                self.__dict__.update(data)
+                return
+            ## end if
+        ## end if
+
         # Open file, read contents, close stream
         # No particular exception handling; that will be the responsibility
         #  of the calling routine.
@@ -516,168 +619,217 @@ class OpanXYZ(object):
                     "XYZ file: " + XYZ_path)
         ## end try
 
-        # Initialize the description vector and geometry array
-        # CANNOT use matrix type for the geometry since it's 3D.
-        # Retriever function for geometry should convert the given slice
-        #  to a vector as an np.matrix, though.
-        # Geometry is constructed as a length-3N vector of
-        #  coordinates, where atom 1's x/y/z coordinates are sequential,
-        #  then atom 2's x/y/z coordinates are sequential, etc.
-        # Multiple geometries in a single XYZ file are stacked in a simple
-        #  array.
-        self.descs = []
-        self.geoms = []
-
-        # Initialize the atom symbols vector
-        self.atom_syms = []
-
-        # Define a counter for the number of geometries. Store as a persistent
-        #  instance variable because it will be useful later.
-        self.num_geoms = 0
-
-        # Loop over the geometry blocks found in the input file
-        for mch in OpanXYZ.p_geom.finditer(self.in_str):
+        # Parse all of the geometry blocks in the file
+        self.descs, self.atom_syms, geom_arr = \
+                self._parse_blocks(self.in_str.splitlines(), self.num_atoms,
+                                                            bohrs, XYZ_path)
+        self.num_geoms = len(self.descs)
+
+        # Store the geometries as rows of the contiguous stack, which is
+        #  retained for vectorized retrieval
+        self._geom_arr = geom_arr
+        self.geoms = list(geom_arr)
+
+        # Discard the file contents unless asked to keep them
+        if not keep_str:
+            self.in_str = None
+        ## end if
+
+        # Cache the results
+        if cache is not None:
+            cache.store(XYZ_path, 'xyz', dict(num_atoms=self.num_atoms,
+                        num_geoms=self.num_geoms, descs=self.descs,
+                        atom_syms=self.atom_syms, geoms=geom_arr),
+                        stamp, params, self._cache_version)
+        ## end if
+
+    ## end def _load_file
+
+
+    @staticmethod
+    def _parse_blocks(lines, num_atoms, bohrs, XYZ_path, g_ofs=0):
+        """ Parse a series of geometry blocks in bulk.
+
+        The lines are walked as a series of blocks of `num_atoms` + 2
+        lines each: the atom count, the description, and one line per
+        atom. Blank lines between blocks are skipped. All coordinates are
+        then parsed at once into a preallocated (G, 3N) array, and the
+        element IDs are validated once per distinct value.
+
+        Parameters
+        ----------
+        lines
+            |list| of |str| -- Lines of the geometry blocks to be parsed
+
+        num_atoms
+            |int| -- Number of atoms expected in every geometry
+
+        bohrs
+            |bool| -- Flag for whether coordinates are interpreted as in
+            Bohrs or Angstroms
+
+        XYZ_path
+            |str| -- Path of the source file, for error reporting
+
+        g_ofs
+            |int|, optional -- Index of the first geometry in `lines`
+            within the overall file, for error reporting. Default is zero.
+
+        Returns
+        -------
+        descs
+            length-G |list| of |str| -- Geometry descriptions
+
+        atom_syms
+            length-N |list| of |str| -- Atomic symbols (all uppercase)
+
+        geom_arr
+            (G, 3N) |npfloat_| -- Stacked geometries, in Bohrs
+
+        Raises
+        ------
+        ~opan.error.XYZError
+            (typecode :attr:`~opan.error.XYZError.XYZFILE`)
+            If any geometry block is malformed in some fashion
+
+        """
+
+        # Imports
+        import numpy as np
+        from .const import CIC, PHYS, atom_num, atom_sym
+        from .error import XYZError
+        from .utils import safe_cast as scast
+
+        # Initialize the description vector and the list of coordinate
+        #  lines. The coordinate lines are only collected here; all of the
+        #  element and coordinate parsing is done in bulk afterward.
+        descs = []
+        coord_lines = []
+
+        # Walk the lines as a series of blocks of num_atoms + 2 lines
+        blk_len = num_atoms + 2
+        pos = 0
+        while pos < len(lines):
+            # Skip any blank line
+            if not lines[pos].strip():
+                pos += 1
+                continue
+            ## end if
+
             # Check that the number of atoms is consistent with the spec
             #  found in the first geometry block
-            if not scast(mch.group("num"), np.int_) == self.num_atoms:
+            if not scast(lines[pos].strip(), np.int_) == num_atoms:
                 raise XYZError(XYZError.XYZFILE,
                         "Non-constant number of atoms in multiple geometry",
                         "XYZ file: " + XYZ_path)
             ## end if
 
-            # Store the description for the current geometry
-            self.descs.append(mch.group("desc"))
-
-            # Assemble the coordinates vector and assemble/check the element
-            #  ID vector.
-            # Reset the atom counter and the coordinates vector
-            atom_count = 0
-            coord_vec = np.empty((0,),dtype=np.float_)
-            for line_mch in OpanXYZ.p_coords.finditer(mch.group("coord")):
-                # Check for whether element list has been fully populated
-                if len(self.atom_syms) < self.num_atoms:
-                    # If not, continue populating it; have to check for
-                    #  whether it's an atomic number or an element symbol
-                    if line_mch.group("el").isdigit():
-                        # Atomic number
-                        # Check for valid number
-                        at_num = scast(line_mch.group("el"), np.int_)
-                        if not (CIC.MIN_ATOMIC_NUM <= at_num
-                                                    <= CIC.MAX_ATOMIC_NUM):
-                            raise XYZError(XYZError.XYZFILE,
-                                    "Geometry #{0}, atom #{1} is an \
-                                        unsupported element"
-                                        .format(self.num_geoms, atom_count),
-                                     "XYZ file: {0}".format(XYZ_path))
-                        ##end if
-
-                        # Tag on the new symbol
-                        self.atom_syms.append(atom_sym[at_num])
-                    else:
-                        # Element symbol; store as all caps
-                        # Check for valid element, first by catching if the
-                        #  specified element string is even valid
-                        try:
-                            at_num = atom_num[line_mch.group("el").upper()]
-                        except KeyError:
-                            raise XYZError(XYZError.XYZFILE,
-                                    "Geometry #{0}, atom #{1} is an \
-                                        unrecognized element"
-                                        .format(self.num_geoms, atom_count),
-                                     "XYZ file: {0}".format(XYZ_path))
-                        ## end try
-
-                        # Tag on the new symbol
-                        self.atom_syms.append(line_mch.group("el").upper())
-                    ## end if
-                else: # List is fully populated
-                    # If so, confirm that the element specified at the current
-                    #  line matches that of the first geometry of the file
-                    # Have to check whether it's an atomic number or symbol.
-                    if line_mch.group("el").isdigit():
-                        # Atomic number; don't need safe cast; must trap for
-                        #  a bad atomic number
-                        at_num = scast(line_mch.group("el"), np.int_)
-                        if not (CIC.MIN_ATOMIC_NUM <= at_num
-                                                    <= CIC.MAX_ATOMIC_NUM):
-                            raise XYZError(XYZError.XYZFILE,
-                                    "Geometry #{0}, atom #{1} is an \
-                                        unsupported element"
-                                        .format(self.num_geoms, atom_count),
-                                     "XYZ file: {0}".format(XYZ_path))
-                        ## end if
-                        if not atom_sym[at_num] == self.atom_syms[atom_count]:
-                            raise XYZError(XYZError.XYZFILE,
-                                    "Geometry #{0}, atom #{1} is inconsistent \
-                                        with geometry #0"
-                                        .format(self.num_geoms, atom_count),
-                                     "XYZ file: {0}".format(XYZ_path))
-                        ## end if
-
-                    else:
-                        # Element symbol
-                        # Check for valid element, first by catching if the
-                        #  specified element string is even valid
-                        try:
-                            at_num = atom_num[line_mch.group("el").upper()]
-                        except KeyError:
-                            raise XYZError(XYZError.XYZFILE,
-                                    "Geometry #{0}, atom #{1} is an \
-                                        unrecognized element"
-                                        .format(self.num_geoms, atom_count),
-                                     "XYZ file: {0}".format(XYZ_path))
-                        ## end try
-                        # Confirm symbol matches the initial geometry
-                        if not line_mch.group("el").upper() == \
-                                                self.atom_syms[atom_count]:
-                            raise XYZError(XYZError.XYZFILE,
-                                    "Geometry #{0}, atom #{1} is inconsistent \
-                                        with geometry #0"
-                                        .format(self.num_geoms, atom_count),
-                                    "XYZ file: {0}".format(XYZ_path))
-                        ## end if
-                    ## end if
-                ## end if
-
-                # Append the three coordinates of the current atom to the
-                #  temp coordinates vector, converting to Bohrs if indicated.
-                # Working in Bohrs is desired because they are atomic units
-                #  and thus are part of the internal unit definition of the
-                #  Hartree.
-                for c_str in range(1,4):
-                    coord_vec = np.concatenate(
-                            (coord_vec, [
-                        scast(line_mch.group("c{0}".format(c_str)), np.float_) /
-                        (1.0 if bohrs else PHYS.ANG_PER_BOHR)
-                                        ]), axis=0)
-                ## next c_str
-
-                # Increment the atom_count for the atom number
-                atom_count += 1
-
-            ## next line_mch
-
-            # Confirm that number of imported coordinates matches the
-            #  number expected from self.num_atoms
-            if not coord_vec.shape[0] == 3*self.num_atoms:
+            # Confirm that there are enough lines left for the coordinates
+            #  of all num_atoms atoms
+            if pos + blk_len > len(lines):
                 raise XYZError(XYZError.XYZFILE,
                         "Geometry #{0} atom count is inconsistent"
-                            .format(self.num_geoms),
+                            .format(g_ofs + len(descs)),
                         "XYZ file: {0}".format(XYZ_path))
             ## end if
 
-            # Assemble the coordinates vector into the actual coordinates
-            #  stack for the XYZ
-            self.geoms.append(coord_vec)
+            # Store the description and coordinate lines for the current
+            #  geometry
+            descs.append(lines[pos + 1])
+            coord_lines.extend(lines[pos + 2:pos + blk_len])
+            pos += blk_len
+
+        ## loop
+
+        # Store the number of geometries found
+        num_geoms = len(descs)
+
+        # Every coordinate line must consist of exactly four
+        #  whitespace-separated fields: the element ID and the three
+        #  coordinates. Thus, the whole of the coordinates text must split
+        #  cleanly into a (G*N, 4) array of fields. If it does not, hunt
+        #  down the first offending geometry for the error message.
+        fields = " ".join(coord_lines).split()
+        if not len(fields) == 4 * num_atoms * num_geoms:
+            bad_line = [len(l.split()) == 4 for l in coord_lines].index(False)
+            raise XYZError(XYZError.XYZFILE,
+                    "Geometry #{0} atom count is inconsistent"
+                        .format(g_ofs + bad_line // num_atoms),
+                    "XYZ file: {0}".format(XYZ_path))
+        ## end if
+        coord_lines = None
+        els = np.array(fields[0::4]).reshape((num_geoms, num_atoms))
+        del fields[0::4]
+
+        # Parse all coordinates at once into the preallocated geometry stack,
+        #  converting to Bohrs if indicated. Working in Bohrs is desired
+        #  because they are atomic units and thus are part of the internal
+        #  unit definition of the Hartree.
+        # Multiple geometries are stacked in a simple (G, 3N) array, each
+        #  row a length-3N vector of coordinates, where atom 1's x/y/z
+        #  coordinates are sequential, then atom 2's x/y/z coordinates are
+        #  sequential, etc.
+        geom_arr = np.empty((num_geoms, 3 * num_atoms), dtype=np.float_)
+        try:
+            geom_arr.flat[:] = fields
+        except ValueError:
+            raise XYZError(XYZError.XYZFILE,
+                    "Non-numeric coordinate value found",
+                    "XYZ file: {0}".format(XYZ_path))
+        ## end try
+        fields = None
+        if not bohrs:
+            geom_arr /= PHYS.ANG_PER_BOHR
+        ## end if
 
-            # Increment the count of the number of geometries. Once the
-            #  'mch' iteration is completed, this will accurately reflect
-            #  the number of geometries read from the file.
-            self.num_geoms += 1
+        # Validate each distinct element ID only once, converting atomic
+        #  numbers to their symbols and element symbols to all caps. Failures
+        #  are flagged with an empty string, and then reported at the first
+        #  atom where they occur.
+        el_ids, el_idx = np.unique(els, return_inverse=True)
+        el_syms = []
+        for el in el_ids:
+            if el.isdigit():
+                # Atomic number; must trap for a bad atomic number
+                at_num = scast(el, np.int_)
+                if not (CIC.MIN_ATOMIC_NUM <= at_num <= CIC.MAX_ATOMIC_NUM):
+                    el_syms.append('')
+                else:
+                    el_syms.append(atom_sym[at_num])
+                ## end if
+            else:
+                # Element symbol; check for valid element
+                if el.upper() in atom_num:
+                    el_syms.append(el.upper())
+                else:
+                    el_syms.append('')
+                ## end if
+            ## end if
+        ## next el
+        syms = np.array(el_syms)[el_idx].reshape(els.shape)
+
+        # Locate the first atom with an invalid element ID or an element
+        #  differing from that of the first geometry
+        bad = np.logical_or(syms == '', syms != syms[0])
+        if np.any(bad):
+            g_num, at = divmod(np.argmax(bad), num_atoms)
+            if syms[g_num, at] == '':
+                raise XYZError(XYZError.XYZFILE,
+                        "Geometry #{0}, atom #{1} is an unrecognized "
+                        "or unsupported element".format(g_ofs + g_num, at),
+                        "XYZ file: {0}".format(XYZ_path))
+            else:
+                raise XYZError(XYZError.XYZFILE,
+                        "Geometry #{0}, atom #{1} is inconsistent "
+                        "with geometry #{2}".format(g_ofs + g_num, at, g_ofs),
+                        "XYZ file: {0}".format(XYZ_path))
+            ## end if
+        ## end if
 
-        ## next mch
+        # Return the descriptions, the atom symbols and the geometries
+        return descs, list(map(str, syms[0])), geom_arr
 
-    ## end def _load_file
+    ## end def _parse_blocks
 
 
     def geom_single(self, g_num):
@@ -1534,129 +1686,1359 @@ class OpanXYZ(object):
     ## end def displ_iter
 
 
-    def _none_subst(self, *args):
-        """ Helper function to insert full ranges for |None| for X_iter methods.
+    def displ_multi(self, g_nums, ats_1, ats_2, invalid_error=False):
+        """ Batch of displacement vectors, as an array.
 
-        Custom method, specifically tailored, taking in the arguments from
-        an X_iter method and performing the replacement of |None| after
-        error-checking the arguments for a max of one |None| value, and ensuring
-        that if a |None| is present, no other non-|str| iterables are present.
+        Displacements are in Bohrs, pointing from each of `ats_1`
+        toward the corresponding atom of `ats_2`, as with
+        :meth:`displ_single`.
+
+        See `above <toc-batch_>`_ for more information on
+        calling options.
 
         Parameters
         ----------
-        args : 3-5 arguments of |int| or iterable |int|, or |None|
-            First argument is always the indices for the geometries; all
-            following are for the atoms in sequence as required for the
-            particular :samp:`{x}_iter` method
+        g_nums
+            |int| or length-R iterable |int| or |None| --
+            Index/indices of the desired geometry/geometries
+
+        ats_1
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the first atom(s)
+
+        ats_2
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the second atom(s)
+
+        invalid_error
+            |bool|, optional --
+            If |False| (the default), ``nan`` values are returned for
+            results corresponding to invalid indices. If |True|,
+            exceptions are raised per normal.
 
         Returns
         -------
-        arglist     : 3-5 arguments, matching input params
-            Argument list, with |None| substituted if validly present
+        displs
+            (R, T, 3) |npfloat_| --
+            Displacement vectors for each atom pair, in each geometry
 
         Raises
         ------
-        ~exceptions.ValueError  : If more than one |None| argument is present
+        ~exceptions.IndexError
+            If `invalid_error` is |True| and an invalid (out-of-range)
+            `g_num` or `at_#` is provided.
+
+        ~exceptions.ValueError
+            If the atom index arrays are not all the same length.
 
-        ~exceptions.ValueError  : If an arg is non-|str| iterable when one
-        |None| is present
         """
 
         # Imports
         import numpy as np
 
-        # Initialize argument list return value, and as None not found
-        arglist = [a for a in args]
-        none_found = False
-
-        # Check for None values
-        none_vals = list(map(lambda e: isinstance(e, type(None)), arglist))
-
-        # Error if more than one None; handle if exactly one; pass through if
-        #  none.
-        if np.count_nonzero(none_vals) > 1:
-            raise ValueError(
-                    "Multiple 'None' values [indices {0}] not supported"
-                    .format(tuple(np.nonzero(none_vals)[0])))
-        elif np.count_nonzero(none_vals) == 1:
-            # Must be no iterables that are not strings. Thus, an element-wise
-            #  test for iterability and an element-wise test for stringiness
-            #  must give matching arrays
-            if not all(np.equal(list(map(np.iterable, arglist)),
-                        list(map(lambda e: isinstance(e, str), arglist)))):
-                raise ValueError(
-                        "'None' as parameter invalid with non-str iterables")
-            ## end if
+        # Retrieve the geometries and the atom indices
+        geoms, (ats_1, ats_2), ok = \
+                self._multi_setup(g_nums, (ats_1, ats_2), invalid_error)
 
-            # Parameters okay; replace the None with the appropriate range()
-            none_found = True
-            none_loc = np.nonzero(none_vals)[0][0]
-            arglist[none_loc] = \
-                    range(self.num_geoms if none_loc == 0 else self.num_atoms)
-        ## end if
+        # Calculate, blanking any invalid atom pairs
+        displs = geoms[:, ats_2, :] - geoms[:, ats_1, :]
+        displs[:, ~ok, :] = np.nan
 
-        # Return the arguments list and the none-found value
-        return arglist
+        # Return the displacements
+        return displs
 
-    ## end def _none_subst
+    ## end def displ_multi
 
 
-    @staticmethod
-    def _iter_return(tup, fxn, invalid_error):
-        """ Wrapper for exception/|None| output handling of X_iter methods.
+    def dist_multi(self, g_nums, ats_1, ats_2, invalid_error=False):
+        """ Batch of interatomic distances, as an array.
 
-        Attempts to pass `tup` as arguments to `fxn`.  If the call is
-        successful, returns the value produced. If
-        :exc:`~exceptions.IndexError` or
-        :exc:`~exceptions.ValueError`
-        is raised, indicating an invalid index value, re-raise if
-        `invalid_error` is |True| or return |None| if |False|.
+        Distances are in Bohrs as with :meth:`dist_single`.
 
-        Other exceptions are left uncaught.
+        See `above <toc-batch_>`_ for more information on
+        calling options.
 
         Parameters
         ----------
-        tup
-            |tuple| --
-            Input arguments to unpack as arguments to `fxn`
+        g_nums
+            |int| or length-R iterable |int| or |None| --
+            Index/indices of the desired geometry/geometries
 
-        fxn
-            callable --
-            Function/method to call to calculate the return value
+        ats_1
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the first atom(s)
+
+        ats_2
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the second atom(s)
 
         invalid_error
-            |bool| --
-            Flag for whether to return |None| on an
-            :exc:`~exceptions.IndexError` or
-            :exc:`~exceptions.ValueError`, or to re-raise.
+            |bool|, optional --
+            If |False| (the default), ``nan`` values are returned for
+            results corresponding to invalid indices. If |True|,
+            exceptions are raised per normal.
 
         Returns
         -------
-        val
-            |npfloat_| or |None| --
-            Calculated value from fxn(*tup) call, or 'None' value indicating
-            IndexError / ValueError
+        dists
+            (R, T) |npfloat_| --
+            Interatomic distances in Bohrs for each atom pair,
+            in each geometry
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If `invalid_error` is |True| and an invalid (out-of-range)
+            `g_num` or `at_#` is provided.
+
+        ~exceptions.ValueError
+            If the atom index arrays are not all the same length.
 
         """
 
-        try:
-            val = fxn(*tup)
-        except (IndexError, ValueError):
-            if invalid_error:
-                # Raise the exception if invalid_error indicates
-                raise
-            else:
-                # Otherwise, just return a 'None' value
-                return None
-            ## end if
-        else:
-            # Good value; just generate it
-            return val
-        ## end try
+        # Imports
+        import numpy as np
 
-    ## end def _iter_return
+        # Calculate from the displacements
+        displs = self.displ_multi(g_nums, ats_1, ats_2,
+                                            invalid_error=invalid_error)
+        dists = np.sqrt(np.sum(displs * displs, axis=2))
 
-## end class OpanXYZ
+        # Return the distances
+        return dists
+
+    ## end def dist_multi
+
+
+    def angle_multi(self, g_nums, ats_1, ats_2, ats_3, invalid_error=False):
+        """ Batch of spanning angles, as an array.
+
+        Angles are in degrees as with :meth:`angle_single`; as there,
+        `ats_1` and `ats_3` can be the same, but `ats_2` must be different
+        from both.
+
+        See `above <toc-batch_>`_ for more information on
+        calling options.
+
+        Parameters
+        ----------
+        g_nums
+            |int| or length-R iterable |int| or |None| --
+            Index/indices of the desired geometry/geometries
+
+        ats_1
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the first atom(s)
+
+        ats_2
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the second atom(s)
+
+        ats_3
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the third atom(s)
+
+        invalid_error
+            |bool|, optional --
+            If |False| (the default), ``nan`` values are returned for
+            results corresponding to invalid indices or coincident atoms.
+            If |True|, exceptions are raised per normal.
+
+        Returns
+        -------
+        angles
+            (R, T) |npfloat_| --
+            Spanning angles in degrees between corresponding |br|
+            `ats_1`-`ats_2`-`ats_3`, in each geometry
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If `invalid_error` is |True| and an invalid (out-of-range)
+            `g_num` or `at_#` is provided.
+
+        ~exceptions.ValueError
+            If the atom index arrays are not all the same length.
+
+        ~exceptions.ValueError
+            If `invalid_error` is |True| and any `ats_2` element is equal to
+            either the corresponding `ats_1` or `ats_3` element, or any
+            two of the atoms are coincident.
+
+        """
+
+        # Imports
+        import numpy as np
+
+        # Retrieve the geometries and the atom indices
+        geoms, (ats_1, ats_2, ats_3), ok = self._multi_setup(g_nums,
+                                    (ats_1, ats_2, ats_3), invalid_error)
+
+        # Complain or blank if ats_2 matches either of ats_1 or ats_3
+        dup = np.logical_and(ok, np.logical_or(ats_2 == ats_1,
+                                                        ats_2 == ats_3))
+        if invalid_error and np.any(dup):
+            raise ValueError("'ats_2' must differ from 'ats_1' and 'ats_3' "
+                            "(index set #{0})".format(np.argmax(dup)))
+        ## end if
+
+        # Calculate the angles; identical ats_1 and ats_3 give zero
+        angles, short = self._vec_angles(geoms[:, ats_1, :] -
+                                                geoms[:, ats_2, :],
+                                        geoms[:, ats_3, :] -
+                                                geoms[:, ats_2, :])
+        angles[:, ats_1 == ats_3] = 0.0
+        short[:, ats_1 == ats_3] = False
+
+        # Complain about or blank any coincident atoms
+        if invalid_error and np.any(short):
+            raise ValueError("Coincident atoms in index set #{0}"
+                            .format(np.argmax(np.any(short, axis=0))))
+        ## end if
+        angles[short] = np.nan
+        angles[:, np.logical_or(~ok, dup)] = np.nan
+
+        # Return the angles
+        return angles
+
+    ## end def angle_multi
+
+
+    def dihed_multi(self, g_nums, ats_1, ats_2, ats_3, ats_4,
+                                                    invalid_error=False):
+        """ Batch of dihedral angles, as an array.
+
+        Angles are in degrees, with the same sign convention and
+        linearity checks as :meth:`dihed_single`.
+
+        See `above <toc-batch_>`_ for more information on
+        calling options.
+
+        Parameters
+        ----------
+        g_nums
+            |int| or length-R iterable |int| or |None| --
+            Index/indices of the desired geometry/geometries
+
+        ats_1
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the first atom(s)
+
+        ats_2
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the second atom(s)
+
+        ats_3
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the third atom(s)
+
+        ats_4
+            |int| or length-T iterable |int| or |None| --
+            Index/indices of the fourth atom(s)
+
+        invalid_error
+            |bool|, optional --
+            If |False| (the default), ``nan`` values are returned for
+            results corresponding to invalid indices, coincident atoms,
+            or insufficiently nonlinear atom trios. If |True|,
+            exceptions are raised per normal.
+
+        Returns
+        -------
+        diheds
+            (R, T) |npfloat_| --
+            Out-of-plane/dihedral angles in degrees for the indicated
+            atom sets `ats_1`-`ats_2`-`ats_3`-`ats_4`, in each geometry
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If `invalid_error` is |True| and an invalid (out-of-range)
+            `g_num` or `at_#` is provided.
+
+        ~exceptions.ValueError
+            If the atom index arrays are not all the same length.
+
+        ~exceptions.ValueError
+            If `invalid_error` is |True| and any corresponding `ats_#`
+            indices are equal, or any two of the atoms are coincident.
+
+        ~opan.error.XYZError
+            (typecode :data:`~opan.error.XYZError.DIHED`) If
+            `invalid_error` is |True| and either of the atom trios is
+            too close to linearity for any group of `ats_#`
+
+        """
+
+        # Imports
+        import numpy as np
+        from .const import PRM
+        from .error import XYZError
+
+        # Retrieve the geometries and the atom indices
+        geoms, ats, ok = self._multi_setup(g_nums,
+                            (ats_1, ats_2, ats_3, ats_4), invalid_error)
+        ats_1, ats_2, ats_3, ats_4 = ats
+
+        # All four atom indices must be distinct
+        dup = np.zeros(ok.shape, dtype=bool)
+        for i in range(4):
+            for j in range(i + 1, 4):
+                dup = np.logical_or(dup, ats[i] == ats[j])
+            ## next j
+        ## next i
+        dup = np.logical_and(ok, dup)
+        if invalid_error and np.any(dup):
+            raise ValueError("Duplicate atom indices in index set #{0}"
+                                                .format(np.argmax(dup)))
+        ## end if
+
+        # Displacements among the atoms
+        d_1_2 = geoms[:, ats_2, :] - geoms[:, ats_1, :]
+        d_2_3 = geoms[:, ats_3, :] - geoms[:, ats_2, :]
+        d_3_4 = geoms[:, ats_4, :] - geoms[:, ats_3, :]
+
+        # Check the atom trios for linearity, using the same angles as
+        #  dihed_single: at_2-at_1-at_3 and at_3-at_2-at_4
+        ang_1, short_1 = self._vec_angles(d_1_2,
+                            geoms[:, ats_3, :] - geoms[:, ats_1, :])
+        ang_2, short_2 = self._vec_angles(d_2_3,
+                            geoms[:, ats_4, :] - geoms[:, ats_2, :])
+        short = np.logical_or(short_1, short_2)
+        if invalid_error and np.any(short):
+            raise ValueError("Coincident atoms in index set #{0}"
+                            .format(np.argmax(np.any(short, axis=0))))
+        ## end if
+        with np.errstate(invalid='ignore'):
+            linear = np.logical_or(
+                    np.minimum(ang_1, 180.0 - ang_1) < PRM.NON_PARALLEL_TOL,
+                    np.minimum(ang_2, 180.0 - ang_2) < PRM.NON_PARALLEL_TOL)
+        ## end with
+        if invalid_error and np.any(linear):
+            idx = np.argmax(np.any(linear, axis=0))
+            raise XYZError(XYZError.DIHED,
+                    "Atom set {0} is insufficiently nonlinear"
+                        .format((ats_1[idx], ats_2[idx],
+                                        ats_3[idx], ats_4[idx])),
+                    "XYZ file: {0}".format(self.XYZ_path))
+        ## end if
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Normalized at_2 --> at_3 displacement, defining the
+            #  projection plane
+            plane_norm = d_2_3 / self._norms(d_2_3)
+
+            # Orthonormal basis in the projection plane, with the first
+            #  vector being the normalized projection of the at_1 --> at_2
+            #  displacement onto that plane, as from ortho_basis
+            on2 = np.cross(plane_norm, d_1_2 / self._norms(d_1_2))
+            on2 /= self._norms(on2)
+            on1 = np.cross(on2, plane_norm)
+            on1 /= self._norms(on1)
+
+            # Project the at_3 --> at_4 displacement onto the plane and
+            #  re-normalize
+            back_vec = d_3_4 - plane_norm * (
+                        np.sum(d_3_4 * plane_norm, axis=2)[:, :, None] /
+                        np.sum(plane_norm * plane_norm, axis=2)[:, :, None])
+            back_vec /= self._norms(back_vec)
+        ## end with
+
+        # Departure of the dihedral from 180 degrees, signed per the
+        #  handedness of the in-plane basis, as in dihed_single
+        diheds = self._vec_angles(back_vec, on1)[0]
+        diheds *= np.sign(np.sum(back_vec * on2, axis=2))
+        diheds += 180.0
+
+        # Blank the invalid values and return
+        diheds[np.logical_or(short, linear)] = np.nan
+        diheds[:, np.logical_or(~ok, dup)] = np.nan
+        return diheds
+
+    ## end def dihed_multi
+
+
+    def dist_matrix(self, g_nums=None):
+        """ Full interatomic distance matrices, as an array.
+
+        Distances are in Bohrs as with :meth:`dist_single`. The squared
+        distances are assembled from the Gram matrix of the (centered)
+        coordinates of each geometry, computed with a single stacked matrix
+        product. The diagonal is identically zero.
+
+        Parameters
+        ----------
+        g_nums
+            |int| or length-R iterable |int| or |None|, optional --
+            Index/indices of the desired geometry/geometries. Default is
+            |None|, indicating all geometries.
+
+        Returns
+        -------
+        dists
+            (R, N, N) |npfloat_| --
+            Symmetric matrices of the interatomic distances in each
+            geometry
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If an invalid (out-of-range) `g_num` is provided
+
+        """
+
+        # Imports
+        import numpy as np
+
+        # Retrieve the geometries, centered to minimize roundoff error
+        geoms = self._geom_stack(g_nums, True)
+        geoms -= geoms.mean(axis=1)[:, None, :]
+
+        # |r_i - r_j|^2 = |r_i|^2 + |r_j|^2 - 2 r_i . r_j; negative values
+        #  from roundoff are clipped
+        gram = np.matmul(geoms, geoms.transpose((0, 2, 1)))
+        sqs = np.diagonal(gram, axis1=1, axis2=2)
+        dists = sqs[:, :, None] + sqs[:, None, :] - 2.0 * gram
+        np.maximum(dists, 0.0, out=dists)
+        np.sqrt(dists, out=dists)
+
+        # Strict zeros on the diagonal
+        dists[:, np.arange(self.num_atoms), np.arange(self.num_atoms)] = 0.0
+
+        # Return the matrices
+        return dists
+
+    ## end def dist_matrix
+
+
+    def neighbor_list(self, g_num, cutoff):
+        """ Sparse list of the atom pairs within a cutoff distance.
+
+        The pairs are located with a cell list: the atoms are binned into
+        cubic cells of side `cutoff`, and only atoms in the same or
+        adjacent cells are compared. Memory and time thus scale with the
+        number of atoms and of near neighbors, rather than as N\\ :sup:`2`.
+
+        Parameters
+        ----------
+        g_num
+            |int| -- Index of the desired geometry
+
+        cutoff
+            |float| -- Maximum interatomic distance, in Bohrs
+
+        Returns
+        -------
+        pairs
+            (M, 2) |nparray| of |int| --
+            Indices of the atom pairs separated by no more than `cutoff`,
+            with the first index of each pair less than the second, and
+            sorted by first and then second index
+
+        dists
+            length-M |npfloat_| --
+            Distances in Bohrs between the atoms of each pair
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If an invalid (out-of-range) `g_num` is provided
+
+        ~exceptions.ValueError
+            If `cutoff` is not positive
+
+        """
+
+        # Imports
+        import itertools as itt
+        import numpy as np
+
+        # Complain if the cutoff is bad
+        if not cutoff > 0:
+            raise ValueError("'cutoff' must be positive")
+        ## end if
+
+        # Retrieve the geometry
+        xyz = self.geom_single(g_num).reshape((-1, 3))
+
+        # Bin the atoms into cells, and sort them by cell
+        cells = np.floor((xyz - xyz.min(axis=0)) / cutoff).astype(np.int_)
+        dims = cells.max(axis=0) + 1
+        keys = np.ravel_multi_index(cells.T, dims)
+        order = np.argsort(keys, kind='mergesort')
+        keys = keys[order]
+
+        # Collect candidate pairs from each of the adjacent cells, including
+        #  the atom's own cell. Every pair is found once in each direction;
+        #  only the one with the lower index first is kept.
+        ats_1 = []
+        ats_2 = []
+        for ofs in itt.product((-1, 0, 1), repeat=3):
+            # Neighbor cells, where they exist
+            nbrs = cells + ofs
+            ats = np.flatnonzero(np.all(np.logical_and(0 <= nbrs,
+                                                    nbrs < dims), axis=1))
+            nbr_keys = np.ravel_multi_index(nbrs[ats].T, dims)
+
+            # Ranges in the sorted atoms of the neighbor cells
+            los = np.searchsorted(keys, nbr_keys, side='left')
+            cts = np.searchsorted(keys, nbr_keys, side='right') - los
+
+            # Expand to the candidate pairs
+            at_1 = np.repeat(ats, cts)
+            at_2 = order[np.repeat(los - np.cumsum(cts) + cts, cts) +
+                                            np.arange(np.sum(cts))]
+            keep = at_1 < at_2
+            ats_1.append(at_1[keep])
+            ats_2.append(at_2[keep])
+        ## next ofs
+        ats_1 = np.concatenate(ats_1)
+        ats_2 = np.concatenate(ats_2)
+
+        # Screen by distance
+        displs = xyz[ats_2] - xyz[ats_1]
+        dists = np.sqrt(np.sum(displs * displs, axis=1))
+        keep = dists <= cutoff
+
+        # Sort and return
+        pairs = np.column_stack((ats_1[keep], ats_2[keep]))
+        srt = np.lexsort((pairs[:, 1], pairs[:, 0]))
+        return pairs[srt], dists[keep][srt]
+
+    ## end def neighbor_list
+
+
+    def _multi_setup(self, g_nums, ats, invalid_error):
+        """ Helper function to prepare the arguments for X_multi methods.
+
+        Retrieves the indicated geometries as an (R, N, 3) stack, with
+        the rows for invalid geometry indices filled with ``nan``, and
+        converts the atom indices to equal-length arrays of nonnegative
+        indices, with those of invalid index sets replaced by zero.
+
+        Parameters
+        ----------
+        g_nums
+            |int| or iterable |int| or |None| --
+            Indices of the geometries; |None| indicates all geometries
+
+        ats
+            |tuple| of |int| or iterable |int| or |None| --
+            Indices of the atoms, per argument of the calling
+            :samp:`{x}_multi` method; |None| indicates all atoms
+
+        invalid_error
+            |bool| --
+            Flag for whether to raise an error on an invalid index
+
+        Returns
+        -------
+        geoms
+            (R, N, 3) |npfloat_| -- Stacked geometries
+
+        ats
+            |list| of length-T |nparray| of |int| -- Atom indices
+
+        ok
+            length-T |nparray| of |bool| -- Flags for whether each
+            set of atom indices is valid
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If `invalid_error` is |True| and an index is out of range
+
+        ~exceptions.ValueError
+            If the atom index arrays are not all the same length, or
+            any indices are not given as a scalar or a vector
+
+        """
+
+        # Imports
+        import numpy as np
+
+        # Retrieve the geometries
+        geoms = self._geom_stack(g_nums, invalid_error)
+
+        # Atom indices, which must all be of the same length
+        try:
+            ats = np.broadcast_arrays(*[self._idx_vec(a, self.num_atoms)
+                                                            for a in ats])
+        except ValueError:
+            raise ValueError("Atom index arrays are not all the same length")
+        ## end try
+
+        # Complain about invalid atom indices, if indicated
+        ok = np.ones(ats[0].shape, dtype=bool)
+        for i, a in enumerate(ats):
+            a_ok = np.logical_and(-self.num_atoms <= a, a < self.num_atoms)
+            if invalid_error and not np.all(a_ok):
+                raise IndexError("Invalid index for 'ats_{0}' ({1})"
+                                    .format(i + 1, a[np.argmin(a_ok)]))
+            ## end if
+            ok = np.logical_and(ok, a_ok)
+        ## next i
+
+        # Wrap negative indices and zero out invalid index sets
+        ats = [np.where(ok, a % self.num_atoms, 0) for a in ats]
+
+        # Return the geometries, indices and validity flags
+        return geoms, ats, ok
+
+    ## end def _multi_setup
+
+
+    @staticmethod
+    def _idx_vec(idxs, num):
+        """ Coerce indices for the X_multi methods to an integer vector.
+
+        As with the :samp:`{x}_single` methods, the indices are coerced to
+        their floor() values.
+
+        Parameters
+        ----------
+        idxs
+            |int| or iterable |int| or |None| --
+            Indices; |None| indicates ``range(num)``
+
+        num
+            |int| -- Number of items being indexed
+
+        Returns
+        -------
+        vec
+            |nparray| of |int| -- Indices as a vector
+
+        Raises
+        ------
+        ~exceptions.ValueError
+            If `idxs` is not a scalar or a vector
+
+        """
+
+        # Imports
+        import numpy as np
+
+        # Full range for None
+        if idxs is None:
+            return np.arange(num)
+        ## end if
+
+        # Coerce and check shape
+        vec = np.atleast_1d(np.floor(np.asarray(idxs, dtype=np.float_)))
+        if not len(vec.shape) == 1:
+            raise ValueError("Indices must be scalar or vector")
+        ## end if
+
+        # Return
+        return vec.astype(np.int_)
+
+    ## end def _idx_vec
+
+
+    def _geom_stack(self, g_nums, invalid_error):
+        """ Retrieve the indicated geometries as an (R, N, 3) stack.
+
+        Parameters
+        ----------
+        g_nums
+            |int| or iterable |int| or |None| --
+            Indices of the geometries; |None| indicates all geometries
+
+        invalid_error
+            |bool| --
+            If |False|, the rows for invalid geometry indices are filled
+            with ``nan``. If |True|, an error is raised.
+
+        Returns
+        -------
+        geoms
+            (R, N, 3) |npfloat_| -- Stacked geometries
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If `invalid_error` is |True| and an index is out of range
+
+        """
+
+        # Imports
+        import numpy as np
+
+        # Geometry indices; complain if invalid, if indicated
+        g_nums = self._idx_vec(g_nums, self.num_geoms)
+        g_ok = np.logical_and(-self.num_geoms <= g_nums,
+                                            g_nums < self.num_geoms)
+        if invalid_error and not np.all(g_ok):
+            raise IndexError("Invalid index for 'g_nums' ({0})"
+                                    .format(g_nums[np.argmin(g_ok)]))
+        ## end if
+
+        # Stack the geometries, leaving NaN for any invalid index
+        geoms = np.full((g_nums.shape[0], self.num_atoms, 3), np.nan,
+                                                            dtype=np.float_)
+        geoms[g_ok] = self._geom_rows(g_nums[g_ok]) \
+                                        .reshape((-1, self.num_atoms, 3))
+
+        # Return the stack
+        return geoms
+
+    ## end def _geom_stack
+
+    def _geom_rows(self, g_nums):
+        """ Retrieve the indicated geometries by fancy indexing.
+
+        Parameters
+        ----------
+        g_nums
+            |nparray| of |int| -- Valid indices of the geometries
+
+        Returns
+        -------
+        geoms
+            (R, 3N) |npfloat_| -- Stacked geometries
+
+        """
+
+        return self._geom_arr[g_nums]
+
+    ## end def _geom_rows
+
+
+    @staticmethod
+    def _norms(vecs):
+        """ Norms of a stack of 3-vectors, shaped for broadcasting.
+
+        Parameters
+        ----------
+        vecs
+            (R, T, 3) |npfloat_| -- Vectors
+
+        Returns
+        -------
+        norms
+            (R, T, 1) |npfloat_| -- Euclidean norms of `vecs`
+
+        """
+
+        # Imports
+        import numpy as np
+
+        # Calculate and return
+        return np.sqrt(np.sum(vecs * vecs, axis=2))[:, :, None]
+
+    ## end def _norms
+
+
+    @classmethod
+    def _vec_angles(cls, vecs_1, vecs_2):
+        """ Angles between pairs of stacked 3-vectors.
+
+        Vectorized equivalent of :func:`~opan.utils.vector.vec_angle`.
+
+        Parameters
+        ----------
+        vecs_1
+            (R, T, 3) |npfloat_| -- First vectors
+
+        vecs_2
+            (R, T, 3) |npfloat_| -- Second vectors
+
+        Returns
+        -------
+        angles
+            (R, T) |npfloat_| -- Angles in degrees between the vectors,
+            ``nan`` where either vector is too short
+
+        short
+            (R, T) |nparray| of |bool| -- Flags for where either vector
+            has norm smaller than
+            :data:`PRM.ZERO_VEC_TOL <opan.const.PRM.ZERO_VEC_TOL>`
+
+        """
+
+        # Imports
+        import numpy as np
+        from .const import PRM
+
+        # Norms, and the flags for too-short vectors
+        norms_1 = cls._norms(vecs_1)[:, :, 0]
+        norms_2 = cls._norms(vecs_2)[:, :, 0]
+        with np.errstate(invalid='ignore'):
+            short = np.logical_or(norms_1 < PRM.ZERO_VEC_TOL,
+                                        norms_2 < PRM.ZERO_VEC_TOL)
+        ## end with
+
+        # Calculate, clipping any values pushed past +/-1 by numerical
+        #  precision errors
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dotp = np.sum(vecs_1 * vecs_2, axis=2) / norms_1 / norms_2
+            angles = np.degrees(np.arccos(np.clip(dotp, -1.0, 1.0)))
+        ## end with
+        angles[short] = np.nan
+
+        # Return the angles and the flags
+        return angles, short
+
+    ## end def _vec_angles
+
+
+    def _none_subst(self, *args):
+        """ Helper function to insert full ranges for |None| for X_iter methods.
+
+        Custom method, specifically tailored, taking in the arguments from
+        an X_iter method and performing the replacement of |None| after
+        error-checking the arguments for a max of one |None| value, and ensuring
+        that if a |None| is present, no other non-|str| iterables are present.
+
+        Parameters
+        ----------
+        args : 3-5 arguments of |int| or iterable |int|, or |None|
+            First argument is always the indices for the geometries; all
+            following are for the atoms in sequence as required for the
+            particular :samp:`{x}_iter` method
+
+        Returns
+        -------
+        arglist     : 3-5 arguments, matching input params
+            Argument list, with |None| substituted if validly present
+
+        Raises
+        ------
+        ~exceptions.ValueError  : If more than one |None| argument is present
+
+        ~exceptions.ValueError  : If an arg is non-|str| iterable when one
+        |None| is present
+        """
+
+        # Imports
+        import numpy as np
+
+        # Initialize argument list return value, and as None not found
+        arglist = [a for a in args]
+        none_found = False
+
+        # Check for None values
+        none_vals = list(map(lambda e: isinstance(e, type(None)), arglist))
+
+        # Error if more than one None; handle if exactly one; pass through if
+        #  none.
+        if np.count_nonzero(none_vals) > 1:
+            raise ValueError(
+                    "Multiple 'None' values [indices {0}] not supported"
+                    .format(tuple(np.nonzero(none_vals)[0])))
+        elif np.count_nonzero(none_vals) == 1:
+            # Must be no iterables that are not strings. Thus, an element-wise
+            #  test for iterability and an element-wise test for stringiness
+            #  must give matching arrays
+            if not all(np.equal(list(map(np.iterable, arglist)),
+                        list(map(lambda e: isinstance(e, str), arglist)))):
+                raise ValueError(
+                        "'None' as parameter invalid with non-str iterables")
+            ## end if
+
+            # Parameters okay; replace the None with the appropriate range()
+            none_found = True
+            none_loc = np.nonzero(none_vals)[0][0]
+            arglist[none_loc] = \
+                    range(self.num_geoms if none_loc == 0 else self.num_atoms)
+        ## end if
+
+        # Return the arguments list and the none-found value
+        return arglist
+
+    ## end def _none_subst
+
+
+    @staticmethod
+    def _iter_return(tup, fxn, invalid_error):
+        """ Wrapper for exception/|None| output handling of X_iter methods.
+
+        Attempts to pass `tup` as arguments to `fxn`.  If the call is
+        successful, returns the value produced. If
+        :exc:`~exceptions.IndexError` or
+        :exc:`~exceptions.ValueError`
+        is raised, indicating an invalid index value, re-raise if
+        `invalid_error` is |True| or return |None| if |False|.
+
+        Other exceptions are left uncaught.
+
+        Parameters
+        ----------
+        tup
+            |tuple| --
+            Input arguments to unpack as arguments to `fxn`
+
+        fxn
+            callable --
+            Function/method to call to calculate the return value
+
+        invalid_error
+            |bool| --
+            Flag for whether to return |None| on an
+            :exc:`~exceptions.IndexError` or
+            :exc:`~exceptions.ValueError`, or to re-raise.
+
+        Returns
+        -------
+        val
+            |npfloat_| or |None| --
+            Calculated value from fxn(*tup) call, or 'None' value indicating
+            IndexError / ValueError
+
+        """
+
+        try:
+            val = fxn(*tup)
+        except (IndexError, ValueError):
+            if invalid_error:
+                # Raise the exception if invalid_error indicates
+                raise
+            else:
+                # Otherwise, just return a 'None' value
+                return None
+            ## end if
+        else:
+            # Good value; just generate it
+            return val
+        ## end try
+
+    ## end def _iter_return
+
+## end class OpanXYZ
+
+
+class OpanXYZStream(OpanXYZ):
+    """ Streaming reader for large OpenBabel XYZ trajectories.
+
+    Initializer is called as::
+
+        OpanXYZStream(path='path/to/file'[, bohrs=False[, chunk=100]])
+
+    Where :class:`OpanXYZ` holds every geometry of a file in memory, this
+    class scans the file once on initialization to index the byte offset
+    of each geometry block, and thereafter reads geometries from disk only
+    as they are needed. Any geometry can thus be retrieved in constant
+    time, and trajectories far larger than available memory can be
+    processed.
+
+    All of the :ref:`methods <methods>` and
+    :ref:`generators <generators>` of :class:`OpanXYZ`
+    (:meth:`~OpanXYZ.dist_iter`, :meth:`~OpanXYZ.angle_iter`,
+    :meth:`~OpanXYZ.dihed_iter`, etc.) are available, and operate
+    directly on the file. To keep sequential access efficient, geometries
+    are read and parsed `chunk` at a time, and the most recently read
+    chunk is retained.
+
+    The optional keyword argument `bohrs` has the same meaning as for
+    :class:`OpanXYZ`. The file format requirements are likewise identical,
+    save that problems with geometries after the first are only detected
+    when those geometries are read.
+
+    Since the geometries are not held in memory, the :attr:`~OpanXYZ.geoms`,
+    :attr:`~OpanXYZ.descs` and :attr:`~OpanXYZ.in_str` instance variables
+    of :class:`OpanXYZ` are not present; :meth:`iter_chunks` provides
+    the geometries in bulk.
+
+    **Instance Variables**
+
+    .. attribute:: atom_syms
+
+        length-N |str| -- Atomic symbols for the atoms (all uppercase)
+
+    .. attribute:: bohrs
+
+        |bool| -- Whether coordinates in the file are interpreted as Bohrs
+
+    .. attribute:: chunk
+
+        |int| -- Number of geometries read from disk at a time
+
+    .. attribute:: num_atoms
+
+        |int| -- Number of atoms per geometry, N
+
+    .. attribute:: num_geoms
+
+        |int| -- Number of geometries, G
+
+    .. attribute:: offsets
+
+        length-(G+1) |nparray| of |int| -- Byte offset of the start of each geometry
+        block in the file, followed by the total size of the file
+
+    .. attribute:: XYZ_path
+
+        |str| -- Full path to the OpenBabel file
+
+    **Methods**
+
+    .. automethod:: geom_single(g_num)
+
+    .. automethod:: geoms_range(g_start, g_stop)
+
+    .. automethod:: iter_chunks(chunk=None, g_start=0, g_stop=None)
+
+    """
+
+    # Class constants
+    #: |int| -- Number of bytes read at a time while indexing a file
+    INDEX_BLOCK = 2**22
+
+    def __init__(self, **kwargs):
+        """ Index an OpenBabel file for streamed access.
+
+        See the class documentation for calling details.
+        """
+
+        # Imports
+        import numpy as np
+        from .error import XYZError
+        from .utils import safe_cast as scast
+
+        # Must have the path
+        if not 'path' in kwargs:
+            raise NameError("Insufficient named parameters found")
+        ## end if
+
+        # Store the settings
+        self.XYZ_path = kwargs['path']
+        self.bohrs = kwargs['bohrs'] if 'bohrs' in kwargs else False
+        self.chunk = scast(kwargs['chunk'] if 'chunk' in kwargs else 100,
+                                                                    np.int_)
+        if self.chunk is None or self.chunk < 1:
+            raise ValueError("'chunk' must be a positive integer")
+        ## end if
+
+        # Retrieve the number of atoms from the head of the file; as with
+        #  OpanXYZ, the file must start with a geometry block
+        with open(self.XYZ_path, 'rb') as in_fl:
+            self.num_atoms = scast(in_fl.readline().decode().strip(), np.int_)
+        ## end with
+        if self.num_atoms is None:
+            raise XYZError(XYZError.XYZFILE,
+                    "No geometry block found at start of file",
+                    "XYZ file: " + self.XYZ_path)
+        ## end if
+
+        # Index the geometry blocks
+        self.offsets = self._index_file()
+        self.num_geoms = self.offsets.shape[0] - 1
+
+        # Initialize the chunk cache
+        self._cache_start = 0
+        self._cache = np.empty((0, 3 * self.num_atoms), dtype=np.float_)
+
+        # Read the first chunk, storing the atom symbols; this also
+        #  checks the first geometry block for validity
+        self.atom_syms = None
+        self.geom_single(0)
+
+    ## end def __init__
+
+
+    def _index_file(self):
+        """ Locate the byte offsets of all geometry blocks in the file.
+
+        The file is read in blocks of :attr:`INDEX_BLOCK` bytes. Within
+        each, the line starts and the non-blank lines are located with
+        vectorized operations. The blocks are then walked as in
+        :meth:`_parse_blocks`: blank lines are skipped ahead of each atom
+        count line, which heads a geometry block of exactly N+2 lines,
+        blank or not.
+
+        Returns
+        -------
+        offsets
+            length-(G+1) |nparray| of |int| -- Byte offsets of the geometry
+            blocks, followed by the total size of the file
+
+        Raises
+        ------
+        ~opan.error.XYZError
+            (typecode :attr:`~opan.error.XYZError.XYZFILE`)
+            If an atom count line does not match the first geometry, or if
+            the file does not end with a whole geometry block
+
+        """
+
+        # Imports
+        import os
+        import numpy as np
+        from .error import XYZError
+
+        # Lookup table for whitespace bytes
+        is_ws = np.zeros((256,), dtype=bool)
+        is_ws[list(b' \t\n\r\f\v')] = True
+
+        # Walk the file. 'base' is the file offset of the start of 'buf',
+        #  'skip' is the number of lines at the start of 'buf' that belong
+        #  to a geometry block begun in an earlier buffer, and 'num_geoms'
+        #  is the running count of geometry blocks.
+        blk_len = self.num_atoms + 2
+        starts = []
+        base = 0
+        skip = 0
+        num_geoms = 0
+        buf = b''
+        with open(self.XYZ_path, 'rb') as in_fl:
+            while True:
+                data = in_fl.read(self.INDEX_BLOCK)
+
+                # Only whole lines are processed; a partial line at the end
+                #  of the buffer is carried over. At the end of the file,
+                #  terminate any unterminated last line.
+                if not data:
+                    if not buf:
+                        break
+                    ## end if
+                    buf += b'\n'
+                ## end if
+                buf += data
+                stop = buf.rfind(b'\n') + 1
+                if stop == 0:
+                    continue
+                ## end if
+
+                # Locate the line starts and ends in the buffer, and the
+                #  lines holding a non-whitespace character
+                arr = np.frombuffer(buf[:stop], dtype=np.uint8)
+                ends = np.flatnonzero(arr == ord('\n'))
+                begs = np.concatenate(([0], ends[:-1] + 1))
+                cts = np.concatenate(([0], np.cumsum(~is_ws[arr])))
+                nonblank = np.flatnonzero(cts[ends] > cts[begs])
+
+                # Each block head is the first non-blank line after the end
+                #  of the previous block, and must hold the atom count
+                heads = []
+                pos = skip
+                k = np.searchsorted(nonblank, pos)
+                while k < nonblank.shape[0]:
+                    i = nonblank[k]
+                    try:
+                        ok = int(buf[begs[i]:ends[i]]) == self.num_atoms
+                    except ValueError:
+                        ok = False
+                    ## end try
+                    if not ok:
+                        raise XYZError(XYZError.XYZFILE,
+                                "Geometry #{0} atom count is inconsistent"
+                                    .format(num_geoms + len(heads)),
+                                "XYZ file: {0}".format(self.XYZ_path))
+                    ## end if
+                    heads.append(begs[i])
+                    pos = i + blk_len
+                    k = np.searchsorted(nonblank, pos)
+                ## loop
+                starts.append(base + np.array(heads, dtype=np.int_))
+                num_geoms += len(heads)
+
+                # Advance
+                skip = max(pos - begs.shape[0], 0)
+                base += stop
+                buf = buf[stop:]
+            ## loop
+        ## end with
+
+        # Must end with a whole geometry block
+        if skip > 0:
+            raise XYZError(XYZError.XYZFILE,
+                    "Geometry #{0} atom count is inconsistent"
+                        .format(num_geoms - 1),
+                    "XYZ file: {0}".format(self.XYZ_path))
+        ## end if
+
+        # Tack on the end of the file and return. 'base' overshoots by one
+        #  if a newline was added to an unterminated last line.
+        starts.append([min(base, os.path.getsize(self.XYZ_path))])
+        return np.concatenate(starts).astype(np.int_)
+
+    ## end def _index_file
+
+
+    def geoms_range(self, g_start, g_stop):
+        """ Read a contiguous range of geometries from the file.
+
+        Parameters
+        ----------
+        g_start
+            |int| -- Index of the first geometry to read
+
+        g_stop
+            |int| -- Index one past the last geometry to read
+
+        Returns
+        -------
+        geoms
+            (`g_stop` - `g_start`, 3N) |npfloat_| --
+            Stacked geometries, in Bohrs
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If `g_start` and `g_stop` do not indicate a valid, non-empty
+            range of geometries
+
+        ~opan.error.XYZError
+            (typecode :attr:`~opan.error.XYZError.XYZFILE`)
+            If any of the geometry blocks read is malformed in some fashion
+
+        """
+
+        # Imports
+        from .error import XYZError
+
+        # Complain if the range is invalid
+        if not 0 <= g_start < g_stop <= self.num_geoms:
+            raise IndexError("Invalid geometry range ({0}, {1})"
+                                                .format(g_start, g_stop))
+        ## end if
+
+        # Read the text of the geometry blocks
+        with open(self.XYZ_path, 'rb') as in_fl:
+            in_fl.seek(self.offsets[g_start])
+            in_str = in_fl.read(self.offsets[g_stop] -
+                                        self.offsets[g_start]).decode()
+        ## end with
+
+        # Parse
+        descs, atom_syms, geoms = self._parse_blocks(in_str.splitlines(),
+                            self.num_atoms, self.bohrs, self.XYZ_path,
+                            g_ofs=g_start)
+
+        # Check consistency of the atoms with the first geometry. On the
+        #  initial read from __init__, the atoms are stored instead.
+        if self.atom_syms is None:
+            self.atom_syms = atom_syms
+        elif not atom_syms == self.atom_syms:
+            raise XYZError(XYZError.XYZFILE,
+                    "Geometry #{0} is inconsistent with geometry #0"
+                        .format(g_start),
+                    "XYZ file: {0}".format(self.XYZ_path))
+        ## end if
+
+        # Return the geometries
+        return geoms
+
+    ## end def geoms_range
+
+
+    def geom_single(self, g_num):
+        """ Retrieve a single geometry.
+
+        If the geometry is not in the most recently read chunk, the chunk
+        of :attr:`chunk` geometries starting at `g_num` is read from disk.
+
+        Parameters
+        ----------
+        g_num
+            |int| --
+            Index of the desired geometry
+
+        Returns
+        -------
+        geom
+            length-3N |npfloat_| --
+            Vector of the atomic coordinates for the geometry indicated
+            by `g_num`
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If an invalid (out-of-range) `g_num` is provided
+
+        """
+
+        # Complain if g_num is invalid; otherwise, wrap negative indices
+        if not (-self.num_geoms <= g_num < self.num_geoms):
+            raise IndexError("Invalid index for 'g_num' ({0})".format(g_num))
+        ## end if
+        g_num = int(g_num) % self.num_geoms
+
+        # Read the chunk if needed
+        if not (self._cache_start <= g_num <
+                            self._cache_start + self._cache.shape[0]):
+            self._cache = self.geoms_range(g_num,
+                            min(g_num + self.chunk, self.num_geoms))
+            self._cache_start = g_num
+        ## end if
+
+        # Return the geometry
+        return self._cache[g_num - self._cache_start]
+
+    ## end def geom_single
+
+
+    def _geom_rows(self, g_nums):
+        """ Retrieve the indicated geometries via :meth:`geom_single`.
+
+        The geometries are not held in memory, so each is read through
+        the chunk of :meth:`geom_single`.
+
+        """
+
+        # Imports
+        import numpy as np
+
+        return np.array([self.geom_single(g) for g in g_nums],
+                                dtype=np.float_).reshape((-1,
+                                                    3 * self.num_atoms))
+
+    ## end def _geom_rows
+
+
+    def iter_chunks(self, chunk=None, g_start=0, g_stop=None):
+        """ Iterator over the geometries in batches.
+
+        Geometries are read fresh from the file, and the chunk of
+        :meth:`geom_single` is left untouched.
+
+        Parameters
+        ----------
+        chunk
+            |int|, optional --
+            Maximum number of geometries per batch. Default is
+            :attr:`chunk`.
+
+        g_start
+            |int|, optional --
+            Index of the first geometry. Default is zero.
+
+        g_stop
+            |int|, optional --
+            Index one past the last geometry. Default is
+            :attr:`num_geoms`.
+
+        Yields
+        ------
+        geoms
+            (k, 3N) |npfloat_| --
+            Stacked geometries, in Bohrs, with k no greater than `chunk`
+
+        Raises
+        ------
+        ~exceptions.IndexError
+            If `g_start` and `g_stop` do not indicate a valid range of
+            geometries
+
+        """
+
+        # Fill the defaults
+        if chunk is None:
+            chunk = self.chunk
+        ## end if
+        if g_stop is None:
+            g_stop = self.num_geoms
+        ## end if
+
+        # Yield the batches
+        for g in range(g_start, g_stop, chunk):
+            yield self.geoms_range(g, min(g + chunk, g_stop))
+        ## next g
+
+    ## end def iter_chunks
+
+## end class OpanXYZStream
 
 
 if __name__ == '__main__':  # pragma: no cover